@@ -16,14 +16,11 @@ Usage:
 # ============================================================================
 # WARNINGS SUPPRESSION (must be at the very top, before any other imports)
 # ============================================================================
-# Suppress known third-party library warnings:
-# 1. DuckDuckGo search package rename warning (RuntimeWarning)
-# 2. Unclosed SSL sockets from HTTP clients like anthropic/httpx (ResourceWarning)
+# Suppress the DuckDuckGo search package rename warning (RuntimeWarning).
+# Upstream HTTP connections are pooled and closed at exit by
+# src.core.transport, so ResourceWarnings are no longer silenced here.
 import warnings
 
-# Suppress ResourceWarnings (unclosed sockets)
-warnings.simplefilter("ignore", ResourceWarning)
-
 # Suppress the specific DuckDuckGo rename warning
 # The library raises this with stacklevel=2 so it appears from our code
 warnings.filterwarnings(
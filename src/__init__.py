@@ -8,10 +8,28 @@ __version__ = "2.0.0"
 __author__ = "Student"
 __email__ = "student@university.edu"
 
-from src.core.smart_queue import SmartAgentQueue
-from src.models.content import ContentResult, ContentType
-from src.models.route import Route, RoutePoint
-from src.models.user_profile import UserProfile
+from typing import TYPE_CHECKING
+
+from src._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core.smart_queue import SmartAgentQueue
+    from src.models.content import ContentResult, ContentType
+    from src.models.route import Route, RoutePoint
+    from src.models.user_profile import UserProfile
+
+# Exports are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "SmartAgentQueue": "src.core.smart_queue",
+        "ContentResult": "src.models.content",
+        "ContentType": "src.models.content",
+        "Route": "src.models.route",
+        "RoutePoint": "src.models.route",
+        "UserProfile": "src.models.user_profile",
+    },
+)
 
 __all__ = [
     "ContentResult",
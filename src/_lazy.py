@@ -0,0 +1,59 @@
+"""
+Lazy package namespaces (PEP 562).
+
+A package's __init__ maps its public names to the modules that define
+them; a name is imported on first attribute access and then cached in
+the package namespace, so later lookups are plain dict hits.
+
+Example:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        attributes={"SmartAgentQueue": "src.core.smart_queue"},
+        submodules=("di", "plugins"),
+    )
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    attributes: Mapping[str, str] | None = None,
+    submodules: Iterable[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ for a package.
+
+    Args:
+        package: The package's __name__
+        attributes: Public name -> module defining it (absolute, or
+            relative to the package with a leading ".")
+        submodules: Submodule names exposed as attributes
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package's __init__
+    """
+    attributes = dict(attributes or {})
+    submodules = frozenset(submodules)
+    namespace = sys.modules[package].__dict__
+
+    def module_getattr(name: str) -> Any:
+        if name in submodules:
+            value = importlib.import_module(f"{package}.{name}")
+        elif name in attributes:
+            module = importlib.import_module(attributes[name], package)
+            value = getattr(module, name)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        namespace[name] = value
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted(set(namespace) | set(attributes) | submodules)
+
+    return module_getattr, module_dir
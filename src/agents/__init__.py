@@ -8,10 +8,27 @@ Contains specialized agents for finding content:
 - JudgeAgent: Evaluates and selects best content
 """
 
-from src.agents.base_agent import BaseAgent
-from src.agents.judge_agent import JudgeAgent
-from src.agents.music_agent import MusicAgent
-from src.agents.text_agent import TextAgent
-from src.agents.video_agent import VideoAgent
+from typing import TYPE_CHECKING
+
+from src._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.agents.base_agent import BaseAgent
+    from src.agents.judge_agent import JudgeAgent
+    from src.agents.music_agent import MusicAgent
+    from src.agents.text_agent import TextAgent
+    from src.agents.video_agent import VideoAgent
+
+# Exports are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseAgent": "src.agents.base_agent",
+        "JudgeAgent": "src.agents.judge_agent",
+        "MusicAgent": "src.agents.music_agent",
+        "TextAgent": "src.agents.text_agent",
+        "VideoAgent": "src.agents.video_agent",
+    },
+)
 
 __all__ = ["BaseAgent", "VideoAgent", "MusicAgent", "TextAgent", "JudgeAgent"]
@@ -5,12 +5,16 @@ Provides common functionality for LLM interaction and logging.
 
 import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import closing
 from datetime import datetime
 from typing import Any
 
-import anthropic
-from openai import OpenAI
-
+from src.agents.prompt_builder import estimate_tokens
+from src.core.observability.timing import timed, timed_stage
+from src.core.observability.tracing import PIPELINE_TRACER, get_tracer, trace
+from src.core.transport import get_transports
+from src.cost_analysis.tracker import get_cost_tracker
 from src.models.content import ContentResult, ContentType
 from src.models.route import RoutePoint
 from src.utils import AGENT_SKILLS
@@ -30,6 +34,12 @@ class BaseAgent(ABC):
     - Standard interface for content search
     """
 
+    # Completion budgets (tokens) per prompt kind; every prompt asks for a
+    # short, structured answer, so a budget only bounds a runaway response
+    QUERY_MAX_TOKENS = 96
+    SELECTION_MAX_TOKENS = 128
+    SCORE_MAX_TOKENS = 8
+
     def __init__(self, agent_type: str):
         """
         Initialize the agent.
@@ -49,17 +59,35 @@ class BaseAgent(ABC):
         # Track execution
         self.current_point_id: str | None = None
         self.thread_name: str | None = None
+        # When set, LLM usage is split across these points instead
+        self.usage_point_ids: tuple[str, ...] = ()
 
     def _init_llm_client(self):
         """Initialize the appropriate LLM client. Prioritizes Claude/Anthropic."""
+        # SDKs are imported only for the configured provider; each costs
+        # hundreds of milliseconds of startup
         # Priority 1: Anthropic/Claude (preferred)
         if settings.anthropic_api_key:
-            self.llm_client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+            import anthropic
+
+            self.llm_client = anthropic.Anthropic(
+                api_key=settings.anthropic_api_key,
+                http_client=get_transports().httpx_client(
+                    "anthropic", anthropic.DefaultHttpxClient
+                ),
+            )
             self.llm_type = "anthropic"
             logger.info(f"{self.name}: Using Claude (Anthropic)")
         # Priority 2: OpenAI (fallback)
         elif settings.openai_api_key:
-            self.llm_client = OpenAI(api_key=settings.openai_api_key)
+            import openai
+
+            self.llm_client = openai.OpenAI(
+                api_key=settings.openai_api_key,
+                http_client=get_transports().httpx_client(
+                    "openai", openai.DefaultHttpxClient
+                ),
+            )
             self.llm_type = "openai"
             logger.info(f"{self.name}: Using GPT (OpenAI)")
         # Priority 3: No API key - use mock responses
@@ -70,17 +98,89 @@ class BaseAgent(ABC):
                 f"{self.name}: No LLM API key configured - using mock responses"
             )
 
-    def _call_llm(self, prompt: str, system_prompt: str | None = None) -> str:
+    def _call_llm(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        max_tokens: int | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> str:
         """
         Call the LLM with the given prompt.
 
         Args:
             prompt: User prompt
             system_prompt: Optional system prompt
+            max_tokens: Completion budget (defaults to LLM_MAX_TOKENS)
+            stop_when: Predicate on the text received so far; when given, the
+                response is streamed and returned as soon as it holds
 
         Returns:
             LLM response text
         """
+        if stop_when is not None and self._can_stream():
+            text = ""
+            with closing(self._stream_llm(prompt, system_prompt, max_tokens)) as chunks:
+                for chunk in chunks:
+                    text += chunk
+                    if stop_when(text):
+                        break
+            return text
+
+        with get_tracer(PIPELINE_TRACER).span("llm.call") as span, timed_stage("llm"):
+            span.set_attribute("agent.type", self.agent_type)
+            span.set_attribute("llm.provider", self.llm_type or "mock")
+            response = self._call_llm_provider(
+                prompt, system_prompt, max_tokens or settings.llm_max_tokens
+            )
+        if self.llm_client is not None:
+            self._record_llm_usage(prompt, system_prompt, response)
+        return response
+
+    def _record_llm_usage(
+        self, prompt: str, system_prompt: str | None, response: str
+    ) -> None:
+        """Report the estimated tokens of a provider call to the cost tracker."""
+        system_prompt = system_prompt or self._get_system_prompt()
+        input_tokens = estimate_tokens(system_prompt) + estimate_tokens(prompt)
+        output_tokens = estimate_tokens(response)
+
+        point_ids = self.usage_point_ids or (self.current_point_id,)
+        tracker = get_cost_tracker()
+        for point_id in point_ids:
+            tracker.record_llm_usage(
+                input_tokens=input_tokens // len(point_ids),
+                output_tokens=output_tokens // len(point_ids),
+                agent_type=self.agent_type,
+                point_id=point_id,
+            )
+
+    def _can_stream(self) -> bool:
+        return self.llm_client is not None and settings.llm_streaming
+
+    def _anthropic_model(self) -> str:
+        if "claude" in settings.llm_model:
+            return settings.llm_model
+        return "claude-3-haiku-20240307"
+
+    def _openai_messages(
+        self, prompt: str, system_prompt: str | None
+    ) -> list[dict[str, str]]:
+        messages = []
+        if system_prompt or self._get_system_prompt():
+            messages.append(
+                {
+                    "role": "system",
+                    "content": system_prompt or self._get_system_prompt(),
+                }
+            )
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _call_llm_provider(
+        self, prompt: str, system_prompt: str | None, max_tokens: int
+    ) -> str:
+        """Send the prompt to the configured provider (mock if none)."""
         if not self.llm_client:
             return self._mock_llm_response(prompt)
 
@@ -88,29 +188,18 @@ class BaseAgent(ABC):
             if self.llm_type == "anthropic":
                 messages = [{"role": "user", "content": prompt}]
                 response = self.llm_client.messages.create(
-                    model=settings.llm_model
-                    if "claude" in settings.llm_model
-                    else "claude-3-haiku-20240307",
-                    max_tokens=1024,
+                    model=self._anthropic_model(),
+                    max_tokens=max_tokens,
                     system=system_prompt or self._get_system_prompt(),
                     messages=messages,
                 )
                 return str(response.content[0].text)
             else:  # OpenAI
-                messages = []
-                if system_prompt or self._get_system_prompt():
-                    messages.append(
-                        {
-                            "role": "system",
-                            "content": system_prompt or self._get_system_prompt(),
-                        }
-                    )
-                messages.append({"role": "user", "content": prompt})
-
                 response = self.llm_client.chat.completions.create(
                     model=settings.llm_model,
-                    messages=messages,
+                    messages=self._openai_messages(prompt, system_prompt),
                     temperature=settings.llm_temperature,
+                    max_tokens=max_tokens,
                 )
                 return str(response.choices[0].message.content or "")
 
@@ -118,6 +207,134 @@ class BaseAgent(ABC):
             logger.error(f"{self.name}: LLM call failed - {e}")
             return self._mock_llm_response(prompt)
 
+    def _stream_llm(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """
+        Yield the response text as it is generated.
+
+        Closing the iterator early cancels the request. In mock mode, or
+        with LLM_STREAMING off, the whole _call_llm response is one chunk.
+        """
+        if not self._can_stream():
+            yield self._call_llm(prompt, system_prompt, max_tokens)
+            return
+
+        # Not made current: the caller's own spans (e.g. searches started
+        # from early lines) are siblings of the stream, not children
+        span = get_tracer(PIPELINE_TRACER).span("llm.stream", activate=False)
+        span.set_attribute("agent.type", self.agent_type)
+        span.set_attribute("llm.provider", self.llm_type or "mock")
+        received: list[str] = []
+        try:
+            with timed_stage("llm"):
+                try:
+                    for chunk in self._stream_llm_provider(
+                        prompt, system_prompt, max_tokens or settings.llm_max_tokens
+                    ):
+                        received.append(chunk)
+                        yield chunk
+                except Exception as e:
+                    logger.error(f"{self.name}: LLM stream failed - {e}")
+                    span.record_exception(e)
+                    if not received:
+                        yield self._mock_llm_response(prompt)
+        finally:
+            span.set_attribute("llm.chunks", len(received))
+            span.end()
+            self._record_llm_usage(prompt, system_prompt, "".join(received))
+
+    def _stream_llm_provider(
+        self, prompt: str, system_prompt: str | None, max_tokens: int
+    ) -> Iterator[str]:
+        """Stream text deltas from the configured provider."""
+        if self.llm_type == "anthropic":
+            with self.llm_client.messages.stream(
+                model=self._anthropic_model(),
+                max_tokens=max_tokens,
+                system=system_prompt or self._get_system_prompt(),
+                messages=[{"role": "user", "content": prompt}],
+            ) as stream:
+                yield from stream.text_stream
+        else:  # OpenAI
+            stream = self.llm_client.chat.completions.create(
+                model=settings.llm_model,
+                messages=self._openai_messages(prompt, system_prompt),
+                temperature=settings.llm_temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+            try:
+                for event in stream:
+                    if event.choices and event.choices[0].delta.content:
+                        yield event.choices[0].delta.content
+            finally:
+                stream.close()
+
+    def _stream_llm_lines(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """Yield each non-empty response line, stripped, once it is complete."""
+        pending = ""
+        with closing(self._stream_llm(prompt, system_prompt, max_tokens)) as chunks:
+            for chunk in chunks:
+                *lines, pending = (pending + chunk).split("\n")
+                for line in lines:
+                    if line.strip():
+                        yield line.strip()
+        if pending.strip():
+            yield pending.strip()
+
+    def _stream_queries(
+        self,
+        prompt: str,
+        empty: Sequence[str],
+        failed: Sequence[str],
+        limit: int = 3,
+    ) -> Iterator[str]:
+        """
+        Yield up to `limit` search queries, one per response line, as the
+        LLM writes them, so the first search can start before the rest.
+
+        Args:
+            prompt: Prompt asking for one query per line
+            empty: Queries used when the response has none
+            failed: Queries used when the LLM call fails before any query
+            limit: Most queries to yield (the stream is cancelled after)
+        """
+        # A stage of its own on the critical path; not made current, so the
+        # searches started from early queries are its siblings
+        span = get_tracer(PIPELINE_TRACER).span(
+            "agent.generate_queries", activate=False
+        )
+        span.set_attribute("agent.type", self.agent_type)
+        produced = 0
+        try:
+            try:
+                for query in self._stream_llm_lines(
+                    prompt, max_tokens=self.QUERY_MAX_TOKENS
+                ):
+                    produced += 1
+                    yield query
+                    if produced >= limit:
+                        return
+            except Exception as e:
+                span.record_exception(e)
+                if not produced:
+                    yield from failed
+                return
+            if not produced:
+                yield from empty
+        finally:
+            span.set_attribute("agent.queries", produced)
+            span.end()
+
     def _mock_llm_response(self, prompt: str) -> str:
         """Provide a mock response when LLM is unavailable."""
         return f"Mock response for: {prompt[:100]}..."
@@ -146,22 +363,31 @@ Respond in a structured format that can be easily parsed."""
         self.current_point_id = point.id
         self.thread_name = threading.current_thread().name
 
-        logger.info(f"[{self.agent_type}] Starting search for: {point.address}")
+        logger.info("[%s] Starting search for: %s", self.agent_type, point.address)
 
         start_time = datetime.now()
 
+        with get_tracer(PIPELINE_TRACER).span("agent.execute") as span:
+            span.set_attribute("agent.type", self.agent_type)
+            span.set_attribute("point.id", point.id)
+            return self._execute_search(point, start_time)
+
+    def _execute_search(
+        self, point: RoutePoint, start_time: datetime
+    ) -> ContentResult | None:
+        """Run _search_content with logging; failures return None."""
         try:
             result = self._search_content(point)
 
             if result:
                 duration = (datetime.now() - start_time).total_seconds()
                 logger.info(
-                    f"[{self.agent_type}] Found: {result.title} ({duration:.2f}s)"
+                    "[%s] Found: %s (%.2fs)", self.agent_type, result.title, duration
                 )
                 return result
             else:
                 logger.warning(
-                    f"[{self.agent_type}] No content found for {point.address}"
+                    "[%s] No content found for %s", self.agent_type, point.address
                 )
                 return None
 
@@ -188,6 +414,8 @@ Respond in a structured format that can be easily parsed."""
         """Return the type of content this agent provides."""
         pass
 
+    @trace("agent.score_candidate", tracer_name=PIPELINE_TRACER)
+    @timed("scoring")
     def _calculate_relevance_score(
         self, content: dict[str, Any], location: str
     ) -> float:
@@ -218,7 +446,7 @@ Consider:
 Respond with ONLY a number between 0 and 10 (can include decimals)."""
 
         try:
-            response = self._call_llm(prompt)
+            response = self._call_llm(prompt, max_tokens=self.SCORE_MAX_TOKENS)
             # Extract number from response
             import re
 
@@ -6,6 +6,7 @@ Production-grade base agent with:
 - Lifecycle hooks (pre/post execute, on_error, on_success)
 - Event emission for observability
 - Resilience patterns (retry, circuit breaker, timeout)
+- Stale-while-revalidate last-good content cache (shared per agent type)
 - Metrics collection
 - Distributed tracing
 - Configuration validation
@@ -42,6 +43,7 @@ import threading
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import (
@@ -69,9 +71,11 @@ from src.core.resilience import (
     CircuitBreakerOpen,
     RetryPolicy,
     TimeoutError,
+    get_retry_budget,
     with_retry,
     with_timeout,
 )
+from src.core.resilience.stale_cache import DiskStore, StaleWhileRevalidateCache
 
 # Model imports
 from src.models import ContentResult, ContentType, RoutePoint
@@ -169,6 +173,9 @@ class AgentConfig(BaseModel):
     circuit_breaker_threshold: int = 5
     circuit_breaker_reset_timeout: float = 60.0
     cache_ttl_seconds: int = 3600
+    cache_stale_after_seconds: int = 300
+    cache_max_entries: int = 1024
+    cache_dir: str | None = None  # Persist last-good content when set
     log_level: str = "INFO"
 
     # LLM settings (if applicable)
@@ -193,6 +200,63 @@ agent_execution_duration = Histogram(
 )
 
 
+# ============== Shared Content Caches ==============
+
+# Agents are created per point, so content caches live at module level,
+# one per agent type and cache configuration, and share one refresh pool
+_content_caches: dict[tuple[Any, ...], StaleWhileRevalidateCache[ContentResult]] = {}
+_content_caches_lock = threading.Lock()
+_refresh_executor: ThreadPoolExecutor | None = None
+
+
+def get_content_cache(
+    name: str, config: BaseModel
+) -> StaleWhileRevalidateCache[ContentResult]:
+    """Get or create the shared content cache for an agent type and config."""
+    global _refresh_executor
+    cache_dir = getattr(config, "cache_dir", None)
+    ttl = getattr(config, "cache_ttl_seconds", 3600)
+    stale_after = min(getattr(config, "cache_stale_after_seconds", 300), ttl)
+    max_entries = getattr(config, "cache_max_entries", 1024)
+    key = (name, cache_dir, ttl, stale_after, max_entries)
+
+    with _content_caches_lock:
+        cache = _content_caches.get(key)
+        if cache is None:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="SWR-agents"
+                )
+            disk_store = (
+                DiskStore(
+                    directory=f"{cache_dir}/{name}",
+                    serializer=lambda r: r.model_dump(mode="json"),
+                    deserializer=ContentResult.model_validate,
+                )
+                if cache_dir
+                else None
+            )
+            cache = _content_caches[key] = StaleWhileRevalidateCache(
+                name=name,
+                stale_after_seconds=stale_after,
+                ttl_seconds=ttl,
+                max_entries=max_entries,
+                disk_store=disk_store,
+                executor=_refresh_executor,
+            )
+        return cache
+
+
+def shutdown_content_caches() -> None:
+    """Stop the shared refresh pool and drop every content cache."""
+    global _refresh_executor
+    with _content_caches_lock:
+        executor, _refresh_executor = _refresh_executor, None
+        _content_caches.clear()
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
 # ============== Enhanced Base Agent ==============
 
 
@@ -272,7 +336,7 @@ class EnhancedBaseAgent(ABC, Generic[TConfig]):
             reset_timeout=cb_reset_timeout,
         )
 
-        # Initialize retry policy
+        # Initialize retry policy (draws from the process-wide retry budget)
         max_retries = getattr(config, "max_retries", 3)
         backoff_factor = getattr(config, "retry_backoff_factor", 2.0)
         self._retry_policy = RetryPolicy(
@@ -280,8 +344,13 @@ class EnhancedBaseAgent(ABC, Generic[TConfig]):
             backoff_factor=backoff_factor,
             initial_delay=1.0,
             max_delay=30.0,
+            retry_budget=get_retry_budget(),
+            upstream=self.name,
         )
 
+        # Last-good content per location (shared by agents of this type)
+        self._content_cache = self._create_content_cache()
+
         # Lifecycle hooks
         self._pre_execute_hooks: list[Callable] = []
         self._post_execute_hooks: list[Callable] = []
@@ -344,6 +413,7 @@ class EnhancedBaseAgent(ABC, Generic[TConfig]):
                 else 0.0
             ),
             "circuit_breaker": self._circuit_breaker.get_stats(),
+            "content_cache": self._content_cache.get_stats(),
         }
 
     # ==================== Main Execution ====================
@@ -380,7 +450,7 @@ class EnhancedBaseAgent(ABC, Generic[TConfig]):
 
             # Emit start event
             publish(
-                AgentExecutionStarted(
+                AgentExecutionStarted.create(
                     source=self.name,
                     agent_name=self.name,
                     agent_type=self.__class__.__name__,
@@ -396,8 +466,8 @@ class EnhancedBaseAgent(ABC, Generic[TConfig]):
                 # Run pre-execute hooks
                 self._run_pre_execute_hooks(point)
 
-                # Execute with resilience
-                result = self._execute_with_resilience(point)
+                # Execute with resilience (cache-first for CACHEABLE agents)
+                result = self._execute_cached(point)
 
                 # Record success
                 duration = time.time() - start_time
@@ -416,7 +486,7 @@ class EnhancedBaseAgent(ABC, Generic[TConfig]):
 
                 # Emit completion event
                 publish(
-                    AgentExecutionCompleted(
+                    AgentExecutionCompleted.create(
                         source=self.name,
                         agent_name=self.name,
                         agent_type=self.__class__.__name__,
@@ -434,20 +504,17 @@ class EnhancedBaseAgent(ABC, Generic[TConfig]):
 
             except CircuitBreakerOpen as e:
                 logger.warning(f"Circuit breaker open for {self.name}")
-                self._handle_failure(point, e, start_time)
-                return None
+                return self._handle_failure(point, e, start_time)
 
             except TimeoutError as e:
                 logger.warning(f"Timeout in {self.name}: {e}")
                 with self._lock:
                     self._state = AgentState.TIMEOUT
-                self._handle_failure(point, e, start_time)
-                return None
+                return self._handle_failure(point, e, start_time)
 
             except Exception as e:
                 logger.error(f"Error in {self.name}: {e}")
-                self._handle_failure(point, e, start_time)
-                return None
+                return self._handle_failure(point, e, start_time)
 
     def _execute_with_resilience(
         self,
@@ -466,13 +533,69 @@ class EnhancedBaseAgent(ABC, Generic[TConfig]):
         result = with_retry(_inner, self._retry_policy)
         return result  # type: ignore[no-any-return]
 
+    # ==================== Content Cache ====================
+
+    def _create_content_cache(self) -> StaleWhileRevalidateCache[ContentResult]:
+        """The last-good content cache shared by agents of this type."""
+        return get_content_cache(self.name, self._config)
+
+    def _cache_key(self, point: RoutePoint) -> str:
+        """
+        Cache key for a location.
+
+        Coordinates are rounded to ~10 m so the same place on different
+        routes shares an entry. Override for agents whose content depends
+        on more than the location.
+        """
+        return f"{point.latitude:.4f},{point.longitude:.4f}"
+
+    def _execute_cached(self, point: RoutePoint) -> ContentResult | None:
+        """Execute through the content cache."""
+        key = self._cache_key(point)
+        metadata = getattr(self.__class__, "metadata", None)
+
+        if metadata and AgentCapability.CACHEABLE in metadata.capabilities:
+            result = self._content_cache.get_or_load(
+                key, lambda: self._execute_with_resilience(point)
+            )
+            if result is not None and result.point_id != point.id:
+                result = result.model_copy(update={"point_id": point.id})
+            return result
+
+        result = self._execute_with_resilience(point)
+        if result is not None:
+            self._content_cache.put(key, result)
+        return result
+
+    def _cached_fallback(self, point: RoutePoint) -> ContentResult | None:
+        """Last-good content for the point's location, if any."""
+        entry = self._content_cache.get(self._cache_key(point))
+        if entry is None:
+            return None
+
+        return entry.value.model_copy(
+            update={
+                "point_id": point.id,
+                "metadata": {
+                    **entry.value.metadata,
+                    "served_from_cache": True,
+                    "cache_age_seconds": round(entry.age_seconds, 1),
+                },
+            }
+        )
+
     def _handle_failure(
         self,
         point: RoutePoint,
         error: Exception,
         start_time: float,
-    ) -> None:
-        """Handle execution failure."""
+    ) -> ContentResult | None:
+        """
+        Handle execution failure.
+
+        Returns the last-good cached content for the location so degraded
+        points still get real content, or None if nothing is cached.
+        """
         time.time() - start_time
         self._failure_count += 1
 
@@ -488,7 +611,7 @@ class EnhancedBaseAgent(ABC, Generic[TConfig]):
 
         # Emit failure event
         publish(
-            AgentExecutionFailed(
+            AgentExecutionFailed.create(
                 source=self.name,
                 agent_name=self.name,
                 agent_type=self.__class__.__name__,
@@ -498,6 +621,12 @@ class EnhancedBaseAgent(ABC, Generic[TConfig]):
             )
         )
 
+        cached = self._cached_fallback(point)
+        if cached is not None:
+            logger.info(f"{self.name}: serving cached content for {point.id}")
+            agent_executions.inc(agent_type=self.name, status="cached_fallback")
+        return cached
+
     # ==================== Hook Management ====================
 
     def add_pre_execute_hook(self, hook: Callable[[RoutePoint], None]) -> None:
@@ -12,21 +12,229 @@ Decision Logic:
 - 1 agent → Simple decision, use the available content
 
 The Judge WAITS for the Smart Queue to provide results (with timeout mechanism).
+
+Tiered evaluation (2-3 candidates): a deterministic rule scorer
+(relevance x profile weight + location/audience priors) decides on its own
+when its winner leads by at least `fast_margin` points; only close calls
+are escalated to the LLM judge. Escalations also record whether the LLM
+agreed with the rule scorer.
+
+LLM prompts are split in two: the role, criteria and user profile go into
+a system prompt built once per profile, and each call only sends the
+location and one compact line per candidate. Both are fitted into
+LLM_INPUT_BUDGET_TOKENS.
 """
 
+import functools
+import random
 import re
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from typing import Any, cast
 
 from src.agents.base_agent import BaseAgent
+from src.agents.prompt_builder import (
+    BuiltPrompt,
+    PromptBuilder,
+    clip,
+    encode_candidates,
+)
+from src.core.observability.metrics import Counter
+from src.core.observability.tracing import PIPELINE_TRACER, trace
 from src.models.content import ContentResult, ContentType
 from src.models.decision import JudgeDecision
 from src.models.route import RoutePoint
 from src.models.user_profile import AgeGroup, UserProfile
 from src.utils import AGENT_SKILLS
+from src.utils.config import settings
 from src.utils.logger import get_logger, log_judge_decision
 
 logger = get_logger(__name__)
 
+# The judge formats end with the verdict; generation can stop once it is in
+_VERDICT = re.compile(r"WINNER:\s*\d+.*?WINNER_SCORE:\s*[\d.]+\s", re.DOTALL)
+
+
+def _verdict_complete(text: str) -> bool:
+    return _VERDICT.search(text) is not None
+
+
+# Location keywords that favour a content type (rule scorer priors)
+_HISTORIC_PLACES = ("museum", "memorial", "ancient", "old")
+_SCENIC_PLACES = ("view", "park", "beach", "mountain")
+_CULTURAL_PLACES = ("theatre", "concert", "festival")
+
+
+# =============================================================================
+# Tier Metrics (process-wide: a JudgeAgent is created per point)
+# =============================================================================
+
+judge_decisions_total = Counter(
+    "judge_decisions_total",
+    "Multi-candidate judge decisions by tier (rule or llm)",
+    labels=["tier"],
+)
+
+judge_llm_agreement_total = Counter(
+    "judge_llm_agreement_total",
+    "LLM judge decisions compared with the rule scorer's pick",
+    labels=["agreed"],
+)
+
+judge_llm_seconds_total = Counter(
+    "judge_llm_seconds_total",
+    "Time spent in LLM judge evaluations",
+)
+
+judge_batch_calls_total = Counter(
+    "judge_batch_calls_total",
+    "LLM judge calls that evaluated several points at once",
+)
+
+judge_batch_fallbacks_total = Counter(
+    "judge_batch_fallbacks_total",
+    "Points re-evaluated alone after a missing or malformed batch verdict",
+)
+
+judge_prompt_tokens_total = Counter(
+    "judge_prompt_tokens_total",
+    "Estimated input tokens (system + user prompt) sent to the LLM judge",
+)
+
+judge_latency_saved_seconds_total = Counter(
+    "judge_latency_saved_seconds_total",
+    "Estimated LLM judge time avoided by rule decisions",
+)
+
+_shadow_lock = threading.Lock()
+_shadow_random = random.Random()
+
+
+def _mean_llm_seconds() -> float:
+    llm_decisions = judge_decisions_total.get(tier="llm")
+    if not llm_decisions:
+        return 0.0
+    return judge_llm_seconds_total.get() / llm_decisions
+
+
+def get_judge_stats() -> dict[str, Any]:
+    """Get tiered-judge statistics (escalation and agreement rates)."""
+    rule = judge_decisions_total.get(tier="rule")
+    llm = judge_decisions_total.get(tier="llm")
+    agreed = judge_llm_agreement_total.get(agreed="true")
+    compared = agreed + judge_llm_agreement_total.get(agreed="false")
+    return {
+        "rule_decisions": int(rule),
+        "llm_decisions": int(llm),
+        "escalation_rate": round(llm / (rule + llm), 4) if rule + llm else 0.0,
+        "agreement_rate": round(agreed / compared, 4) if compared else None,
+        "llm_mean_ms": round(_mean_llm_seconds() * 1000, 3),
+        "latency_saved_seconds": round(judge_latency_saved_seconds_total.get(), 3),
+        "batch_calls": int(judge_batch_calls_total.get()),
+        "batch_fallbacks": int(judge_batch_fallbacks_total.get()),
+        "prompt_tokens_per_llm_decision": round(
+            judge_prompt_tokens_total.get() / llm, 1
+        )
+        if llm
+        else 0.0,
+    }
+
+
+# =============================================================================
+# Prompts
+# =============================================================================
+
+_ROLE = (
+    "You are an expert tour guide content curator. For each request, pick "
+    "the content option that best suits THIS user at the given location: "
+    "weigh relevance to the place, fit with the user's age group and "
+    "preferences, and appropriateness for everyone in the group. Options "
+    "are listed as: number. TYPE initial-score | title | description. "
+    "Answer exactly in the requested format."
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _system_prompt(
+    agent_context: str,
+    judge_criteria: str,
+    system_criteria: tuple[str, ...],
+    budget_tokens: int,
+) -> BuiltPrompt:
+    """The judge's per-profile system prompt (shared by every call)."""
+    profile = f"USER PROFILE:\n{agent_context}"
+    criteria = f"USER CRITERIA:\n{judge_criteria}"
+    builder = PromptBuilder(budget_tokens)
+    builder.add("role", _ROLE, priority=3, required=True)
+    builder.add(
+        "profile",
+        profile,
+        priority=2,
+        fallbacks=[clip(profile, 240)],
+    )
+    builder.add(
+        "criteria",
+        criteria,
+        priority=2,
+        fallbacks=[clip(criteria, 200)],
+    )
+    builder.add(
+        "system_criteria",
+        "ALSO CONSIDER:\n" + "\n".join(f"- {c}" for c in system_criteria),
+        priority=1,
+    )
+    return builder.build()
+
+
+_TWO_OPTIONS_TASK = """Compare the 2 options (one agent didn't respond in time) and select the best one for this user here.
+
+SCORES:
+- Option 1: [score 0-10]
+- Option 2: [score 0-10]
+
+REASONING: [2-3 sentences explaining why this content is best for THIS user]
+WINNER: [1 or 2]
+WINNER_SCORE: [final score 0-10]"""
+
+_OPTIONS_TASK = """Score each option (0-10) for relevance to this place AND fit with this user, then select the single best one.
+
+SCORES:
+- Video: [score 0-10]
+- Music: [score 0-10]
+- Text: [score 0-10]
+
+REASONING: [2-3 sentences explaining why this content is the best choice for THIS USER at this location]
+WINNER: [number 1-{count}]
+WINNER_SCORE: [final score 0-10]"""
+
+_BATCH_TASK = """For EACH point, select the best option for THIS user at that location. Judge every point on its own; do not balance content types across points.
+
+Answer with one block per point, in order:
+POINT 1:
+WINNER: [option number]
+WINNER_SCORE: [final score 0-10]
+REASONING: [1-2 sentences explaining why this content is best for THIS user]
+
+POINT 2:
+..."""
+
+
+def _options(candidates: Sequence[ContentResult], description_chars: int = 80) -> str:
+    return f"Options:\n{encode_candidates(candidates, description_chars)}"
+
+
+@dataclass(frozen=True)
+class Escalation:
+    """A point the screen and rule tier left to the LLM judge."""
+
+    point: RoutePoint
+    # Candidates left after screening (prohibited content types removed)
+    candidates: list[ContentResult]
+    # The rule scorer's pick, for agreement tracking
+    rule_winner: int
+
 
 class JudgeAgent(BaseAgent):
     """
@@ -39,10 +247,46 @@ class JudgeAgent(BaseAgent):
     - Content type appropriateness
     """
 
-    def __init__(self, user_profile: UserProfile | None = None):
+    # Scores, 2-3 sentences of reasoning and the verdict
+    VERDICT_MAX_TOKENS = 320
+    # One WINNER/WINNER_SCORE/REASONING block per batched point
+    BATCH_MAX_TOKENS_PER_POINT = 120
+    # Input budget added per point after the first in a batched prompt
+    BATCH_INPUT_TOKENS_PER_POINT = 120
+
+    def __init__(
+        self,
+        user_profile: UserProfile | None = None,
+        fast_margin: float | None = None,
+        shadow_rate: float | None = None,
+        batch_size: int | None = None,
+        input_budget_tokens: int | None = None,
+    ):
+        """
+        Args:
+            user_profile: Default profile for evaluations
+            fast_margin: Rule-score lead (0-10 scale) needed to skip the LLM;
+                None uses JUDGE_FAST_MARGIN, a negative value always escalates
+            shadow_rate: Fraction of rule decisions also sent to the LLM to
+                measure agreement (the rule decision is kept)
+            batch_size: Most points sent to the LLM in one evaluate_batch call;
+                None uses JUDGE_BATCH_SIZE
+            input_budget_tokens: Estimated input tokens (system + user prompt)
+                per single-point LLM call; None uses LLM_INPUT_BUDGET_TOKENS
+        """
         super().__init__("judge")
         self.evaluation_criteria = AGENT_SKILLS["judge_agent"]["scoring_criteria"]
         self.user_profile = user_profile or UserProfile()
+        self.fast_margin = (
+            settings.judge_fast_margin if fast_margin is None else fast_margin
+        )
+        self.shadow_rate = (
+            settings.judge_shadow_rate if shadow_rate is None else shadow_rate
+        )
+        self.batch_size = batch_size or settings.judge_batch_size
+        self.input_budget_tokens = (
+            input_budget_tokens or settings.llm_input_budget_tokens
+        )
 
     def get_content_type(self) -> ContentType:
         """Judge doesn't produce content, but returns the selected type."""
@@ -55,6 +299,7 @@ class JudgeAgent(BaseAgent):
         """
         return None
 
+    @trace("judge.evaluate", tracer_name=PIPELINE_TRACER)
     def evaluate(
         self,
         point: RoutePoint,
@@ -83,6 +328,133 @@ class JudgeAgent(BaseAgent):
         # Use provided profile or fall back to instance profile
         profile = user_profile or self.user_profile
 
+        candidates, decision = self._screen(point, candidates, profile)
+        if decision is not None:
+            return decision
+
+        # ═══════════════════════════════════════════════════════════════════
+        # CASES 2-3: Rule scorer first; LLM only for close calls
+        # ═══════════════════════════════════════════════════════════════════
+        evaluation = self._evaluate_tiered(point, candidates, profile)
+        return self._decide(point, candidates, evaluation)
+
+    def evaluate_batch(
+        self,
+        items: Sequence[tuple[RoutePoint, list[ContentResult]]],
+        user_profile: UserProfile | None = None,
+    ) -> list[JudgeDecision]:
+        """
+        Evaluate several points for the same user profile.
+
+        Every point is screened and rule-scored exactly as in evaluate();
+        the close calls left over are sent to the LLM together (see
+        evaluate_escalated).
+
+        Args:
+            items: (point, candidates) pairs
+            user_profile: Optional user profile to override instance profile
+
+        Returns:
+            One JudgeDecision per item, in input order
+        """
+        if any(not candidates for _, candidates in items):
+            raise ValueError("No candidates to evaluate")
+
+        decisions: list[JudgeDecision | None] = [None] * len(items)
+        escalated: list[int] = []
+        escalations: list[Escalation] = []
+        for i, (point, candidates) in enumerate(items):
+            outcome = self.triage(point, candidates, user_profile)
+            if isinstance(outcome, Escalation):
+                escalated.append(i)
+                escalations.append(outcome)
+            else:
+                decisions[i] = outcome
+
+        verdicts = self.evaluate_escalated(escalations, user_profile)
+        for i, decision in zip(escalated, verdicts, strict=True):
+            decisions[i] = decision
+        return cast(list[JudgeDecision], decisions)
+
+    def triage(
+        self,
+        point: RoutePoint,
+        candidates: list[ContentResult],
+        user_profile: UserProfile | None = None,
+    ) -> JudgeDecision | Escalation:
+        """
+        Decide a point without the LLM if the screen or rule tier can.
+
+        Returns the decision evaluate() would make, or the Escalation to
+        pass to evaluate_escalated() when the call is too close.
+        """
+        if not candidates:
+            raise ValueError("No candidates to evaluate")
+
+        profile = user_profile or self.user_profile
+        candidates, decision = self._screen(point, candidates, profile)
+        if decision is not None:
+            return decision
+        evaluation, rule_winner = self._rule_tier(point, candidates, profile)
+        if evaluation is None:
+            return Escalation(point, candidates, rule_winner)
+        return self._decide(point, candidates, evaluation)
+
+    def evaluate_escalated(
+        self,
+        escalations: Sequence[Escalation],
+        user_profile: UserProfile | None = None,
+    ) -> list[JudgeDecision]:
+        """
+        Ask the LLM to decide points triage() escalated.
+
+        Points are sent up to batch_size per call, with the profile stated
+        once. A point whose verdict is missing or malformed in the batched
+        response is re-evaluated on its own.
+
+        Returns:
+            One JudgeDecision per escalation, in input order
+        """
+        profile = user_profile or self.user_profile
+        decisions: list[JudgeDecision] = []
+
+        size = max(self.batch_size, 1)
+        for start in range(0, len(escalations), size):
+            chunk = escalations[start : start + size]
+            batched = len(chunk) > 1
+
+            started = time.perf_counter()
+            evaluations: list[dict[str, Any] | None] = [None] * len(chunk)
+            if batched:
+                evaluations = self._evaluate_batch_with_llm(
+                    [(e.point, e.candidates) for e in chunk], profile
+                )
+                judge_batch_calls_total.inc()
+            shared_seconds = (time.perf_counter() - started) / len(chunk)
+
+            for escalation, evaluation in zip(chunk, evaluations, strict=True):
+                point, candidates = escalation.point, escalation.candidates
+                seconds = shared_seconds
+                if evaluation is None:
+                    if batched:
+                        judge_batch_fallbacks_total.inc()
+                    started = time.perf_counter()
+                    evaluation = self._evaluate_with_llm(point, candidates, profile)
+                    seconds += time.perf_counter() - started
+                self._record_escalation(evaluation, escalation.rule_winner, seconds)
+                decisions.append(self._decide(point, candidates, evaluation))
+
+        return decisions
+
+    def _screen(
+        self, point: RoutePoint, candidates: list[ContentResult], profile: UserProfile
+    ) -> tuple[list[ContentResult], JudgeDecision | None]:
+        """
+        Drop prohibited content types and settle trivial cases.
+
+        Returns the remaining candidates, and a decision if no comparison
+        is needed (nothing safe left, or a single option).
+        """
         # Get content type preferences/weights from user profile
         type_preferences = profile.get_content_type_preferences()
 
@@ -105,7 +477,7 @@ class JudgeAgent(BaseAgent):
                 f"[Judge] All candidates filtered out due to safety constraints "
                 f"(excluded types: {excluded_types})"
             )
-            return JudgeDecision(
+            return candidates, JudgeDecision(
                 point_id=point.id,
                 selected_content=None,  # No safe content available
                 all_candidates=candidates,
@@ -136,7 +508,7 @@ class JudgeAgent(BaseAgent):
                 f"[Judge] Single option available: {candidate.content_type.value}"
             )
 
-            return JudgeDecision(
+            return candidates, JudgeDecision(
                 point_id=point.id,
                 selected_content=candidate,
                 all_candidates=candidates,
@@ -144,18 +516,15 @@ class JudgeAgent(BaseAgent):
                 scores={candidate.content_type: candidate.relevance_score},
             )
 
-        # ═══════════════════════════════════════════════════════════════════
-        # CASE 2: Two candidates → Compare against user profile
-        # ═══════════════════════════════════════════════════════════════════
-        if num_candidates == 2:
-            evaluation = self._evaluate_two_candidates(point, candidates, profile)
-
-        # ═══════════════════════════════════════════════════════════════════
-        # CASE 3: Three candidates → Full comparison with profile
-        # ═══════════════════════════════════════════════════════════════════
-        else:
-            evaluation = self._evaluate_candidates(point, candidates, profile)
+        return candidates, None
 
+    def _decide(
+        self,
+        point: RoutePoint,
+        candidates: list[ContentResult],
+        evaluation: dict[str, Any],
+    ) -> JudgeDecision:
+        """Turn an evaluation (winner index, score, reasoning) into a decision."""
         # Get the winner
         winner_idx = evaluation.get("winner_index", 0)
         if 0 <= winner_idx < len(candidates):
@@ -184,6 +553,148 @@ class JudgeAgent(BaseAgent):
 
         return decision
 
+    def _evaluate_tiered(
+        self, point: RoutePoint, candidates: list[ContentResult], profile: UserProfile
+    ) -> dict[str, Any]:
+        """Decide by rule score when the lead is clear, else ask the LLM."""
+        evaluation, rule_winner = self._rule_tier(point, candidates, profile)
+        if evaluation is not None:
+            return evaluation
+
+        started = time.perf_counter()
+        evaluation = self._evaluate_with_llm(point, candidates, profile)
+        self._record_escalation(evaluation, rule_winner, time.perf_counter() - started)
+        return evaluation
+
+    def _rule_tier(
+        self, point: RoutePoint, candidates: list[ContentResult], profile: UserProfile
+    ) -> tuple[dict[str, Any] | None, int]:
+        """
+        Rule evaluation if the leader is fast_margin ahead, else None.
+
+        Also returns the rule scorer's pick, for agreement tracking.
+        """
+        scores = self.rule_scores(point, candidates, profile)
+        ranked = sorted(range(len(candidates)), key=scores.__getitem__, reverse=True)
+        margin = scores[ranked[0]] - scores[ranked[1]]
+
+        if self.fast_margin < 0 or margin < self.fast_margin:
+            return None, ranked[0]
+
+        judge_decisions_total.inc(tier="rule")
+        judge_latency_saved_seconds_total.inc(_mean_llm_seconds())
+        if self.shadow_rate > 0:
+            with _shadow_lock:
+                shadow = _shadow_random.random() < self.shadow_rate
+            if shadow:
+                self._record_agreement(
+                    self._evaluate_with_llm(point, candidates, profile), ranked[0]
+                )
+        evaluation = self._rule_evaluation(
+            candidates, scores, ranked[0], margin, profile
+        )
+        return evaluation, ranked[0]
+
+    def _record_escalation(
+        self, evaluation: dict[str, Any], rule_winner: int, seconds: float
+    ) -> None:
+        judge_llm_seconds_total.inc(seconds)
+        judge_decisions_total.inc(tier="llm")
+        self._record_agreement(evaluation, rule_winner)
+
+    def _evaluate_with_llm(
+        self, point: RoutePoint, candidates: list[ContentResult], profile: UserProfile
+    ) -> dict[str, Any]:
+        self.current_point_id = point.id
+        if len(candidates) == 2:
+            return self._evaluate_two_candidates(point, candidates, profile)
+        return self._evaluate_candidates(point, candidates, profile)
+
+    @staticmethod
+    def _record_agreement(evaluation: dict[str, Any], rule_winner: int) -> None:
+        agreed = evaluation.get("winner_index", 0) == rule_winner
+        judge_llm_agreement_total.inc(agreed="true" if agreed else "false")
+
+    @staticmethod
+    def _rule_evaluation(
+        candidates: list[ContentResult],
+        scores: list[float],
+        winner: int,
+        margin: float,
+        profile: UserProfile,
+    ) -> dict[str, Any]:
+        best = candidates[winner]
+        return {
+            "winner_index": winner,
+            "winner_score": min(scores[winner], 10.0),
+            "reasoning": (
+                f"Selected {best.content_type.value} by profile-weighted score "
+                f"(lead of {margin:.1f} points for {profile.age_group.value} user)"
+            ),
+            "scores": {
+                c.content_type: round(min(score, 10.0), 2)
+                for c, score in zip(candidates, scores, strict=True)
+            },
+        }
+
+    def rule_scores(
+        self,
+        point: RoutePoint,
+        candidates: list[ContentResult],
+        profile: UserProfile | None = None,
+    ) -> list[float]:
+        """
+        Deterministic score per candidate, uncapped.
+
+        relevance x profile type weight, plus boosts for the location named
+        in the title, content type fitting the kind of place, and titles
+        matching the audience's age group.
+        """
+        profile = profile or self.user_profile
+        location = (point.location_name or point.address).lower()
+        weights = profile.compile().preferences
+        historic = any(word in location for word in _HISTORIC_PLACES)
+        scenic = any(word in location for word in _SCENIC_PLACES)
+        cultural = any(word in location for word in _CULTURAL_PLACES)
+        age_group = profile.age_group
+
+        scores = []
+        for c in candidates:
+            title = c.title.lower()
+
+            # Apply user profile preference multiplier
+            score = c.relevance_score * weights.get(c.content_type.value.lower(), 1.0)
+
+            # Boost for location mention in title
+            if location in title:
+                score += 2.0
+
+            # Boost for historical content at historical sites
+            if historic and (
+                c.metadata.get("is_historical")
+                or c.metadata.get("fact_type") == "historical"
+            ):
+                score += 1.5
+
+            # Slight preference for video at scenic, music at cultural locations
+            if scenic and c.content_type == ContentType.VIDEO:
+                score += 1.0
+            if cultural and c.content_type == ContentType.MUSIC:
+                score += 1.0
+
+            # Age-specific boosts
+            if age_group == AgeGroup.KID:
+                # Kids love animated/fun content
+                if "fun" in title or "kids" in title:
+                    score += 1.5
+            elif age_group == AgeGroup.SENIOR:
+                # Seniors appreciate classic/historical content
+                if "classic" in title or "history" in title:
+                    score += 1.5
+
+            scores.append(score)
+        return scores
+
     def _generate_single_candidate_reasoning(
         self, candidate: ContentResult, profile: UserProfile
     ) -> str:
@@ -206,6 +717,31 @@ class JudgeAgent(BaseAgent):
 
         return f"Only {content_type} content available - {match_quality} for {profile.age_group.value} user"
 
+    def _system_prompt_for(self, profile: UserProfile) -> BuiltPrompt:
+        """System prompt for the profile; built once, shared by every call."""
+        plan = profile.compile()
+        return _system_prompt(
+            plan.agent_context,
+            plan.judge_criteria,
+            tuple(self.evaluation_criteria),
+            self.input_budget_tokens // 2,
+        )
+
+    def _ask(
+        self,
+        system: BuiltPrompt,
+        prompt: BuiltPrompt,
+        max_tokens: int,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> str:
+        judge_prompt_tokens_total.inc(system.tokens + prompt.tokens)
+        return self._call_llm(
+            prompt.text,
+            system_prompt=system.text,
+            max_tokens=max_tokens,
+            stop_when=stop_when,
+        )
+
     def _evaluate_two_candidates(
         self, point: RoutePoint, candidates: list[ContentResult], profile: UserProfile
     ) -> dict[str, Any]:
@@ -214,67 +750,34 @@ class JudgeAgent(BaseAgent):
         Uses user profile to make the decision.
         """
         location = point.location_name or point.address
-
-        # Get user profile preferences
-        type_preferences = profile.get_content_type_preferences()
-        profile_context = profile.to_agent_context()
-        profile_criteria = profile.to_judge_criteria()
-
-        # Build candidate descriptions
-        candidate_descriptions = []
-        for i, c in enumerate(candidates):
-            type_emoji = {
-                ContentType.VIDEO: "🎬",
-                ContentType.MUSIC: "🎵",
-                ContentType.TEXT: "📖",
-            }.get(c.content_type, "📄")
-
-            candidate_descriptions.append(
-                f"{i + 1}. {type_emoji} [{c.content_type.value.upper()}] {c.title}\n"
-                f"   Description: {c.description[:150] if c.description else 'N/A'}...\n"
-                f"   Initial Score: {c.relevance_score:.1f}/10"
+        system = self._system_prompt_for(profile)
+        prompt = (
+            PromptBuilder(self.input_budget_tokens - system.tokens)
+            .add("location", f"Location: {location}", required=True)
+            .add(
+                "candidates",
+                _options(candidates),
+                required=True,
+                fallbacks=[_options(candidates, 40), _options(candidates, 0)],
             )
-
-        candidates_text = "\n\n".join(candidate_descriptions)
-
-        prompt = f"""You are a tour guide content curator selecting content for a specific user.
-
-**Location:** {location}
-
-**User Profile:**
-{profile_context}
-
-**User Criteria:**
-{profile_criteria}
-
-**Available Content (2 options - one agent didn't respond in time):**
-
-{candidates_text}
-
-**Your Task:**
-Compare these 2 content options and select the BEST one for this specific user at this location.
-
-Consider:
-1. Which content type (video/music/text) suits this user's age group and preferences?
-2. Is the content appropriate for the user profile?
-3. Does it enhance the travel experience for THIS specific user?
-
-**Response Format:**
-SCORES:
-- Option 1: [score 0-10]
-- Option 2: [score 0-10]
-
-WINNER: [1 or 2]
-WINNER_SCORE: [final score 0-10]
-REASONING: [2-3 sentences explaining why this content is best for THIS user]"""
+            .add("task", _TWO_OPTIONS_TASK, required=True)
+            .build()
+        )
 
         try:
-            response = self._call_llm(prompt)
+            response = self._ask(
+                system,
+                prompt,
+                max_tokens=self.VERDICT_MAX_TOKENS,
+                stop_when=_verdict_complete,
+            )
             return self._parse_two_candidate_response(response, candidates)
         except Exception as e:
             logger.warning(f"Two-candidate evaluation failed: {e}")
             # Fallback: use profile preferences
-            return self._fallback_two_candidate_selection(candidates, type_preferences)
+            return self._fallback_two_candidate_selection(
+                candidates, profile.compile().preferences
+            )
 
     def _parse_two_candidate_response(
         self, response: str, candidates: list[ContentResult]
@@ -295,7 +798,7 @@ REASONING: [2-3 sentences explaining why this content is best for THIS user]"""
 
             # Parse reasoning
             reasoning_match = re.search(
-                r"REASONING:\s*(.+?)(?=$|\n\n)", response, re.DOTALL
+                r"REASONING:\s*(.+?)(?=\n\s*WINNER|\n\n|$)", response, re.DOTALL
             )
             if reasoning_match:
                 result["reasoning"] = reasoning_match.group(1).strip()
@@ -347,81 +850,29 @@ REASONING: [2-3 sentences explaining why this content is best for THIS user]"""
             Evaluation results dictionary
         """
         location = point.location_name or point.address
-
-        # Get user profile context
-        profile_context = profile.to_agent_context()
-        profile_criteria = profile.to_judge_criteria()
-
-        # Build candidate descriptions
-        candidate_descriptions = []
-        for i, c in enumerate(candidates):
-            type_emoji = {
-                ContentType.VIDEO: "🎬",
-                ContentType.MUSIC: "🎵",
-                ContentType.TEXT: "📖",
-            }.get(c.content_type, "📄")
-
-            candidate_descriptions.append(
-                f"{i + 1}. {type_emoji} [{c.content_type.value.upper()}] {c.title}\n"
-                f"   Source: {c.source}\n"
-                f"   Description: {c.description[:150] if c.description else 'N/A'}...\n"
-                f"   Initial Score: {c.relevance_score:.1f}/10"
+        if point.address and point.address != location:
+            location = f"{location} ({point.address})"
+        system = self._system_prompt_for(profile)
+        prompt = (
+            PromptBuilder(self.input_budget_tokens - system.tokens)
+            .add("location", f"Location: {location}", required=True)
+            .add(
+                "candidates",
+                _options(candidates),
+                required=True,
+                fallbacks=[_options(candidates, 40), _options(candidates, 0)],
             )
-
-        candidates_text = "\n\n".join(candidate_descriptions)
-
-        # Build evaluation criteria text (system + user-specific)
-        system_criteria = "\n".join(f"- {c}" for c in self.evaluation_criteria)
-
-        prompt = f"""You are an expert tour guide content curator selecting the BEST content for a SPECIFIC user.
-
-**Location:** {location}
-**Full Address:** {point.address}
-
-═══════════════════════════════════════════════════════════════════
-USER PROFILE (CRITICAL - Match content to this user!)
-═══════════════════════════════════════════════════════════════════
-{profile_context}
-
-**User-Specific Criteria:**
-{profile_criteria}
-
-═══════════════════════════════════════════════════════════════════
-AVAILABLE CONTENT (All 3 agents responded)
-═══════════════════════════════════════════════════════════════════
-
-{candidates_text}
-
-═══════════════════════════════════════════════════════════════════
-EVALUATION
-═══════════════════════════════════════════════════════════════════
-
-**System Criteria:**
-{system_criteria}
-
-**Your Task:**
-1. Score each content option (0-10) considering BOTH location relevance AND user profile match
-2. Select the BEST single piece of content for THIS SPECIFIC USER at this location
-3. Explain your decision with reference to the user profile
-
-Consider:
-- Is a {profile.age_group.value} user more likely to enjoy video, music, or text?
-- Does the content match the user's stated preferences?
-- Is the content appropriate for the user's demographics?
-- Which content type creates the best experience for THIS user?
-
-**Response Format:**
-SCORES:
-- Video: [score 0-10]
-- Music: [score 0-10]
-- Text: [score 0-10]
-
-WINNER: [number 1-{len(candidates)}]
-WINNER_SCORE: [final score 0-10]
-REASONING: [2-3 sentences explaining why this content is the best choice for THIS USER at this location]"""
+            .add("task", _OPTIONS_TASK.format(count=len(candidates)), required=True)
+            .build()
+        )
 
         try:
-            response = self._call_llm(prompt)
+            response = self._ask(
+                system,
+                prompt,
+                max_tokens=self.VERDICT_MAX_TOKENS,
+                stop_when=_verdict_complete,
+            )
             return self._parse_evaluation_response(response, candidates)
         except Exception as e:
             logger.warning(f"Evaluation failed: {e}")
@@ -475,7 +926,7 @@ REASONING: [2-3 sentences explaining why this content is the best choice for THI
 
             # Parse reasoning
             reasoning_match = re.search(
-                r"REASONING:\s*(.+?)(?=$|\n\n)", response, re.DOTALL
+                r"REASONING:\s*(.+?)(?=\n\s*WINNER|\n\n|$)", response, re.DOTALL
             )
             if reasoning_match:
                 result["reasoning"] = reasoning_match.group(1).strip()
@@ -500,6 +951,97 @@ REASONING: [2-3 sentences explaining why this content is the best choice for THI
 
         return result
 
+    def _evaluate_batch_with_llm(
+        self,
+        items: list[tuple[RoutePoint, list[ContentResult]]],
+        profile: UserProfile,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Ask for one verdict per point in a single LLM call.
+
+        Returns an evaluation per point, or None where the response gave
+        no usable verdict for it.
+        """
+
+        def points(description_chars: int) -> str:
+            return "\n\n".join(
+                f"POINT {n}: {point.location_name or point.address}\n"
+                + encode_candidates(candidates, description_chars)
+                for n, (point, candidates) in enumerate(items, start=1)
+            )
+
+        system = self._system_prompt_for(profile)
+        budget = (
+            self.input_budget_tokens
+            + self.BATCH_INPUT_TOKENS_PER_POINT * (len(items) - 1)
+            - system.tokens
+        )
+        prompt = (
+            PromptBuilder(budget)
+            .add("points", points(80), required=True, fallbacks=[points(40), points(0)])
+            .add("task", _BATCH_TASK, required=True)
+            .build()
+        )
+
+        # Usage is billed to the batched points in equal shares
+        self.usage_point_ids = tuple(point.id for point, _ in items)
+        try:
+            response = self._ask(
+                system,
+                prompt,
+                max_tokens=self.BATCH_MAX_TOKENS_PER_POINT * len(items),
+            )
+        except Exception as e:
+            logger.warning(f"Batched evaluation failed: {e}")
+            return [None] * len(items)
+        finally:
+            self.usage_point_ids = ()
+        return self._parse_batch_response(response, items)
+
+    def _parse_batch_response(
+        self, response: str, items: list[tuple[RoutePoint, list[ContentResult]]]
+    ) -> list[dict[str, Any] | None]:
+        """Parse per-point verdicts; points without a valid WINNER get None."""
+        results: list[dict[str, Any] | None] = [None] * len(items)
+
+        # ["preamble", "1", "block 1", "2", "block 2", ...]
+        parts = re.split(
+            r"^[\s*#]*POINT\s+(\d+)\W*?:", response, flags=re.IGNORECASE | re.MULTILINE
+        )
+        for number, block in zip(parts[1::2], parts[2::2], strict=True):
+            index = int(number) - 1
+            if not 0 <= index < len(items) or results[index] is not None:
+                continue
+            candidates = items[index][1]
+
+            winner_match = re.search(r"WINNER:\W*(\d+)", block)
+            if not winner_match:
+                continue
+            winner_index = int(winner_match.group(1)) - 1
+            if not 0 <= winner_index < len(candidates):
+                continue
+
+            evaluation: dict[str, Any] = {
+                "winner_index": winner_index,
+                "scores": {c.content_type: c.relevance_score for c in candidates},
+            }
+            score_match = re.search(r"WINNER_SCORE:\W*([\d.]+)", block)
+            if score_match:
+                try:
+                    evaluation["winner_score"] = min(
+                        max(float(score_match.group(1)), 0.0), 10.0
+                    )
+                except ValueError:
+                    pass
+            reasoning_match = re.search(
+                r"REASONING:\s*(.+?)(?=\n\s*\n|$)", block, re.DOTALL
+            )
+            if reasoning_match:
+                evaluation["reasoning"] = reasoning_match.group(1).strip()
+            results[index] = evaluation
+
+        return results
+
     def quick_evaluate(
         self,
         point: RoutePoint,
@@ -524,58 +1066,10 @@ REASONING: [2-3 sentences explaining why this content is the best choice for THI
         if len(candidates) == 1:
             return candidates[0]
 
-        profile = user_profile or self.user_profile
-        location = (point.location_name or point.address).lower()
-        type_preferences = profile.get_content_type_preferences()
-
-        # Score each candidate
-        scored_candidates = []
-        for c in candidates:
-            score = c.relevance_score
-
-            # Apply user profile preference multiplier
-            type_key = c.content_type.value.lower()
-            profile_multiplier = type_preferences.get(type_key, 1.0)
-            score *= profile_multiplier
-
-            # Boost for location mention in title
-            if location in c.title.lower():
-                score += 2.0
-
-            # Boost for historical content at historical sites
-            if (
-                c.metadata.get("is_historical")
-                or c.metadata.get("fact_type") == "historical"
-            ):
-                if any(
-                    word in location
-                    for word in ["museum", "memorial", "ancient", "old"]
-                ):
-                    score += 1.5
-
-            # Slight preference for video at scenic locations
-            if c.content_type == ContentType.VIDEO:
-                if any(
-                    word in location for word in ["view", "park", "beach", "mountain"]
-                ):
-                    score += 1.0
-
-            # Slight preference for music at cultural locations
-            if c.content_type == ContentType.MUSIC:
-                if any(word in location for word in ["theatre", "concert", "festival"]):
-                    score += 1.0
-
-            # Age-specific boosts
-            if profile.age_group == AgeGroup.KID:
-                # Kids love animated/fun content
-                if "fun" in c.title.lower() or "kids" in c.title.lower():
-                    score += 1.5
-            elif profile.age_group == AgeGroup.SENIOR:
-                # Seniors appreciate classic/historical content
-                if "classic" in c.title.lower() or "history" in c.title.lower():
-                    score += 1.5
-
-            scored_candidates.append((c, min(score, 10.0)))
+        scores = self.rule_scores(point, candidates, user_profile)
+        scored_candidates = [
+            (c, min(score, 10.0)) for c, score in zip(candidates, scores, strict=True)
+        ]
 
         # Return highest scored
         best = max(scored_candidates, key=lambda x: x[1])
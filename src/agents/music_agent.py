@@ -4,9 +4,15 @@ Uses YouTube Music search (or Spotify) and LLM for smart recommendations.
 """
 
 import re
+from collections.abc import Iterator
+from contextlib import closing
+from itertools import islice
 from typing import Any
 
 from src.agents.base_agent import BaseAgent
+from src.core.observability.timing import timed
+from src.core.observability.tracing import PIPELINE_TRACER, trace
+from src.core.transport import get_transports
 from src.models.content import ContentResult, ContentType
 from src.models.route import RoutePoint
 from src.utils.config import settings
@@ -36,11 +42,15 @@ class MusicAgent(BaseAgent):
                 import spotipy
                 from spotipy.oauth2 import SpotifyClientCredentials
 
+                session = get_transports().requests_session("spotify")
                 auth_manager = SpotifyClientCredentials(
                     client_id=settings.spotify_client_id,
                     client_secret=settings.spotify_client_secret,
+                    requests_session=session,
+                )
+                self.spotify_client = spotipy.Spotify(
+                    auth_manager=auth_manager, requests_session=session
                 )
-                self.spotify_client = spotipy.Spotify(auth_manager=auth_manager)
                 logger.info("Spotify client initialized")
             except Exception as e:
                 logger.warning(f"Could not initialize Spotify client: {e}")
@@ -63,21 +73,21 @@ class MusicAgent(BaseAgent):
     def _search_content(self, point: RoutePoint) -> ContentResult | None:
         """Search for relevant songs."""
 
-        # Generate search queries using LLM
-        search_queries = self._generate_search_queries(point)
-
         # Try different sources
         songs = []
 
-        # Try Spotify first
-        if self.spotify_client:
-            for query in search_queries[:2]:
-                results = self._search_spotify(query)
-                songs.extend(results)
+        # Try Spotify first, searching each LLM query as soon as it is written
+        search_queries = []
+        with closing(self._iter_search_queries(point)) as queries:
+            for query in islice(queries, 2):
+                search_queries.append(query)
+                if self.spotify_client:
+                    results = self._search_spotify(query)
+                    songs.extend(results)
 
         # Try YouTube Music
         if not songs and self.youtube_music_available:
-            for query in search_queries[:2]:
+            for query in search_queries:
                 results = self._search_youtube_music(query)
                 songs.extend(results)
 
@@ -106,8 +116,8 @@ class MusicAgent(BaseAgent):
 
         return self._get_mock_result(point)
 
-    def _generate_search_queries(self, point: RoutePoint) -> list[str]:
-        """Use LLM to generate music search queries."""
+    def _iter_search_queries(self, point: RoutePoint) -> Iterator[str]:
+        """Yield music search queries as the LLM writes them."""
 
         location = point.location_name or point.address
 
@@ -125,13 +135,18 @@ Full Address: {point.address}
 Return ONLY 3 search queries, one per line, no numbering or bullets.
 Include both Hebrew and English search terms if relevant."""
 
-        try:
-            response = self._call_llm(prompt)
-            queries = [q.strip() for q in response.strip().split("\n") if q.strip()]
-            return queries[:3] if queries else [f"{location} song", f"{location} music"]
-        except Exception:
-            return [f"{location} song", f"{location} Israeli song", f"{location} music"]
+        return self._stream_queries(
+            prompt,
+            empty=[f"{location} song", f"{location} music"],
+            failed=[
+                f"{location} song",
+                f"{location} Israeli song",
+                f"{location} music",
+            ],
+        )
 
+    @trace("agent.search", tracer_name=PIPELINE_TRACER)
+    @timed("search")
     def _search_spotify(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
         """Search Spotify for songs."""
 
@@ -164,6 +179,8 @@ Include both Hebrew and English search terms if relevant."""
             logger.warning(f"Spotify search failed: {e}")
             return []
 
+    @trace("agent.search", tracer_name=PIPELINE_TRACER)
+    @timed("search")
     def _search_youtube_music(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
         """Search YouTube for music videos."""
 
@@ -210,6 +227,8 @@ Include both Hebrew and English search terms if relevant."""
             logger.warning(f"YouTube music search failed: {e}")
             return []
 
+    @trace("agent.select", tracer_name=PIPELINE_TRACER)
+    @timed("scoring")
     def _select_best_song(self, songs: list[dict], point: RoutePoint) -> dict | None:
         """Use LLM to select the most relevant song."""
 
@@ -250,7 +269,7 @@ SCORE: [0-10]
 REASON: [one sentence]"""
 
         try:
-            response = self._call_llm(prompt)
+            response = self._call_llm(prompt, max_tokens=self.SELECTION_MAX_TOKENS)
 
             # Parse response
             song_match = re.search(r"SONG:\s*(\d+)", response)
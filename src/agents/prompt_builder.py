@@ -0,0 +1,175 @@
+"""
+Token-budgeted prompt construction.
+
+A prompt is assembled from named sections. When the estimated size is
+over the input budget, sections are shrunk lowest priority first: each
+step swaps a section for its next (shorter) fallback, and a section
+without fallbacks left is dropped unless it is required. Required
+sections are never dropped, so a prompt can still end up over budget.
+
+Sizes use LLMCostModel.estimate_tokens (~4 characters per token), the
+same estimate the cost tracker is fed.
+
+Example:
+    builder = PromptBuilder(budget_tokens=400)
+    builder.add("location", f"Location: {name}", required=True)
+    builder.add(
+        "candidates",
+        encode_candidates(candidates),
+        fallbacks=[encode_candidates(candidates, description_chars=0)],
+    )
+    prompt = builder.build()
+    prompt.text, prompt.tokens, prompt.trimmed
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+
+from src.core.observability.metrics import Counter
+from src.cost_analysis.models import LLMCostModel
+from src.models.content import ContentResult
+
+_cost_model = LLMCostModel()
+
+prompt_trims = Counter(
+    "prompt_sections_trimmed_total",
+    "Prompt sections shortened or dropped to fit the input budget",
+    labels=["section"],
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimated token count of text."""
+    return _cost_model.estimate_tokens(text)
+
+
+def clip(text: str, max_chars: int) -> str:
+    """Cut text to at most max_chars, at a word boundary, marking the cut."""
+    if len(text) <= max_chars:
+        return text
+    cut = text[: max(max_chars - 3, 0)]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip() + "..."
+
+
+def encode_candidates(
+    candidates: Sequence[ContentResult], description_chars: int = 80
+) -> str:
+    """
+    One line per candidate: number, type, score, title and a short description.
+
+        1. VIDEO 7.5 | Battle of Ammunition Hill | Documentary with veterans...
+
+    Args:
+        candidates: Options in the order the response refers to them
+        description_chars: Description length kept (0 omits it)
+    """
+    lines = []
+    for i, c in enumerate(candidates, start=1):
+        line = (
+            f"{i}. {c.content_type.value.upper()} {c.relevance_score:.1f} | {c.title}"
+        )
+        description = " ".join((c.description or "").split())
+        if description and description_chars > 0:
+            line += f" | {clip(description, description_chars)}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class BuiltPrompt:
+    """A prompt and its estimated size."""
+
+    text: str
+    tokens: int
+    budget_tokens: int
+    # Names of sections that were shortened or dropped to fit
+    trimmed: tuple[str, ...] = ()
+
+    @property
+    def over_budget(self) -> bool:
+        return self.tokens > self.budget_tokens
+
+
+@dataclass
+class _Section:
+    name: str
+    text: str
+    priority: int
+    required: bool
+    fallbacks: list[str] = field(default_factory=list)
+
+
+class PromptBuilder:
+    """
+    Collect prompt sections and fit them into a token budget.
+
+    Parameters:
+        budget_tokens: Estimated input tokens the prompt may use
+        separator: Text placed between sections
+    """
+
+    def __init__(self, budget_tokens: int, separator: str = "\n\n"):
+        self.budget_tokens = budget_tokens
+        self.separator = separator
+        self._sections: list[_Section] = []
+
+    def add(
+        self,
+        name: str,
+        text: str,
+        priority: int = 0,
+        required: bool = False,
+        fallbacks: Sequence[str] = (),
+    ) -> PromptBuilder:
+        """
+        Append a section.
+
+        Args:
+            name: Section name (reported when trimmed)
+            text: Section text; empty sections are skipped
+            priority: Higher priorities are shrunk last
+            required: Never drop the section (fallbacks are still used)
+            fallbacks: Shorter versions to use, in order, when over budget
+        """
+        if text:
+            self._sections.append(
+                _Section(name, text, priority, required, list(fallbacks))
+            )
+        return self
+
+    def build(self) -> BuiltPrompt:
+        """Join the sections, shrinking them until the prompt fits."""
+        # Shrinking works on copies, so build() can be called again
+        sections = [replace(s, fallbacks=list(s.fallbacks)) for s in self._sections]
+        text = self._join(sections)
+        trimmed: list[str] = []
+
+        # Among equal priorities, sections shrink in the order they were added
+        for section in sorted(sections, key=lambda s: s.priority):
+            while estimate_tokens(text) > self.budget_tokens:
+                if section.fallbacks:
+                    section.text = section.fallbacks.pop(0)
+                elif section.required:
+                    break
+                else:
+                    section.text = ""
+                if section.name not in trimmed:
+                    trimmed.append(section.name)
+                    prompt_trims.inc(section=section.name)
+                text = self._join(sections)
+                if not section.text:
+                    break
+
+        return BuiltPrompt(
+            text=text,
+            tokens=estimate_tokens(text),
+            budget_tokens=self.budget_tokens,
+            trimmed=tuple(trimmed),
+        )
+
+    def _join(self, sections: list[_Section]) -> str:
+        return self.separator.join(s.text for s in sections if s.text)
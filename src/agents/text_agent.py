@@ -3,8 +3,10 @@ Text Agent - Specializes in finding historical facts and interesting stories abo
 Uses web search and LLM for intelligent content discovery.
 """
 
+import importlib.util
 import re
 import warnings
+from collections.abc import Iterator
 from typing import Any
 
 # Suppress the deprecation warning about duckduckgo_search package rename
@@ -14,6 +16,9 @@ warnings.filterwarnings(
 )
 
 from src.agents.base_agent import BaseAgent
+from src.core.observability.timing import timed
+from src.core.observability.tracing import PIPELINE_TRACER, trace
+from src.core.transport import get_transports
 from src.models.content import ContentResult, ContentType
 from src.models.route import RoutePoint
 from src.utils.logger import get_logger
@@ -27,32 +32,35 @@ class TextAgent(BaseAgent):
     Uses DuckDuckGo search and LLM for summarization.
     """
 
+    # Title, type, a 2-3 sentence story and a score
+    STORY_MAX_TOKENS = 320
+
     def __init__(self):
         super().__init__("text")
         self._init_search_client()
 
     def _init_search_client(self):
-        """Initialize web search client."""
-        self.search_available = False
-
-        try:
-            # Suppress RuntimeWarning from duckduckgo_search about package rename
-            # This uses filterwarnings with lineno=0 to catch all warnings from this module
-            warnings.filterwarnings(
-                "ignore",
-                message=".*renamed.*",
-                category=RuntimeWarning,
-                lineno=0,  # Match any line
-            )
-            from duckduckgo_search import DDGS
+        """Check web search is available; the client is created on first search."""
+        self.search_client = None
+        self.search_available = (
+            importlib.util.find_spec("duckduckgo_search") is not None
+        )
+        if not self.search_available:
+            logger.warning("duckduckgo-search not available")
 
-            self.search_client = DDGS()
+    def _get_search_client(self) -> Any:
+        """Import the search package and get the client pool on first use."""
+        if self.search_client is None and self.search_available:
+            with warnings.catch_warnings():
+                # Suppress RuntimeWarning from duckduckgo_search about package rename
+                warnings.filterwarnings(
+                    "ignore", message=".*renamed.*", category=RuntimeWarning
+                )
+                from duckduckgo_search import DDGS
 
-            self.search_available = True
-            logger.info("DuckDuckGo search client initialized")
-        except ImportError:
-            logger.warning("duckduckgo-search not available")
-            self.search_client = None
+            # DDGS sessions are not thread-safe; lease them from a shared pool
+            self.search_client = get_transports().pool("duckduckgo", DDGS)
+        return self.search_client
 
     def get_content_type(self) -> ContentType:
         return ContentType.TEXT
@@ -60,12 +68,9 @@ class TextAgent(BaseAgent):
     def _search_content(self, point: RoutePoint) -> ContentResult | None:
         """Search for interesting facts and stories."""
 
-        # Generate search queries using LLM
-        search_queries = self._generate_search_queries(point)
-
-        # Search the web
+        # Search the web for each LLM query as soon as it is written
         all_results = []
-        for query in search_queries[:3]:
+        for query in self._iter_search_queries(point):
             results = self._search_web(query)
             all_results.extend(results)
 
@@ -95,8 +100,8 @@ class TextAgent(BaseAgent):
 
         return self._get_mock_result(point)
 
-    def _generate_search_queries(self, point: RoutePoint) -> list[str]:
-        """Use LLM to generate search queries for interesting facts."""
+    def _iter_search_queries(self, point: RoutePoint) -> Iterator[str]:
+        """Yield fact search queries as the LLM writes them."""
 
         location = point.location_name or point.address
 
@@ -115,33 +120,33 @@ Search for:
 Return ONLY 3 search queries, one per line, no numbering or bullets.
 Mix Hebrew and English queries for better coverage."""
 
-        try:
-            response = self._call_llm(prompt)
-            queries = [q.strip() for q in response.strip().split("\n") if q.strip()]
-            return (
-                queries[:3] if queries else [f"{location} history", f"{location} facts"]
-            )
-        except Exception:
-            return [
+        return self._stream_queries(
+            prompt,
+            empty=[f"{location} history", f"{location} facts"],
+            failed=[
                 f"{location} history",
                 f"{location} interesting facts",
                 f"{location} historical facts",
-            ]
+            ],
+        )
 
+    @trace("agent.search", tracer_name=PIPELINE_TRACER)
+    @timed("search")
     def _search_web(self, query: str, max_results: int = 5) -> list[dict[str, Any]]:
         """Search the web for information."""
 
-        if not self.search_available or not self.search_client:
+        if not self.search_available:
             return []
 
         try:
-            results = list(
-                self.search_client.text(
-                    query,
-                    max_results=max_results,
-                    region="il-he",  # Israel, Hebrew
+            with self._get_search_client().lease() as search_client:
+                results = list(
+                    search_client.text(
+                        query,
+                        max_results=max_results,
+                        region="il-he",  # Israel, Hebrew
+                    )
                 )
-            )
 
             parsed_results = []
             for result in results:
@@ -171,6 +176,8 @@ Mix Hebrew and English queries for better coverage."""
         except Exception:
             return url
 
+    @trace("agent.synthesize", tracer_name=PIPELINE_TRACER)
+    @timed("scoring")
     def _synthesize_content(
         self, results: list[dict], point: RoutePoint
     ) -> dict | None:
@@ -210,7 +217,7 @@ STORY: [The 2-3 sentence engaging content]
 SCORE: [Relevance score 0-10]"""
 
         try:
-            response = self._call_llm(prompt)
+            response = self._call_llm(prompt, max_tokens=self.STORY_MAX_TOKENS)
 
             # Parse response
             title_match = re.search(r"TITLE:\s*(.+)", response)
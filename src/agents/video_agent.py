@@ -3,9 +3,13 @@ Video Agent - Specializes in finding relevant YouTube videos for locations.
 """
 
 import re
+from collections.abc import Iterator
 from typing import Any
 
 from src.agents.base_agent import BaseAgent
+from src.core.observability.timing import timed
+from src.core.observability.tracing import PIPELINE_TRACER, trace
+from src.core.transport import get_transports
 from src.models.content import ContentResult, ContentType
 from src.models.route import RoutePoint
 from src.utils.config import settings
@@ -25,17 +29,25 @@ class VideoAgent(BaseAgent):
         self._init_youtube_client()
 
     def _init_youtube_client(self):
-        """Initialize YouTube API client."""
+        """Initialize the (process-wide) pool of YouTube API clients."""
         self.youtube_client = None
 
         if settings.youtube_api_key:
             try:
                 from googleapiclient.discovery import build
 
-                self.youtube_client = build(
-                    "youtube", "v3", developerKey=settings.youtube_api_key
+                # API clients wrap a non-thread-safe httplib2.Http, so they
+                # are leased from a pool rather than shared
+                self.youtube_client = get_transports().pool(
+                    "youtube",
+                    lambda: build(
+                        "youtube",
+                        "v3",
+                        developerKey=settings.youtube_api_key,
+                        cache_discovery=False,
+                    ),
                 )
-                logger.info("YouTube API client initialized")
+                logger.info("YouTube API client pool initialized")
             except Exception as e:
                 logger.warning(f"Could not initialize YouTube client: {e}")
 
@@ -45,12 +57,9 @@ class VideoAgent(BaseAgent):
     def _search_content(self, point: RoutePoint) -> ContentResult | None:
         """Search for relevant YouTube videos."""
 
-        # Generate search queries using LLM
-        search_queries = self._generate_search_queries(point)
-
-        # Search YouTube
+        # Search YouTube for each LLM query as soon as it is written
         videos = []
-        for query in search_queries[:3]:  # Limit to 3 queries
+        for query in self._iter_search_queries(point):  # At most 3 queries
             results = self._search_youtube(query)
             videos.extend(results)
 
@@ -81,8 +90,8 @@ class VideoAgent(BaseAgent):
 
         return self._get_mock_result(point)
 
-    def _generate_search_queries(self, point: RoutePoint) -> list[str]:
-        """Use LLM to generate effective search queries."""
+    def _iter_search_queries(self, point: RoutePoint) -> Iterator[str]:
+        """Yield search queries as the LLM writes them."""
 
         location = point.location_name or point.address
 
@@ -101,13 +110,14 @@ Consider searching for:
 
 Return ONLY 3 search queries, one per line, no numbering or bullets."""
 
-        try:
-            response = self._call_llm(prompt)
-            queries = [q.strip() for q in response.strip().split("\n") if q.strip()]
-            return queries[:3] if queries else [location]
-        except Exception:
-            return [location, f"{location} history", f"{location} documentary"]
+        return self._stream_queries(
+            prompt,
+            empty=[location],
+            failed=[location, f"{location} history", f"{location} documentary"],
+        )
 
+    @trace("agent.search", tracer_name=PIPELINE_TRACER)
+    @timed("search")
     def _search_youtube(self, query: str, max_results: int = 5) -> list[dict[str, Any]]:
         """Search YouTube for videos."""
 
@@ -115,16 +125,20 @@ Return ONLY 3 search queries, one per line, no numbering or bullets."""
             return []
 
         try:
-            request = self.youtube_client.search().list(
-                part="snippet",
-                q=query,
-                type="video",
-                maxResults=max_results,
-                relevanceLanguage=settings.language,
-                videoDuration="medium",  # 4-20 minutes
-                safeSearch="moderate",
-            )
-            response = request.execute()
+            with self.youtube_client.lease() as youtube:
+                response = (
+                    youtube.search()
+                    .list(
+                        part="snippet",
+                        q=query,
+                        type="video",
+                        maxResults=max_results,
+                        relevanceLanguage=settings.language,
+                        videoDuration="medium",  # 4-20 minutes
+                        safeSearch="moderate",
+                    )
+                    .execute()
+                )
 
             videos = []
             for item in response.get("items", []):
@@ -148,6 +162,8 @@ Return ONLY 3 search queries, one per line, no numbering or bullets."""
             logger.warning(f"YouTube search failed: {e}")
             return []
 
+    @trace("agent.select", tracer_name=PIPELINE_TRACER)
+    @timed("scoring")
     def _select_best_video(self, videos: list[dict], point: RoutePoint) -> dict | None:
         """Use LLM to select the most relevant video."""
 
@@ -188,7 +204,7 @@ SCORE: [0-10]
 REASON: [one sentence]"""
 
         try:
-            response = self._call_llm(prompt)
+            response = self._call_llm(prompt, max_tokens=self.SELECTION_MAX_TOKENS)
 
             # Parse response
             video_match = re.search(r"VIDEO:\s*(\d+)", response)
@@ -41,14 +41,25 @@ from fastapi import (
     status,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from pydantic import BaseModel, Field
 
+from src.agents.base_agent_v2 import shutdown_content_caches
+from src.core.observability.health import (
+    HealthRegistry,
+    HealthStatus,
+    get_cached_health,
+    get_health_scheduler,
+)
+from src.core.observability.metrics import PROMETHEUS_CONTENT_TYPE, MetricsRegistry
+from src.core.observability.profiler import get_profiler
+from src.core.transport import shutdown_transports
 from src.services.tour_service import (
     TourService,
     TourStatus,
     get_tour_service,
 )
+from src.utils.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -140,6 +151,7 @@ class PlaylistItem(BaseModel):
     reasoning: str | None
     processing_time_seconds: float
     all_candidates: list[dict]
+    timing: dict | None = None
 
 
 class TourResultsResponse(BaseModel):
@@ -235,9 +247,29 @@ async def lifespan(app: FastAPI):
     logger.info(f"   API Mode: {tour_service._api_mode}")
     logger.info(f"   Agents Available: {tour_service._agents_available}")
 
+    # Probes read the scheduler's cached aggregate instead of running checks
+    HealthRegistry.register(
+        "tour_service",
+        lambda: tour_service is not None,
+        critical=True,
+        interval=10.0,
+        description="TourService is initialized",
+    )
+    scheduler = get_health_scheduler()
+    scheduler.start()
+
+    if settings.profiling_enabled:
+        get_profiler(settings.profiling_hz).start()
+        logger.info(f"   Profiling at {settings.profiling_hz:g} Hz (/admin/profile)")
+
     yield
 
     logger.info("👋 Tour Guide API shutting down...")
+    scheduler.reset()
+    HealthRegistry.unregister("tour_service")
+    get_profiler().stop()
+    shutdown_content_caches()
+    shutdown_transports()
 
 
 # =============================================================================
@@ -347,56 +379,98 @@ async def health_check():
     - Agent availability
     - API mode configuration
     - Which APIs are using real data vs mock
+    - The health scheduler's cached check results, with their age
+
+    No checks run here; the response is built from cached state.
     """
-    global tour_service
     uptime = (datetime.now() - startup_time).total_seconds() if startup_time else 0
 
     service = tour_service or get_tour_service()
-    api_status = service.get_api_status()
-    is_live = api_status.get("is_live", False)
+    cached = get_cached_health()
+
+    status_value = "healthy"
+    if cached is not None and cached.status in (
+        HealthStatus.UNHEALTHY,
+        HealthStatus.DEGRADED,
+    ):
+        status_value = cached.status.value
 
     return HealthResponse(
-        status="healthy",
+        status=status_value,
         version="2.0.0",
         uptime_seconds=uptime,
         timestamp=datetime.now().isoformat(),
         api_mode=service._api_mode,
         checks={
-            "tour_service": {"status": "healthy"},
-            "data_mode": "🔴 LIVE" if is_live else "⚪ DEMO",
-            "using_real_apis": api_status.get("using_real_apis", False),
-            "agents_available": service._agents_available,
-            "api_keys": api_status.get("api_keys", {}),
-            "agents": {
-                "video": {
-                    "status": "live" if is_live else "mock",
-                    "icon": "🔴" if is_live else "⚪",
-                },
-                "music": {
-                    "status": "live" if is_live else "mock",
-                    "icon": "🔴" if is_live else "⚪",
-                },
-                "text": {
-                    "status": "live" if is_live else "mock",
-                    "icon": "🔴" if is_live else "⚪",
-                },
-                "judge": {
-                    "status": "live" if is_live else "mock",
-                    "icon": "🔴" if is_live else "⚪",
-                },
-            },
+            **_service_checks(service),
+            "health": cached.to_dict() if cached is not None else None,
         },
     )
 
 
+_service_checks_cache: tuple[TourService, dict] | None = None
+
+
+def _service_checks(service: TourService) -> dict:
+    """Static part of the /health payload, built once per service."""
+    global _service_checks_cache
+    if _service_checks_cache is not None and _service_checks_cache[0] is service:
+        return _service_checks_cache[1]
+
+    api_status = service.get_api_status()
+    is_live = api_status.get("is_live", False)
+    agent_status = {
+        "status": "live" if is_live else "mock",
+        "icon": "🔴" if is_live else "⚪",
+    }
+    checks = {
+        "tour_service": {"status": "healthy"},
+        "data_mode": "🔴 LIVE" if is_live else "⚪ DEMO",
+        "using_real_apis": api_status.get("using_real_apis", False),
+        "agents_available": service._agents_available,
+        "api_keys": api_status.get("api_keys", {}),
+        "agents": {
+            agent: dict(agent_status) for agent in ("video", "music", "text", "judge")
+        },
+    }
+    _service_checks_cache = (service, checks)
+    return checks
+
+
 @app.get(
     "/ready",
     tags=["Health"],
     summary="Readiness probe",
 )
 async def readiness_check():
-    """Check if the application is ready to accept requests."""
-    return {"ready": True, "message": "Service is ready to accept requests"}
+    """
+    Check if the application is ready to accept requests.
+
+    Reads the health scheduler's cached aggregate: not ready (503) while a
+    critical check fails or the snapshot is stale. Without a running
+    scheduler there is nothing to wait for and the service is ready.
+    """
+    cached = get_cached_health()
+    if cached is None:
+        return {"ready": True, "message": "Service is ready to accept requests"}
+
+    health = cached.to_dict()
+    if cached.status == HealthStatus.UNHEALTHY or health["stale"]:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "ready": False,
+                "message": "Stale health data"
+                if health["stale"]
+                else "Critical health checks failing",
+                "health": health,
+            },
+        )
+    return {
+        "ready": True,
+        "message": "Service is ready to accept requests",
+        "health": health,
+    }
 
 
 @app.get(
@@ -406,42 +480,81 @@ async def readiness_check():
 )
 async def metrics():
     """
-    Export metrics in Prometheus format.
+    Export metrics in Prometheus text format.
 
-    Metrics include:
-    - Request counts and latencies
-    - Agent response times
-    - Queue statistics
-    - Active tour counts
+    Metrics include every metric in the MetricsRegistry:
+    - Tour counts by status and active tours
+    - Agent, point and tour latency summaries (p50/p95/p99)
+    - Agent execution counts and duration histograms
     """
-    service = get_tour_service()
-    tours = service.store.list_all()
-
-    active_count = len([t for t in tours if t.status == TourStatus.PROCESSING])
-    completed_count = len([t for t in tours if t.status == TourStatus.COMPLETED])
-    failed_count = len([t for t in tours if t.status == TourStatus.FAILED])
-
-    metrics_text = f"""
-# HELP tour_requests_total Total tour requests
-# TYPE tour_requests_total counter
-tour_requests_total{{status="completed"}} {completed_count}
-tour_requests_total{{status="failed"}} {failed_count}
-tour_requests_total{{status="processing"}} {active_count}
-
-# HELP active_tours Currently processing tours
-# TYPE active_tours gauge
-active_tours {active_count}
-
-# HELP tour_service_api_mode Current API mode
-# TYPE tour_service_api_mode gauge
-tour_service_api_mode{{mode="{service._api_mode}"}} 1
-"""
-    return JSONResponse(
-        content=metrics_text,
-        media_type="text/plain",
+    # Tour counters are maintained on status transitions, so a scrape is
+    # independent of the number of stored tours.
+    get_tour_service()
+    return PlainTextResponse(
+        MetricsRegistry.to_prometheus(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
     )
 
 
+# =============================================================================
+# Admin Endpoints
+# =============================================================================
+
+
+@app.get(
+    "/admin/profile",
+    tags=["Observability"],
+    summary="CPU profile (folded stacks)",
+)
+async def cpu_profile(
+    seconds: float = 10.0,
+    group: str | None = None,
+    format: str = "folded",
+):
+    """
+    Sample thread stacks for a window and return where CPU time went.
+
+    Requires PROFILING_ENABLED. The default output is folded stacks
+    ("group;frame;frame count"), ready for flamegraph.pl or speedscope;
+    `format=json` returns per-group sample totals and profiler stats
+    instead. `seconds=0` returns everything since the profiler started.
+    `group` limits either output to one thread group, e.g. "PointProcessor".
+    """
+    if not settings.profiling_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profiling is disabled (set PROFILING_ENABLED=true)",
+        )
+    if not 0 <= seconds <= 300:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="seconds must be between 0 and 300",
+        )
+    if format not in ("folded", "json"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="format must be 'folded' or 'json'",
+        )
+
+    profiler = get_profiler(settings.profiling_hz)
+    profiler.start()
+
+    if seconds:
+        before = profiler.snapshot()
+        await asyncio.sleep(seconds)
+        window = profiler.snapshot() - before
+    else:
+        window = profiler.snapshot()
+
+    if format == "json":
+        return {
+            "window_seconds": seconds,
+            "groups": profiler.group_totals(window, group=group),
+            "profiler": profiler.get_stats(),
+        }
+    return PlainTextResponse(profiler.format_folded(window, group=group))
+
+
 # =============================================================================
 # Tour Endpoints - Real Processing
 # =============================================================================
@@ -533,6 +646,9 @@ async def get_tour_results(tour_id: str):
     - Judge reasoning
     - All candidate content from agents
     - Processing metrics
+    - Per-point latency breakdown (`timing`: agent LLM/search/scoring time,
+      queue wait, judge and store update time) and per-stage p50/p95/p99
+      across the tour in `summary.timing`
     """
     service = get_tour_service()
     results = service.get_tour_results(tour_id)
@@ -546,6 +662,36 @@ async def get_tour_results(tour_id: str):
     return results
 
 
+@app.get(
+    "/api/v1/tours/{tour_id}/critical-path",
+    tags=["Tours"],
+    summary="Get tour critical path",
+)
+async def get_tour_critical_path(tour_id: str):
+    """
+    Explain where a finished tour's latency went.
+
+    For every point, returns the spans on the critical path, the stage
+    with the most self time (route fetch, query generation, search,
+    scoring, judge, ...) and the agent whose work set the latency.
+    """
+    service = get_tour_service()
+    if not service.get_tour(tour_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tour {tour_id} not found",
+        )
+
+    report = service.get_critical_path(tour_id)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No trace available for tour {tour_id} (still running?)",
+        )
+
+    return report
+
+
 @app.delete(
     "/api/v1/tours/{tour_id}",
     tags=["Tours"],
@@ -15,11 +15,20 @@ Usage:
     python main.py -o "Paris" -d "Lyon"      Custom route (needs API keys)
 """
 
+from __future__ import annotations
+
 import argparse
 import sys
 import time
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from src.core.observability.tracing import (
+    PIPELINE_TRACER,
+    get_tracer,
+    submit_in_context,
+)
+from src.core.transport import shutdown_transports
 from src.models.route import RoutePoint
 from src.models.user_profile import (
     UserProfile,
@@ -30,6 +39,9 @@ from src.models.user_profile import (
 )
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from src.core.observability.profiler import SamplingProfiler
+
 logger = get_logger(__name__)
 
 
@@ -218,6 +230,15 @@ def process_point_with_queue(
     Process a single point using queue-based synchronization.
     This demonstrates the core architecture: agents → queue → judge
     """
+    with get_tracer(PIPELINE_TRACER).span("point.process") as span:
+        span.set_attribute("point.index", point.index)
+        span.set_attribute("point.name", point.location_name or point.address)
+        return _process_point_with_queue(point, profile, verbose)
+
+
+def _process_point_with_queue(
+    point: RoutePoint, profile: UserProfile | None = None, verbose: bool = False
+) -> dict[str, Any]:
     import threading
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -226,6 +247,11 @@ def process_point_with_queue(
     queue_lock = threading.Lock()
 
     def run_agent(agent_class, name: str):
+        with get_tracer(PIPELINE_TRACER).span("agent.run") as span:
+            span.set_attribute("agent.type", name.lower())
+            return _run_agent(agent_class, name)
+
+    def _run_agent(agent_class, name: str):
         """Run an agent and collect result."""
         start = time.time()
         try:
@@ -254,9 +280,9 @@ def process_point_with_queue(
     # Run 3 agents in parallel
     with ThreadPoolExecutor(max_workers=3, thread_name_prefix="Agent") as executor:
         futures = {
-            executor.submit(run_agent, VideoAgent, "Video"): "video",
-            executor.submit(run_agent, MusicAgent, "Music"): "music",
-            executor.submit(run_agent, TextAgent, "Text"): "text",
+            submit_in_context(executor, run_agent, VideoAgent, "Video"): "video",
+            submit_in_context(executor, run_agent, MusicAgent, "Music"): "music",
+            submit_in_context(executor, run_agent, TextAgent, "Text"): "text",
         }
 
         # Wait for all to complete (with timeout)
@@ -515,13 +541,6 @@ def run_custom_route(
 
 def main() -> int:
     """Main entry point. Returns exit code."""
-    import warnings
-
-    # Suppress ResourceWarning about unclosed SSL sockets from HTTP clients
-    # This is a known issue with many Python HTTP libraries (anthropic, httpx)
-    # that don't always close connections cleanly on exit
-    warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed")
-
     parser = argparse.ArgumentParser(
         description="Multi-Agent Tour Guide System - Full Pipeline",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -533,6 +552,8 @@ Examples:
   python main.py --demo --profile family   Family-friendly content
   python main.py --interactive             Interactive setup wizard
   python main.py -o "Paris" -d "Lyon"      Custom route (requires API keys)
+  python main.py --demo --critical-path    Show which stage/agent set each point's latency
+  python main.py --demo --cpu-profile run.folded   Write a flamegraph-ready CPU profile
         """,
     )
 
@@ -572,30 +593,50 @@ Examples:
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
+    parser.add_argument(
+        "--critical-path",
+        action="store_true",
+        help="Trace the run and print which stage/agent set each point's latency",
+    )
+    parser.add_argument(
+        "--cpu-profile",
+        metavar="FILE",
+        type=str,
+        help="Sample thread stacks during the run and write folded stacks to FILE",
+    )
+    parser.add_argument(
+        "--cpu-profile-hz",
+        type=float,
+        default=100.0,
+        help="Sampling rate for --cpu-profile (default: 100)",
+    )
 
     args = parser.parse_args()
 
     try:
-        if args.interactive:
-            run_interactive()
-        elif args.demo or (not args.origin and not args.destination):
-            profile = get_profile(args.profile, args.min_age)
-            run_demo_pipeline(
-                mode=args.mode,
-                profile=profile,
-                verbose=args.verbose,
-                interval_seconds=float(args.interval),
-            )
-        else:
-            # Custom route with real Google Maps API
-            profile = get_profile(args.profile, args.min_age)
-            run_custom_route(
-                origin=args.origin,
-                destination=args.destination,
-                mode=args.mode,
-                profile=profile,
-                verbose=args.verbose,
-            )
+        profiler = None
+        if args.cpu_profile:
+            from src.core.observability.profiler import SamplingProfiler
+
+            profiler = SamplingProfiler(hz=args.cpu_profile_hz)
+            profiler.start()
+        try:
+            if args.critical_path:
+                with get_tracer(PIPELINE_TRACER).span("tour") as span:
+                    run_selected_pipeline(args)
+                print_critical_path(span.context.trace_id)
+            else:
+                run_selected_pipeline(args)
+        finally:
+            from src.agents.base_agent_v2 import shutdown_content_caches
+
+            # Close pooled upstream connections and the content-cache refresh
+            # pool before exit, rather than leaving them for the interpreter
+            shutdown_content_caches()
+            shutdown_transports()
+            if profiler is not None:
+                profiler.stop()
+                write_cpu_profile(profiler, args.cpu_profile)
         return 0
     except KeyboardInterrupt:
         print("\n\n👋 Tour guide stopped by user.")
@@ -609,6 +650,53 @@ Examples:
         return 1
 
 
+def run_selected_pipeline(args: argparse.Namespace) -> None:
+    """Run the pipeline variant chosen on the command line."""
+    if args.interactive:
+        run_interactive()
+    elif args.demo or (not args.origin and not args.destination):
+        profile = get_profile(args.profile, args.min_age)
+        run_demo_pipeline(
+            mode=args.mode,
+            profile=profile,
+            verbose=args.verbose,
+            interval_seconds=float(args.interval),
+        )
+    else:
+        # Custom route with real Google Maps API
+        profile = get_profile(args.profile, args.min_age)
+        run_custom_route(
+            origin=args.origin,
+            destination=args.destination,
+            mode=args.mode,
+            profile=profile,
+            verbose=args.verbose,
+        )
+
+
+def print_critical_path(trace_id: str) -> None:
+    """Print the critical-path report for a traced run."""
+    from src.core.observability.critical_path import analyze_trace, collect_trace
+
+    report = analyze_trace(collect_trace(trace_id))
+    print("\n" + "═" * 60)
+    print("⏱️ CRITICAL PATH")
+    print("═" * 60)
+    print(report.format_text() if report else "No trace recorded.")
+
+
+def write_cpu_profile(profiler: SamplingProfiler, path: str) -> None:
+    """Write the profile as folded stacks and summarize it per thread group."""
+    Path(path).write_text(profiler.format_folded(), encoding="utf-8")
+    stats = profiler.get_stats()
+    print(
+        f"\n🔥 CPU profile: {stats['samples']} samples at {stats['hz']:g} Hz "
+        f"(overhead {stats['overhead_percent']:.2f}%) -> {path}"
+    )
+    for group, samples in profiler.group_totals().items():
+        print(f"   {group:<20} {samples:>8} samples")
+
+
 # Entry point for setuptools console_scripts
 def app():
     """Entry point for setuptools."""
@@ -65,8 +65,18 @@ Example Usage:
     service = container.resolve(IService)
 """
 
-# Import submodules for easier access
-from src.core import di, observability, plugins, resilience
+from typing import TYPE_CHECKING
+
+from src._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core import di, observability, plugins, resilience
+
+# Submodules are imported on first access (PEP 562), so using one of them
+# doesn't load the others
+__getattr__, __dir__ = lazy_exports(
+    __name__, submodules=("di", "observability", "plugins", "resilience")
+)
 
 __all__ = [
     "plugins",
@@ -1,25 +1,40 @@
 """
 Collector - Aggregates results from the judge and produces the final tour guide output.
 Maintains order and provides the final playlist.
+
+JudgeBatcher sits in front of a collector when many points finish close
+together: it judges them with one LLM call per batch and hands each
+decision to the collector's add_decision (and to the submitter's future).
+The orchestrator routes its points through one when JUDGE_BATCH_SIZE > 1.
 """
 
+from __future__ import annotations
+
 import threading
 from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from src.models.content import ContentResult
 from src.models.decision import JudgeDecision
 from src.models.output import TourGuideOutput
-from src.models.route import Route
+from src.models.route import Route, RoutePoint
+from src.utils.config import settings
 from src.utils.logger import get_logger, set_log_context
 
+if TYPE_CHECKING:
+    from src.agents.judge_agent import Escalation, JudgeAgent
+    from src.models.user_profile import UserProfile
+
 logger = get_logger(__name__)
 
 
 def log_collector_update(point_id: str, content: str):
     """Log collector update."""
     set_log_context(point_id=point_id, agent_type="collector")
-    logger.info(f"📥 Collected: {content}")
+    logger.info("📥 Collected: %s", content)
 
 
 class ResultCollector:
@@ -259,3 +274,205 @@ class StreamingCollector(ResultCollector):
                 if point_id not in yielded:
                     yielded.add(point_id)
                     yield self.decisions[point_id]
+
+
+# ============== Batched Judging ==============
+
+
+@dataclass
+class JudgeBatcherStats:
+    """Statistics for a judge batcher."""
+
+    points: int = 0
+    decided_inline: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    judge_failures: int = 0
+
+
+class JudgeBatcher:
+    """
+    Judge points in batches and deliver decisions to a collector.
+
+    submit() screens and rule-scores each point in the calling thread
+    (JudgeAgent.triage); points settled there are decided at once and never
+    wait for a batch. Only points escalated to the LLM are queued. A batch
+    is judged when max_batch of them are pending, or max_wait_seconds after
+    the first arrived. Decisions are those JudgeAgent.evaluate would make
+    per point; they are passed to on_decision and resolve the future
+    submit returned.
+
+    Parameters:
+        judge: Judge used for every batch
+        on_decision: Receives each decision, e.g. ResultCollector.add_decision
+            (None when submitters only wait on their futures)
+        max_batch: Escalated points per batch (None uses JUDGE_BATCH_SIZE)
+        max_wait_seconds: Longest a point waits for its batch to fill
+            (None uses JUDGE_BATCH_WAIT_MS)
+        user_profile: Profile override passed to the judge
+
+    Example:
+        collector = ResultCollector(route)
+        batcher = JudgeBatcher(JudgeAgent(profile), collector.add_decision)
+        for point, candidates in finished_points:
+            batcher.submit(point, candidates)
+        batcher.close()
+    """
+
+    def __init__(
+        self,
+        judge: JudgeAgent,
+        on_decision: Callable[[JudgeDecision], Any] | None = None,
+        max_batch: int | None = None,
+        max_wait_seconds: float | None = None,
+        user_profile: UserProfile | None = None,
+    ):
+        self.judge = judge
+        self.on_decision = on_decision
+        self.max_batch = max(max_batch or settings.judge_batch_size, 1)
+        self.max_wait_seconds = (
+            settings.judge_batch_wait_ms / 1000
+            if max_wait_seconds is None
+            else max_wait_seconds
+        )
+        self.user_profile = user_profile
+
+        self._pending: list[tuple[Escalation, Future[JudgeDecision]]] = []
+        self._lock = threading.Lock()
+        # Held while a batch is judged and delivered, so batches stay in order
+        self._flush_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._closed = False
+
+        self.stats = JudgeBatcherStats()
+
+    def submit(
+        self, point: RoutePoint, candidates: list[ContentResult]
+    ) -> Future[JudgeDecision]:
+        """
+        Judge a point, batching it if it needs the LLM.
+
+        The returned future is already resolved when the screen or rule
+        tier decided the point.
+        """
+        if not candidates:
+            raise ValueError("No candidates to evaluate")
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("JudgeBatcher is closed")
+
+        future: Future[JudgeDecision] = Future()
+        try:
+            outcome = self.judge.triage(point, list(candidates), self.user_profile)
+        except Exception as e:
+            logger.error(f"Judge failed for point {point.index}: {e}")
+            with self._lock:
+                self.stats.judge_failures += 1
+            outcome = self._fallback_decision(point, candidates)
+        if isinstance(outcome, JudgeDecision):
+            with self._lock:
+                self.stats.decided_inline += 1
+            self._deliver(outcome, future)
+            return future
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("JudgeBatcher is closed")
+            self._pending.append((outcome, future))
+            full = len(self._pending) >= self.max_batch
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.max_wait_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full:
+            self.flush()
+        return future
+
+    def flush(self) -> int:
+        """Judge all pending points now; returns how many were judged."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                timer, self._timer = self._timer, None
+            if timer is not None:
+                timer.cancel()
+            if not batch:
+                return 0
+
+            self.stats.points += len(batch)
+            self.stats.batches += 1
+            self.stats.largest_batch = max(self.stats.largest_batch, len(batch))
+
+            try:
+                decisions = self._judge([escalation for escalation, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                raise
+
+            for (_, future), decision in zip(batch, decisions, strict=True):
+                self._deliver(decision, future)
+            return len(batch)
+
+    def _deliver(self, decision: JudgeDecision, future: Future[JudgeDecision]) -> None:
+        if self.on_decision is not None:
+            try:
+                self.on_decision(decision)
+            except Exception as e:
+                logger.error(f"Decision callback error: {e}")
+        future.set_result(decision)
+
+    def close(self) -> None:
+        """Judge what is pending and refuse further points."""
+        with self._lock:
+            self._closed = True
+        self.flush()
+
+    def _judge(self, batch: list[Escalation]) -> list[JudgeDecision]:
+        try:
+            return self.judge.evaluate_escalated(batch, user_profile=self.user_profile)
+        except Exception as e:
+            logger.error(f"Batched judge failed, judging points one by one: {e}")
+
+        decisions = []
+        for escalation in batch:
+            point, candidates = escalation.point, escalation.candidates
+            try:
+                decision = self.judge.evaluate(
+                    point, candidates, user_profile=self.user_profile
+                )
+            except Exception as e:
+                logger.error(f"Judge failed for point {point.index}: {e}")
+                with self._lock:
+                    self.stats.judge_failures += 1
+                decision = self._fallback_decision(point, candidates)
+            decisions.append(decision)
+        return decisions
+
+    @staticmethod
+    def _fallback_decision(
+        point: RoutePoint, candidates: list[ContentResult]
+    ) -> JudgeDecision:
+        return JudgeDecision(
+            point_id=point.id,
+            selected_content=candidates[0],
+            all_candidates=candidates,
+            reasoning="Judge failed - using first available content",
+            scores={},
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics."""
+        with self._lock:
+            pending = len(self._pending)
+        batches = self.stats.batches
+        return {
+            "points": self.stats.points,
+            "decided_inline": self.stats.decided_inline,
+            "batches": batches,
+            "pending": pending,
+            "largest_batch": self.stats.largest_batch,
+            "avg_batch_size": round(self.stats.points / batches, 2) if batches else 0.0,
+            "judge_failures": self.stats.judge_failures,
+        }
@@ -37,25 +37,51 @@ Example:
         return service.get_all()
 """
 
-from src.core.di.container import (
-    Container,
-    Lifetime,
-    get_container,
-    inject,
-    injectable,
-    set_container,
-)
-from src.core.di.providers import (
-    FactoryProvider,
-    Provider,
-    SingletonProvider,
-    TransientProvider,
-    ValueProvider,
-)
-from src.core.di.scope import (
-    Scope,
-    ScopeContext,
-    scoped,
+from typing import TYPE_CHECKING
+
+from src._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core.di.container import (
+        Container,
+        Lifetime,
+        get_container,
+        inject,
+        injectable,
+        set_container,
+    )
+    from src.core.di.providers import (
+        FactoryProvider,
+        Provider,
+        SingletonProvider,
+        TransientProvider,
+        ValueProvider,
+    )
+    from src.core.di.scope import (
+        Scope,
+        ScopeContext,
+        scoped,
+    )
+
+# Exports are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Container": "src.core.di.container",
+        "Lifetime": "src.core.di.container",
+        "get_container": "src.core.di.container",
+        "inject": "src.core.di.container",
+        "injectable": "src.core.di.container",
+        "set_container": "src.core.di.container",
+        "FactoryProvider": "src.core.di.providers",
+        "Provider": "src.core.di.providers",
+        "SingletonProvider": "src.core.di.providers",
+        "TransientProvider": "src.core.di.providers",
+        "ValueProvider": "src.core.di.providers",
+        "Scope": "src.core.di.scope",
+        "ScopeContext": "src.core.di.scope",
+        "scoped": "src.core.di.scope",
+    },
 )
 
 __all__ = [
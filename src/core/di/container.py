@@ -14,6 +14,12 @@ Example:
 
     # Resolve
     service = container.resolve(UserService)
+
+Constructor signatures are inspected once per registration and compiled
+into a ConstructionPlan (parameter -> registration). Registering anything
+discards the compiled plans, since a new registration can change how a
+parameter is wired. Objects are constructed outside the container lock;
+only singleton creation is serialized, so each singleton is built once.
 """
 
 from __future__ import annotations
@@ -68,6 +74,33 @@ class Registration:
     tags: set[str] = field(default_factory=set)
 
 
+@dataclass(frozen=True)
+class PlannedDependency:
+    """A constructor parameter wired to a registration."""
+
+    name: str
+    service_type: type
+    registration: Registration
+    required: bool
+
+
+@dataclass(frozen=True)
+class ConstructionPlan:
+    """
+    How to build one registration, compiled from its signature.
+
+    target is the factory or class to call, or None when the registration
+    is a plain value returned as is.
+    """
+
+    registration: Registration
+    target: Callable[..., Any] | None
+    dependencies: tuple[PlannedDependency, ...] = ()
+
+
+_PRIMITIVES = (str, int, float, bool)
+
+
 class Container:
     """
     Dependency Injection Container.
@@ -104,7 +137,10 @@ class Container:
         self._registrations: dict[type, Registration] = {}
         self._parent = parent
         self._lock = threading.RLock()
-        self._resolving: set[type] = set()  # For circular dependency detection
+        # Held only while a singleton is built, never for transient objects
+        self._singleton_lock = threading.RLock()
+        self._plans: dict[type, ConstructionPlan] = {}
+        self._plans_compiled = 0
 
     def register(
         self,
@@ -129,6 +165,7 @@ class Container:
         impl = implementation or service_type
 
         with self._lock:
+            self._plans.clear()
             self._registrations[service_type] = Registration(
                 service_type=service_type,
                 implementation=impl,
@@ -156,6 +193,7 @@ class Container:
             lifetime: Instance lifetime
         """
         with self._lock:
+            self._plans.clear()
             self._registrations[service_type] = Registration(
                 service_type=service_type,
                 implementation=factory,
@@ -179,6 +217,7 @@ class Container:
             instance: The instance to use
         """
         with self._lock:
+            self._plans.clear()
             self._registrations[service_type] = Registration(
                 service_type=service_type,
                 implementation=type(instance),
@@ -205,133 +244,178 @@ class Container:
             DependencyNotFoundError: If service not registered
             CircularDependencyError: If circular dependency detected
         """
-        return self._resolve(service_type, set())
+        return self._resolve(service_type, {})
 
     def _resolve(
         self,
         service_type: type[T],
-        resolving_stack: set[type],
+        resolving: dict[type, None],
     ) -> T:
-        """Internal resolution with circular dependency detection."""
-        # Check for circular dependency
-        if service_type in resolving_stack:
-            chain = " -> ".join(t.__name__ for t in resolving_stack)
-            raise CircularDependencyError(
-                f"Circular dependency detected: {chain} -> {service_type.__name__}"
-            )
+        """
+        Internal resolution with circular dependency detection.
 
-        with self._lock:
-            registration = self._registrations.get(service_type)
+        resolving is the chain of types being built on this call path
+        (an insertion-ordered dict, for O(1) membership and a readable chain).
+        """
+        registration = self._registrations.get(service_type)
 
+        if registration is None:
             # Check parent container
-            if not registration and self._parent:
+            if self._parent:
                 return self._parent.resolve(service_type)
+            raise DependencyNotFoundError(
+                f"No registration found for {service_type.__name__}"
+            )
 
-            if not registration:
-                raise DependencyNotFoundError(
-                    f"No registration found for {service_type.__name__}"
-                )
-
-            # Return existing singleton
-            if registration.lifetime == Lifetime.SINGLETON and registration.instance:
-                return registration.instance  # type: ignore[no-any-return]
-
-            # Track resolution stack
-            resolving_stack = resolving_stack | {service_type}
+        # Return existing singleton without locking
+        instance = registration.instance
+        if instance is not None and registration.lifetime is Lifetime.SINGLETON:
+            return instance  # type: ignore[no-any-return]
 
-            # Create instance
-            instance = self._create_instance(registration, resolving_stack)
+        if service_type in resolving:
+            chain = " -> ".join(t.__name__ for t in resolving)
+            raise CircularDependencyError(
+                f"Circular dependency detected: {chain} -> {service_type.__name__}"
+            )
 
-            # Store singleton
-            if registration.lifetime == Lifetime.SINGLETON:
-                registration.instance = instance
+        if registration.lifetime is not Lifetime.SINGLETON:
+            return self._create_instance(registration, resolving)  # type: ignore[no-any-return]
 
-            return instance  # type: ignore[no-any-return]
+        with self._singleton_lock:
+            # Another thread may have built it while we waited
+            if registration.instance is None:
+                registration.instance = self._create_instance(registration, resolving)
+            return registration.instance  # type: ignore[no-any-return]
 
     def _create_instance(
         self,
         registration: Registration,
-        resolving_stack: set[type],
+        resolving: dict[type, None],
     ) -> Any:
         """Create an instance with dependency injection."""
-        impl = registration.implementation
-
-        # Use factory if provided
-        if registration.factory:
-            # Resolve factory dependencies
-            sig = inspect.signature(registration.factory)
-            kwargs = self._resolve_parameters(sig, resolving_stack)
-            return registration.factory(**kwargs)
+        plan = self._plans.get(registration.service_type)
+        if plan is None or plan.registration is not registration:
+            plan = self._compile_plan(registration)
 
-        # Get constructor parameters
-        if inspect.isclass(impl):
-            try:
-                sig = inspect.signature(impl.__init__)
-                kwargs = self._resolve_parameters(sig, resolving_stack)
-                return impl(**kwargs)
-            except ValueError:
-                # No signature (e.g., built-in types)
-                return impl()
-
-        # It's a callable or value
-        return impl
+        if plan.target is None:
+            # It's a callable or value
+            return registration.implementation
 
-    def _resolve_parameters(
-        self,
-        sig: inspect.Signature,
-        resolving_stack: set[type],
-    ) -> dict[str, Any]:
-        """Resolve constructor parameters."""
         kwargs = {}
-
+        if plan.dependencies:
+            resolving[registration.service_type] = None
+            try:
+                for dependency in plan.dependencies:
+                    # Built singletons are used directly
+                    dep = dependency.registration
+                    if dep.instance is not None and dep.lifetime is Lifetime.SINGLETON:
+                        kwargs[dependency.name] = dep.instance
+                        continue
+                    try:
+                        kwargs[dependency.name] = self._resolve(
+                            dependency.service_type, resolving
+                        )
+                    except DependencyNotFoundError:
+                        if dependency.required:
+                            raise
+            finally:
+                del resolving[registration.service_type]
+
+        return plan.target(**kwargs)
+
+    def _compile_plan(self, registration: Registration) -> ConstructionPlan:
+        """Inspect a registration's signature once and cache the wiring."""
+        with self._lock:
+            impl = registration.implementation
+            if registration.factory:
+                target = signature_of = registration.factory
+            elif inspect.isclass(impl):
+                target, signature_of = impl, impl.__init__
+            else:
+                target = signature_of = None
+
+            dependencies: tuple[PlannedDependency, ...] = ()
+            if signature_of is not None:
+                dependencies = self._plan_parameters(signature_of)
+
+            plan = ConstructionPlan(registration, target, dependencies)
+            # Don't cache a plan for a registration replaced meanwhile
+            if self._registrations.get(registration.service_type) is registration:
+                self._plans[registration.service_type] = plan
+                self._plans_compiled += 1
+            return plan
+
+    def _plan_parameters(
+        self, func: Callable[..., Any]
+    ) -> tuple[PlannedDependency, ...]:
+        """Map constructor parameters to registrations."""
+        try:
+            sig = inspect.signature(func)
+        except (ValueError, TypeError):
+            # No signature (e.g., built-in types)
+            return ()
+        try:
+            hints = get_type_hints(func)
+        except Exception:
+            hints = {}
+
+        dependencies = []
         for name, param in sig.parameters.items():
-            if name == "self":
+            if name == "self" or param.kind in (
+                inspect.Parameter.VAR_POSITIONAL,
+                inspect.Parameter.VAR_KEYWORD,
+            ):
                 continue
 
-            # Get type annotation
-            if param.annotation != inspect.Parameter.empty:
-                param_type = param.annotation
+            param_type = hints.get(name, param.annotation)
+            if param_type is inspect.Parameter.empty:
+                continue
+            has_default = param.default is not inspect.Parameter.empty
 
-                # Skip primitives and optionals with defaults
-                if param_type in (str, int, float, bool):
-                    if param.default != inspect.Parameter.empty:
-                        continue
+            # Skip primitives and optionals with defaults
+            if param_type in _PRIMITIVES and has_default:
+                continue
 
-                # Try to resolve
-                try:
-                    if param_type in self._registrations:
-                        kwargs[name] = self._resolve(param_type, resolving_stack)
-                    elif param.default == inspect.Parameter.empty:
-                        # Required parameter without registration
-                        logger.warning(f"Cannot resolve parameter {name}: {param_type}")
-                except DependencyNotFoundError:
-                    if param.default == inspect.Parameter.empty:
-                        raise
+            try:
+                registration = self._registrations.get(param_type)
+            except TypeError:  # Unhashable annotation
+                registration = None
+
+            if registration is not None:
+                dependencies.append(
+                    PlannedDependency(
+                        name=name,
+                        service_type=param_type,
+                        registration=registration,
+                        required=not has_default,
+                    )
+                )
+            elif not has_default:
+                # Required parameter without registration
+                logger.warning(f"Cannot resolve parameter {name}: {param_type}")
 
-        return kwargs
+        return tuple(dependencies)
 
     def resolve_all(self, service_type: type[T]) -> list[T]:
         """Resolve all registrations that implement a type."""
-        results: list[T] = []
-
         with self._lock:
-            for reg_type, registration in self._registrations.items():
-                impl = registration.implementation
-                if isinstance(impl, type) and issubclass(impl, service_type):
-                    results.append(self.resolve(reg_type))
-
-        return results
+            matching = [
+                reg_type
+                for reg_type, registration in self._registrations.items()
+                if isinstance(registration.implementation, type)
+                and issubclass(registration.implementation, service_type)
+            ]
+        return [self.resolve(reg_type) for reg_type in matching]
 
     def resolve_by_tag(self, tag: str) -> list[Any]:
         """Resolve all services with a specific tag."""
-        results: list[Any] = []
-
         with self._lock:
-            for service_type, registration in self._registrations.items():
-                if tag in registration.tags:
-                    results.append(self.resolve(service_type))
-
-        return results
+            matching = [
+                service_type
+                for service_type, registration in self._registrations.items()
+                if tag in registration.tags
+            ]
+        return [self.resolve(service_type) for service_type in matching]
 
     def is_registered(self, service_type: type) -> bool:
         """Check if a type is registered."""
@@ -361,10 +445,24 @@ class Container:
                 for t, r in self._registrations.items()
             }
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get resolution statistics."""
+        return {
+            "registrations": len(self._registrations),
+            "compiled_plans": len(self._plans),
+            "plans_compiled": self._plans_compiled,
+            "singletons_built": sum(
+                1
+                for r in self._registrations.values()
+                if r.lifetime is Lifetime.SINGLETON and r.instance is not None
+            ),
+        }
+
     def clear(self) -> None:
         """Clear all registrations."""
         with self._lock:
             self._registrations.clear()
+            self._plans.clear()
 
 
 # ============== Global Container ==============
@@ -5,9 +5,10 @@ Observability Framework
 Production-grade observability for monitoring, tracing, and metrics.
 
 Components:
-- Metrics: Counters, gauges, histograms
+- Metrics: Counters, gauges, histograms, quantile sketches
 - Tracing: Distributed tracing with span management
 - Health Checks: Service health monitoring
+- Profiling: Sampling CPU profiler with folded-stack output
 - Structured Logging: Contextual logging
 
 Academic Reference:
@@ -31,38 +32,100 @@ Example:
         return db.ping()
 """
 
-from src.core.observability.health import (
-    HealthCheck,
-    HealthRegistry,
-    HealthStatus,
-    get_health_status,
-    health_check,
-)
-from src.core.observability.metrics import (
-    Counter,
-    Gauge,
-    Histogram,
-    MetricsRegistry,
-    Timer,
-    counted,
-    timed,
-)
-from src.core.observability.nps_metrics import (
-    EngagementMetrics,
-    FeedbackEntry,
-    NPSCategory,
-    NPSReport,
-    UserSatisfactionCollector,
-    collect_nps_score,
-    get_nps_score,
-    get_satisfaction_collector,
-)
-from src.core.observability.tracing import (
-    Span,
-    SpanContext,
-    Tracer,
-    get_tracer,
-    trace,
+from typing import TYPE_CHECKING
+
+from src._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core.observability.exporters import (
+        BatchSpanProcessor,
+        OTLPJsonLinesExporter,
+    )
+    from src.core.observability.health import (
+        CachedHealth,
+        HealthCheck,
+        HealthRegistry,
+        HealthScheduler,
+        HealthStatus,
+        get_cached_health,
+        get_health_scheduler,
+        get_health_status,
+        health_check,
+    )
+    from src.core.observability.metrics import (
+        PROMETHEUS_CONTENT_TYPE,
+        Counter,
+        Gauge,
+        Histogram,
+        MetricsRegistry,
+        QuantileSketch,
+        Timer,
+        counted,
+        timed,
+    )
+    from src.core.observability.nps_metrics import (
+        EngagementMetrics,
+        FeedbackEntry,
+        NPSCategory,
+        NPSReport,
+        UserSatisfactionCollector,
+        collect_nps_score,
+        get_nps_score,
+        get_satisfaction_collector,
+    )
+    from src.core.observability.profiler import SamplingProfiler, get_profiler
+    from src.core.observability.sketch import DDSketch
+    from src.core.observability.tracing import (
+        SamplingPolicy,
+        Span,
+        SpanContext,
+        Tracer,
+        get_tracer,
+        trace,
+    )
+
+# Exports are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BatchSpanProcessor": "src.core.observability.exporters",
+        "OTLPJsonLinesExporter": "src.core.observability.exporters",
+        "CachedHealth": "src.core.observability.health",
+        "HealthCheck": "src.core.observability.health",
+        "HealthRegistry": "src.core.observability.health",
+        "HealthScheduler": "src.core.observability.health",
+        "HealthStatus": "src.core.observability.health",
+        "get_cached_health": "src.core.observability.health",
+        "get_health_scheduler": "src.core.observability.health",
+        "get_health_status": "src.core.observability.health",
+        "health_check": "src.core.observability.health",
+        "PROMETHEUS_CONTENT_TYPE": "src.core.observability.metrics",
+        "Counter": "src.core.observability.metrics",
+        "Gauge": "src.core.observability.metrics",
+        "Histogram": "src.core.observability.metrics",
+        "MetricsRegistry": "src.core.observability.metrics",
+        "QuantileSketch": "src.core.observability.metrics",
+        "Timer": "src.core.observability.metrics",
+        "counted": "src.core.observability.metrics",
+        "timed": "src.core.observability.metrics",
+        "EngagementMetrics": "src.core.observability.nps_metrics",
+        "FeedbackEntry": "src.core.observability.nps_metrics",
+        "NPSCategory": "src.core.observability.nps_metrics",
+        "NPSReport": "src.core.observability.nps_metrics",
+        "UserSatisfactionCollector": "src.core.observability.nps_metrics",
+        "collect_nps_score": "src.core.observability.nps_metrics",
+        "get_nps_score": "src.core.observability.nps_metrics",
+        "get_satisfaction_collector": "src.core.observability.nps_metrics",
+        "SamplingProfiler": "src.core.observability.profiler",
+        "get_profiler": "src.core.observability.profiler",
+        "DDSketch": "src.core.observability.sketch",
+        "SamplingPolicy": "src.core.observability.tracing",
+        "Span": "src.core.observability.tracing",
+        "SpanContext": "src.core.observability.tracing",
+        "Tracer": "src.core.observability.tracing",
+        "get_tracer": "src.core.observability.tracing",
+        "trace": "src.core.observability.tracing",
+    },
 )
 
 __all__ = [
@@ -70,22 +133,35 @@ __all__ = [
     "Counter",
     "Gauge",
     "Histogram",
+    "QuantileSketch",
+    "DDSketch",
     "Timer",
     "MetricsRegistry",
+    "PROMETHEUS_CONTENT_TYPE",
     "timed",
     "counted",
     # Tracing
     "Tracer",
     "Span",
     "SpanContext",
+    "SamplingPolicy",
+    "BatchSpanProcessor",
+    "OTLPJsonLinesExporter",
     "trace",
     "get_tracer",
     # Health
     "HealthCheck",
     "HealthStatus",
     "HealthRegistry",
+    "HealthScheduler",
+    "CachedHealth",
     "health_check",
     "get_health_status",
+    "get_health_scheduler",
+    "get_cached_health",
+    # Profiling
+    "SamplingProfiler",
+    "get_profiler",
     # NPS & User Satisfaction
     "UserSatisfactionCollector",
     "FeedbackEntry",
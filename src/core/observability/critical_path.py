@@ -0,0 +1,260 @@
+"""
+Critical Path Analysis
+======================
+
+Explain where the latency of a trace went.
+
+The critical path of a span is the chain of descendants that determined
+when it finished: starting from the parent's end, take the child that
+ended last, then the child that ended last before that one started, and
+so on, recursing into each. Work that overlapped it (e.g. the faster
+agents of a parallel fan-out) is off the path and did not add latency.
+
+For a tour this gives, per point, the stage that dominated the point's
+latency (largest self time on the path) and the agent whose work set it.
+
+Example:
+    spans = collect_trace(trace_id)
+    report = analyze_trace(spans)
+
+    for point in report.points:
+        print(point.index, point.bottleneck.name, point.critical_agent)
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.core.observability.tracing import Span, Tracer
+
+POINT_SPAN = "point.process"
+
+# Tolerance for children ending at (almost) the same instant as the cursor
+_EPSILON_MS = 0.001
+
+
+@dataclass
+class PathSegment:
+    """A span on the critical path."""
+
+    name: str
+    span_id: str
+    depth: int
+    start_offset_ms: float
+    duration_ms: float
+    self_ms: float
+    agent_type: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "depth": self.depth,
+            "start_offset_ms": round(self.start_offset_ms, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            "self_ms": round(self.self_ms, 3),
+            "agent_type": self.agent_type,
+        }
+
+
+@dataclass
+class PointCriticalPath:
+    """Critical path of one route point."""
+
+    index: int | None
+    name: str | None
+    duration_ms: float
+    segments: list[PathSegment] = field(default_factory=list)
+
+    @property
+    def bottleneck(self) -> PathSegment | None:
+        """
+        Segment with the most self time.
+
+        This is the point span itself when most of its time is not covered
+        by any instrumented stage.
+        """
+        return max(self.segments, key=lambda s: s.self_ms, default=None)
+
+    @property
+    def critical_agent(self) -> str | None:
+        """Agent whose work was on the critical path, if any."""
+        for segment in self.segments:
+            if segment.agent_type:
+                return segment.agent_type
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        bottleneck = self.bottleneck
+        return {
+            "point_index": self.index,
+            "point_name": self.name,
+            "duration_ms": round(self.duration_ms, 3),
+            "bottleneck_stage": bottleneck.name if bottleneck else None,
+            "bottleneck_ms": round(bottleneck.self_ms, 3) if bottleneck else None,
+            "critical_agent": self.critical_agent,
+            "path": [segment.to_dict() for segment in self.segments],
+        }
+
+
+@dataclass
+class CriticalPathReport:
+    """Critical path of a whole trace, broken down per point."""
+
+    trace_id: str
+    root_name: str
+    duration_ms: float
+    stages: list[PathSegment] = field(default_factory=list)
+    points: list[PointCriticalPath] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "root": self.root_name,
+            "duration_ms": round(self.duration_ms, 3),
+            "stages": [stage.to_dict() for stage in self.stages],
+            "points": [point.to_dict() for point in self.points],
+        }
+
+    def format_text(self) -> str:
+        """Human-readable report for the CLI."""
+        lines = [
+            f"Critical path for trace {self.trace_id} "
+            f"({self.root_name}, {self.duration_ms:.1f}ms)",
+            "",
+            "Stages:",
+        ]
+        for stage in self.stages:
+            lines.append(
+                f"  {stage.name:<24} {stage.duration_ms:>10.1f}ms "
+                f"(self {stage.self_ms:.1f}ms)"
+            )
+
+        if self.points:
+            lines += ["", "Points:"]
+        for point in self.points:
+            bottleneck = point.bottleneck
+            label = point.name or f"#{point.index}"
+            lines.append(
+                f"  [{point.index}] {label}: {point.duration_ms:.1f}ms, "
+                f"bottleneck {bottleneck.name if bottleneck else '-'} "
+                f"({bottleneck.self_ms if bottleneck else 0:.1f}ms), "
+                f"critical agent {point.critical_agent or '-'}"
+            )
+        return "\n".join(lines)
+
+
+# ============== Analysis ==============
+
+
+def collect_trace(trace_id: str) -> list[Span]:
+    """Gather the finished spans of a trace from every tracer."""
+    spans: list[Span] = []
+    for tracer in list(Tracer._instances.values()):
+        spans.extend(tracer.get_spans(trace_id=trace_id, limit=tracer.max_spans))
+    return spans
+
+
+def _children_by_parent(spans: list[Span]) -> dict[str | None, list[Span]]:
+    children: dict[str | None, list[Span]] = defaultdict(list)
+    for span in spans:
+        children[span.context.parent_span_id].append(span)
+    return children
+
+
+def critical_path(
+    root: Span,
+    spans: list[Span],
+    stop_at: str | None = None,
+) -> list[PathSegment]:
+    """
+    Critical path below (and including) root, ordered by start time.
+
+    Args:
+        root: Span whose latency is explained
+        spans: All finished spans of the trace
+        stop_at: Span name whose subtree is not descended into
+    """
+    children = _children_by_parent(spans)
+    origin = root.start_time
+    segments: list[PathSegment] = []
+
+    def offset_ms(moment) -> float:
+        return (moment - origin).total_seconds() * 1000
+
+    def walk(span: Span, depth: int, agent_type: str | None) -> None:
+        agent_type = span.attributes.get("agent.type", agent_type)
+        segment = PathSegment(
+            name=span.name,
+            span_id=span.context.span_id,
+            depth=depth,
+            start_offset_ms=offset_ms(span.start_time),
+            duration_ms=span.duration_ms or 0.0,
+            self_ms=span.duration_ms or 0.0,
+            agent_type=agent_type,
+        )
+        segments.append(segment)
+
+        if depth > 0 and span.name == stop_at:
+            return
+
+        cursor = offset_ms(span.end_time or span.start_time)
+        ordered = sorted(
+            (c for c in children.get(span.context.span_id, []) if c.end_time),
+            key=lambda c: c.end_time,
+            reverse=True,
+        )
+        for child in ordered:
+            if offset_ms(child.end_time) <= cursor + _EPSILON_MS:
+                segment.self_ms -= child.duration_ms or 0.0
+                walk(child, depth + 1, agent_type)
+                cursor = offset_ms(child.start_time)
+
+        segment.self_ms = max(segment.self_ms, 0.0)
+
+    walk(root, 0, None)
+    segments.sort(key=lambda s: (s.start_offset_ms, s.depth))
+    return segments
+
+
+def analyze_trace(spans: list[Span]) -> CriticalPathReport | None:
+    """
+    Build a critical-path report from the spans of one trace.
+
+    Returns None if the trace's root span has not finished (or was
+    evicted from the tracer's buffer).
+    """
+    finished = [s for s in spans if s.end_time is not None]
+    roots = [s for s in finished if s.context.parent_span_id is None]
+    if not roots:
+        return None
+    root = min(roots, key=lambda s: s.start_time)
+
+    stages = [
+        segment
+        for segment in critical_path(root, finished, stop_at=POINT_SPAN)
+        if segment.depth == 1
+    ]
+
+    points = []
+    for span in sorted(
+        (s for s in finished if s.name == POINT_SPAN), key=lambda s: s.start_time
+    ):
+        points.append(
+            PointCriticalPath(
+                index=span.attributes.get("point.index"),
+                name=span.attributes.get("point.name"),
+                duration_ms=span.duration_ms or 0.0,
+                segments=critical_path(span, finished),
+            )
+        )
+
+    return CriticalPathReport(
+        trace_id=root.context.trace_id,
+        root_name=root.name,
+        duration_ms=root.duration_ms or 0.0,
+        stages=stages,
+        points=points,
+    )
@@ -0,0 +1,359 @@
+"""
+Span Exporters
+==============
+
+Ship finished spans off the request path.
+
+BatchSpanProcessor queues spans from Tracer._record (a non-blocking put)
+and a background thread drains the queue in batches, so exporting never
+adds latency to the traced code. When the queue is full new spans are
+dropped and counted rather than blocking.
+
+OTLPJsonLinesExporter writes each batch as one line of OTLP/JSON
+(ExportTraceServiceRequest), which the OpenTelemetry Collector's file
+receiver and most trace tooling can ingest, to a local file or a TCP
+socket.
+
+Example:
+    tracer = get_tracer("tour-guide")
+    tracer.add_span_processor(
+        BatchSpanProcessor(OTLPJsonLinesExporter(path="traces.jsonl"))
+    )
+
+    ...
+
+    tracer.shutdown()  # flush remaining spans
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from src.core.observability.tracing import Span, SpanKind, SpanStatus
+
+logger = logging.getLogger(__name__)
+
+
+class SpanProcessor(Protocol):
+    """Receives every span the tracer records."""
+
+    def on_end(self, span: Span) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class SpanExporter(Protocol):
+    """Writes a batch of spans to a backend."""
+
+    def export(self, spans: list[Span]) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+# ============== OTLP/JSON Encoding ==============
+
+_OTLP_SPAN_KIND = {
+    SpanKind.INTERNAL: 1,
+    SpanKind.SERVER: 2,
+    SpanKind.CLIENT: 3,
+    SpanKind.PRODUCER: 4,
+    SpanKind.CONSUMER: 5,
+}
+
+_OTLP_STATUS_CODE = {
+    SpanStatus.UNSET: 0,
+    SpanStatus.OK: 1,
+    SpanStatus.ERROR: 2,
+}
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, list | tuple):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()]
+
+
+def _unix_nanos(moment: Any) -> str:
+    return str(int(moment.timestamp() * 1_000_000_000))
+
+
+def span_to_otlp(span: Span) -> dict[str, Any]:
+    """Encode a finished span as an OTLP/JSON span object."""
+    status: dict[str, Any] = {"code": _OTLP_STATUS_CODE[span.status]}
+    if "status_message" in span.attributes:
+        status["message"] = str(span.attributes["status_message"])
+
+    encoded = {
+        "traceId": span.context.trace_id,
+        "spanId": span.context.span_id,
+        "name": span.name,
+        "kind": _OTLP_SPAN_KIND[span.kind],
+        "startTimeUnixNano": _unix_nanos(span.start_time),
+        "endTimeUnixNano": _unix_nanos(span.end_time or span.start_time),
+        "attributes": _otlp_attributes(span.attributes),
+        "events": [
+            {
+                "name": event.name,
+                "timeUnixNano": _unix_nanos(event.timestamp),
+                "attributes": _otlp_attributes(event.attributes),
+            }
+            for event in span.events
+        ],
+        "status": status,
+    }
+    if span.context.parent_span_id:
+        encoded["parentSpanId"] = span.context.parent_span_id
+    return encoded
+
+
+def encode_otlp_request(
+    spans: list[Span],
+    service_name: str,
+    scope_name: str = "src.core.observability",
+    scope_version: str = "1.0.0",
+) -> dict[str, Any]:
+    """Wrap spans in an OTLP ExportTraceServiceRequest."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": service_name})
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": scope_name, "version": scope_version},
+                        "spans": [span_to_otlp(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+# ============== Exporters ==============
+
+
+class OTLPJsonLinesExporter:
+    """
+    Write span batches as OTLP/JSON lines to a file or TCP socket.
+
+    Parameters:
+        path: File to append to
+        address: (host, port) of a TCP listener (used if path is None)
+        service_name: Value of the `service.name` resource attribute
+
+    Example:
+        exporter = OTLPJsonLinesExporter(path="logs/traces.jsonl")
+        exporter = OTLPJsonLinesExporter(address=("127.0.0.1", 4319))
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        address: tuple[str, int] | None = None,
+        service_name: str = "tour-guide",
+    ):
+        if path is None and address is None:
+            raise ValueError("Either path or address is required")
+
+        self.path = Path(path) if path is not None else None
+        self.address = address
+        self.service_name = service_name
+
+        self._socket: socket.socket | None = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, spans: list[Span]) -> None:
+        """Write one OTLP/JSON line for the batch."""
+        if not spans:
+            return
+        line = json.dumps(
+            encode_otlp_request(spans, self.service_name),
+            separators=(",", ":"),
+            default=str,
+        )
+        data = (line + "\n").encode("utf-8")
+
+        if self.path is not None:
+            with open(self.path, "ab") as f:
+                f.write(data)
+            return
+
+        try:
+            self._connection().sendall(data)
+        except OSError:
+            # Drop the broken connection; the next batch reconnects
+            self._close_socket()
+            raise
+
+    def _connection(self) -> socket.socket:
+        if self._socket is None:
+            self._socket = socket.create_connection(self.address, timeout=5.0)
+        return self._socket
+
+    def _close_socket(self) -> None:
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            finally:
+                self._socket = None
+
+    def shutdown(self) -> None:
+        self._close_socket()
+
+
+# ============== Batch Processor ==============
+
+
+@dataclass
+class BatchProcessorStats:
+    """Statistics for a batch span processor."""
+
+    spans_queued: int = 0
+    spans_exported: int = 0
+    spans_dropped: int = 0
+    batches_exported: int = 0
+    export_failures: int = 0
+
+
+_FLUSH = object()
+
+
+class BatchSpanProcessor:
+    """
+    Export spans in batches from a background thread.
+
+    Parameters:
+        exporter: Backend the batches are written to
+        max_queue_size: Spans buffered before new ones are dropped
+        max_batch_size: Spans per export call
+        schedule_delay_seconds: Maximum time a span waits for a batch
+
+    Example:
+        processor = BatchSpanProcessor(OTLPJsonLinesExporter(path="t.jsonl"))
+        tracer.add_span_processor(processor)
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 512,
+        schedule_delay_seconds: float = 1.0,
+    ):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.schedule_delay_seconds = schedule_delay_seconds
+
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue_size)
+        self._flushed = threading.Condition()
+        self._flush_generation = 0
+        self._shutdown = False
+
+        self.stats = BatchProcessorStats()
+
+        self._worker = threading.Thread(
+            target=self._run, name="BatchSpanProcessor", daemon=True
+        )
+        self._worker.start()
+
+    def on_end(self, span: Span) -> None:
+        """Queue a span without blocking the caller."""
+        if self._shutdown:
+            return
+        try:
+            self._queue.put_nowait(span)
+            self.stats.spans_queued += 1
+        except queue.Full:
+            self.stats.spans_dropped += 1
+
+    def _run(self) -> None:
+        batch: list[Span] = []
+        # When the oldest span in the batch must be exported by
+        deadline: float | None = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _FLUSH or item is None:
+                self._export(batch)
+                batch, deadline = [], None
+                if item is _FLUSH:
+                    with self._flushed:
+                        self._flush_generation += 1
+                        self._flushed.notify_all()
+                    if self._shutdown and self._queue.empty():
+                        return
+                continue
+
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.schedule_delay_seconds
+            if len(batch) >= self.max_batch_size or time.monotonic() >= deadline:
+                self._export(batch)
+                batch, deadline = [], None
+
+    def _export(self, batch: list[Span]) -> None:
+        if not batch:
+            return
+        try:
+            self.exporter.export(batch)
+            self.stats.spans_exported += len(batch)
+            self.stats.batches_exported += 1
+        except Exception as e:
+            self.stats.export_failures += 1
+            self.stats.spans_dropped += len(batch)
+            logger.warning(f"Span export failed ({len(batch)} spans): {e}")
+
+    def force_flush(self, timeout: float = 5.0) -> bool:
+        """Export everything queued so far. Returns False on timeout."""
+        if not self._worker.is_alive():
+            return False
+        with self._flushed:
+            target = self._flush_generation + 1
+            self._queue.put(_FLUSH)
+            return self._flushed.wait_for(
+                lambda: self._flush_generation >= target, timeout=timeout
+            )
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Flush remaining spans and stop the worker."""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self.force_flush(timeout)
+        self._worker.join(timeout)
+        self.exporter.shutdown()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get processor statistics."""
+        return {
+            "queued": self._queue.qsize(),
+            "spans_queued": self.stats.spans_queued,
+            "spans_exported": self.stats.spans_exported,
+            "spans_dropped": self.stats.spans_dropped,
+            "batches_exported": self.stats.batches_exported,
+            "export_failures": self.stats.export_failures,
+        }
@@ -9,6 +9,15 @@ Features:
 - Dependency health (databases, APIs)
 - Liveness and readiness probes
 - Health aggregation
+- Background scheduling with a cached aggregate
+
+Each check runs on its own daemon thread and is abandoned (reported
+unhealthy) once its timeout passes, so a hung dependency cannot block the
+caller. A check that is still running is not started again; later runs
+wait on the same attempt.
+
+HealthScheduler runs due checks in the background at their interval and
+publishes the aggregate, so probes only read the cached snapshot.
 
 Example:
     @health_check("database", critical=True)
@@ -19,6 +28,10 @@ Example:
     status = get_health_status()
     if not status.is_healthy:
         alert_ops_team()
+
+    # Or keep it fresh in the background and read the cache
+    get_health_scheduler().start()
+    cached = get_cached_health()
 """
 
 from __future__ import annotations
@@ -28,6 +41,7 @@ import threading
 import time
 import traceback
 from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -97,6 +111,7 @@ class HealthRegistry:
     """
 
     _checks: dict[str, HealthCheck] = {}
+    _in_flight: dict[str, Future] = {}
     _lock = threading.RLock()
 
     @classmethod
@@ -163,11 +178,44 @@ class HealthRegistry:
             if now - check.last_check_time < check.interval:
                 return check.last_result
 
-        # Run the check
-        start_time = time.time()
+        return cls._collect(check, cls._submit(check), time.perf_counter(), now)
+
+    @classmethod
+    def _submit(cls, check: HealthCheck) -> Future:
+        """Start the check on a daemon thread, or join the attempt in flight."""
+        with cls._lock:
+            future = cls._in_flight.get(check.name)
+            if future is not None and not future.done():
+                return future
+
+            future = Future()
+            cls._in_flight[check.name] = future
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(check.check_fn())
+            except BaseException as e:
+                future.set_exception(e)
+
+        # Daemon threads: an abandoned, hung check must not block exit
+        threading.Thread(target=run, name=f"health-{check.name}", daemon=True).start()
+        return future
+
+    @classmethod
+    def _collect(
+        cls,
+        check: HealthCheck,
+        future: Future,
+        started: float,
+        now: float,
+    ) -> HealthCheckResult:
+        """Wait for a submitted check (up to its timeout) and record the result."""
+        remaining = check.timeout - (time.perf_counter() - started)
         try:
-            result = check.check_fn()
-            duration_ms = (time.time() - start_time) * 1000
+            result = future.result(timeout=max(remaining, 0.0))
+            duration_ms = (time.perf_counter() - started) * 1000
 
             if result:
                 status = HealthStatus.HEALTHY
@@ -179,7 +227,7 @@ class HealthRegistry:
                 check.consecutive_failures += 1
 
             health_result = HealthCheckResult(
-                name=name,
+                name=check.name,
                 status=status,
                 message=message,
                 duration_ms=duration_ms,
@@ -190,18 +238,20 @@ class HealthRegistry:
             )
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - started) * 1000
             check.consecutive_failures += 1
+            timed_out = not future.done()
 
             health_result = HealthCheckResult(
-                name=name,
+                name=check.name,
                 status=HealthStatus.UNHEALTHY,
-                message=str(e),
+                message=f"Timed out after {check.timeout}s" if timed_out else str(e),
                 duration_ms=duration_ms,
-                error=traceback.format_exc(),
+                error=None if timed_out else "".join(traceback.format_exception(e)),
                 details={
                     "critical": check.critical,
                     "consecutive_failures": check.consecutive_failures,
+                    "timed_out": timed_out,
                 },
             )
 
@@ -216,16 +266,33 @@ class HealthRegistry:
         cls,
         force: bool = False,
     ) -> dict[str, HealthCheckResult]:
-        """Run all registered health checks."""
-        results = {}
+        """
+        Run all registered health checks concurrently.
 
+        Checks within their interval return their last result; the call
+        takes at most as long as the slowest check's timeout.
+        """
         with cls._lock:
-            check_names = list(cls._checks.keys())
+            checks = list(cls._checks.values())
 
-        for name in check_names:
-            results[name] = cls.run_check(name, force=force)
+        now = time.time()
+        results: dict[str, HealthCheckResult] = {}
+        pending = []
+        for check in checks:
+            if (
+                not force
+                and check.last_result
+                and now - check.last_check_time < check.interval
+            ):
+                results[check.name] = check.last_result
+            else:
+                pending.append((check, cls._submit(check), time.perf_counter()))
 
-        return results
+        for check, future, started in pending:
+            results[check.name] = cls._collect(check, future, started, now)
+
+        # Keep registration order
+        return {check.name: results[check.name] for check in checks}
 
     @classmethod
     def get_aggregate_status(cls) -> AggregateHealth:
@@ -254,6 +321,7 @@ class HealthRegistry:
         """Clear all checks (for testing)."""
         with cls._lock:
             cls._checks.clear()
+            cls._in_flight.clear()
 
 
 @dataclass
@@ -340,6 +408,138 @@ class AggregateHealth:
         }
 
 
+# ============== Background Scheduling ==============
+
+
+@dataclass
+class CachedHealth:
+    """
+    Aggregate health published by the scheduler, with staleness metadata.
+
+    The response payload is rendered once when the snapshot is published;
+    reads only add the current age.
+    """
+
+    aggregate: AggregateHealth
+    computed_at: float  # time.monotonic() when published
+    max_age: float
+    payload: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def status(self) -> HealthStatus:
+        return self.aggregate.status
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.computed_at
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the scheduler has not refreshed within max_age."""
+        return self.age_seconds > self.max_age
+
+    def to_dict(self) -> dict[str, Any]:
+        age = self.age_seconds
+        return {
+            **self.payload,
+            "age_seconds": round(age, 3),
+            "max_age_seconds": self.max_age,
+            "stale": age > self.max_age,
+        }
+
+
+class HealthScheduler:
+    """
+    Run health checks in the background and cache the aggregate.
+
+    Every `tick` seconds the checks whose interval has elapsed are run
+    concurrently (with their timeouts enforced) and a new snapshot is
+    published. Readers get the last snapshot without running anything.
+
+    Parameters:
+        tick: Seconds between scheduling passes
+        max_age: Age after which the snapshot is reported stale
+            (defaults to the longest check interval plus timeout, plus a tick)
+
+    Example:
+        scheduler = HealthScheduler(tick=1.0)
+        scheduler.start()
+        cached = scheduler.get_cached()
+        scheduler.stop()
+    """
+
+    def __init__(self, tick: float = 1.0, max_age: float | None = None):
+        self.tick = tick
+        self.max_age = max_age
+        self._cached: CachedHealth | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.refreshes = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Publish a first snapshot, then keep refreshing in the background."""
+        with self._lock:
+            if self.is_running:
+                return
+            self._stop.clear()
+            self.refresh()
+            self._thread = threading.Thread(
+                target=self._run, name="HealthScheduler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread (the last snapshot is kept)."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.tick):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Health refresh failed: {e}")
+
+    def refresh(self) -> CachedHealth:
+        """Run due checks now and publish the aggregate."""
+        results = HealthRegistry.run_all_checks()
+        aggregate = AggregateHealth.from_results(results)
+        cached = CachedHealth(
+            aggregate=aggregate,
+            computed_at=time.monotonic(),
+            max_age=self._max_age(),
+            payload=aggregate.to_dict(),
+        )
+        self._cached = cached
+        self.refreshes += 1
+        return cached
+
+    def _max_age(self) -> float:
+        if self.max_age is not None:
+            return self.max_age
+        with HealthRegistry._lock:
+            checks = list(HealthRegistry._checks.values())
+        longest = max((c.interval + c.timeout for c in checks), default=0.0)
+        return longest + self.tick
+
+    def get_cached(self) -> CachedHealth | None:
+        """Last published snapshot, or None before the first refresh."""
+        return self._cached
+
+    def reset(self) -> None:
+        """Stop and drop the cached snapshot (for testing)."""
+        self.stop()
+        self._cached = None
+
+
 # ============== Decorator ==============
 
 
@@ -387,6 +587,25 @@ def get_health_status() -> AggregateHealth:
     return HealthRegistry.get_aggregate_status()
 
 
+_scheduler: HealthScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_health_scheduler() -> HealthScheduler:
+    """Get the process-wide health scheduler (not started)."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = HealthScheduler()
+    return _scheduler
+
+
+def get_cached_health() -> CachedHealth | None:
+    """Last snapshot published by the health scheduler, if any."""
+    return _scheduler.get_cached() if _scheduler is not None else None
+
+
 # ============== Standard Health Checks ==============
 
 
@@ -8,6 +8,7 @@ Metric Types:
 - Counter: Monotonically increasing value (e.g., total requests)
 - Gauge: Value that can go up or down (e.g., active connections)
 - Histogram: Distribution of values (e.g., response times)
+- QuantileSketch: Mergeable DDSketch with accurate percentiles (e.g., latency)
 
 Example:
     # Create metrics
@@ -19,11 +20,20 @@ Example:
     requests.inc(method="GET", path="/api")
     active_agents.set(5)
     response_time.observe(0.234)
+
+    latency = QuantileSketch("point_latency_seconds", "Point latency", ["stage"])
+    latency.observe(1.7, stage="judge")
+    latency.get_percentile(0.99, stage="judge")
+
+    # Prometheus text exposition (cached per metric between mutations)
+    body = MetricsRegistry.to_prometheus()
 """
 
 from __future__ import annotations
 
+import bisect
 import logging
+import math
 import threading
 import time
 from collections import defaultdict
@@ -32,6 +42,8 @@ from dataclasses import dataclass, field
 from functools import wraps
 from typing import Any, TypeVar
 
+from src.core.observability.sketch import DDSketch
+
 logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -46,6 +58,39 @@ class MetricValue:
     timestamp: float = field(default_factory=time.time)
 
 
+# ============== Prometheus Text Format ==============
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(
+    names: list[str], key: tuple, extra: tuple[str, str] | None = None
+) -> str:
+    """Render a label set as `{a="x",b="y"}` (empty string if no labels)."""
+    pairs = [
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(names, key, strict=False)
+    ]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{_escape_label_value(extra[1])}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value the way Prometheus parses it."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
 class Counter:
     """
     A monotonically increasing counter.
@@ -70,6 +115,7 @@ class Counter:
         self.label_names = labels or []
         self._values: dict[tuple, float] = defaultdict(float)
         self._lock = threading.Lock()
+        self._version = 0
 
         MetricsRegistry.register(self)
 
@@ -81,12 +127,13 @@ class Counter:
         key = self._labels_key(labels)
         with self._lock:
             self._values[key] += value
+            self._version += 1
 
     def get(self, **labels) -> float:
         """Get current value for given labels."""
         key = self._labels_key(labels)
         with self._lock:
-            return self._values[key]
+            return self._values.get(key, 0.0)
 
     def _labels_key(self, labels: dict[str, str]) -> tuple:
         """Create a hashable key from labels."""
@@ -103,6 +150,15 @@ class Counter:
                 for key, value in self._values.items()
             ]
 
+    def prometheus_samples(self) -> list[str]:
+        """Render samples in Prometheus text format."""
+        with self._lock:
+            return [
+                f"{self.name}{_format_labels(self.label_names, key)} "
+                f"{_format_value(value)}"
+                for key, value in self._values.items()
+            ]
+
 
 class Gauge:
     """
@@ -128,6 +184,7 @@ class Gauge:
         self.label_names = labels or []
         self._values: dict[tuple, float] = defaultdict(float)
         self._lock = threading.Lock()
+        self._version = 0
 
         MetricsRegistry.register(self)
 
@@ -136,24 +193,27 @@ class Gauge:
         key = self._labels_key(labels)
         with self._lock:
             self._values[key] = value
+            self._version += 1
 
     def inc(self, value: float = 1.0, **labels) -> None:
         """Increment the gauge."""
         key = self._labels_key(labels)
         with self._lock:
             self._values[key] += value
+            self._version += 1
 
     def dec(self, value: float = 1.0, **labels) -> None:
         """Decrement the gauge."""
         key = self._labels_key(labels)
         with self._lock:
             self._values[key] -= value
+            self._version += 1
 
     def get(self, **labels) -> float:
         """Get current value."""
         key = self._labels_key(labels)
         with self._lock:
-            return self._values[key]
+            return self._values.get(key, 0.0)
 
     def _labels_key(self, labels: dict[str, str]) -> tuple:
         return tuple(labels.get(name, "") for name in self.label_names)
@@ -168,12 +228,24 @@ class Gauge:
                 for key, value in self._values.items()
             ]
 
+    def prometheus_samples(self) -> list[str]:
+        """Render samples in Prometheus text format."""
+        with self._lock:
+            return [
+                f"{self.name}{_format_labels(self.label_names, key)} "
+                f"{_format_value(value)}"
+                for key, value in self._values.items()
+            ]
+
 
 class Histogram:
     """
     Distribution of values across buckets.
 
     Use for things like response times, request sizes, etc.
+    Observations land in exactly one bucket (found by bisection); counts
+    are accumulated only when reading. Use QuantileSketch when accurate
+    percentiles matter more than fixed Prometheus buckets.
 
     Example:
         histogram = Histogram(
@@ -196,31 +268,39 @@ class Histogram:
         self.name = name
         self.description = description
         self.label_names = labels or []
-        self.buckets = buckets or self.DEFAULT_BUCKETS
+        self.buckets = tuple(sorted(buckets or self.DEFAULT_BUCKETS))
 
-        self._bucket_counts: dict[tuple, dict[float, int]] = defaultdict(
-            lambda: defaultdict(int)
-        )
+        # Per-label non-cumulative counts; the extra slot is the +Inf bucket
+        self._bucket_counts: dict[tuple, list[int]] = {}
         self._sum: dict[tuple, float] = defaultdict(float)
         self._count: dict[tuple, int] = defaultdict(int)
         self._lock = threading.Lock()
+        self._version = 0
 
         MetricsRegistry.register(self)
 
     def observe(self, value: float, **labels) -> None:
         """Record an observation."""
         key = self._labels_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
 
         with self._lock:
             self._sum[key] += value
             self._count[key] += 1
 
-            for bucket in self.buckets:
-                if value <= bucket:
-                    self._bucket_counts[key][bucket] += 1
+            counts = self._bucket_counts.get(key)
+            if counts is None:
+                counts = self._bucket_counts[key] = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self._version += 1
 
     def get_percentile(self, p: float, **labels) -> float | None:
-        """Get approximate percentile value."""
+        """
+        Get approximate percentile value.
+
+        Returns the upper bound of the bucket holding the percentile (the
+        largest finite bound if it falls in the +Inf bucket).
+        """
         key = self._labels_key(labels)
 
         with self._lock:
@@ -228,16 +308,28 @@ class Histogram:
             if total == 0:
                 return None
 
-            target = int(total * p)
+            target = max(1, math.ceil(total * p))
             cumulative = 0
 
-            for bucket in sorted(self.buckets):
-                cumulative += self._bucket_counts[key][bucket]
+            for bound, count in zip(
+                self.buckets, self._bucket_counts[key], strict=False
+            ):
+                cumulative += count
                 if cumulative >= target:
-                    return bucket
+                    return bound
 
             return self.buckets[-1]
 
+    def cumulative_buckets(self, key: tuple) -> list[tuple[float, int]]:
+        """Cumulative (upper_bound, count) pairs for a label key, ending at +Inf."""
+        counts = self._bucket_counts.get(key, [0] * (len(self.buckets) + 1))
+        result = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+            cumulative += count
+            result.append((bound, cumulative))
+        return result
+
     def _labels_key(self, labels: dict[str, str]) -> tuple:
         return tuple(labels.get(name, "") for name in self.label_names)
 
@@ -248,10 +340,185 @@ class Histogram:
                 "sum": dict(self._sum),
                 "count": dict(self._count),
                 "buckets": {
-                    key: dict(buckets) for key, buckets in self._bucket_counts.items()
+                    key: dict(self.cumulative_buckets(key)[:-1])
+                    for key in self._bucket_counts
                 },
             }
 
+    def prometheus_samples(self) -> list[str]:
+        """Render `_bucket`/`_sum`/`_count` samples in Prometheus text format."""
+        lines = []
+        with self._lock:
+            for key in self._bucket_counts:
+                for bound, cumulative in self.cumulative_buckets(key):
+                    labels = _format_labels(
+                        self.label_names, key, ("le", _format_value(bound))
+                    )
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.label_names, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(self._sum[key])}")
+                lines.append(f"{self.name}_count{labels} {self._count[key]}")
+        return lines
+
+
+class QuantileSketch:
+    """
+    Per-label DDSketch for accurate, mergeable percentiles.
+
+    Inserts are O(1) and every percentile is within `relative_accuracy`
+    of the true value. Sketches from other workers can be merged in via
+    merge() using the payload from to_dict().
+
+    Example:
+        latency = QuantileSketch(
+            "agent_latency_seconds",
+            "Agent latency",
+            labels=["agent_type"],
+        )
+        latency.observe(0.82, agent_type="video")
+        latency.get_quantiles(agent_type="video")  # {"p50": ..., "p95": ...}
+    """
+
+    DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        labels: list[str] | None = None,
+        relative_accuracy: float = 0.01,
+        quantiles: tuple[float, ...] | None = None,
+    ):
+        self.name = name
+        self.description = description
+        self.label_names = labels or []
+        self.relative_accuracy = relative_accuracy
+        self.quantiles = quantiles or self.DEFAULT_QUANTILES
+
+        self._sketches: dict[tuple, DDSketch] = {}
+        self._lock = threading.Lock()
+        self._version = 0
+
+        MetricsRegistry.register(self)
+
+    def _sketch_for(self, key: tuple) -> DDSketch:
+        """Get or create the sketch for a label key. Caller holds the lock."""
+        sketch = self._sketches.get(key)
+        if sketch is None:
+            sketch = self._sketches[key] = DDSketch(self.relative_accuracy)
+        return sketch
+
+    def observe(self, value: float, **labels) -> None:
+        """Record an observation."""
+        key = self._labels_key(labels)
+        with self._lock:
+            self._sketch_for(key).add(value)
+            self._version += 1
+
+    def get_percentile(self, p: float, **labels) -> float | None:
+        """Get the value at percentile p (0-1), or None if empty."""
+        key = self._labels_key(labels)
+        with self._lock:
+            sketch = self._sketches.get(key)
+            return sketch.quantile(p) if sketch else None
+
+    def get_quantiles(self, **labels) -> dict[str, float | None]:
+        """Get the configured quantiles keyed as p50/p95/p99."""
+        key = self._labels_key(labels)
+        with self._lock:
+            sketch = self._sketches.get(key)
+            return {
+                f"p{q * 100:g}": (sketch.quantile(q) if sketch else None)
+                for q in self.quantiles
+            }
+
+    def get_count(self, **labels) -> int:
+        """Number of observations for the given labels."""
+        key = self._labels_key(labels)
+        with self._lock:
+            sketch = self._sketches.get(key)
+            return sketch.count if sketch else 0
+
+    def label_sets(self) -> list[dict[str, str]]:
+        """Label combinations that have observations."""
+        with self._lock:
+            return [
+                dict(zip(self.label_names, key, strict=False)) for key in self._sketches
+            ]
+
+    def snapshot(self) -> dict[tuple, DDSketch]:
+        """Independent copies of every per-label sketch."""
+        with self._lock:
+            return {key: sketch.copy() for key, sketch in self._sketches.items()}
+
+    def merge(self, other: QuantileSketch | dict[str, Any]) -> None:
+        """
+        Merge another worker's sketches into this one.
+
+        Accepts a QuantileSketch or the payload produced by to_dict().
+        """
+        if isinstance(other, QuantileSketch):
+            incoming = other.snapshot()
+        else:
+            incoming = {
+                tuple(entry["labels"]): DDSketch.from_dict(entry["sketch"])
+                for entry in other["series"]
+            }
+
+        with self._lock:
+            for key, sketch in incoming.items():
+                self._sketch_for(key).merge(sketch)
+            self._version += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize all per-label sketches for cross-worker merging."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "labels": list(self.label_names),
+                "series": [
+                    {"labels": list(key), "sketch": sketch.to_dict()}
+                    for key, sketch in self._sketches.items()
+                ],
+            }
+
+    def _labels_key(self, labels: dict[str, str]) -> tuple:
+        return tuple(labels.get(name, "") for name in self.label_names)
+
+    def collect(self) -> list[MetricValue]:
+        """Collect one value per label set and quantile."""
+        with self._lock:
+            values = []
+            for key, sketch in self._sketches.items():
+                base = dict(zip(self.label_names, key, strict=False))
+                for q in self.quantiles:
+                    values.append(
+                        MetricValue(
+                            value=sketch.quantile(q) or 0.0,
+                            labels={**base, "quantile": f"{q:g}"},
+                        )
+                    )
+            return values
+
+    def prometheus_samples(self) -> list[str]:
+        """Render as a Prometheus summary (quantiles plus `_sum`/`_count`)."""
+        lines = []
+        with self._lock:
+            for key, sketch in self._sketches.items():
+                for q in self.quantiles:
+                    labels = _format_labels(
+                        self.label_names, key, ("quantile", f"{q:g}")
+                    )
+                    value = sketch.quantile(q)
+                    lines.append(
+                        f"{self.name}{labels} "
+                        f"{_format_value(math.nan if value is None else value)}"
+                    )
+                labels = _format_labels(self.label_names, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(sketch.sum)}")
+                lines.append(f"{self.name}_count{labels} {sketch.count}")
+        return lines
+
 
 class Timer:
     """
@@ -311,10 +578,16 @@ class MetricsRegistry:
     - Metric registration and discovery
     - Bulk collection for export
     - Prometheus format export
+
+    Every metric bumps a version counter on mutation, and the rendered
+    text of each metric is cached against that version, so a scrape only
+    re-renders metrics that changed since the previous one.
     """
 
     _metrics: dict[str, Any] = {}
     _lock = threading.Lock()
+    # name -> (metric, version, rendered text)
+    _render_cache: dict[str, tuple[Any, int, str]] = {}
 
     @classmethod
     def register(cls, metric: Any) -> None:
@@ -345,34 +618,68 @@ class MetricsRegistry:
                 }
         return result
 
+    PROMETHEUS_TYPES = {
+        "Counter": "counter",
+        "Gauge": "gauge",
+        "Histogram": "histogram",
+        "QuantileSketch": "summary",
+    }
+
     @classmethod
     def to_prometheus(cls) -> str:
-        """Export metrics in Prometheus format."""
-        lines = []
-
+        """Export metrics in Prometheus text exposition format (v0.0.4)."""
         with cls._lock:
-            for name, metric in cls._metrics.items():
-                # Add help and type
-                lines.append(f"# HELP {name} {metric.description}")
-                lines.append(f"# TYPE {name} {type(metric).__name__.lower()}")
-
-                # Add values
-                for value in metric.collect():
-                    if value.labels:
-                        label_str = ",".join(
-                            f'{k}="{v}"' for k, v in value.labels.items()
-                        )
-                        lines.append(f"{name}{{{label_str}}} {value.value}")
-                    else:
-                        lines.append(f"{name} {value.value}")
+            metrics = list(cls._metrics.items())
+
+        blocks = []
+        for name, metric in metrics:
+            # Read the version before rendering: a concurrent mutation then
+            # leaves a newer body under an older version, which only costs
+            # one extra re-render on the next scrape.
+            version = getattr(metric, "_version", None)
+            with cls._lock:
+                cached = cls._render_cache.get(name)
+            if (
+                cached is not None
+                and version is not None
+                and cached[0] is metric
+                and cached[1] == version
+            ):
+                blocks.append(cached[2])
+                continue
+
+            text = cls._render(name, metric)
+            if version is not None:
+                with cls._lock:
+                    cls._render_cache[name] = (metric, version, text)
+            blocks.append(text)
+
+        return "".join(blocks)
+
+    @classmethod
+    def _render(cls, name: str, metric: Any) -> str:
+        """Render HELP/TYPE and samples for one metric."""
+        kind = cls.PROMETHEUS_TYPES.get(type(metric).__name__, "untyped")
+        help_text = metric.description.replace("\\", "\\\\").replace("\n", "\\n")
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+        if hasattr(metric, "prometheus_samples"):
+            lines.extend(metric.prometheus_samples())
+        else:
+            for value in metric.collect():
+                labels = _format_labels(
+                    list(value.labels), tuple(value.labels.values())
+                )
+                lines.append(f"{name}{labels} {_format_value(value.value)}")
 
-        return "\n".join(lines)
+        return "\n".join(lines) + "\n"
 
     @classmethod
     def clear(cls) -> None:
         """Clear all metrics (for testing)."""
         with cls._lock:
             cls._metrics.clear()
+            cls._render_cache.clear()
 
 
 # ============== Decorators ==============
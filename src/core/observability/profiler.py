@@ -0,0 +1,315 @@
+"""
+Sampling Profiler
+=================
+
+Low-overhead, in-process CPU profiling by stack sampling.
+
+A background thread wakes `hz` times per second, reads every thread's
+current frame (sys._current_frames) and counts the stack. Threads are
+grouped by name prefix ("PointProcessor", "Agent-P", "EventBus", ...),
+so the output answers "what are the point processors doing" rather than
+"what is thread 7 doing".
+
+Stacks are kept as tuples of code objects and rendered only on export,
+which keeps a sample cheap enough for always-on use at 100 Hz.
+
+Output is in folded-stack format, one line per distinct stack:
+
+    PointProcessor;process (orchestrator.py:120);_search (base_agent.py:80) 42
+
+which flamegraph.pl, speedscope and inferno render directly.
+
+Example:
+    profiler = SamplingProfiler(hz=100)
+    profiler.start()
+
+    before = profiler.snapshot()
+    time.sleep(30)
+    window = profiler.snapshot() - before
+    print(profiler.format_folded(window))
+
+    profiler.stop()
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import CodeType, FrameType
+from typing import Any
+
+# Thread-name prefixes of the pipeline's worker pools
+DEFAULT_GROUPS = (
+    "PointProcessor",
+    "Agent-P",
+    "EventBus",
+    "TourService",
+    "PluginStart",
+    "MainThread",
+)
+
+# "ThreadPoolExecutor-3_1" -> "ThreadPoolExecutor", "health-db" stays
+_TRAILING_INDEX = re.compile(r"[-_]\d+(?:_\d+)?$")
+
+StackKey = tuple[str, tuple[CodeType, ...]]
+
+
+def _frame_label(code: CodeType) -> str:
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+@dataclass
+class ProfilerStats:
+    """Statistics for a sampling profiler."""
+
+    samples: int = 0
+    stacks_recorded: int = 0
+    sampling_seconds: float = 0.0
+    running_seconds: float = 0.0
+
+
+class SamplingProfiler:
+    """
+    Sample all thread stacks at a fixed rate and aggregate them by group.
+
+    Parameters:
+        hz: Samples per second
+        groups: Thread-name prefixes to aggregate under; other threads are
+            grouped by name with any trailing pool index removed
+        max_depth: Frames kept per stack (outermost frames beyond it are dropped)
+        include_idle: Also count threads parked in wait/sleep/select calls
+
+    Example:
+        with SamplingProfiler(hz=100) as profiler:
+            run_tour()
+        Path("tour.folded").write_text(profiler.format_folded())
+    """
+
+    # Leaf functions of a parked thread; such samples are not CPU time
+    IDLE_LEAVES = frozenset(
+        {"wait", "_wait_for_tstate_lock", "select", "poll", "accept"}
+    )
+
+    def __init__(
+        self,
+        hz: float = 100.0,
+        groups: tuple[str, ...] = DEFAULT_GROUPS,
+        max_depth: int = 64,
+        include_idle: bool = False,
+    ):
+        if hz <= 0:
+            raise ValueError("hz must be positive")
+
+        self.hz = hz
+        self.groups = tuple(groups)
+        self.max_depth = max_depth
+        self.include_idle = include_idle
+
+        self._counts: Counter[StackKey] = Counter()
+        self._group_by_ident: dict[int, str] = {}
+        self._labels: dict[CodeType, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+
+        self.stats = ProfilerStats()
+
+    # ==================== Lifecycle ====================
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling in a background daemon thread."""
+        if self.is_running:
+            return
+        self._stop.clear()
+        # Threads may have come and gone (and idents been reused) while stopped
+        self._group_by_ident = {}
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="SamplingProfiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling; recorded stacks are kept."""
+        thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join()
+            self.stats.running_seconds += time.perf_counter() - self._started_at
+
+    def __enter__(self) -> SamplingProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def reset(self) -> None:
+        """Drop all recorded stacks."""
+        with self._lock:
+            self._counts.clear()
+
+    # ==================== Sampling ====================
+
+    def _run(self) -> None:
+        interval = 1.0 / self.hz
+        next_tick = time.perf_counter()
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            self.sample()
+            self.stats.sampling_seconds += time.perf_counter() - started
+
+            # Fixed-rate schedule; skip ticks instead of bursting after a stall
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay < 0:
+                next_tick = time.perf_counter()
+                delay = 0
+            self._stop.wait(delay)
+
+    def sample(self) -> None:
+        """Record the current stack of every other thread once."""
+        own = threading.get_ident()
+        frames = sys._current_frames()
+        recorded = []
+
+        # Thread idents are reused, so names are re-read about once a second
+        if self.stats.samples % max(int(self.hz), 1) == 0:
+            self._group_by_ident = {}
+
+        for ident, frame in frames.items():
+            if ident == own:
+                continue
+            if not self.include_idle and frame.f_code.co_name in self.IDLE_LEAVES:
+                continue
+            recorded.append((self._group_for(ident), self._stack(frame)))
+
+        with self._lock:
+            for key in recorded:
+                self._counts[key] += 1
+        self.stats.samples += 1
+        self.stats.stacks_recorded += len(recorded)
+
+    def _stack(self, frame: FrameType | None) -> tuple[CodeType, ...]:
+        codes = []
+        while frame is not None and len(codes) < self.max_depth:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        return tuple(codes)
+
+    def _group_for(self, ident: int) -> str:
+        group = self._group_by_ident.get(ident)
+        if group is None:
+            self._group_by_ident = {
+                thread.ident: self.group_name(thread.name)
+                for thread in threading.enumerate()
+                if thread.ident is not None
+            }
+            group = self._group_by_ident.get(ident, "unknown")
+        return group
+
+    def group_name(self, thread_name: str) -> str:
+        """Group a thread name by configured prefix or pool name."""
+        for prefix in self.groups:
+            if thread_name.startswith(prefix):
+                return prefix
+        return _TRAILING_INDEX.sub("", thread_name)
+
+    # ==================== Export ====================
+
+    def snapshot(self) -> Counter[StackKey]:
+        """Copy of the counts so far; subtract two snapshots for a window."""
+        with self._lock:
+            return Counter(self._counts)
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = _frame_label(code)
+        return label
+
+    def folded(
+        self,
+        counts: Counter[StackKey] | None = None,
+        group: str | None = None,
+    ) -> dict[str, int]:
+        """Folded stack -> sample count, optionally for one group only."""
+        if counts is None:
+            counts = self.snapshot()
+
+        folded: Counter[str] = Counter()
+        for (stack_group, codes), count in counts.items():
+            if group is not None and stack_group != group:
+                continue
+            frames = ";".join(self._label(code) for code in codes)
+            folded[f"{stack_group};{frames}" if frames else stack_group] += count
+        return dict(folded)
+
+    def format_folded(
+        self,
+        counts: Counter[StackKey] | None = None,
+        group: str | None = None,
+    ) -> str:
+        """Folded stacks as flamegraph.pl input, heaviest first."""
+        folded = self.folded(counts, group)
+        lines = sorted(folded.items(), key=lambda item: (-item[1], item[0]))
+        return "".join(f"{stack} {count}\n" for stack, count in lines)
+
+    def group_totals(
+        self,
+        counts: Counter[StackKey] | None = None,
+        group: str | None = None,
+    ) -> dict[str, int]:
+        """Samples per thread group, heaviest first, optionally for one group only."""
+        if counts is None:
+            counts = self.snapshot()
+        totals: Counter[str] = Counter()
+        for (stack_group, _), count in counts.items():
+            if group is not None and stack_group != group:
+                continue
+            totals[stack_group] += count
+        return dict(totals.most_common())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get profiler statistics, including its own CPU overhead."""
+        running = self.stats.running_seconds
+        if self.is_running:
+            running += time.perf_counter() - self._started_at
+        return {
+            "running": self.is_running,
+            "hz": self.hz,
+            "samples": self.stats.samples,
+            "stacks_recorded": self.stats.stacks_recorded,
+            "distinct_stacks": len(self._counts),
+            "overhead_percent": round(100 * self.stats.sampling_seconds / running, 3)
+            if running
+            else 0.0,
+        }
+
+
+# ============== Process-wide Profiler ==============
+
+_profiler: SamplingProfiler | None = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler(hz: float | None = None) -> SamplingProfiler:
+    """Get the process-wide profiler (created on first use, not started)."""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = SamplingProfiler(hz=hz or 100.0)
+    return _profiler
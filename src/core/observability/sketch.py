@@ -0,0 +1,222 @@
+"""
+DDSketch Quantile Sketch
+========================
+
+Mergeable quantile sketch with bounded relative error.
+
+Values are mapped to logarithmically spaced bins, so every quantile is
+returned within `relative_accuracy` of the true value regardless of the
+distribution. Inserts are O(1) (one log and one dict update), memory is
+bounded by `max_bins`, and two sketches with the same accuracy merge
+exactly by adding bin counts, which makes per-worker sketches combinable.
+
+Academic Reference:
+    - Masson, Rim, Lee, "DDSketch: A Fast and Fully-Mergeable Quantile
+      Sketch with Relative-Error Guarantees" (VLDB 2019)
+
+Example:
+    sketch = DDSketch(relative_accuracy=0.01)
+    for latency in latencies:
+        sketch.add(latency)
+
+    p99 = sketch.quantile(0.99)
+
+    other = DDSketch.from_dict(payload_from_worker)
+    sketch.merge(other)
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+
+class DDSketch:
+    """
+    Quantile sketch with relative-error guarantees.
+
+    Parameters:
+        relative_accuracy: Maximum relative error of returned quantiles
+        max_bins: Bin cap per sign; the lowest bins are collapsed beyond it
+        min_value: Magnitudes at or below this count as zero
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        max_bins: int = 2048,
+        min_value: float = 1e-9,
+    ):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.min_value = min_value
+
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero_count = 0
+
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    # ==================== Insertion ====================
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) * self._multiplier)
+
+    def _bin_value(self, key: int) -> float:
+        """Representative value of a bin (within relative_accuracy)."""
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value (optionally with a weight)."""
+        if value > self.min_value:
+            store = self._positive
+            key = self._key(value)
+        elif value < -self.min_value:
+            store = self._negative
+            key = self._key(-value)
+        else:
+            self._zero_count += count
+            store = None
+
+        if store is not None:
+            store[key] = store.get(key, 0) + count
+            if len(store) > self.max_bins:
+                self._collapse(store)
+
+        self.count += count
+        self.sum += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def _collapse(self, store: dict[int, int]) -> None:
+        """Fold the lowest-magnitude bins together to respect max_bins."""
+        keys = sorted(store)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        for key in keys[:excess]:
+            store[target] += store.pop(key)
+
+    # ==================== Queries ====================
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Get the value at quantile q (0 <= q <= 1).
+
+        Returns None for an empty sketch.
+        """
+        if self.count == 0:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError("quantile must be in [0, 1]")
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return self._clamp(-self._bin_value(key))
+
+        seen += self._zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._clamp(self._bin_value(key))
+
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    @property
+    def avg(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def num_bins(self) -> int:
+        return (
+            len(self._positive) + len(self._negative) + (1 if self._zero_count else 0)
+        )
+
+    # ==================== Merging ====================
+
+    def merge(self, other: DDSketch) -> None:
+        """Merge another sketch with the same relative accuracy into this one."""
+        if not math.isclose(self._gamma, other._gamma):
+            raise ValueError("Cannot merge sketches with different accuracy")
+        if other.count == 0:
+            return
+
+        for mine, theirs in (
+            (self._positive, other._positive),
+            (self._negative, other._negative),
+        ):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+            if len(mine) > self.max_bins:
+                self._collapse(mine)
+
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> DDSketch:
+        """Return an independent copy."""
+        clone = DDSketch(self.relative_accuracy, self.max_bins, self.min_value)
+        clone.merge(self)
+        return clone
+
+    # ==================== Serialization ====================
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for shipping between workers."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "min_value": self.min_value,
+            "positive": {str(k): v for k, v in self._positive.items()},
+            "negative": {str(k): v for k, v in self._negative.items()},
+            "zero_count": self._zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DDSketch:
+        """Rebuild a sketch serialized with to_dict."""
+        sketch = cls(
+            relative_accuracy=data["relative_accuracy"],
+            max_bins=data.get("max_bins", 2048),
+            min_value=data.get("min_value", 1e-9),
+        )
+        sketch._positive = {int(k): v for k, v in data.get("positive", {}).items()}
+        sketch._negative = {int(k): v for k, v in data.get("negative", {}).items()}
+        sketch._zero_count = data.get("zero_count", 0)
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
@@ -0,0 +1,245 @@
+"""
+Point Timing Breakdown
+======================
+
+Per-point latency records for capacity planning.
+
+Unlike traces, which are sampled and evicted, a PointTiming is kept with
+every point result. Code on the hot path marks stages on the StageTimer
+bound to the current context:
+
+    with timed_stage("llm"):
+        response = client.messages.create(...)
+
+    @timed("search")
+    def _search_youtube(self, query): ...
+
+Stage times are exclusive: time spent in a nested stage is subtracted
+from the enclosing one, so an LLM call made while scoring counts as
+"llm", not twice. Without a bound timer, stages are a no-op.
+
+summarize_timings aggregates the points of a tour into p50/p95/p99 per stage.
+
+Example:
+    timer = StageTimer()
+    with bind_timer(timer):
+        result = agent.execute(point)
+    timing = AgentTiming.from_timer("video", timer, total_seconds)
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import math
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+_current_timer: contextvars.ContextVar[StageTimer | None] = contextvars.ContextVar(
+    "stage_timer", default=None
+)
+
+
+class StageTimer:
+    """
+    Accumulate exclusive time per stage name.
+
+    Not thread-safe: bind one timer per thread of work (e.g. per agent).
+    """
+
+    __slots__ = ("totals", "calls", "_children")
+
+    def __init__(self):
+        self.totals: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        # Time spent in nested stages, one slot per open stage
+        self._children: list[float] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        self._children.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._children.pop()
+            self.totals[name] = self.totals.get(name, 0.0) + elapsed - nested
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if self._children:
+                self._children[-1] += elapsed
+
+    def get(self, name: str) -> float:
+        """Exclusive seconds recorded for a stage."""
+        return self.totals.get(name, 0.0)
+
+
+@contextmanager
+def bind_timer(timer: StageTimer) -> Iterator[StageTimer]:
+    """Make timer the target of timed_stage in this context."""
+    token = _current_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _current_timer.reset(token)
+
+
+@contextmanager
+def timed_stage(name: str) -> Iterator[None]:
+    """Record the block as stage `name` on the bound timer, if any."""
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+    with timer.stage(name):
+        yield
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    """Decorator form of timed_stage."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            timer = _current_timer.get()
+            if timer is None:
+                return func(*args, **kwargs)
+            with timer.stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ============== Records ==============
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+@dataclass
+class AgentTiming:
+    """
+    Where one agent's time went (exclusive stages).
+
+    llm_ms covers every LLM call, including those made while scoring;
+    search_ms the upstream content APIs; scoring_ms candidate selection
+    and scoring outside the LLM; other_ms the rest (setup, parsing).
+    """
+
+    agent_type: str
+    total_ms: float = 0.0
+    llm_ms: float = 0.0
+    search_ms: float = 0.0
+    scoring_ms: float = 0.0
+    other_ms: float = 0.0
+    llm_calls: int = 0
+
+    @classmethod
+    def from_timer(
+        cls, agent_type: str, timer: StageTimer, total_seconds: float
+    ) -> AgentTiming:
+        llm = timer.get("llm")
+        search = timer.get("search")
+        scoring = timer.get("scoring")
+        return cls(
+            agent_type=agent_type,
+            total_ms=_ms(total_seconds),
+            llm_ms=_ms(llm),
+            search_ms=_ms(search),
+            scoring_ms=_ms(scoring),
+            other_ms=_ms(max(total_seconds - llm - search - scoring, 0.0)),
+            llm_calls=timer.calls.get("llm", 0),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_ms": self.total_ms,
+            "llm_ms": self.llm_ms,
+            "search_ms": self.search_ms,
+            "scoring_ms": self.scoring_ms,
+            "other_ms": self.other_ms,
+            "llm_calls": self.llm_calls,
+        }
+
+
+@dataclass
+class PointTiming:
+    """
+    Latency breakdown of one route point.
+
+    agents_ms is the wall time of the parallel agent fan-out; queue_wait_ms
+    is the part of it not covered by the slowest agent (pool scheduling and
+    result collection). judge_llm_ms is included in judge_ms.
+    store_update_ms covers the point's store updates before the final one,
+    which publishes the timing to subscribers.
+    """
+
+    total_ms: float = 0.0
+    agents_ms: float = 0.0
+    queue_wait_ms: float = 0.0
+    judge_ms: float = 0.0
+    judge_llm_ms: float = 0.0
+    store_update_ms: float = 0.0
+    agents: dict[str, AgentTiming] = field(default_factory=dict)
+
+    def stages(self) -> dict[str, float]:
+        """Flat stage -> milliseconds, including per-agent stages."""
+        flat = {
+            "total_ms": self.total_ms,
+            "agents_ms": self.agents_ms,
+            "queue_wait_ms": self.queue_wait_ms,
+            "judge_ms": self.judge_ms,
+            "judge_llm_ms": self.judge_llm_ms,
+            "store_update_ms": self.store_update_ms,
+        }
+        for agent_type, agent in self.agents.items():
+            for key in ("total_ms", "llm_ms", "search_ms", "scoring_ms"):
+                flat[f"{agent_type}.{key}"] = getattr(agent, key)
+        return flat
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_ms": self.total_ms,
+            "agents_ms": self.agents_ms,
+            "queue_wait_ms": self.queue_wait_ms,
+            "judge_ms": self.judge_ms,
+            "judge_llm_ms": self.judge_llm_ms,
+            "store_update_ms": self.store_update_ms,
+            "agents": {name: agent.to_dict() for name, agent in self.agents.items()},
+        }
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of a sorted, non-empty list."""
+    rank = max(math.ceil(q * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_timings(timings: list[PointTiming]) -> dict[str, Any]:
+    """
+    Aggregate point timings into per-stage percentiles.
+
+    Returns {"points": n, "stages": {stage: {p50, p95, p99, max, mean}}}.
+    """
+    samples: dict[str, list[float]] = {}
+    for timing in timings:
+        for stage, value in timing.stages().items():
+            samples.setdefault(stage, []).append(value)
+
+    stages = {}
+    for stage, values in samples.items():
+        values.sort()
+        stages[stage] = {
+            "p50": _percentile(values, 0.50),
+            "p95": _percentile(values, 0.95),
+            "p99": _percentile(values, 0.99),
+            "max": values[-1],
+            "mean": round(sum(values) / len(values), 3),
+        }
+    return {"points": len(timings), "stages": stages}
@@ -6,9 +6,11 @@ Trace execution across components with span management.
 
 Features:
 - Span creation and nesting
-- Context propagation
+- Context propagation (parent restored via contextvar token, no lookup)
 - Timing and attributes
-- Export to tracing backends
+- Fixed-capacity ring buffer of finished spans
+- Head and tail sampling
+- Export to tracing backends (see exporters.BatchSpanProcessor)
 
 Example:
     tracer = get_tracer("tour-guide")
@@ -21,25 +23,54 @@ Example:
             with tracer.span("process_point") as child:
                 child.set_attribute("point_id", point.id)
                 result = process(point)
+
+    # Record 10% of traces, but always keep failed or slow ones
+    tracer = Tracer(
+        "tour-guide",
+        sampling=SamplingPolicy(rate=0.1, latency_threshold_ms=5000),
+    )
 """
 
 from __future__ import annotations
 
 import contextvars
 import logging
+import random
 import threading
+from collections import OrderedDict, deque
 from collections.abc import Callable
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from functools import wraps
-from typing import Any, TypeVar
-from uuid import uuid4
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from src.core.observability.exporters import SpanProcessor
 
 logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# W3C trace-flags bit for "sampled"
+TRACE_FLAG_SAMPLED = 0x01
+
+# Tracer used by the tour pipeline (orchestrator, agents, queue, judge)
+PIPELINE_TRACER = "tour-guide"
+
+_id_random = random.Random()
+
+
+def _new_trace_id() -> str:
+    """Random non-zero 128-bit trace ID as 32 hex chars."""
+    return f"{_id_random.getrandbits(128) or 1:032x}"
+
+
+def _new_span_id() -> str:
+    """Random non-zero 64-bit span ID as 16 hex chars."""
+    return f"{_id_random.getrandbits(64) or 1:016x}"
+
 
 class SpanKind(Enum):
     """Kind of span."""
@@ -71,7 +102,11 @@ class SpanContext:
     trace_id: str
     span_id: str
     parent_span_id: str | None = None
-    trace_flags: int = 0
+    trace_flags: int = TRACE_FLAG_SAMPLED
+
+    @property
+    def is_sampled(self) -> bool:
+        return bool(self.trace_flags & TRACE_FLAG_SAMPLED)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -81,12 +116,26 @@ class SpanContext:
         }
 
     @classmethod
-    def create(cls, parent: SpanContext | None = None) -> SpanContext:
-        """Create a new span context."""
+    def create(
+        cls, parent: SpanContext | None = None, sampled: bool = True
+    ) -> SpanContext:
+        """
+        Create a new span context.
+
+        Children inherit the parent's trace ID and sampling decision;
+        `sampled` only applies to new root contexts.
+        """
+        if parent is not None:
+            return cls(
+                trace_id=parent.trace_id,
+                span_id=_new_span_id(),
+                parent_span_id=parent.span_id,
+                trace_flags=parent.trace_flags,
+            )
         return cls(
-            trace_id=parent.trace_id if parent else str(uuid4()).replace("-", ""),
-            span_id=str(uuid4()).replace("-", "")[:16],
-            parent_span_id=parent.span_id if parent else None,
+            trace_id=_new_trace_id(),
+            span_id=_new_span_id(),
+            trace_flags=TRACE_FLAG_SAMPLED if sampled else 0,
         )
 
 
@@ -119,6 +168,8 @@ class Span:
 
     # Internal
     _tracer: Tracer | None = field(default=None, repr=False)
+    _parent: Span | None = field(default=None, repr=False)
+    _token: contextvars.Token | None = field(default=None, repr=False)
 
     @property
     def duration_ms(self) -> float | None:
@@ -214,10 +265,68 @@ _current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
 )
 
 
+@dataclass
+class SamplingPolicy:
+    """
+    Head and tail sampling decisions.
+
+    The head decision is made once per trace at its root span with
+    probability `rate` and inherited by every child. Traces dropped at the
+    head are buffered until their root ends, and kept anyway (tail
+    sampling) if any span failed or the root was slower than
+    `latency_threshold_ms`.
+    """
+
+    rate: float = 1.0
+    keep_errors: bool = True
+    latency_threshold_ms: float | None = None
+    max_pending_traces: int = 1000
+
+    @property
+    def tail_enabled(self) -> bool:
+        return self.rate < 1.0 and (
+            self.keep_errors or self.latency_threshold_ms is not None
+        )
+
+    def sample_head(self) -> bool:
+        return self.rate >= 1.0 or _id_random.random() < self.rate
+
+    def keep_tail(self, root: Span, has_error: bool) -> bool:
+        if self.keep_errors and has_error:
+            return True
+        duration = root.duration_ms
+        return (
+            self.latency_threshold_ms is not None
+            and duration is not None
+            and duration >= self.latency_threshold_ms
+        )
+
+
+@dataclass
+class _PendingTrace:
+    """Spans of a head-dropped trace awaiting the tail decision."""
+
+    spans: list[Span] = field(default_factory=list)
+    has_error: bool = False
+
+
+@dataclass
+class TracerStats:
+    """Statistics for a tracer."""
+
+    spans_started: int = 0
+    spans_recorded: int = 0
+    spans_dropped: int = 0
+    traces_kept_by_tail: int = 0
+
+
 class Tracer:
     """
     Tracer for creating and managing spans.
 
+    Finished spans are kept in a fixed-capacity ring buffer (oldest
+    evicted first) and handed to any registered span processors.
+
     Example:
         tracer = Tracer("my-service")
 
@@ -234,13 +343,19 @@ class Tracer:
         name: str,
         version: str = "1.0.0",
         max_spans: int = 10000,
+        sampling: SamplingPolicy | None = None,
     ):
         self.name = name
         self.version = version
         self.max_spans = max_spans
+        self.sampling = sampling or SamplingPolicy()
 
-        self._spans: list[Span] = []
+        self._spans: deque[Span] = deque(maxlen=max_spans)
         self._spans_lock = threading.Lock()
+        self._pending: OrderedDict[str, _PendingTrace] = OrderedDict()
+        self._processors: list[SpanProcessor] = []
+
+        self.stats = TracerStats()
 
         with Tracer._lock:
             Tracer._instances[name] = self
@@ -250,6 +365,7 @@ class Tracer:
         name: str,
         kind: SpanKind = SpanKind.INTERNAL,
         attributes: dict[str, Any] | None = None,
+        activate: bool = True,
     ) -> Span:
         """
         Create a new span.
@@ -261,55 +377,106 @@ class Tracer:
             name: Span name
             kind: Span kind
             attributes: Initial attributes
+            activate: Make it the current span (parent of spans created
+                until it ends). Pass False for spans that stay open across
+                unrelated work, such as a generator's lifetime.
 
         Returns:
             New span
         """
         # Get parent context
         parent = _current_span.get()
-        parent_context = parent.context if parent else None
 
-        # Create span
-        context = SpanContext.create(parent_context)
+        if parent is not None:
+            context = SpanContext.create(parent.context)
+        else:
+            context = SpanContext.create(sampled=self.sampling.sample_head())
+
         span = Span(
             name=name,
             context=context,
             kind=kind,
             attributes=attributes or {},
             _tracer=self,
+            _parent=parent,
         )
 
-        # Set as current
-        _current_span.set(span)
+        # Set as current; the token restores the parent on end
+        if activate:
+            span._token = _current_span.set(span)
+        self.stats.spans_started += 1
 
-        logger.debug(f"Started span: {name} ({context.span_id})")
         return span
 
     def _on_span_end(self, span: Span) -> None:
         """Called when a span ends."""
-        # Restore parent as current
-        parent_id = span.context.parent_span_id
-        if parent_id:
-            # Find parent span
-            with self._spans_lock:
-                for s in reversed(self._spans):
-                    if s.context.span_id == parent_id:
-                        _current_span.set(s)
-                        break
-        else:
-            _current_span.set(None)
+        self._restore_parent(span)
 
-        # Store span
+        if span.context.is_sampled:
+            self._record(span)
+        elif self.sampling.tail_enabled:
+            self._buffer_for_tail(span)
+        else:
+            self.stats.spans_dropped += 1
+
+    def _restore_parent(self, span: Span) -> None:
+        """Make the span's parent current again without searching for it."""
+        token, span._token = span._token, None
+        if token is not None:
+            try:
+                _current_span.reset(token)
+                return
+            except ValueError:
+                # Ended in a different context (another thread or task)
+                pass
+        if _current_span.get() is span:
+            _current_span.set(span._parent)
+
+    def _record(self, span: Span) -> None:
         with self._spans_lock:
             self._spans.append(span)
-            # Limit stored spans
-            if len(self._spans) > self.max_spans:
-                self._spans = self._spans[-self.max_spans // 2 :]
+            self.stats.spans_recorded += 1
+        for processor in self._processors:
+            processor.on_end(span)
 
-        logger.debug(
-            f"Ended span: {span.name} ({span.context.span_id}) - "
-            f"{span.duration_ms:.2f}ms"
-        )
+    def _buffer_for_tail(self, span: Span) -> None:
+        """Hold a head-dropped span until its trace's root ends."""
+        trace_id = span.context.trace_id
+        is_root = span.context.parent_span_id is None
+
+        with self._spans_lock:
+            pending = self._pending.pop(trace_id, None) or _PendingTrace()
+            pending.spans.append(span)
+            pending.has_error |= span.status == SpanStatus.ERROR
+
+            if not is_root:
+                self._pending[trace_id] = pending
+                while len(self._pending) > self.sampling.max_pending_traces:
+                    _, evicted = self._pending.popitem(last=False)
+                    self.stats.spans_dropped += len(evicted.spans)
+                return
+
+            keep = self.sampling.keep_tail(span, pending.has_error)
+            if not keep:
+                self.stats.spans_dropped += len(pending.spans)
+                return
+            self.stats.traces_kept_by_tail += 1
+
+        for buffered in pending.spans:
+            buffered.context.trace_flags |= TRACE_FLAG_SAMPLED
+            self._record(buffered)
+
+    # ==================== Processors ====================
+
+    def add_span_processor(self, processor: SpanProcessor) -> None:
+        """Hand every recorded span to a processor (e.g. a batch exporter)."""
+        self._processors.append(processor)
+
+    def shutdown(self) -> None:
+        """Flush and stop all span processors."""
+        processors, self._processors = self._processors, []
+        for processor in processors:
+            processor.shutdown()
 
     def get_current_span(self) -> Span | None:
         """Get the current active span."""
@@ -333,6 +500,21 @@ class Tracer:
         """Clear recorded spans."""
         with self._spans_lock:
             self._spans.clear()
+            self._pending.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get tracer statistics."""
+        return {
+            "name": self.name,
+            "stored_spans": len(self._spans),
+            "max_spans": self.max_spans,
+            "pending_traces": len(self._pending),
+            "sample_rate": self.sampling.rate,
+            "spans_started": self.stats.spans_started,
+            "spans_recorded": self.stats.spans_recorded,
+            "spans_dropped": self.stats.spans_dropped,
+            "traces_kept_by_tail": self.stats.traces_kept_by_tail,
+        }
 
     @classmethod
     def get(cls, name: str) -> Tracer | None:
@@ -356,6 +538,20 @@ def get_current_span() -> Span | None:
     return _current_span.get()
 
 
+def submit_in_context(
+    executor: Executor, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+) -> Future:
+    """
+    Submit work to an executor so it runs under the caller's current span.
+
+    Thread pools do not inherit contextvars; this copies the caller's
+    context so spans opened in the worker become children of the
+    submitting span.
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args, **kwargs)
+
+
 def trace(
     name: str | None = None,
     kind: SpanKind = SpanKind.INTERNAL,
@@ -1,6 +1,11 @@
 """
 Orchestrator - Manages the parallel execution of agents for each route point.
 Coordinates multithreading and ensures proper synchronization.
+
+When JUDGE_BATCH_SIZE > 1, points are judged through a shared JudgeBatcher:
+points the screen or rule tier settle are decided at once in their own
+thread, and only close calls wait to share one LLM call per batch (for at
+most JUDGE_BATCH_TIMEOUT_SECONDS). Each point reports its own decision.
 """
 
 import queue
@@ -13,6 +18,12 @@ from src.agents.judge_agent import JudgeAgent
 from src.agents.music_agent import MusicAgent
 from src.agents.text_agent import TextAgent
 from src.agents.video_agent import VideoAgent
+from src.core.collector import JudgeBatcher
+from src.core.observability.tracing import (
+    PIPELINE_TRACER,
+    get_tracer,
+    submit_in_context,
+)
 from src.models.content import ContentResult
 from src.models.decision import JudgeDecision
 from src.models.route import RoutePoint
@@ -38,7 +49,10 @@ class PointProcessor:
     """
 
     def __init__(
-        self, point: RoutePoint, result_callback: Callable[[JudgeDecision], None]
+        self,
+        point: RoutePoint,
+        result_callback: Callable[[JudgeDecision], None],
+        judge_batcher: JudgeBatcher | None = None,
     ):
         """
         Initialize processor for a single point.
@@ -46,9 +60,11 @@ class PointProcessor:
         Args:
             point: The route point to process
             result_callback: Callback to invoke when processing is complete
+            judge_batcher: Shared batcher to judge through (None = own judge)
         """
         self.point = point
         self.result_callback = result_callback
+        self.judge_batcher = judge_batcher
         self.content_results: list[ContentResult] = []
         self.decision: JudgeDecision | None = None
         self.lock = threading.Lock()
@@ -61,18 +77,26 @@ class PointProcessor:
         Process the point by running all content agents in parallel,
         then running the judge on the results.
         """
+        with get_tracer(PIPELINE_TRACER).span("point.process") as span:
+            span.set_attribute("point.id", self.point.id)
+            span.set_attribute("point.index", self.point.index)
+            span.set_attribute("point.name", self.point.location_name or "")
+            self._process()
+
+    def _process(self):
         self.started_at = datetime.now()
         set_log_context(point_id=self.point.id, agent_type="orchestrator")
 
         logger.info(
-            f"🎯 Starting processing for point {self.point.index}: {self.point.address}"
+            "🎯 Starting processing for point %s: %s",
+            self.point.index,
+            self.point.address,
         )
 
         # Create agents
         video_agent = VideoAgent()
         music_agent = MusicAgent()
         text_agent = TextAgent()
-        judge_agent = JudgeAgent()
 
         # Run content agents in parallel using ThreadPoolExecutor
         with ThreadPoolExecutor(
@@ -80,9 +104,9 @@ class PointProcessor:
         ) as executor:
             # Submit all agent tasks
             futures = {
-                executor.submit(self._run_agent, video_agent): "video",
-                executor.submit(self._run_agent, music_agent): "music",
-                executor.submit(self._run_agent, text_agent): "text",
+                submit_in_context(executor, self._run_agent, video_agent): "video",
+                submit_in_context(executor, self._run_agent, music_agent): "music",
+                submit_in_context(executor, self._run_agent, text_agent): "text",
             }
 
             # Collect results as they complete
@@ -94,7 +118,9 @@ class PointProcessor:
                         with self.lock:
                             self.content_results.append(result)
                         logger.info(
-                            f"✅ {agent_type} agent completed for point {self.point.index}"
+                            "✅ %s agent completed for point %s",
+                            agent_type,
+                            self.point.index,
                         )
                 except Exception as e:
                     logger.error(f"❌ {agent_type} agent failed: {e}")
@@ -102,10 +128,11 @@ class PointProcessor:
         # Run judge on collected results
         if self.content_results:
             try:
-                self.decision = judge_agent.evaluate(self.point, self.content_results)
+                self.decision = self._judge()
                 logger.info(
-                    f"⚖️ Judge selected: {self.decision.selected_content.content_type.value} "
-                    f"for point {self.point.index}"
+                    "⚖️ Judge selected: %s for point %s",
+                    self.decision.selected_content.content_type.value,
+                    self.point.index,
                 )
             except Exception as e:
                 logger.error(f"Judge failed for point {self.point.index}: {e}")
@@ -121,7 +148,7 @@ class PointProcessor:
 
         self.completed_at = datetime.now()
         duration = (self.completed_at - self.started_at).total_seconds()
-        logger.info(f"🏁 Point {self.point.index} completed in {duration:.2f}s")
+        logger.info("🏁 Point %s completed in %.2fs", self.point.index, duration)
 
         # Notify completion via callback
         if self.decision and self.result_callback:
@@ -129,6 +156,14 @@ class PointProcessor:
 
         self.completed.set()
 
+    def _judge(self) -> JudgeDecision:
+        """Judge the collected results, batched with other points if enabled."""
+        if self.judge_batcher is None:
+            return JudgeAgent().evaluate(self.point, self.content_results)
+        # Screening and the rule tier run here; only escalations are queued
+        future = self.judge_batcher.submit(self.point, self.content_results)
+        return future.result(timeout=settings.judge_batch_timeout_seconds)
+
     def _run_agent(self, agent) -> ContentResult | None:  # type: ignore[no-untyped-def]
         """Run a single agent and return its result."""
         try:
@@ -160,6 +195,7 @@ class Orchestrator:
         self.results_lock = threading.Lock()
         self.results_queue: queue.Queue[JudgeDecision] = queue.Queue()
         self.executor: ThreadPoolExecutor | None = None
+        self.judge_batcher: JudgeBatcher | None = None
         self.is_running = False
         self._futures: dict[Future, str] = {}
 
@@ -192,12 +228,14 @@ class Orchestrator:
         if not self.is_running:
             self.start()
 
-        processor = PointProcessor(point, self._on_point_complete)
+        processor = PointProcessor(
+            point, self._on_point_complete, judge_batcher=self.judge_batcher
+        )
         self.active_processors[point.id] = processor
 
         if self.executor is None:
             raise RuntimeError("Orchestrator not started")
-        future = self.executor.submit(processor.process)
+        future = submit_in_context(self.executor, processor.process)
         self._futures[future] = point.id
 
         log_orchestrator_event(
@@ -244,6 +282,14 @@ class Orchestrator:
                 max_workers=self.max_concurrent_points,
                 thread_name_prefix="PointProcessor",
             )
+            if settings.judge_batch_size > 1 and self.max_concurrent_points > 1:
+                # A batch never holds more points than can run at once
+                self.judge_batcher = JudgeBatcher(
+                    JudgeAgent(),
+                    max_batch=min(
+                        settings.judge_batch_size, self.max_concurrent_points
+                    ),
+                )
             self.is_running = True
             log_orchestrator_event(
                 "Started", f"thread_pool_size={self.max_concurrent_points}"
@@ -253,6 +299,9 @@ class Orchestrator:
         """Stop the orchestrator and cleanup."""
         if self.is_running:
             self.executor.shutdown(wait=True)
+            if self.judge_batcher is not None:
+                self.judge_batcher.close()
+                self.judge_batcher = None
             self.is_running = False
             log_orchestrator_event("Stopped")
 
@@ -26,31 +26,62 @@ Example Usage:
     manager.start_all()
 """
 
-from src.core.plugins.base import (
-    BasePlugin,
-    PluginCapability,
-    PluginMetadata,
-    PluginState,
-)
-from src.core.plugins.events import (
-    Event,
-    EventBus,
-    EventHandler,
-    EventPriority,
-    publish,
-    subscribe,
-)
-from src.core.plugins.hooks import (
-    Hook,
-    HookPriority,
-    HookRegistry,
-    HookType,
-    after_hook,
-    before_hook,
-    hookable,
+from typing import TYPE_CHECKING
+
+from src._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core.plugins.base import (
+        BasePlugin,
+        PluginCapability,
+        PluginMetadata,
+        PluginState,
+    )
+    from src.core.plugins.events import (
+        Event,
+        EventBus,
+        EventHandler,
+        EventPriority,
+        publish,
+        subscribe,
+    )
+    from src.core.plugins.hooks import (
+        Hook,
+        HookPriority,
+        HookRegistry,
+        HookType,
+        after_hook,
+        before_hook,
+        hookable,
+    )
+    from src.core.plugins.manager import PluginManager
+    from src.core.plugins.registry import PluginRegistry
+
+# Exports are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BasePlugin": "src.core.plugins.base",
+        "PluginCapability": "src.core.plugins.base",
+        "PluginMetadata": "src.core.plugins.base",
+        "PluginState": "src.core.plugins.base",
+        "Event": "src.core.plugins.events",
+        "EventBus": "src.core.plugins.events",
+        "EventHandler": "src.core.plugins.events",
+        "EventPriority": "src.core.plugins.events",
+        "publish": "src.core.plugins.events",
+        "subscribe": "src.core.plugins.events",
+        "Hook": "src.core.plugins.hooks",
+        "HookPriority": "src.core.plugins.hooks",
+        "HookRegistry": "src.core.plugins.hooks",
+        "HookType": "src.core.plugins.hooks",
+        "after_hook": "src.core.plugins.hooks",
+        "before_hook": "src.core.plugins.hooks",
+        "hookable": "src.core.plugins.hooks",
+        "PluginManager": "src.core.plugins.manager",
+        "PluginRegistry": "src.core.plugins.registry",
+    },
 )
-from src.core.plugins.manager import PluginManager
-from src.core.plugins.registry import PluginRegistry
 
 __all__ = [
     # Base
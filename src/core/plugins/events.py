@@ -29,20 +29,32 @@ Example:
 
     # Publish events
     EventBus.publish(UserLoggedIn(user_id="123", timestamp=datetime.now()))
+
+Dispatch:
+    Handlers for each concrete event type (its own, its Event base
+    classes' and the global ones, in priority order) are resolved once
+    into a dispatch table and cached until a subscription changes, so
+    publish takes no lock and sorts nothing. Hot paths can build events
+    with Event.create(), which skips validation. Subscribers registered
+    with queued=True get a bounded mailbox drained in batches on the
+    bus's thread pool, so slow handlers never block the publisher.
 """
 
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
+import random
 import threading
 import traceback
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Awaitable, Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import IntEnum
+from functools import partial
 from typing import (
     Any,
     TypeVar,
@@ -50,6 +62,7 @@ from typing import (
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
+from pydantic_core import PydanticUndefined
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +84,11 @@ class EventPriority(IntEnum):
     MONITOR = 1000  # Monitoring/logging only
 
 
+def _new_event_id() -> str:
+    """Random 128-bit hex ID (no syscall, unlike uuid4)."""
+    return f"{random.getrandbits(128):032x}"
+
+
 class Event(BaseModel):
     """
     Base class for all events.
@@ -87,7 +105,7 @@ class Event(BaseModel):
         metadata: Additional event metadata
     """
 
-    event_id: str = Field(default_factory=lambda: str(uuid4()))
+    event_id: str = Field(default_factory=_new_event_id)
     event_type: str = Field(default="")
     timestamp: datetime = Field(default_factory=datetime.now)
     source: str | None = None
@@ -103,6 +121,54 @@ class Event(BaseModel):
     class Config:
         frozen = True  # Events are immutable
 
+    @classmethod
+    def create(cls: type[T], **data: Any) -> T:
+        """
+        Build an event without validation.
+
+        For trusted hot-path callers that pass correctly typed fields;
+        defaults and default factories are applied as usual.
+        """
+        plan = _CREATE_PLANS.get(cls)
+        if plan is None:
+            plan = _CREATE_PLANS[cls] = _create_plan(cls)
+        static, factories = plan
+
+        values = {**static, **data}
+        for name, factory in factories:
+            if name not in data:
+                values[name] = factory()
+        if not values["event_type"]:
+            values["event_type"] = cls.__name__
+
+        event = cls.__new__(cls)
+        object.__setattr__(event, "__dict__", values)
+        object.__setattr__(event, "__pydantic_fields_set__", set(data))
+        object.__setattr__(event, "__pydantic_extra__", None)
+        object.__setattr__(event, "__pydantic_private__", None)
+        return event
+
+
+def _create_plan(
+    cls: type[Event],
+) -> tuple[dict[str, Any], tuple[tuple[str, Callable[[], Any]], ...]]:
+    """Split a model's defaults into static values and factories."""
+    static = {}
+    factories = []
+    for name, info in cls.model_fields.items():
+        if info.default_factory is not None:
+            factories.append((name, info.default_factory))
+        elif isinstance(info.default, list | dict | set):
+            # Mutable defaults are copied per instance, as pydantic does
+            factories.append((name, partial(copy.deepcopy, info.default)))
+        elif info.default is not PydanticUndefined:
+            static[name] = info.default
+    return static, tuple(factories)  # type: ignore[return-value]
+
+
+# Per-class (static defaults, default factories) used by Event.create
+_CREATE_PLANS: dict[type[Event], tuple[dict[str, Any], tuple[Any, ...]]] = {}
+
 
 # ============== Pre-defined System Events ==============
 
@@ -197,6 +263,120 @@ class HandlerRegistration:
     weak: bool  # Use weak reference
     filter_fn: Callable[[Event], bool] | None = None
     handler_id: str = field(default_factory=lambda: str(uuid4())[:8])
+    mailbox: SubscriberMailbox | None = None
+
+
+class SubscriberMailbox:
+    """
+    Bounded queue of events for one queued subscriber.
+
+    Publishing only appends; a drain task on the bus executor delivers
+    pending events in batches of up to max_batch_size. At most one drain
+    task per mailbox is scheduled at a time, so a subscriber sees its
+    events in publish order. When full, new events are dropped and
+    counted instead of blocking the publisher.
+
+    Parameters:
+        registration: Subscriber the events are delivered to
+        max_queue_size: Pending events before new ones are dropped
+        max_batch_size: Events delivered per drain iteration
+        batch: Call the handler once per batch with a list of events
+    """
+
+    def __init__(
+        self,
+        registration: HandlerRegistration,
+        max_queue_size: int = 1024,
+        max_batch_size: int = 64,
+        batch: bool = False,
+    ):
+        self.registration = registration
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.batch = batch
+
+        self._pending: deque[Event] = deque()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._scheduled = False
+
+        self.delivered = 0
+        self.dropped = 0
+        self.batches = 0
+
+    def offer(self, event: Event) -> bool:
+        """Queue an event; returns False if it was dropped."""
+        with self._lock:
+            if len(self._pending) >= self.max_queue_size:
+                self.dropped += 1
+                return False
+            self._pending.append(event)
+            if self._scheduled:
+                return True
+            self._scheduled = True
+        EventBus._executor.submit(self._drain)
+        return True
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._scheduled = False
+                    self._idle.notify_all()
+                    return
+                count = min(len(self._pending), self.max_batch_size)
+                batch = [self._pending.popleft() for _ in range(count)]
+            self._deliver(batch)
+
+    def _deliver(self, batch: list[Event]) -> None:
+        reg = self.registration
+        if self.batch:
+            try:
+                result = reg.handler(batch)  # type: ignore[arg-type]
+                if reg.is_async:
+                    asyncio.run(result)  # type: ignore[arg-type]
+            except Exception as e:
+                EventBus._handle_error(batch[-1], e, reg)
+        elif reg.is_async:
+
+            async def run_all() -> None:
+                for event in batch:
+                    try:
+                        await reg.handler(event)  # type: ignore[misc]
+                    except Exception as e:
+                        EventBus._handle_error(event, e, reg)
+
+            asyncio.run(run_all())
+        else:
+            for event in batch:
+                try:
+                    reg.handler(event)
+                except Exception as e:
+                    EventBus._handle_error(event, e, reg)
+
+        with self._lock:
+            self.delivered += len(batch)
+            self.batches += 1
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Wait until all queued events have been delivered."""
+        with self._lock:
+            return self._idle.wait_for(
+                lambda: not self._pending and not self._scheduled, timeout
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "handler_id": self.registration.handler_id,
+            "pending": len(self._pending),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "batches": self.batches,
+        }
 
 
 class EventBus:
@@ -232,11 +412,15 @@ class EventBus:
     _lock = threading.RLock()
     _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="EventBus")
 
+    # Concrete event type -> handlers in delivery order; rebuilt lazily
+    # after any subscription change
+    _dispatch: dict[type[Event], tuple[HandlerRegistration, ...]] = {}
+
     # Configuration
     _async_mode: bool = False
     _error_handler: Callable[[Event, Exception], None] | None = None
-    _event_log: list[Event] = []
     _max_log_size: int = 1000
+    _event_log: deque[Event] = deque(maxlen=_max_log_size)
 
     @classmethod
     def subscribe(
@@ -247,6 +431,10 @@ class EventBus:
         once: bool = False,
         weak: bool = False,
         filter_fn: Callable[[T], bool] | None = None,
+        queued: bool = False,
+        max_queue_size: int = 1024,
+        max_batch_size: int = 64,
+        batch: bool = False,
     ) -> Callable[[Callable[[T], None]], Callable[[T], None]]:
         """
         Decorator to subscribe a handler to an event type.
@@ -257,6 +445,10 @@ class EventBus:
             once: Unsubscribe after first call
             weak: Use weak reference (auto-cleanup)
             filter_fn: Only call handler if filter returns True
+            queued: Deliver from a bounded mailbox off the publisher's thread
+            max_queue_size: Mailbox capacity (queued only)
+            max_batch_size: Events drained per batch (queued only)
+            batch: Handler receives a list of events (queued only)
 
         Returns:
             Decorator function
@@ -275,6 +467,10 @@ class EventBus:
                 once=once,
                 weak=weak,
                 filter_fn=filter_fn,  # type: ignore[arg-type]
+                queued=queued,
+                max_queue_size=max_queue_size,
+                max_batch_size=max_batch_size,
+                batch=batch,
             )
             return handler
 
@@ -290,6 +486,10 @@ class EventBus:
         once: bool = False,
         weak: bool = False,
         filter_fn: Callable[[Event], bool] | None = None,
+        queued: bool = False,
+        max_queue_size: int = 1024,
+        max_batch_size: int = 64,
+        batch: bool = False,
     ) -> str:
         """
         Add an event handler.
@@ -301,6 +501,10 @@ class EventBus:
             once: Remove after first call
             weak: Use weak reference
             filter_fn: Event filter predicate
+            queued: Deliver from a bounded mailbox off the publisher's thread
+            max_queue_size: Mailbox capacity (queued only)
+            max_batch_size: Events drained per batch (queued only)
+            batch: Handler receives a list of events (queued only)
 
         Returns:
             Handler ID for later removal
@@ -315,16 +519,23 @@ class EventBus:
             weak=weak,
             filter_fn=filter_fn,
         )
+        if queued:
+            registration.mailbox = SubscriberMailbox(
+                registration, max_queue_size, max_batch_size, batch
+            )
 
         with cls._lock:
             handlers = cls._handlers[event_type]
             handlers.append(registration)
             # Sort by priority (lower = earlier)
             handlers.sort(key=lambda r: r.priority)
+            cls._invalidate()
 
         logger.debug(
-            f"Subscribed {handler.__name__} to {event_type.__name__} "
-            f"(priority={priority.name})"
+            "Subscribed %s to %s (priority=%s)",
+            handler.__name__,
+            event_type.__name__,
+            priority.name,
         )
 
         return registration.handler_id
@@ -350,6 +561,7 @@ class EventBus:
         with cls._lock:
             cls._global_handlers.append(registration)
             cls._global_handlers.sort(key=lambda r: r.priority)
+            cls._invalidate()
 
         return registration.handler_id
 
@@ -361,11 +573,13 @@ class EventBus:
                 for reg in handlers:
                     if reg.handler_id == handler_id:
                         handlers.remove(reg)
+                        cls._invalidate()
                         return True
 
             for reg in cls._global_handlers:
                 if reg.handler_id == handler_id:
                     cls._global_handlers.remove(reg)
+                    cls._invalidate()
                     return True
 
         return False
@@ -382,9 +596,41 @@ class EventBus:
             for reg in handlers:
                 if reg.handler is handler:
                     handlers.remove(reg)
+                    cls._invalidate()
                     return True
         return False
 
+    @classmethod
+    def _invalidate(cls) -> None:
+        """Drop cached dispatch tables (caller holds the lock)."""
+        cls._dispatch = {}
+
+    @classmethod
+    def _handlers_for(cls, event_type: type[Event]) -> tuple[HandlerRegistration, ...]:
+        """Dispatch table for a concrete event type."""
+        table = cls._dispatch.get(event_type)
+        if table is not None:
+            return table
+
+        with cls._lock:
+            # Type-specific handlers
+            handlers = list(cls._handlers.get(event_type, []))
+
+            # Walk up class hierarchy for parent event types
+            for base in event_type.__mro__[1:]:
+                if base is Event or not issubclass(base, Event):
+                    continue
+                handlers.extend(cls._handlers.get(base, []))
+
+            # Global handlers
+            handlers.extend(cls._global_handlers)
+
+            # Sort by priority (stable, so registration order breaks ties)
+            handlers.sort(key=lambda r: r.priority)
+            table = tuple(handlers)
+            cls._dispatch[event_type] = table
+            return table
+
     @classmethod
     def publish(
         cls,
@@ -402,28 +648,11 @@ class EventBus:
             wait: If async, wait for completion
         """
         # Log event
-        cls._log_event(event)
+        cls._event_log.append(event)
 
-        logger.debug(f"Publishing event: {event.event_type}")
-
-        # Collect handlers
-        handlers = []
-
-        with cls._lock:
-            # Type-specific handlers
-            handlers.extend(cls._handlers.get(type(event), []))
-
-            # Walk up class hierarchy for parent event types
-            for base in type(event).__mro__[1:]:
-                if base is Event or not issubclass(base, Event):
-                    continue
-                handlers.extend(cls._handlers.get(base, []))
-
-            # Global handlers
-            handlers.extend(cls._global_handlers)
-
-        # Sort by priority
-        handlers.sort(key=lambda r: r.priority)
+        handlers = cls._handlers_for(type(event))
+        if not handlers:
+            return
 
         # Execute handlers
         to_remove = []
@@ -433,7 +662,9 @@ class EventBus:
                 continue
 
             try:
-                if reg.is_async:
+                if reg.mailbox is not None:
+                    reg.mailbox.offer(event)
+                elif reg.is_async:
                     if sync:
                         # Run async in thread pool
                         coro = reg.handler(event)
@@ -459,29 +690,24 @@ class EventBus:
         if to_remove:
             with cls._lock:
                 for reg in to_remove:
-                    for handlers in cls._handlers.values():
-                        if reg in handlers:
-                            handlers.remove(reg)
+                    for handlers_list in cls._handlers.values():
+                        if reg in handlers_list:
+                            handlers_list.remove(reg)
+                cls._invalidate()
 
     @classmethod
     async def publish_async(cls, event: Event) -> None:
         """Publish event with async handler execution."""
-        cls._log_event(event)
-
-        handlers = []
-
-        with cls._lock:
-            handlers.extend(cls._handlers.get(type(event), []))
-            handlers.extend(cls._global_handlers)
+        cls._event_log.append(event)
 
-        handlers.sort(key=lambda r: r.priority)
-
-        for reg in handlers:
+        for reg in cls._handlers_for(type(event)):
             if reg.filter_fn and not reg.filter_fn(event):
                 continue
 
             try:
-                if reg.is_async:
+                if reg.mailbox is not None:
+                    reg.mailbox.offer(event)
+                elif reg.is_async:
                     coro = reg.handler(event)
                     if coro is not None:
                         await coro
@@ -526,12 +752,8 @@ class EventBus:
 
     @classmethod
     def _log_event(cls, event: Event) -> None:
-        """Log event to internal buffer."""
-        with cls._lock:
-            cls._event_log.append(event)
-            # Trim if too large
-            if len(cls._event_log) > cls._max_log_size:
-                cls._event_log = cls._event_log[-cls._max_log_size // 2 :]
+        """Log event to internal buffer (bounded; oldest events drop off)."""
+        cls._event_log.append(event)
 
     @classmethod
     def get_event_log(
@@ -540,11 +762,23 @@ class EventBus:
         limit: int = 100,
     ) -> list[Event]:
         """Get recent events from the log."""
+        events = list(cls._event_log)[-limit:]
+        if event_type:
+            events = [e for e in events if isinstance(e, event_type)]
+        return events
+
+    @classmethod
+    def flush(cls, timeout: float | None = 5.0) -> bool:
+        """Wait for queued subscribers to drain. Returns False on timeout."""
         with cls._lock:
-            events = cls._event_log[-limit:]
-            if event_type:
-                events = [e for e in events if isinstance(e, event_type)]
-            return events
+            mailboxes = cls._mailboxes()
+        return all(mailbox.wait_idle(timeout) for mailbox in mailboxes)
+
+    @classmethod
+    def _mailboxes(cls) -> list[SubscriberMailbox]:
+        registrations = [r for h in cls._handlers.values() for r in h]
+        registrations += cls._global_handlers
+        return [r.mailbox for r in registrations if r.mailbox is not None]
 
     @classmethod
     def set_error_handler(
@@ -558,9 +792,12 @@ class EventBus:
     def clear(cls) -> None:
         """Clear all handlers and event log (for testing)."""
         with cls._lock:
+            for mailbox in cls._mailboxes():
+                mailbox.clear()
             cls._handlers.clear()
             cls._global_handlers.clear()
             cls._event_log.clear()
+            cls._invalidate()
 
     @classmethod
     def get_stats(cls) -> dict[str, Any]:
@@ -571,6 +808,8 @@ class EventBus:
                 "global_handler_count": len(cls._global_handlers),
                 "event_types": list(cls._handlers.keys()),
                 "event_log_size": len(cls._event_log),
+                "dispatch_tables": len(cls._dispatch),
+                "queued_subscribers": [m.get_stats() for m in cls._mailboxes()],
             }
 
 
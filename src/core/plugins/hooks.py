@@ -37,10 +37,19 @@ Example:
         result = func(*args, **kwargs)
         print(f"Took {time.time() - start}s")
         return result
+
+Dispatch:
+    Each hook point is compiled into an immutable HookChain (enabled hooks
+    per type, in priority order, with the AROUND hooks pre-composed). The
+    chain is cached and rebuilt only when the registry version changes
+    (register, unregister, enable/disable, clear), so a hooked call takes
+    no lock and copies nothing. A hook point without enabled hooks calls
+    the wrapped function directly.
 """
 
 from __future__ import annotations
 
+import bisect
 import logging
 import threading
 from collections import defaultdict
@@ -106,6 +115,130 @@ class Hook:
             return self.handler(*args, **kwargs)
         return None
 
+    def __setattr__(self, key: str, value: Any) -> None:
+        super().__setattr__(key, value)
+        if key in ("enabled", "priority", "handler"):
+            # Compiled chains hold the enabled handlers in priority order
+            HookRegistry._invalidate()
+
+
+# ============== Compiled Dispatch ==============
+
+
+def _call_target(func: Callable, args: tuple, kwargs: dict) -> Any:
+    return func(*args, **kwargs)
+
+
+def _compose_around(handler: Callable, inner: Callable) -> Callable:
+    def step(func: Callable, args: tuple, kwargs: dict) -> Any:
+        return handler(lambda: inner(func, args, kwargs), *args, **kwargs)
+
+    return step
+
+
+class HookChain:
+    """
+    Immutable, pre-sorted dispatch chain for one hook point.
+
+    Built by HookRegistry.compile for a registry version; only enabled
+    hooks are included.
+    """
+
+    __slots__ = (
+        "name",
+        "version",
+        "before",
+        "around",
+        "after",
+        "error",
+        "finally_",
+        "empty",
+        "_around_call",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        version: int,
+        hooks: dict[HookType, list[Hook]],
+    ):
+        def enabled(hook_type: HookType) -> tuple[Hook, ...]:
+            return tuple(h for h in hooks.get(hook_type, ()) if h.enabled)
+
+        self.name = name
+        self.version = version
+        self.before = enabled(HookType.BEFORE)
+        self.around = enabled(HookType.AROUND)
+        self.after = enabled(HookType.AFTER)
+        self.error = enabled(HookType.ERROR)
+        self.finally_ = enabled(HookType.FINALLY)
+        self.empty = not (
+            self.before or self.around or self.after or self.error or self.finally_
+        )
+
+        around_call: Callable = _call_target
+        for hook in reversed(self.around):
+            around_call = _compose_around(hook.handler, around_call)
+        self._around_call = around_call
+
+    def hooks_for(self, hook_type: HookType) -> tuple[Hook, ...]:
+        return {
+            HookType.BEFORE: self.before,
+            HookType.AROUND: self.around,
+            HookType.AFTER: self.after,
+            HookType.ERROR: self.error,
+            HookType.FINALLY: self.finally_,
+        }[hook_type]
+
+    @staticmethod
+    def run(hooks: tuple[Hook, ...], *args, **kwargs) -> list[Any]:
+        """Call each hook in order, re-raising the first failure."""
+        counts = HookRegistry._execution_counts
+        results = []
+        for hook in hooks:
+            try:
+                results.append(hook.handler(*args, **kwargs))
+                counts[hook.hook_id] += 1
+            except Exception as e:
+                logger.error(f"Hook {hook.hook_id} failed: {e}")
+                raise
+        return results
+
+    def invoke(self, func: Callable, args: tuple, kwargs: dict) -> Any:
+        """Call func with this chain's hooks around it."""
+        result = None
+        error = None
+
+        try:
+            if self.before:
+                self.run(self.before, *args, **kwargs)
+
+            result = self._around_call(func, args, kwargs)
+
+            if self.after:
+                # Allow after hooks to modify result
+                for after_result in self.run(self.after, result, *args, **kwargs):
+                    if after_result is not None:
+                        result = after_result
+
+            return result
+
+        except Exception as e:
+            error = e
+            if self.error:
+                try:
+                    self.run(self.error, e, *args, **kwargs)
+                except Exception:
+                    pass
+            raise
+
+        finally:
+            if self.finally_:
+                try:
+                    self.run(self.finally_, result, error, *args, **kwargs)
+                except Exception:
+                    pass
+
 
 class HookRegistry:
     """
@@ -140,6 +273,10 @@ class HookRegistry:
     # Metrics
     _execution_counts: dict[str, int] = defaultdict(int)
 
+    # Compiled dispatch chains, valid while their version matches _version
+    _version: int = 0
+    _compiled: dict[str, HookChain] = {}
+
     @classmethod
     def register(
         cls,
@@ -173,9 +310,10 @@ class HookRegistry:
 
         with cls._lock:
             hooks = cls._hooks[name][hook_type]
-            hooks.append(hook)
-            # Sort by priority
-            hooks.sort(key=lambda h: h.priority)
+            # Keep priority order (stable for equal priorities)
+            index = bisect.bisect_right([h.priority for h in hooks], priority)
+            hooks.insert(index, hook)
+            cls._invalidate()
 
         logger.debug(
             f"Registered {hook_type.name} hook for '{name}' (priority={priority.name})"
@@ -192,6 +330,7 @@ class HookRegistry:
                     for hook in hooks:
                         if hook.hook_id == hook_id:
                             hooks.remove(hook)
+                            cls._invalidate()
                             return True
         return False
 
@@ -240,20 +379,36 @@ class HookRegistry:
         Returns:
             List of hook return values
         """
-        results = []
-        hooks = cls.get_hooks(name, hook_type)
+        hooks = cls.compile(name).hooks_for(hook_type)
+        if not hooks:
+            return []
+        return HookChain.run(hooks, *args, **kwargs)
 
-        for hook in hooks:
-            if hook.enabled:
-                try:
-                    result = hook.handler(*args, **kwargs)
-                    results.append(result)
-                    cls._execution_counts[hook.hook_id] += 1
-                except Exception as e:
-                    logger.error(f"Hook {hook.hook_id} failed: {e}")
-                    raise
+    @classmethod
+    def compile(cls, name: str) -> HookChain:
+        """
+        Get the dispatch chain for a hook point.
 
-        return results
+        Served from cache without locking while the registry is unchanged;
+        rebuilt after any registration change.
+        """
+        chain = cls._compiled.get(name)
+        if chain is not None and chain.version == cls._version:
+            return chain
+
+        with cls._lock:
+            version = cls._version
+            type_hooks = cls._hooks.get(name, {})
+            chain = HookChain(
+                name, version, {t: list(h) for t, h in type_hooks.items()}
+            )
+            cls._compiled[name] = chain
+            return chain
+
+    @classmethod
+    def _invalidate(cls) -> None:
+        """Mark all compiled chains stale."""
+        cls._version += 1
 
     @classmethod
     def set_enabled(cls, hook_id: str, enabled: bool) -> bool:
@@ -302,6 +457,8 @@ class HookRegistry:
         with cls._lock:
             cls._hooks.clear()
             cls._execution_counts.clear()
+            cls._compiled.clear()
+            cls._invalidate()
 
     @classmethod
     def get_stats(cls) -> dict[str, Any]:
@@ -315,6 +472,10 @@ class HookRegistry:
             return {
                 "hook_points": len(cls._hooks),
                 "total_hooks": total_hooks,
+                "version": cls._version,
+                "compiled_chains": sum(
+                    1 for c in cls._compiled.values() if c.version == cls._version
+                ),
                 "execution_counts": dict(cls._execution_counts),
             }
 
@@ -348,64 +509,14 @@ def hookable(name: str) -> Callable[[F], F]:
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            result = None
-            error = None
-
-            try:
-                # Execute BEFORE hooks
-                HookRegistry.execute_hooks(name, HookType.BEFORE, *args, **kwargs)
-
-                # Execute AROUND hooks or the function itself
-                around_hooks = HookRegistry.get_hooks(name, HookType.AROUND)
-
-                if around_hooks:
-                    # Chain around hooks
-                    def chain_around(index: int):
-                        if index >= len(around_hooks):
-                            return func(*args, **kwargs)
-
-                        hook = around_hooks[index]
-                        if hook.enabled:
-                            return hook.handler(
-                                lambda: chain_around(index + 1),
-                                *args,
-                                **kwargs,
-                            )
-                        return chain_around(index + 1)
-
-                    result = chain_around(0)
-                else:
-                    result = func(*args, **kwargs)
-
-                # Execute AFTER hooks
-                after_results = HookRegistry.execute_hooks(
-                    name, HookType.AFTER, result, *args, **kwargs
-                )
-
-                # Allow after hooks to modify result
-                for after_result in after_results:
-                    if after_result is not None:
-                        result = after_result
-
-                return result
-
-            except Exception as e:
-                error = e
-                # Execute ERROR hooks
-                try:
-                    HookRegistry.execute_hooks(name, HookType.ERROR, e, *args, **kwargs)
-                except Exception:
-                    pass
-                raise
-
-            finally:
-                # Execute FINALLY hooks
-                try:
-                    HookRegistry.execute_hooks(
-                        name, HookType.FINALLY, result, error, *args, **kwargs
-                    )
-                except Exception:
-                    pass
+            chain = HookRegistry._compiled.get(name)
+            if chain is None or chain.version != HookRegistry._version:
+                chain = HookRegistry.compile(name)
+
+            # Fast path: nothing to run around the call
+            if chain.empty:
+                return func(*args, **kwargs)
+            return chain.invoke(func, args, kwargs)
 
         return wrapper  # type: ignore
 
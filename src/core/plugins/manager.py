@@ -32,13 +32,25 @@ Example:
 
     # Graceful shutdown
     manager.stop_all()
+
+Startup:
+    start_all() groups enabled plugins into topological levels (a plugin's
+    level is one more than its deepest enabled dependency) and starts each
+    level in parallel, waiting at most start_timeout for it. With
+    parallel_start off, plugins start one at a time and each gets its own
+    start_timeout. Plugins whose dependencies failed are skipped. Per-plugin
+    timings are available from get_startup_report().
 """
 
 import logging
 import signal
 import threading
+import time
 from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -74,6 +86,7 @@ class PluginManagerConfig(BaseModel):
     auto_start: bool = True
     start_timeout: float = 30.0
     parallel_start: bool = True
+    max_start_workers: int = 8
 
     # Shutdown
     stop_timeout: float = 10.0
@@ -88,6 +101,26 @@ class PluginManagerConfig(BaseModel):
     plugin_configs: dict[str, dict[str, Any]] = {}
 
 
+@dataclass
+class PluginStartupRecord:
+    """Startup outcome and timing of one plugin."""
+
+    name: str
+    level: int
+    status: str  # started, failed, timeout, skipped
+    duration_ms: float = 0.0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "level": self.level,
+            "status": self.status,
+            "duration_ms": round(self.duration_ms, 3),
+            "error": self.error,
+        }
+
+
 class PluginManager:
     """
     Central manager for all plugins.
@@ -137,9 +170,14 @@ class PluginManager:
 
         # State tracking
         self._started_plugins: set[str] = set()
+        self._starting_plugins: set[str] = set()
         self._failed_plugins: dict[str, Exception] = {}
         self._restart_counts: dict[str, int] = defaultdict(int)
 
+        # Last start_all() timings
+        self._startup_records: dict[str, PluginStartupRecord] = {}
+        self._startup_total_ms = 0.0
+
         # Threading
         self._lock = threading.RLock()
         self._shutdown_event = threading.Event()
@@ -308,68 +346,80 @@ class PluginManager:
         """
         Start a single plugin.
 
+        The manager lock is only held for bookkeeping, so independent
+        plugins can start concurrently.
+
         Args:
             name: Plugin name
             config: Plugin configuration
         """
         with self._lock:
-            if name in self._started_plugins:
+            if name in self._started_plugins or name in self._starting_plugins:
                 logger.debug(f"Plugin {name} already started")
                 return
+            self._starting_plugins.add(name)
 
-            try:
-                logger.info(f"Starting plugin: {name}")
+        try:
+            logger.info(f"Starting plugin: {name}")
 
-                # Get or create instance
-                plugin = PluginRegistry.get_instance(name, self._context)
+            # Get or create instance
+            plugin = PluginRegistry.get_instance(name, self._context)
 
-                # Get config from manager config or parameter
-                plugin_config = config or self.config.plugin_configs.get(name, {})
+            # Get config from manager config or parameter
+            plugin_config = config or self.config.plugin_configs.get(name, {})
 
-                # Configure and start
-                plugin.configure(plugin_config)
-                plugin.start()
+            # Configure and start
+            plugin.configure(plugin_config)
+            plugin.start()
 
+            with self._lock:
                 self._started_plugins.add(name)
                 self._failed_plugins.pop(name, None)
 
-                # Publish event
-                EventBus.publish(
-                    PluginStartedEvent(
-                        source="PluginManager",
-                        plugin_name=name,
-                    )
+            # Publish event
+            EventBus.publish(
+                PluginStartedEvent(
+                    source="PluginManager",
+                    plugin_name=name,
                 )
+            )
 
-                # Callbacks
-                for callback in self._on_plugin_started:
-                    try:
-                        callback(name)
-                    except Exception:
-                        pass
+            # Callbacks
+            for callback in self._on_plugin_started:
+                try:
+                    callback(name)
+                except Exception:
+                    pass
 
-                logger.info(f"Plugin {name} started successfully")
+            logger.info(f"Plugin {name} started successfully")
 
-            except Exception as e:
-                logger.error(f"Failed to start plugin {name}: {e}")
-                self._failed_plugins[name] = e
+        except Exception as e:
+            logger.error(f"Failed to start plugin {name}: {e}")
+            self._record_failure(name, e)
+            raise
 
-                EventBus.publish(
-                    PluginErrorEvent(
-                        source="PluginManager",
-                        plugin_name=name,
-                        error_type=type(e).__name__,
-                        error_message=str(e),
-                    )
-                )
+        finally:
+            with self._lock:
+                self._starting_plugins.discard(name)
 
-                for failed_callback in self._on_plugin_failed:
-                    try:
-                        failed_callback(name, e)
-                    except Exception:
-                        pass
+    def _record_failure(self, name: str, error: Exception) -> None:
+        with self._lock:
+            self._failed_plugins[name] = error
+
+        EventBus.publish(
+            PluginErrorEvent(
+                source="PluginManager",
+                plugin_name=name,
+                error_type=type(error).__name__,
+                error_message=str(error),
+            )
+        )
 
-                raise
+        for failed_callback in self._on_plugin_failed:
+            try:
+                failed_callback(name, error)
+            except Exception:
+                pass
 
     def stop(self, name: str) -> None:
         """
@@ -419,41 +469,166 @@ class PluginManager:
         """
         Start all enabled plugins in dependency order.
 
+        Plugins in the same topological level start in parallel (unless
+        parallel_start is off). A plugin that has not started within
+        start_timeout is reported as timed out; its start keeps running in
+        the background and it becomes available if it eventually succeeds.
+
         Returns:
             Dict mapping plugin name to success status
         """
         logger.info("Starting all enabled plugins...")
+        began = time.perf_counter()
 
-        results = {}
+        results: dict[str, bool] = {}
+        self._startup_records = {}
         enabled_plugins = PluginRegistry.get_enabled()
+        levels, depends_on = self._start_levels(enabled_plugins, results)
+
+        failed = {name for name, ok in results.items() if not ok}
+        for level, names in enumerate(levels):
+            runnable = []
+            for name in names:
+                blocked = sorted(depends_on[name] & failed)
+                if blocked:
+                    logger.error(f"Skipping plugin {name}: dependency failed {blocked}")
+                    self._startup_records[name] = PluginStartupRecord(
+                        name, level, "skipped", error=f"dependency failed: {blocked}"
+                    )
+                    results[name] = False
+                    failed.add(name)
+                else:
+                    runnable.append(name)
+
+            for record in self._start_level(runnable, level):
+                self._startup_records[record.name] = record
+                results[record.name] = record.status == "started"
+                if record.status != "started":
+                    failed.add(record.name)
+
+        self._startup_total_ms = (time.perf_counter() - began) * 1000
+        success_count = sum(1 for v in results.values() if v)
+        logger.info(
+            f"Started {success_count}/{len(results)} plugins successfully "
+            f"in {self._startup_total_ms:.1f}ms ({len(levels)} levels)"
+        )
 
-        # Resolve dependencies for all plugins
-        start_order = []
-        for name in enabled_plugins:
-            try:
-                deps = PluginRegistry.resolve_dependencies(name)
-                for dep in deps:
-                    if dep not in start_order:
-                        start_order.append(dep)
-            except Exception as e:
-                logger.error(f"Dependency resolution failed for {name}: {e}")
-                results[name] = False
+        return results
 
-        # Start in order
-        for name in start_order:
-            if name not in enabled_plugins:
-                continue
+    def _start_levels(
+        self,
+        names: list[str],
+        results: dict[str, bool],
+    ) -> tuple[list[list[str]], dict[str, set[str]]]:
+        """
+        Group plugins into topological levels (Kahn's algorithm).
 
-            try:
-                self.start(name)
-                results[name] = True
-            except Exception:
-                results[name] = False
+        Only dependencies that are themselves enabled count. Plugins on a
+        dependency cycle are marked failed in results.
+        """
+        enabled = set(names)
+        depends_on = {
+            name: {
+                dep
+                for dep in PluginRegistry.get_metadata(name).depends_on
+                if dep in enabled and dep != name
+            }
+            for name in names
+        }
 
-        success_count = sum(1 for v in results.values() if v)
-        logger.info(f"Started {success_count}/{len(results)} plugins successfully")
+        levels = []
+        placed: set[str] = set()
+        remaining = list(names)
+        while remaining:
+            level = [n for n in remaining if depends_on[n] <= placed]
+            if not level:
+                break
+            levels.append(level)
+            placed.update(level)
+            remaining = [n for n in remaining if n not in placed]
+
+        for name in remaining:
+            logger.error(
+                f"Dependency resolution failed for {name}: circular dependency"
+            )
+            results[name] = False
+            self._startup_records[name] = PluginStartupRecord(
+                name, len(levels), "failed", error="circular dependency"
+            )
 
-        return results
+        return levels, depends_on
+
+    def _timed_start(self, name: str, level: int) -> PluginStartupRecord:
+        began = time.perf_counter()
+        try:
+            self.start(name)
+            status, error = "started", None
+        except Exception as e:
+            status, error = "failed", str(e)
+        duration_ms = (time.perf_counter() - began) * 1000
+        return PluginStartupRecord(name, level, status, duration_ms, error)
+
+    def _start_level(self, names: list[str], level: int) -> list[PluginStartupRecord]:
+        """Start one topological level, in parallel when enabled."""
+        if not names:
+            return []
+        if self.config.parallel_start:
+            workers = min(len(names), self.config.max_start_workers)
+            return self._await_starts(names, level, workers)
+
+        # Serial: one plugin at a time, each with its own start_timeout
+        records = []
+        for name in names:
+            records.extend(self._await_starts([name], level, 1))
+        return records
+
+    def _await_starts(
+        self, names: list[str], level: int, workers: int
+    ) -> list[PluginStartupRecord]:
+        """Start plugins on a worker pool, waiting at most start_timeout."""
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="PluginStart",
+        )
+        futures = {
+            executor.submit(self._timed_start, name, level): name for name in names
+        }
+        done, _ = wait_futures(futures, timeout=self.config.start_timeout)
+        # Do not block on plugins that are still starting
+        executor.shutdown(wait=False)
+
+        records = []
+        for future, name in futures.items():
+            if future in done:
+                records.append(future.result())
+                continue
+
+            error = TimeoutError(
+                f"Plugin {name} did not start within {self.config.start_timeout}s"
+            )
+            logger.error(str(error))
+            self._record_failure(name, error)
+            records.append(
+                PluginStartupRecord(
+                    name,
+                    level,
+                    "timeout",
+                    self.config.start_timeout * 1000,
+                    str(error),
+                )
+            )
+        return records
+
+    def get_startup_report(self) -> dict[str, Any]:
+        """Per-plugin timings of the last start_all(), slowest first per level."""
+        records = sorted(
+            self._startup_records.values(),
+            key=lambda r: (r.level, -r.duration_ms),
+        )
+        return {
+            "total_ms": round(self._startup_total_ms, 3),
+            "plugins": [record.to_dict() for record in records],
+        }
 
     def stop_all(self, timeout: float | None = None) -> None:
         """
@@ -590,6 +765,7 @@ class PluginManager:
             "failed_plugins": len(self._failed_plugins),
             "plugin_dirs": self.config.plugin_dirs,
             "health": self.health_check_all(),
+            "startup": self.get_startup_report(),
         }
 
     # ==================== Context Manager ====================
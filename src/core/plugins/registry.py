@@ -12,6 +12,10 @@ Design Patterns:
 
 Academic Reference:
     - Fowler, "Patterns of Enterprise Application Architecture" (Registry, p. 480)
+
+Discovery is manifest-only by default: plugin.yaml is parsed and the
+metadata registered, but the plugin module is imported on first use
+(get, get_instance). Disabled plugins are therefore never imported.
 """
 
 import importlib
@@ -20,6 +24,7 @@ import logging
 import sys
 import threading
 from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (
     TypeVar,
@@ -51,6 +56,17 @@ class PluginNotFoundError(Exception):
     pass
 
 
+@dataclass
+class DeferredPlugin:
+    """A discovered plugin whose module has not been imported yet."""
+
+    name: str
+    module_file: Path
+    class_name: str | None
+    metadata: PluginMetadata
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
 class PluginRegistry:
     """
     Thread-safe registry for plugin types and instances.
@@ -86,6 +102,9 @@ class PluginRegistry:
     _search_paths: list[Path] = []
     _discovered: set[str] = set()
 
+    # Discovered plugins awaiting import on first use
+    _deferred: dict[str, DeferredPlugin] = {}
+
     @classmethod
     def register(
         cls,
@@ -174,6 +193,7 @@ class PluginRegistry:
                 )
 
             cls._plugins[name] = plugin_class
+            cls._deferred.pop(name, None)
             logger.info(f"Registered plugin: {name} v{cls._metadata[name].version}")
 
     @classmethod
@@ -198,6 +218,9 @@ class PluginRegistry:
                     del cls._metadata[name]
 
                 logger.info(f"Unregistered plugin: {name}")
+            elif cls._deferred.pop(name, None) is not None:
+                cls._metadata.pop(name, None)
+                logger.info(f"Unregistered plugin: {name}")
 
     @classmethod
     def get(cls, name: str) -> type[BasePlugin]:
@@ -213,6 +236,7 @@ class PluginRegistry:
         Raises:
             PluginNotFoundError: If plugin not found
         """
+        cls._ensure_loaded(name)
         with cls._lock:
             if name not in cls._plugins:
                 raise PluginNotFoundError(f"Plugin not found: {name}")
@@ -237,6 +261,7 @@ class PluginRegistry:
         Returns:
             Plugin instance
         """
+        cls._ensure_loaded(name)
         with cls._lock:
             if singleton and name in cls._instances:
                 return cls._instances[name]
@@ -259,9 +284,11 @@ class PluginRegistry:
 
     @classmethod
     def list_plugins(cls) -> list[str]:
-        """List all registered plugin names."""
+        """List all registered plugin names (including not yet imported)."""
         with cls._lock:
-            return list(cls._plugins.keys())
+            return list(cls._plugins.keys()) + [
+                name for name in cls._deferred if name not in cls._plugins
+            ]
 
     @classmethod
     def list_metadata(cls) -> dict[str, PluginMetadata]:
@@ -309,6 +336,12 @@ class PluginRegistry:
     @classmethod
     def exists(cls, name: str) -> bool:
         """Check if a plugin is registered."""
+        with cls._lock:
+            return name in cls._plugins or name in cls._deferred
+
+    @classmethod
+    def is_loaded(cls, name: str) -> bool:
+        """Check if a plugin's module has been imported."""
         with cls._lock:
             return name in cls._plugins
 
@@ -316,7 +349,7 @@ class PluginRegistry:
     def count(cls) -> int:
         """Get number of registered plugins."""
         with cls._lock:
-            return len(cls._plugins)
+            return len(cls._plugins.keys() | cls._deferred.keys())
 
     @classmethod
     def discover(
@@ -325,6 +358,7 @@ class PluginRegistry:
         *,
         recursive: bool = True,
         manifest_name: str = "plugin.yaml",
+        lazy: bool = True,
     ) -> list[str]:
         """
         Discover and register plugins from a directory.
@@ -337,6 +371,7 @@ class PluginRegistry:
             path: Directory to search
             recursive: Search subdirectories
             manifest_name: Name of manifest file
+            lazy: Register from the manifest and import on first use
 
         Returns:
             List of discovered plugin names
@@ -352,7 +387,7 @@ class PluginRegistry:
         pattern = f"**/{manifest_name}" if recursive else manifest_name
         for manifest_path in path.glob(pattern):
             try:
-                plugin_name = cls._load_plugin_from_manifest(manifest_path)
+                plugin_name = cls._load_plugin_from_manifest(manifest_path, lazy)
                 if plugin_name:
                     discovered.append(plugin_name)
             except Exception as e:
@@ -362,7 +397,9 @@ class PluginRegistry:
         return discovered
 
     @classmethod
-    def _load_plugin_from_manifest(cls, manifest_path: Path) -> str | None:
+    def _load_plugin_from_manifest(
+        cls, manifest_path: Path, lazy: bool = False
+    ) -> str | None:
         """Load a plugin from its manifest file."""
         plugin_dir = manifest_path.parent
 
@@ -393,6 +430,43 @@ class PluginRegistry:
         if not module_file.exists():
             raise PluginRegistrationError(f"Plugin module not found in {plugin_dir}")
 
+        deferred = DeferredPlugin(
+            name=name,
+            module_file=module_file,
+            class_name=manifest.get("class"),
+            metadata=metadata,
+        )
+        if lazy:
+            with cls._lock:
+                cls._metadata[name] = metadata
+                cls._deferred[name] = deferred
+                cls._discovered.add(name)
+            logger.info(f"Discovered plugin: {name} v{metadata.version} (deferred)")
+            return str(name)
+
+        cls._import_plugin(deferred)
+        cls._discovered.add(name)
+        return str(name)
+
+    @classmethod
+    def _ensure_loaded(cls, name: str) -> None:
+        """Import a deferred plugin's module if it has not been yet."""
+        deferred = cls._deferred.get(name)
+        if deferred is None:
+            return
+        # Per-plugin lock: other plugins can load (and start) concurrently
+        with deferred.lock:
+            if cls._deferred.get(name) is deferred:
+                cls._import_plugin(deferred)
+                with cls._lock:
+                    cls._deferred.pop(name, None)
+
+    @classmethod
+    def _import_plugin(cls, deferred: DeferredPlugin) -> None:
+        """Import a plugin module and register its plugin class."""
+        name = deferred.name
+        module_file = deferred.module_file
+
         # Load module dynamically
         spec = importlib.util.spec_from_file_location(f"plugins.{name}", module_file)
         if not spec or not spec.loader:
@@ -405,7 +479,7 @@ class PluginRegistry:
         spec.loader.exec_module(module)
 
         # Find plugin class
-        class_name = manifest.get("class")
+        class_name = deferred.class_name
         if class_name:
             plugin_class = getattr(module, class_name)
         else:
@@ -425,10 +499,7 @@ class PluginRegistry:
             raise PluginRegistrationError(f"No plugin class found in {module_file}")
 
         # Register plugin
-        cls.register_plugin(name, plugin_class, metadata=metadata)
-        cls._discovered.add(name)
-
-        return str(name)
+        cls.register_plugin(name, plugin_class, metadata=deferred.metadata)
 
     @classmethod
     def add_search_path(cls, path: str | Path) -> None:
@@ -461,6 +532,7 @@ class PluginRegistry:
             cls._metadata.clear()
             cls._instances.clear()
             cls._discovered.clear()
+            cls._deferred.clear()
 
     @classmethod
     def __iter__(cls) -> Iterator[str]:
@@ -502,7 +574,7 @@ class PluginRegistry:
 
                 if plugin_name in cls._metadata:
                     for dep in cls._metadata[plugin_name].depends_on:
-                        if dep in cls._plugins:
+                        if dep in cls._plugins or dep in cls._deferred:
                             visit(dep)
 
                 stack.remove(plugin_name)
@@ -8,9 +8,11 @@ Implements patterns from the stability patterns literature.
 Patterns Included:
 - Circuit Breaker: Fail fast when service is unhealthy
 - Retry with Backoff: Exponential retry with jitter
+- Retry Budget: Process-wide cap on retry amplification
 - Timeout: Bounded execution time
 - Bulkhead: Resource isolation
 - Fallback: Graceful degradation
+- Stale-While-Revalidate: Last-good content served while refreshing
 - Rate Limiter: Request throttling
 
 Academic Reference:
@@ -25,39 +27,109 @@ Example:
     @timeout(seconds=10)
     def call_external_api():
         return requests.get("https://api.example.com")
+
+    # Async counterparts share the same stats surface
+    @async_circuit_breaker(name="external_api")
+    @async_retry(max_attempts=3)
+    async def call_external_api_async():
+        return await client.get("https://api.example.com")
 """
 
-from src.core.resilience.bulkhead import (
-    Bulkhead,
-    BulkheadFull,
-    bulkhead,
-)
-from src.core.resilience.circuit_breaker import (
-    CircuitBreaker,
-    CircuitBreakerOpen,
-    CircuitState,
-    circuit_breaker,
-)
-from src.core.resilience.fallback import (
-    Fallback,
-    fallback,
-)
-from src.core.resilience.rate_limiter import (
-    RateLimiter,
-    RateLimitExceeded,
-    TokenBucket,
-    rate_limit,
-)
-from src.core.resilience.retry import (
-    RetryError,
-    RetryPolicy,
-    retry,
-    with_retry,
-)
-from src.core.resilience.timeout import (
-    TimeoutError,
-    timeout,
-    with_timeout,
+from typing import TYPE_CHECKING
+
+from src._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core.resilience.bulkhead import (
+        AsyncBulkhead,
+        Bulkhead,
+        BulkheadFull,
+        async_bulkhead,
+        bulkhead,
+    )
+    from src.core.resilience.circuit_breaker import (
+        CircuitBreaker,
+        CircuitBreakerOpen,
+        CircuitState,
+        async_circuit_breaker,
+        circuit_breaker,
+    )
+    from src.core.resilience.fallback import (
+        Fallback,
+        async_fallback,
+        fallback,
+    )
+    from src.core.resilience.rate_limiter import (
+        RateLimiter,
+        RateLimitExceeded,
+        TokenBucket,
+        async_rate_limit,
+        rate_limit,
+    )
+    from src.core.resilience.retry import (
+        RetryError,
+        RetryPolicy,
+        async_retry,
+        async_with_retry,
+        retry,
+        with_retry,
+    )
+    from src.core.resilience.retry_budget import (
+        RetryBudget,
+        get_retry_budget,
+        reset_retry_budget,
+    )
+    from src.core.resilience.stale_cache import (
+        DiskStore,
+        StaleWhileRevalidateCache,
+    )
+    from src.core.resilience.timeout import (
+        TimeoutError,
+        async_timeout,
+        async_with_timeout,
+        timeout,
+        with_timeout,
+    )
+
+# Exports are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncBulkhead": "src.core.resilience.bulkhead",
+        "Bulkhead": "src.core.resilience.bulkhead",
+        "BulkheadFull": "src.core.resilience.bulkhead",
+        "async_bulkhead": "src.core.resilience.bulkhead",
+        "bulkhead": "src.core.resilience.bulkhead",
+        "CircuitBreaker": "src.core.resilience.circuit_breaker",
+        "CircuitBreakerOpen": "src.core.resilience.circuit_breaker",
+        "CircuitState": "src.core.resilience.circuit_breaker",
+        "async_circuit_breaker": "src.core.resilience.circuit_breaker",
+        "circuit_breaker": "src.core.resilience.circuit_breaker",
+        "Fallback": "src.core.resilience.fallback",
+        "async_fallback": "src.core.resilience.fallback",
+        "fallback": "src.core.resilience.fallback",
+        "RateLimiter": "src.core.resilience.rate_limiter",
+        "RateLimitExceeded": "src.core.resilience.rate_limiter",
+        "TokenBucket": "src.core.resilience.rate_limiter",
+        "async_rate_limit": "src.core.resilience.rate_limiter",
+        "rate_limit": "src.core.resilience.rate_limiter",
+        "RetryError": "src.core.resilience.retry",
+        "RetryPolicy": "src.core.resilience.retry",
+        "async_retry": "src.core.resilience.retry",
+        "async_with_retry": "src.core.resilience.retry",
+        "retry": "src.core.resilience.retry",
+        "with_retry": "src.core.resilience.retry",
+        "RetryBudget": "src.core.resilience.retry_budget",
+        "get_retry_budget": "src.core.resilience.retry_budget",
+        "reset_retry_budget": "src.core.resilience.retry_budget",
+        "DiskStore": "src.core.resilience.stale_cache",
+        "StaleWhileRevalidateCache": "src.core.resilience.stale_cache",
+        "TimeoutError": "src.core.resilience.timeout",
+        "async_timeout": "src.core.resilience.timeout",
+        "async_with_timeout": "src.core.resilience.timeout",
+        "timeout": "src.core.resilience.timeout",
+        "with_timeout": "src.core.resilience.timeout",
+    },
 )
 
 __all__ = [
@@ -66,25 +138,41 @@ __all__ = [
     "CircuitState",
     "CircuitBreakerOpen",
     "circuit_breaker",
+    "async_circuit_breaker",
     # Retry
     "RetryPolicy",
     "RetryError",
     "retry",
     "with_retry",
+    "async_retry",
+    "async_with_retry",
+    # Retry Budget
+    "RetryBudget",
+    "get_retry_budget",
+    "reset_retry_budget",
     # Timeout
     "TimeoutError",
     "timeout",
     "with_timeout",
+    "async_timeout",
+    "async_with_timeout",
     # Bulkhead
     "Bulkhead",
     "BulkheadFull",
     "bulkhead",
+    "AsyncBulkhead",
+    "async_bulkhead",
     # Fallback
     "Fallback",
     "fallback",
+    "async_fallback",
+    # Stale-While-Revalidate
+    "StaleWhileRevalidateCache",
+    "DiskStore",
     # Rate Limiter
     "RateLimiter",
     "RateLimitExceeded",
     "rate_limit",
+    "async_rate_limit",
     "TokenBucket",
 ]
@@ -9,6 +9,7 @@ Named after ship bulkheads that prevent flooding from spreading.
 
 Implementation:
 - Semaphore-based concurrency limiting
+- asyncio.Semaphore-based limiting for coroutines
 - Thread pool isolation
 - Queue-based overflow handling
 
@@ -25,6 +26,7 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 from collections.abc import Callable
@@ -219,6 +221,141 @@ class Bulkhead:
         return cls._registry.get(name)
 
 
+class AsyncBulkhead:
+    """
+    Bulkhead for coroutines backed by asyncio.Semaphore.
+
+    Waiting for a permit suspends the coroutine instead of blocking the
+    event loop thread. Exposes the same stats surface as Bulkhead.
+
+    Parameters:
+        name: Identifier for this bulkhead
+        max_concurrent: Maximum concurrent executions
+        max_queued: Maximum queued requests (0 = no queue)
+        timeout: Wait timeout for queued requests
+
+    Example:
+        bulkhead = AsyncBulkhead(name="search", max_concurrent=10)
+
+        async with bulkhead:
+            result = await search_api()
+    """
+
+    _registry: dict[str, AsyncBulkhead] = {}
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        name: str = "default",
+        max_concurrent: int = 10,
+        max_queued: int = 0,
+        timeout: float | None = None,
+    ):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.timeout = timeout
+
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._current_concurrent = 0
+        self._current_queued = 0
+
+        self.stats = BulkheadStats()
+
+        with AsyncBulkhead._lock:
+            AsyncBulkhead._registry[name] = self
+
+    async def acquire(self, timeout: float | None = None) -> bool:
+        """
+        Acquire a permit from the bulkhead.
+
+        Returns True if permit acquired, False if rejected.
+        """
+        timeout = timeout or self.timeout
+
+        self.stats.total_calls += 1
+
+        # Counters are only touched from the event loop, so no lock is needed
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self._on_acquired()
+            return True
+
+        # No queue or queue full
+        if self._current_queued >= self.max_queued:
+            self.stats.rejected_calls += 1
+            return False
+
+        self._current_queued += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.stats.rejected_calls += 1
+            return False
+        finally:
+            self._current_queued -= 1
+
+        self._on_acquired()
+        return True
+
+    def _on_acquired(self) -> None:
+        self._current_concurrent += 1
+        self.stats.max_concurrent_reached = max(
+            self.stats.max_concurrent_reached,
+            self._current_concurrent,
+        )
+
+    def release(self) -> None:
+        """Release a permit back to the bulkhead."""
+        self._current_concurrent -= 1
+        self.stats.successful_calls += 1
+        self._semaphore.release()
+
+    async def __aenter__(self) -> AsyncBulkhead:
+        if not await self.acquire():
+            raise BulkheadFull(
+                f"Bulkhead '{self.name}' is full",
+                self.name,
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+    @property
+    def available_permits(self) -> int:
+        """Number of available permits."""
+        return self.max_concurrent - self._current_concurrent
+
+    @property
+    def queued_count(self) -> int:
+        """Number of queued requests."""
+        return self._current_queued
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get bulkhead statistics."""
+        return {
+            "name": self.name,
+            "max_concurrent": self.max_concurrent,
+            "max_queued": self.max_queued,
+            "current_concurrent": self._current_concurrent,
+            "current_queued": self._current_queued,
+            "available_permits": self.available_permits,
+            **{
+                "total_calls": self.stats.total_calls,
+                "successful_calls": self.stats.successful_calls,
+                "rejected_calls": self.stats.rejected_calls,
+                "acceptance_rate": self.stats.acceptance_rate,
+                "max_concurrent_reached": self.stats.max_concurrent_reached,
+            },
+        }
+
+    @classmethod
+    def get(cls, name: str) -> AsyncBulkhead | None:
+        """Get an async bulkhead by name."""
+        return cls._registry.get(name)
+
+
 class ThreadPoolBulkhead:
     """
     Bulkhead using a dedicated thread pool.
@@ -328,3 +465,40 @@ def bulkhead(
         return wrapper  # type: ignore
 
     return decorator
+
+
+def async_bulkhead(
+    name: str | None = None,
+    max_concurrent: int = 10,
+    max_queued: int = 0,
+    timeout: float | None = None,
+) -> Callable[[F], F]:
+    """
+    Decorator to wrap an async function with an AsyncBulkhead.
+
+    Accepts the same arguments as bulkhead.
+
+    Example:
+        @async_bulkhead(max_concurrent=5)
+        async def call_slow_api():
+            return await client.get(slow_api_url)
+    """
+
+    def decorator(func: F) -> F:
+        bh_name = name or func.__name__
+        bh = AsyncBulkhead(
+            name=bh_name,
+            max_concurrent=max_concurrent,
+            max_queued=max_queued,
+            timeout=timeout,
+        )
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with bh:
+                return await func(*args, **kwargs)
+
+        wrapper.bulkhead = bh  # type: ignore
+        return wrapper  # type: ignore
+
+    return decorator
@@ -24,10 +24,15 @@ Example:
     cb = CircuitBreaker(failure_threshold=5)
     with cb:
         result = call_api()
+
+    # The same breaker can guard coroutines
+    async with cb:
+        result = await call_api_async()
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import time
@@ -265,9 +270,11 @@ class CircuitBreaker:
 
     # ==================== Context Manager ====================
 
-    def __enter__(self) -> CircuitBreaker:
+    def _check_request(self) -> None:
+        """Raise CircuitBreakerOpen if the request is not allowed."""
         if not self.allow_request():
-            self.stats.rejected_calls += 1
+            with self._instance_lock:
+                self.stats.rejected_calls += 1
             raise CircuitBreakerOpen(
                 f"Circuit breaker '{self.name}' is open",
                 self.name,
@@ -275,14 +282,37 @@ class CircuitBreaker:
                 if self._last_failure_time
                 else datetime.now(),
             )
-        return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+    def _record_outcome(self, exc_type, exc_val) -> None:
+        """Record the outcome of a guarded call."""
         if exc_type is None:
             self.record_success()
         elif exc_type is not CircuitBreakerOpen:
             self.record_failure(exc_val)
 
+    def __enter__(self) -> CircuitBreaker:
+        self._check_request()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._record_outcome(exc_type, exc_val)
+
+    # ==================== Async Context Manager ====================
+    #
+    # State lives behind the same instance lock, which is only held for
+    # short non-blocking sections, so one breaker can be shared between
+    # threads and coroutines without blocking the event loop.
+
+    async def __aenter__(self) -> CircuitBreaker:
+        self._check_request()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is asyncio.CancelledError:
+            # Cancellation says nothing about the health of the service
+            return
+        self._record_outcome(exc_type, exc_val)
+
     # ==================== Class Methods ====================
 
     @classmethod
@@ -365,3 +395,44 @@ def circuit_breaker(
         return wrapper  # type: ignore
 
     return decorator
+
+
+def async_circuit_breaker(
+    name: str | None = None,
+    failure_threshold: int = 5,
+    success_threshold: int = 2,
+    reset_timeout: float = 30.0,
+    excluded_exceptions: set[type[Exception]] | None = None,
+) -> Callable[[F], F]:
+    """
+    Decorator to wrap an async function with a circuit breaker.
+
+    Accepts the same arguments as circuit_breaker. Passing the name of an
+    existing breaker shares its state with sync callers.
+
+    Example:
+        @async_circuit_breaker(name="maps_api", failure_threshold=5)
+        async def call_external_api():
+            return await client.get("https://api.example.com")
+    """
+
+    def decorator(func: F) -> F:
+        cb_name = name or func.__name__
+        cb = CircuitBreaker.get(cb_name) or CircuitBreaker(
+            name=cb_name,
+            failure_threshold=failure_threshold,
+            success_threshold=success_threshold,
+            reset_timeout=reset_timeout,
+            excluded_exceptions=excluded_exceptions,
+        )
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with cb:
+                return await func(*args, **kwargs)
+
+        wrapper.circuit_breaker = cb  # type: ignore
+
+        return wrapper  # type: ignore
+
+    return decorator
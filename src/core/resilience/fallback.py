@@ -10,6 +10,7 @@ Features:
 - Dynamic fallback functions
 - Chained fallbacks
 - Fallback caching
+- Async primaries and fallbacks
 
 Example:
     @fallback(default_value=cached_data)
@@ -23,6 +24,7 @@ Example:
 
 from __future__ import annotations
 
+import inspect
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -142,6 +144,56 @@ class Fallback(Generic[T]):
         self.stats.fallback_failures += 1
         raise RuntimeError("All fallbacks failed and no default value provided")
 
+    async def async_execute(
+        self,
+        primary_fn: Callable[..., Any],
+        *args,
+        **kwargs,
+    ) -> T:
+        """
+        Execute an async primary function with fallback support.
+
+        Fallback functions may be sync or async; coroutine results are
+        awaited.
+
+        Args:
+            primary_fn: Primary coroutine function to execute
+            *args, **kwargs: Function arguments
+
+        Returns:
+            Primary result or fallback value
+        """
+        self.stats.total_calls += 1
+
+        try:
+            result = await primary_fn(*args, **kwargs)
+            self.stats.primary_successes += 1
+            return result
+        except self.exceptions as e:
+            if self.log_fallback:
+                logger.warning(
+                    f"Primary function {primary_fn.__name__} failed: {e}, "
+                    f"using fallback"
+                )
+            self.stats.fallback_activations += 1
+
+        candidates = [self.fallback_fn] if self.fallback_fn else []
+        candidates.extend(self.fallback_chain)
+        for fallback_fn in candidates:
+            try:
+                value = fallback_fn(*args, **kwargs)
+                if inspect.isawaitable(value):
+                    value = await value
+                return value
+            except Exception as e:
+                logger.warning(f"Fallback {fallback_fn.__name__} failed: {e}")
+
+        if self.default_value is not None:
+            return self.default_value
+
+        self.stats.fallback_failures += 1
+        raise RuntimeError("All fallbacks failed and no default value provided")
+
 
 def fallback(
     default_value: Any | None = None,
@@ -188,6 +240,43 @@ def fallback(
     return decorator
 
 
+def async_fallback(
+    default_value: Any | None = None,
+    fallback_fn: Callable | None = None,
+    fallback_chain: list[Callable] | None = None,
+    exceptions: list[type[Exception]] | None = None,
+    log_fallback: bool = True,
+) -> Callable[[F], F]:
+    """
+    Decorator to add fallback support to an async function.
+
+    Accepts the same arguments as fallback; fallback functions may be
+    sync or async.
+
+    Example:
+        @async_fallback(fallback_fn=get_from_cache)
+        async def get_data():
+            return await fetch_live_data()
+    """
+    fb = Fallback(
+        default_value=default_value,
+        fallback_fn=fallback_fn,
+        fallback_chain=fallback_chain,
+        exceptions=exceptions,
+        log_fallback=log_fallback,
+    )
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await fb.async_execute(func, *args, **kwargs)
+
+        wrapper.fallback_handler = fb  # type: ignore
+        return wrapper  # type: ignore
+
+    return decorator
+
+
 # ============== Specialized Fallbacks ==============
 
 
@@ -18,10 +18,15 @@ Example:
     @rate_limit(max_calls=100, period=60)  # 100 calls per minute
     def call_api():
         return requests.get(api_url)
+
+    @async_rate_limit(max_calls=10, period=1)
+    async def call_api_async():
+        return await client.get(api_url)
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import time
@@ -140,6 +145,34 @@ class TokenBucket:
 
             time.sleep(max(0.01, wait_time))
 
+    async def async_wait_and_acquire(
+        self,
+        tokens: float = 1.0,
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        Await until tokens are available, then acquire.
+
+        Same semantics as wait_and_acquire, but yields to the event loop
+        while the bucket refills.
+        """
+        start_time = time.time()
+
+        while True:
+            if self.acquire(tokens):
+                return True
+
+            if timeout is not None:
+                elapsed = time.time() - start_time
+                if elapsed >= timeout:
+                    return False
+
+            wait_time = tokens / self.rate
+            if timeout is not None:
+                wait_time = min(wait_time, timeout - (time.time() - start_time))
+
+            await asyncio.sleep(max(0.01, wait_time))
+
     @property
     def available_tokens(self) -> float:
         """Number of available tokens."""
@@ -287,22 +320,58 @@ class RateLimiter:
 
         return allowed
 
+    async def async_acquire(self) -> bool:
+        """
+        Acquire permission for a request without blocking the event loop.
+
+        Returns True if allowed, False if rejected.
+        """
+        self.stats.total_requests += 1
+
+        if isinstance(self._limiter, TokenBucket):
+            if self.block:
+                allowed = await self._limiter.async_wait_and_acquire(
+                    timeout=self.block_timeout
+                )
+            else:
+                allowed = self._limiter.acquire()
+        else:
+            allowed = self._limiter.allow()
+
+        if allowed:
+            self.stats.allowed_requests += 1
+        else:
+            self.stats.rejected_requests += 1
+
+        return allowed
+
+    def _raise_exceeded(self) -> None:
+        retry_after = None
+        if isinstance(self._limiter, SlidingWindowLimiter):
+            retry_after = self._limiter.time_until_next
+
+        raise RateLimitExceeded(
+            f"Rate limit exceeded for '{self.name}'",
+            self.name,
+            retry_after,
+        )
+
     def __enter__(self) -> RateLimiter:
         if not self.acquire():
-            retry_after = None
-            if isinstance(self._limiter, SlidingWindowLimiter):
-                retry_after = self._limiter.time_until_next
-
-            raise RateLimitExceeded(
-                f"Rate limit exceeded for '{self.name}'",
-                self.name,
-                retry_after,
-            )
+            self._raise_exceeded()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         pass
 
+    async def __aenter__(self) -> RateLimiter:
+        if not await self.async_acquire():
+            self._raise_exceeded()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
     @classmethod
     def get(cls, name: str) -> RateLimiter | None:
         """Get a rate limiter by name."""
@@ -367,3 +436,45 @@ def rate_limit(
         return wrapper  # type: ignore
 
     return decorator
+
+
+def async_rate_limit(
+    max_calls: int = 100,
+    period: float = 60.0,
+    name: str | None = None,
+    algorithm: str = "token_bucket",
+    block: bool = True,
+    block_timeout: float | None = None,
+) -> Callable[[F], F]:
+    """
+    Decorator to rate limit an async function.
+
+    Accepts the same arguments as rate_limit. Blocking waits are awaited,
+    so other coroutines keep running while the bucket refills.
+
+    Example:
+        @async_rate_limit(max_calls=10, period=1)
+        async def call_api():
+            return await client.get(api_url)
+    """
+
+    def decorator(func: F) -> F:
+        limiter_name = name or func.__name__
+        limiter = RateLimiter(
+            name=limiter_name,
+            max_calls=max_calls,
+            period=period,
+            algorithm=algorithm,
+            block=block,
+            block_timeout=block_timeout,
+        )
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with limiter:
+                return await func(*args, **kwargs)
+
+        wrapper.rate_limiter = limiter  # type: ignore
+        return wrapper  # type: ignore
+
+    return decorator
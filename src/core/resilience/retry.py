@@ -9,6 +9,7 @@ Features:
 - Configurable retry conditions
 - Exception filtering
 - Retry hooks for logging/metrics
+- Optional process-wide retry budget
 
 Academic Reference:
     - AWS Architecture Blog, "Exponential Backoff and Jitter"
@@ -18,10 +19,15 @@ Example:
     @retry(max_attempts=3, backoff_factor=2, max_delay=30)
     def flaky_api_call():
         return requests.get("https://flaky-api.example.com")
+
+    @async_retry(max_attempts=3, backoff_factor=2)
+    async def flaky_async_call():
+        return await client.get("https://flaky-api.example.com")
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import random
 import time
@@ -33,6 +39,8 @@ from typing import (
     TypeVar,
 )
 
+from src.core.resilience.retry_budget import RetryBudget
+
 logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -67,6 +75,9 @@ class RetryPolicy:
         non_retryable_exceptions: Exception types to NOT retry
         retry_on_result: Function to check if result should be retried
         on_retry: Callback for each retry attempt
+        retry_budget: Shared budget that retries must draw from
+        upstream: Name for retry-budget accounting (None = the retried
+            function's name)
     """
 
     max_attempts: int = 3
@@ -78,6 +89,8 @@ class RetryPolicy:
     non_retryable_exceptions: set[type[Exception]] | None = None
     retry_on_result: Callable[[Any], bool] | None = None
     on_retry: Callable[[int, Exception, float], None] | None = None
+    retry_budget: RetryBudget | None = None
+    upstream: str | None = None
 
     def calculate_delay(self, attempt: int) -> float:
         """
@@ -118,6 +131,17 @@ class RetryPolicy:
         # Default: retry all exceptions
         return True
 
+    def record_success(self) -> None:
+        """Credit the retry budget for a successful call."""
+        if self.retry_budget is not None:
+            self.retry_budget.record_success()
+
+    def budget_allows_retry(self, upstream: str) -> bool:
+        """Draw one retry from the budget (always True without a budget)."""
+        if self.retry_budget is None:
+            return True
+        return self.retry_budget.try_acquire(upstream)
+
 
 def with_retry(
     func: Callable[..., Any],
@@ -140,6 +164,7 @@ def with_retry(
         RetryError: If all attempts fail
     """
     last_exception: Exception | None = None
+    upstream = policy.upstream or getattr(func, "__name__", "unknown")
 
     for attempt in range(policy.max_attempts):
         try:
@@ -147,7 +172,9 @@ def with_retry(
 
             # Check if result should be retried
             if policy.retry_on_result and policy.retry_on_result(result):
-                if attempt < policy.max_attempts - 1:
+                if attempt < policy.max_attempts - 1 and policy.budget_allows_retry(
+                    upstream
+                ):
                     delay = policy.calculate_delay(attempt)
                     logger.debug(
                         f"Retrying due to result, attempt {attempt + 1}/{policy.max_attempts}, "
@@ -156,6 +183,7 @@ def with_retry(
                     time.sleep(delay)
                     continue
 
+            policy.record_success()
             return result
 
         except Exception as e:
@@ -167,6 +195,13 @@ def with_retry(
 
             # Check if we have attempts left
             if attempt < policy.max_attempts - 1:
+                if not policy.budget_allows_retry(upstream):
+                    raise RetryError(
+                        f"Retry budget exhausted after {attempt + 1} attempt(s)",
+                        attempt + 1,
+                        e,
+                    ) from e
+
                 delay = policy.calculate_delay(attempt)
 
                 logger.warning(
@@ -205,6 +240,7 @@ def retry(
     non_retryable_exceptions: set[type[Exception]] | None = None,
     retry_on_result: Callable[[Any], bool] | None = None,
     on_retry: Callable[[int, Exception, float], None] | None = None,
+    retry_budget: RetryBudget | None = None,
 ) -> Callable[[F], F]:
     """
     Decorator to add retry logic to a function.
@@ -219,6 +255,7 @@ def retry(
         non_retryable_exceptions: Never retry these exceptions
         retry_on_result: Retry if this function returns True for result
         on_retry: Callback for each retry
+        retry_budget: Shared budget that retries must draw from
 
     Example:
         @retry(max_attempts=3, backoff_factor=2)
@@ -244,6 +281,7 @@ def retry(
         non_retryable_exceptions=non_retryable_exceptions,
         retry_on_result=retry_on_result,
         on_retry=on_retry,
+        retry_budget=retry_budget,
     )
 
     def decorator(func: F) -> F:
@@ -259,6 +297,145 @@ def retry(
     return decorator
 
 
+# ============== Async Retry ==============
+
+
+async def async_with_retry(
+    func: Callable[..., Any],
+    policy: RetryPolicy,
+    *args,
+    **kwargs,
+) -> Any:
+    """
+    Execute a coroutine function with retry logic.
+
+    Mirrors with_retry, but waits between attempts with asyncio.sleep so the
+    event loop is never blocked. Jitter comes from policy.calculate_delay.
+
+    Args:
+        func: Coroutine function to execute
+        policy: Retry policy configuration
+        *args, **kwargs: Arguments to pass to function
+
+    Returns:
+        Function result
+
+    Raises:
+        RetryError: If all attempts fail
+    """
+    last_exception: Exception | None = None
+    upstream = policy.upstream or getattr(func, "__name__", "unknown")
+
+    for attempt in range(policy.max_attempts):
+        try:
+            result = await func(*args, **kwargs)
+
+            # Check if result should be retried
+            if policy.retry_on_result and policy.retry_on_result(result):
+                if attempt < policy.max_attempts - 1 and policy.budget_allows_retry(
+                    upstream
+                ):
+                    delay = policy.calculate_delay(attempt)
+                    logger.debug(
+                        f"Retrying due to result, attempt {attempt + 1}/{policy.max_attempts}, "
+                        f"waiting {delay:.2f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+            policy.record_success()
+            return result
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as e:
+            last_exception = e
+
+            if not policy.should_retry(e):
+                raise
+
+            if attempt < policy.max_attempts - 1:
+                if not policy.budget_allows_retry(upstream):
+                    raise RetryError(
+                        f"Retry budget exhausted after {attempt + 1} attempt(s)",
+                        attempt + 1,
+                        e,
+                    ) from e
+
+                delay = policy.calculate_delay(attempt)
+
+                logger.warning(
+                    f"Attempt {attempt + 1}/{policy.max_attempts} failed: {e}, "
+                    f"retrying in {delay:.2f}s"
+                )
+
+                if policy.on_retry:
+                    try:
+                        policy.on_retry(attempt + 1, e, delay)
+                    except Exception:
+                        pass
+
+                await asyncio.sleep(delay)
+            else:
+                logger.error(
+                    f"All {policy.max_attempts} attempts failed, last error: {e}"
+                )
+
+    raise RetryError(
+        f"All {policy.max_attempts} attempts failed",
+        policy.max_attempts,
+        last_exception or Exception("Unknown error"),
+    )
+
+
+def async_retry(
+    max_attempts: int = 3,
+    backoff_factor: float = 2.0,
+    initial_delay: float = 1.0,
+    max_delay: float = 60.0,
+    jitter: float = 0.1,
+    retryable_exceptions: set[type[Exception]] | None = None,
+    non_retryable_exceptions: set[type[Exception]] | None = None,
+    retry_on_result: Callable[[Any], bool] | None = None,
+    on_retry: Callable[[int, Exception, float], None] | None = None,
+    retry_budget: RetryBudget | None = None,
+) -> Callable[[F], F]:
+    """
+    Decorator to add retry logic to an async function.
+
+    Accepts the same arguments as retry.
+
+    Example:
+        @async_retry(max_attempts=3, backoff_factor=2)
+        async def flaky_function():
+            return await call_unreliable_api()
+    """
+    policy = RetryPolicy(
+        max_attempts=max_attempts,
+        backoff_factor=backoff_factor,
+        initial_delay=initial_delay,
+        max_delay=max_delay,
+        jitter=jitter,
+        retryable_exceptions=retryable_exceptions,
+        non_retryable_exceptions=non_retryable_exceptions,
+        retry_on_result=retry_on_result,
+        on_retry=on_retry,
+        retry_budget=retry_budget,
+    )
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await async_with_retry(func, policy, *args, **kwargs)
+
+        wrapper.retry_policy = policy  # type: ignore
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
 # ============== Common Retry Policies ==============
 
 AGGRESSIVE_RETRY = RetryPolicy(
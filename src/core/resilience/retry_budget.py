@@ -0,0 +1,242 @@
+"""
+Retry Budget
+============
+
+Caps retries process-wide so that a brownout upstream is not amplified by
+every caller retrying independently.
+
+Each successful call deposits `ratio` tokens into a shared bucket and each
+retry withdraws one token, so retries stay at roughly `ratio` of recent
+successful traffic. A small time-based refill (`min_retries_per_second`)
+keeps low-traffic processes able to retry at all. The bucket is capped at
+`max_tokens`, which bounds how much "recent" success can be banked.
+
+The budget can be bound to a CostTracker; once the monthly budget alert
+has fired, every retry is denied until the tracker is reset. The global
+budget is bound to the global cost tracker when it is created.
+
+Academic Reference:
+    - Google SRE Book, "Handling Overload" (retry budgets)
+    - Finagle, "RetryBudget"
+
+Example:
+    budget = get_retry_budget()  # halts when get_cost_tracker() alerts
+
+    @retry(max_attempts=3, retry_budget=budget)
+    def call_api():
+        return requests.get(api_url)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class BudgetAlertSource(Protocol):
+    """Anything that reports whether the spend alert has fired."""
+
+    @property
+    def budget_alert_active(self) -> bool: ...
+
+
+@dataclass
+class RetryBudgetStats:
+    """Statistics for a retry budget."""
+
+    successes_recorded: int = 0
+    retries_allowed: int = 0
+    retries_denied: int = 0
+    retries_denied_by_cost: int = 0
+    denied_by_upstream: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def retry_ratio(self) -> float:
+        """Granted retries as a fraction of recorded successes."""
+        if self.successes_recorded == 0:
+            return 0.0
+        return self.retries_allowed / self.successes_recorded
+
+
+class RetryBudget:
+    """
+    Token-bucket retry budget shared across agents and upstreams.
+
+    Parameters:
+        ratio: Tokens deposited per successful call (0.1 = retries may be
+            at most ~10% of successful calls)
+        min_retries_per_second: Tokens refilled per second regardless of
+            traffic
+        max_tokens: Bucket capacity (bounds the banked success window)
+
+    Example:
+        budget = RetryBudget(ratio=0.1, min_retries_per_second=1.0)
+
+        budget.record_success()
+        if budget.try_acquire("youtube"):
+            retry_call()
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 20.0,
+    ):
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self._cost_source: BudgetAlertSource | None = None
+        self._halted_by_cost = False
+
+        self.stats = RetryBudgetStats()
+
+    def _refill(self) -> None:
+        """Add time-based tokens. Caller must hold the lock."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.min_retries_per_second > 0:
+            self._tokens = min(
+                self.max_tokens,
+                self._tokens + elapsed * self.min_retries_per_second,
+            )
+
+    def record_success(self) -> None:
+        """Deposit tokens for a successful call."""
+        with self._lock:
+            self.stats.successes_recorded += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_acquire(self, upstream: str = "default") -> bool:
+        """
+        Withdraw one retry token.
+
+        Args:
+            upstream: Name used for per-upstream denial accounting
+
+        Returns:
+            True if the retry may proceed, False if the budget is spent
+        """
+        if self._cost_alert_active():
+            with self._lock:
+                self.stats.retries_denied += 1
+                self.stats.retries_denied_by_cost += 1
+                self.stats.denied_by_upstream[upstream] += 1
+            return False
+
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self.stats.retries_allowed += 1
+                return True
+
+            self.stats.retries_denied += 1
+            self.stats.denied_by_upstream[upstream] += 1
+
+        logger.debug(f"Retry budget exhausted, denying retry for '{upstream}'")
+        return False
+
+    # ==================== Cost Integration ====================
+
+    def bind_cost_tracker(self, tracker: BudgetAlertSource) -> None:
+        """
+        Stop granting retries once the tracker's budget alert fires.
+
+        The tracker is polled on each retry, so resetting it re-enables
+        retries without re-binding.
+        """
+        self._cost_source = tracker
+
+    def _cost_alert_active(self) -> bool:
+        if self._cost_source is None:
+            return False
+
+        active = bool(self._cost_source.budget_alert_active)
+        if active != self._halted_by_cost:
+            self._halted_by_cost = active
+            if active:
+                logger.warning("Cost budget alert active, retries disabled")
+            else:
+                logger.info("Cost budget alert cleared, retries re-enabled")
+        return active
+
+    # ==================== Inspection ====================
+
+    @property
+    def available_tokens(self) -> float:
+        """Number of retries currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reset(self) -> None:
+        """Refill the bucket and clear statistics."""
+        with self._lock:
+            self._tokens = self.max_tokens
+            self._last_refill = time.monotonic()
+            self.stats = RetryBudgetStats()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get retry budget statistics."""
+        return {
+            "ratio": self.ratio,
+            "min_retries_per_second": self.min_retries_per_second,
+            "max_tokens": self.max_tokens,
+            "available_tokens": self.available_tokens,
+            "halted_by_cost": self._halted_by_cost,
+            "successes_recorded": self.stats.successes_recorded,
+            "retries_allowed": self.stats.retries_allowed,
+            "retries_denied": self.stats.retries_denied,
+            "retries_denied_by_cost": self.stats.retries_denied_by_cost,
+            "retry_ratio": self.stats.retry_ratio,
+            "denied_by_upstream": dict(self.stats.denied_by_upstream),
+        }
+
+
+class _GlobalCostTracker:
+    """The process-wide CostTracker, looked up on each poll to follow resets."""
+
+    @property
+    def budget_alert_active(self) -> bool:
+        from src.cost_analysis.tracker import get_cost_tracker
+
+        return get_cost_tracker().budget_alert_active
+
+
+# Global retry budget instance
+_global_budget: RetryBudget | None = None
+_global_lock = threading.Lock()
+
+
+def get_retry_budget() -> RetryBudget:
+    """Get or create the process-wide retry budget (bound to the cost tracker)."""
+    global _global_budget
+    if _global_budget is None:
+        with _global_lock:
+            if _global_budget is None:
+                budget = RetryBudget()
+                budget.bind_cost_tracker(_GlobalCostTracker())
+                _global_budget = budget
+    return _global_budget
+
+
+def reset_retry_budget() -> None:
+    """Reset the process-wide retry budget."""
+    global _global_budget
+    with _global_lock:
+        _global_budget = None
@@ -0,0 +1,371 @@
+"""
+Stale-While-Revalidate Cache
+============================
+
+Serves the last-good value for a key immediately and refreshes it in the
+background, so callers see cached latency instead of upstream latency and
+still have real content when the upstream is down.
+
+Entries go through three ages:
+    fresh   (age < stale_after)  -> served, no refresh
+    stale   (age < ttl)          -> served, background refresh scheduled
+    expired (age >= ttl)         -> dropped, caller must load
+
+Memory is bounded by an LRU cap. An optional directory store keeps the
+last-good values across restarts; it is written through on every put and
+read on a memory miss.
+
+Academic Reference:
+    - RFC 5861, "HTTP Cache-Control Extensions for Stale Content"
+    - Nygard, "Release It!" (Fallback, Steady State)
+
+Example:
+    cache = StaleWhileRevalidateCache(
+        name="video",
+        stale_after_seconds=300,
+        ttl_seconds=86400,
+        max_entries=1000,
+    )
+
+    result = cache.get_or_load("31.7944,35.2283", lambda: search(point))
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheEntry(Generic[T]):
+    """A cached value with its store time."""
+
+    value: T
+    stored_at: float
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.stored_at
+
+
+@dataclass
+class StaleCacheStats:
+    """Statistics for a stale-while-revalidate cache."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.stale_hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits + self.stale_hits) / total
+
+
+class DiskStore:
+    """
+    One-JSON-file-per-key store for last-good values.
+
+    Parameters:
+        directory: Directory for cache files (created if missing)
+        serializer: Converts a value to a JSON-compatible object
+        deserializer: Rebuilds a value from the JSON-compatible object
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        serializer: Callable[[Any], Any],
+        deserializer: Callable[[Any], Any],
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.serializer = serializer
+        self.deserializer = deserializer
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8"), usedforsecurity=False)
+        return self.directory / f"{digest.hexdigest()}.json"
+
+    def load(self, key: str) -> CacheEntry[Any] | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            return CacheEntry(
+                value=self.deserializer(data["value"]),
+                stored_at=float(data["stored_at"]),
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache file {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def save(self, key: str, entry: CacheEntry[Any]) -> None:
+        path = self._path(key)
+        data = {
+            "key": key,
+            "stored_at": entry.stored_at,
+            "value": self.serializer(entry.value),
+        }
+        # A temp file per writer: concurrent saves of one key (or processes
+        # sharing the directory) never interleave, the last replace wins
+        f = tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.directory,
+            prefix=f"{path.stem}.",
+            suffix=".tmp",
+            delete=False,
+        )
+        tmp = Path(f.name)
+        try:
+            with f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+class StaleWhileRevalidateCache(Generic[T]):
+    """
+    Bounded LRU + TTL cache that serves stale values while refreshing.
+
+    Parameters:
+        name: Identifier for this cache (used for refresh thread names)
+        stale_after_seconds: Age after which a hit triggers a refresh
+        ttl_seconds: Age after which an entry is no longer served
+        max_entries: LRU capacity of the in-memory store
+        disk_store: Optional persistent last-good store
+        max_refresh_workers: Threads used for background refreshes
+        executor: Shared refresh pool to use instead of an own one (not
+            shut down by this cache)
+
+    Example:
+        cache = StaleWhileRevalidateCache(name="music", max_entries=500)
+        cache.put("tel-aviv", result)
+        entry = cache.get("tel-aviv")
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        stale_after_seconds: float = 300.0,
+        ttl_seconds: float = 86400.0,
+        max_entries: int = 1024,
+        disk_store: DiskStore | None = None,
+        max_refresh_workers: int = 2,
+        executor: Executor | None = None,
+    ):
+        if stale_after_seconds > ttl_seconds:
+            raise ValueError("stale_after_seconds must not exceed ttl_seconds")
+
+        self.name = name
+        self.stale_after_seconds = stale_after_seconds
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.disk_store = disk_store
+        self.max_refresh_workers = max_refresh_workers
+
+        self._entries: OrderedDict[str, CacheEntry[T]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._shared_executor = executor
+
+        self.stats = StaleCacheStats()
+
+    # ==================== Lookup ====================
+
+    def get(self, key: str) -> CacheEntry[T] | None:
+        """
+        Get an entry that is still within TTL.
+
+        Falls back to the disk store on a memory miss. Does not schedule
+        refreshes; use get_or_load for stale-while-revalidate behaviour.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.age_seconds < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    return entry
+                del self._entries[key]
+                self.stats.expirations += 1
+
+        if self.disk_store is None:
+            return None
+
+        entry = self.disk_store.load(key)
+        if entry is None:
+            return None
+        if entry.age_seconds >= self.ttl_seconds:
+            self.disk_store.delete(key)
+            return None
+
+        with self._lock:
+            self.stats.disk_hits += 1
+            self._store_locked(key, entry)
+        return entry
+
+    def is_stale(self, entry: CacheEntry[T]) -> bool:
+        """Whether an entry is old enough to need a refresh."""
+        return entry.age_seconds >= self.stale_after_seconds
+
+    def put(self, key: str, value: T) -> None:
+        """Store a last-good value."""
+        entry = CacheEntry(value=value, stored_at=time.time())
+        with self._lock:
+            self._store_locked(key, entry)
+
+        if self.disk_store is not None:
+            try:
+                self.disk_store.save(key, entry)
+            except Exception as e:
+                logger.warning(f"Failed to persist cache entry for '{key}': {e}")
+
+    def _store_locked(self, key: str, entry: CacheEntry[T]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Remove a key from memory and disk."""
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk_store is not None:
+            self.disk_store.delete(key)
+
+    # ==================== Stale-While-Revalidate ====================
+
+    def get_or_load(self, key: str, loader: Callable[[], T | None]) -> T | None:
+        """
+        Serve from cache when possible, loading synchronously on a miss.
+
+        Fresh hits are returned as-is. Stale hits are returned immediately
+        and a background refresh is scheduled. Misses call the loader; a
+        None result is not cached.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            stale = self.is_stale(entry)
+            with self._lock:
+                if stale:
+                    self.stats.stale_hits += 1
+                else:
+                    self.stats.hits += 1
+            if stale:
+                self.refresh_async(key, loader)
+            return entry.value
+
+        with self._lock:
+            self.stats.misses += 1
+        value = loader()
+        if value is not None:
+            self.put(key, value)
+        return value
+
+    def refresh_async(self, key: str, loader: Callable[[], T | None]) -> bool:
+        """
+        Schedule a background refresh for a key.
+
+        At most one refresh per key is in flight. Returns False if a refresh
+        for the key is already running.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            executor = self._shared_executor
+            if executor is None and self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_refresh_workers,
+                    thread_name_prefix=f"SWR-{self.name}",
+                )
+            executor = executor or self._executor
+
+        executor.submit(self._refresh, key, loader)
+        return True
+
+    def _refresh(self, key: str, loader: Callable[[], T | None]) -> None:
+        try:
+            value = loader()
+            if value is not None:
+                self.put(key, value)
+            with self._lock:
+                self.stats.refreshes += 1
+        except Exception as e:
+            with self._lock:
+                self.stats.refresh_failures += 1
+            logger.warning(f"Background refresh failed for '{key}': {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    # ==================== Lifecycle ====================
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Clear the in-memory store (disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the cache's own background refresh pool (not a shared one)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "stale_after_seconds": self.stale_after_seconds,
+            "ttl_seconds": self.ttl_seconds,
+            "refreshing": len(self._refreshing),
+            "persistent": self.disk_store is not None,
+            "hits": self.stats.hits,
+            "stale_hits": self.stats.stale_hits,
+            "misses": self.stats.misses,
+            "disk_hits": self.stats.disk_hits,
+            "hit_rate": self.stats.hit_rate,
+            "refreshes": self.stats.refreshes,
+            "refresh_failures": self.stats.refresh_failures,
+            "evictions": self.stats.evictions,
+            "expirations": self.stats.expirations,
+        }
@@ -15,6 +15,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from src.core.observability.tracing import PIPELINE_TRACER, get_tracer
 from src.models.content import ContentResult, ContentType
 from src.utils.logger import get_logger
 
@@ -129,8 +130,12 @@ class SmartAgentQueue:
             count = len(self._results)
 
             logger.info(
-                f"[{self.point_id}] ✅ {agent_type} submitted result "
-                f"({count}/{self.EXPECTED_AGENTS}) [{elapsed:.1f}s elapsed]"
+                "[%s] ✅ %s submitted result (%d/%d) [%.1fs elapsed]",
+                self.point_id,
+                agent_type,
+                count,
+                self.EXPECTED_AGENTS,
+                elapsed,
             )
 
             # Wake up anyone waiting for results
@@ -161,7 +166,11 @@ class SmartAgentQueue:
             elapsed = time.time() - self._start_time
 
             logger.warning(
-                f"[{self.point_id}] ❌ {agent_type} failed: {error} [{elapsed:.1f}s elapsed]"
+                "[%s] ❌ %s failed: %s [%.1fs elapsed]",
+                self.point_id,
+                agent_type,
+                error,
+                elapsed,
             )
 
             # Wake up anyone waiting (they might need to check timeouts)
@@ -181,6 +190,14 @@ class SmartAgentQueue:
             4. At hard timeout, proceed with whatever we have (min 1)
             5. Raise error if 0 results at hard timeout
         """
+        with get_tracer(PIPELINE_TRACER).span("queue.wait") as span:
+            span.set_attribute("point.id", self.point_id)
+            results, metrics = self._wait_for_results()
+            span.set_attribute("queue.status", metrics.status.value)
+            span.set_attribute("queue.results", len(results))
+            return results, metrics
+
+    def _wait_for_results(self) -> tuple[list[ContentResult], QueueMetrics]:
         with self._condition:
             while True:
                 elapsed = time.time() - self._start_time
@@ -192,13 +209,18 @@ class SmartAgentQueue:
                     if result_count >= self.EXPECTED_AGENTS:
                         status = QueueStatus.COMPLETE
                         logger.info(
-                            f"[{self.point_id}] 🎉 All {self.EXPECTED_AGENTS} agents succeeded!"
+                            "[%s] 🎉 All %d agents succeeded!",
+                            self.point_id,
+                            self.EXPECTED_AGENTS,
                         )
                     elif result_count >= self.MIN_REQUIRED_FOR_SOFT:
                         status = QueueStatus.SOFT_DEGRADED
                         logger.info(
-                            f"[{self.point_id}] ⚠️ {result_count}/{self.EXPECTED_AGENTS} agents succeeded "
-                            f"(some failed: {list(self._failures.keys())})"
+                            "[%s] ⚠️ %d/%d agents succeeded (some failed: %s)",
+                            self.point_id,
+                            result_count,
+                            self.EXPECTED_AGENTS,
+                            list(self._failures),
                         )
                     elif result_count >= self.MIN_REQUIRED_FOR_HARD:
                         status = QueueStatus.HARD_DEGRADED
@@ -256,8 +278,11 @@ class SmartAgentQueue:
                     wait_time = max(0.1, self.HARD_TIMEOUT_SECONDS - elapsed)
 
                 logger.debug(
-                    f"[{self.point_id}] Waiting up to {wait_time:.1f}s more "
-                    f"(have {result_count}/{self.EXPECTED_AGENTS})"
+                    "[%s] Waiting up to %.1fs more (have %d/%d)",
+                    self.point_id,
+                    wait_time,
+                    result_count,
+                    self.EXPECTED_AGENTS,
                 )
 
                 self._condition.wait(timeout=wait_time)
@@ -0,0 +1,394 @@
+"""
+HTTP Transports
+===============
+
+Process-wide HTTP connection pools, one per upstream.
+
+Every agent used to build its own SDK client, so each point paid fresh
+TCP and TLS handshakes to the same few hosts. The registry hands out one
+long-lived client per upstream instead, with pools sized for the agent
+thread count, keep-alive, and HTTP/2 where the client library (and the
+optional h2 package) supports it:
+
+    anthropic, openai     shared client of the SDK's own httpx client class
+                          (HTTP/2 when h2 is installed)
+    spotify, google_maps  shared requests.Session with a sized HTTPAdapter
+    youtube, duckduckgo   ClientPool of SDK clients (not thread-safe, so
+                          each is leased by one thread at a time)
+
+Connections opened versus requests sent are counted per upstream, so
+reuse is visible in /metrics and get_stats(). For a ClientPool a newly
+created client counts as a new connection and a lease as a request.
+
+shutdown_transports() closes everything; it runs at interpreter exit and
+from the API lifespan. Clients are rebuilt on next use, so shutdown is
+safe to call more than once.
+
+Example:
+    client = anthropic.Anthropic(
+        api_key=key,
+        http_client=get_transports().httpx_client(
+            "anthropic", anthropic.DefaultHttpxClient
+        ),
+    )
+
+    pool = get_transports().pool("duckduckgo", DDGS)
+    with pool.lease() as ddgs:
+        ddgs.text(query)
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib
+import importlib.util
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any
+
+from src.core.observability.metrics import Counter
+from src.utils.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+http_requests = Counter(
+    "http_requests_total",
+    "Requests sent through the shared HTTP transports",
+    labels=["upstream"],
+)
+http_connections = Counter(
+    "http_connections_opened_total",
+    "New upstream connections opened by the shared HTTP transports",
+    labels=["upstream"],
+)
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Pool sizing for one upstream."""
+
+    # Connections kept open (and the cap on concurrent ones for httpx)
+    max_connections: int = 10
+    max_keepalive: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    connect_timeout: float = 5.0
+
+
+def _upstreams() -> dict[str, TransportConfig]:
+    """Per-upstream pools, sized from the agent thread count."""
+    threads = settings.max_concurrent_threads
+    expiry = settings.http_keepalive_seconds
+    http2 = settings.http2_enabled
+    # Every agent thread may hold one LLM request at a time
+    llm = TransportConfig(
+        max_connections=threads,
+        max_keepalive=threads,
+        keepalive_expiry=expiry,
+        http2=http2,
+    )
+    # One content agent of each kind per point
+    search = TransportConfig(
+        max_connections=max(threads // 3, 2),
+        max_keepalive=max(threads // 3, 2),
+        keepalive_expiry=expiry,
+    )
+    return {
+        "anthropic": llm,
+        "openai": llm,
+        "youtube": search,
+        "spotify": search,
+        "duckduckgo": search,
+        "google_maps": TransportConfig(
+            max_connections=2, max_keepalive=2, keepalive_expiry=expiry
+        ),
+    }
+
+
+def http2_available() -> bool:
+    """Whether httpx can negotiate HTTP/2 (needs the optional h2 package)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+# ============== Client Pool ==============
+
+
+class ClientPool:
+    """
+    Reuse clients that must not be shared between threads.
+
+    A lease takes an idle client (most recently returned first, so its
+    connection is the warmest) or creates one; on release it goes back
+    to the pool, or is closed when max_idle are already waiting.
+    """
+
+    def __init__(
+        self,
+        upstream: str,
+        factory: Callable[[], Any],
+        max_idle: int = 4,
+    ):
+        self.upstream = upstream
+        self.factory = factory
+        self.max_idle = max_idle
+        self._idle: list[Any] = []
+        self._lock = threading.Lock()
+        self.created = 0
+        self.leases = 0
+
+    @contextmanager
+    def lease(self) -> Iterator[Any]:
+        """Borrow a client for the duration of the block."""
+        with self._lock:
+            client = self._idle.pop() if self._idle else None
+            self.leases += 1
+        http_requests.inc(upstream=self.upstream)
+        if client is None:
+            client = self.factory()
+            with self._lock:
+                self.created += 1
+            http_connections.inc(upstream=self.upstream)
+        try:
+            yield client
+        finally:
+            with self._lock:
+                keep = len(self._idle) < self.max_idle
+                if keep:
+                    self._idle.append(client)
+            if not keep:
+                _close(client)
+
+    def close(self) -> None:
+        """Close every idle client."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for client in idle:
+            _close(client)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "requests": self.leases,
+            "connections_opened": self.created,
+            "idle": len(self._idle),
+        }
+
+
+def _close(client: Any) -> None:
+    close = getattr(client, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception as e:
+            logger.debug(f"Closing pooled client failed: {e}")
+
+
+# ============== Registry ==============
+
+
+class TransportRegistry:
+    """
+    Shared HTTP clients keyed by upstream.
+
+    Parameters:
+        configs: Upstream -> pool sizing (defaults from settings);
+            unknown upstreams get TransportConfig()
+    """
+
+    def __init__(self, configs: dict[str, TransportConfig] | None = None):
+        self.configs = configs if configs is not None else _upstreams()
+        self._httpx: dict[str, Any] = {}
+        self._sessions: dict[str, Any] = {}
+        self._pools: dict[str, ClientPool] = {}
+        self._lock = threading.Lock()
+
+    def config(self, upstream: str) -> TransportConfig:
+        return self.configs.get(upstream, TransportConfig())
+
+    def httpx_client(self, upstream: str, client_class: type | None = None) -> Any:
+        """
+        The shared httpx client for an upstream (thread-safe).
+
+        Args:
+            upstream: Upstream name
+            client_class: Client class to build on first use (default
+                httpx.Client). SDKs that pin their own httpx fork only
+                accept their own client type, so pass theirs, e.g.
+                anthropic.DefaultHttpxClient.
+        """
+        with self._lock:
+            client = self._httpx.get(upstream)
+            if client is None:
+                client = self._httpx[upstream] = self._build_httpx(
+                    upstream, client_class
+                )
+            return client
+
+    def requests_session(self, upstream: str) -> Any:
+        """The shared requests.Session for an upstream."""
+        with self._lock:
+            session = self._sessions.get(upstream)
+            if session is None:
+                session = self._sessions[upstream] = self._build_session(upstream)
+            return session
+
+    def pool(self, upstream: str, factory: Callable[[], Any]) -> ClientPool:
+        """The ClientPool for an upstream, created with factory on first use."""
+        with self._lock:
+            pool = self._pools.get(upstream)
+            if pool is None:
+                pool = self._pools[upstream] = ClientPool(
+                    upstream, factory, max_idle=self.config(upstream).max_keepalive
+                )
+            return pool
+
+    def close(self) -> None:
+        """Close every client and pool; later calls build new ones."""
+        with self._lock:
+            clients = [*self._httpx.values(), *self._sessions.values()]
+            pools = list(self._pools.values())
+            self._httpx.clear()
+            self._sessions.clear()
+            self._pools.clear()
+        for client in clients:
+            _close(client)
+        for pool in pools:
+            pool.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Requests, connections opened and reuse rate per upstream."""
+        with self._lock:
+            upstreams = {*self._httpx, *self._sessions, *self._pools}
+        stats = {}
+        for upstream in sorted(upstreams):
+            requests = int(http_requests.get(upstream=upstream))
+            opened = int(http_connections.get(upstream=upstream))
+            stats[upstream] = {
+                "requests": requests,
+                "connections_opened": opened,
+                "reuse_rate": 1 - opened / requests if requests else 0.0,
+            }
+        return stats
+
+    # ---- builders (HTTP libraries are imported only when needed) ----
+
+    def _build_httpx(self, upstream: str, client_class: type | None) -> Any:
+        if client_class is None:
+            import httpx
+
+            client_class = httpx.Client
+        httpx = _httpx_package(client_class)
+
+        config = self.config(upstream)
+        http2 = config.http2 and http2_available()
+
+        def count(request: Any) -> None:
+            http_requests.inc(upstream=upstream)
+            outer = request.extensions.get("trace")
+            request.extensions["trace"] = _connection_tracer(upstream, outer)
+
+        logger.info(f"HTTP transport for {upstream} (http2={http2})")
+        return client_class(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                settings.agent_timeout_seconds, connect=config.connect_timeout
+            ),
+            event_hooks={"request": [count]},
+        )
+
+    def _build_session(self, upstream: str) -> Any:
+        import requests
+
+        config = self.config(upstream)
+        adapter = _counting_adapter(upstream, config)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+
+def _httpx_package(client_class: type) -> ModuleType:
+    """The httpx package (httpx or an SDK's fork of it) a client class is built on."""
+    for cls in client_class.__mro__:
+        package = cls.__module__.partition(".")[0]
+        if package.startswith("httpx"):
+            return importlib.import_module(package)
+    raise TypeError(f"{client_class.__name__} is not an httpx client class")
+
+
+def _connection_tracer(
+    upstream: str, outer: Callable[[str, dict], None] | None
+) -> Callable[[str, dict], None]:
+    """httpcore trace callback counting new TCP connections."""
+
+    def trace(event: str, info: dict) -> None:
+        if event == "connection.connect_tcp.started":
+            http_connections.inc(upstream=upstream)
+        if outer is not None:
+            outer(event, info)
+
+    return trace
+
+
+def _counting_adapter(upstream: str, config: TransportConfig) -> Any:
+    """A requests HTTPAdapter sized by config that counts connections."""
+    from requests.adapters import HTTPAdapter
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class _Counting:
+        def _new_conn(self) -> Any:
+            http_connections.inc(upstream=upstream)
+            return super()._new_conn()
+
+    class CountingHTTPPool(_Counting, HTTPConnectionPool):
+        pass
+
+    class CountingHTTPSPool(_Counting, HTTPSConnectionPool):
+        pass
+
+    class CountingAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": CountingHTTPPool,
+                "https": CountingHTTPSPool,
+            }
+
+        def send(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+            http_requests.inc(upstream=upstream)
+            return super().send(request, *args, **kwargs)
+
+    return CountingAdapter(
+        pool_connections=config.max_keepalive, pool_maxsize=config.max_keepalive
+    )
+
+
+_transports: TransportRegistry | None = None
+_transports_lock = threading.Lock()
+
+
+def get_transports() -> TransportRegistry:
+    """Get the process-wide transport registry (created on first use)."""
+    global _transports
+    if _transports is None:
+        with _transports_lock:
+            if _transports is None:
+                _transports = TransportRegistry()
+    return _transports
+
+
+def shutdown_transports() -> None:
+    """Close every shared HTTP client (no-op if none were created)."""
+    if _transports is not None:
+        _transports.close()
+
+
+atexit.register(shutdown_transports)
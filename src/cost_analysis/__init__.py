@@ -19,41 +19,81 @@ Academic References:
     - Patterson et al. (2021) "Carbon Emissions and Large Neural Network Training"
 """
 
-from src.cost_analysis.models import (
-    APICostModel,
-    APIPricing,
-    ComputeCostModel,
-    ComputePricing,
-    CostCategory,
-    CostEvent,
-    LLMCostModel,
-    LLMPricing,
-    SystemCostReport,
-    TourCostSummary,
-)
-from src.cost_analysis.optimizer import (
-    CostAwareConfigOptimizer,
-    CostOptimizer,
-    OptimizationCategory,
-    OptimizationPriority,
-    OptimizationRecommendation,
-    OptimizationStrategy,
-    ROIAnalysis,
-)
-from src.cost_analysis.tracker import (
-    AgentCostTracker,
-    CostTracker,
-    TourCostTracker,
-    get_cost_tracker,
-    reset_cost_tracker,
-)
-from src.cost_analysis.visualization import (
-    COST_COLORS,
-    CostBreakdownChart,
-    CostDashboardComponents,
-    CostTrendChart,
-    CostVisualizationPanel,
-    ROIChart,
+from typing import TYPE_CHECKING
+
+from src._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.cost_analysis.models import (
+        APICostModel,
+        APIPricing,
+        ComputeCostModel,
+        ComputePricing,
+        CostCategory,
+        CostEvent,
+        LLMCostModel,
+        LLMPricing,
+        SystemCostReport,
+        TourCostSummary,
+    )
+    from src.cost_analysis.optimizer import (
+        CostAwareConfigOptimizer,
+        CostOptimizer,
+        OptimizationCategory,
+        OptimizationPriority,
+        OptimizationRecommendation,
+        OptimizationStrategy,
+        ROIAnalysis,
+    )
+    from src.cost_analysis.tracker import (
+        AgentCostTracker,
+        CostTracker,
+        TourCostTracker,
+        get_cost_tracker,
+        reset_cost_tracker,
+    )
+    from src.cost_analysis.visualization import (
+        COST_COLORS,
+        CostBreakdownChart,
+        CostDashboardComponents,
+        CostTrendChart,
+        CostVisualizationPanel,
+        ROIChart,
+    )
+
+# Exports are imported on first access (PEP 562); visualization pulls in pandas
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "APICostModel": "src.cost_analysis.models",
+        "APIPricing": "src.cost_analysis.models",
+        "ComputeCostModel": "src.cost_analysis.models",
+        "ComputePricing": "src.cost_analysis.models",
+        "CostCategory": "src.cost_analysis.models",
+        "CostEvent": "src.cost_analysis.models",
+        "LLMCostModel": "src.cost_analysis.models",
+        "LLMPricing": "src.cost_analysis.models",
+        "SystemCostReport": "src.cost_analysis.models",
+        "TourCostSummary": "src.cost_analysis.models",
+        "CostAwareConfigOptimizer": "src.cost_analysis.optimizer",
+        "CostOptimizer": "src.cost_analysis.optimizer",
+        "OptimizationCategory": "src.cost_analysis.optimizer",
+        "OptimizationPriority": "src.cost_analysis.optimizer",
+        "OptimizationRecommendation": "src.cost_analysis.optimizer",
+        "OptimizationStrategy": "src.cost_analysis.optimizer",
+        "ROIAnalysis": "src.cost_analysis.optimizer",
+        "AgentCostTracker": "src.cost_analysis.tracker",
+        "CostTracker": "src.cost_analysis.tracker",
+        "TourCostTracker": "src.cost_analysis.tracker",
+        "get_cost_tracker": "src.cost_analysis.tracker",
+        "reset_cost_tracker": "src.cost_analysis.tracker",
+        "COST_COLORS": "src.cost_analysis.visualization",
+        "CostBreakdownChart": "src.cost_analysis.visualization",
+        "CostDashboardComponents": "src.cost_analysis.visualization",
+        "CostTrendChart": "src.cost_analysis.visualization",
+        "CostVisualizationPanel": "src.cost_analysis.visualization",
+        "ROIChart": "src.cost_analysis.visualization",
+    },
 )
 
 __all__ = [
@@ -77,6 +77,8 @@ class CostTracker:
         self._category_totals: dict[CostCategory, float] = defaultdict(float)
         self._agent_totals: dict[str, float] = defaultdict(float)
         self._tour_totals: dict[str, float] = defaultdict(float)
+        # point_id -> [input_tokens, output_tokens]
+        self._point_tokens: dict[str, list[int]] = defaultdict(lambda: [0, 0])
 
         # Alerting
         self._alert_callbacks: list[Callable[[str, float], None]] = []
@@ -161,6 +163,10 @@ class CostTracker:
                 self._agent_totals[agent_type] += cost
             if tour_id:
                 self._tour_totals[tour_id] += cost
+            if point_id:
+                tokens = self._point_tokens[point_id]
+                tokens[0] += input_tokens
+                tokens[1] += output_tokens
 
         self._check_budget()
 
@@ -417,6 +423,22 @@ class CostTracker:
         with self._lock:
             return dict(self._tour_totals)
 
+    def get_point_tokens(self) -> dict[str, dict[str, int]]:
+        """Get LLM input/output tokens by route point."""
+        with self._lock:
+            return {
+                point_id: {"input_tokens": tokens[0], "output_tokens": tokens[1]}
+                for point_id, tokens in self._point_tokens.items()
+            }
+
+    def get_tokens_per_point(self) -> float:
+        """Mean LLM tokens (input + output) per route point with usage."""
+        with self._lock:
+            if not self._point_tokens:
+                return 0.0
+            total = sum(sum(tokens) for tokens in self._point_tokens.values())
+            return total / len(self._point_tokens)
+
     def get_events_in_range(
         self,
         start: datetime,
@@ -453,6 +475,11 @@ class CostTracker:
         """Register callback for budget alerts."""
         self._alert_callbacks.append(callback)
 
+    @property
+    def budget_alert_active(self) -> bool:
+        """Whether the budget alert has fired since the last reset."""
+        return self._alert_sent
+
     def _check_budget(self) -> None:
         """Check if budget threshold is exceeded."""
         total_cost = self.get_total_cost()
@@ -504,6 +531,7 @@ class CostTracker:
             self._category_totals.clear()
             self._agent_totals.clear()
             self._tour_totals.clear()
+            self._point_tokens.clear()
             self._alert_sent = False
 
 
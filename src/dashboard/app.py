@@ -31,6 +31,7 @@ Date: November 2025
 
 from __future__ import annotations
 
+import atexit
 import threading
 import time
 from typing import Any
@@ -345,8 +346,10 @@ def create_app() -> Dash:
         ],
     )
 
-    # Initialize data manager
+    # Initialize data manager; tours run in this process feed the monitor
     data_manager = DashboardDataManager()
+    data_manager.attach_tour_store()
+    atexit.register(data_manager.close)
 
     # ========================================================================
     # Layout Definition
@@ -1219,8 +1222,8 @@ def create_app() -> Dash:
         # Agent status
         agent_fig = SystemMonitorPanel.create_agent_status_cards(metrics)
 
-        # Generate history data (simulated)
-        history = [
+        # Live history from the event store, simulated until tours run
+        history = data_manager.get_throughput_history(60) or [
             {"timestamp": i, "throughput": np.random.uniform(5, 20)} for i in range(60)
         ]
         throughput_fig = SystemMonitorPanel.create_throughput_chart(history)
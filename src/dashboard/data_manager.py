@@ -48,11 +48,17 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
 
+from src.dashboard.event_store import DashboardEventStore
+
+if TYPE_CHECKING:
+    from src.dashboard.sweep import ParameterSweep
+    from src.services.tour_service import TourStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -155,104 +161,144 @@ class SmartQueueSimulator:
         ),
     ]
 
+    # Status values indexed by the vectorized engine's status codes
+    _STATUSES = np.array(
+        [
+            QueueStatus.COMPLETE.value,
+            QueueStatus.SOFT_DEGRADED.value,
+            QueueStatus.HARD_DEGRADED.value,
+            QueueStatus.FAILED.value,
+        ]
+    )
+
     def __init__(
         self,
         queue_config: QueueConfig | None = None,
         agents: list[AgentConfig] | None = None,
+        rng: np.random.Generator | int | None = None,
     ):
+        """
+        Args:
+            queue_config: Timeouts and result thresholds
+            agents: Agent response models (defaults to DEFAULT_AGENTS)
+            rng: Generator or seed; None draws a seed from the global
+                np.random state, so np.random.seed() still makes runs
+                reproducible
+        """
         self.queue_config = queue_config or QueueConfig()
         self.agents = agents or [AgentConfig(**a.__dict__) for a in self.DEFAULT_AGENTS]
+        self.rng = (
+            rng
+            if rng is None or isinstance(rng, np.random.Generator)
+            else np.random.default_rng(rng)
+        )
 
-    def simulate_single(self) -> SimulationResult:
-        """Simulate a single queue processing cycle."""
-        cfg = self.queue_config
-        agent_times = {}
-        agent_success = {}
-        agent_quality = {}
+    def _generator(self) -> np.random.Generator:
+        if self.rng is not None:
+            return self.rng
+        return np.random.default_rng(np.random.randint(0, 2**31 - 1))
 
-        # Generate agent responses
-        for agent in self.agents:
-            response_time = agent.shift + np.random.lognormal(agent.mu, agent.sigma)
-            success = np.random.random() < agent.reliability
-            quality = (
-                np.clip(np.random.normal(agent.quality_mean, agent.quality_std), 0, 10)
-                if success
-                else 0.0
-            )
+    def simulate_batch(self, n_simulations: int) -> dict[str, np.ndarray]:
+        """
+        Simulate n queue cycles at once.
 
-            agent_times[agent.name] = response_time
-            agent_success[agent.name] = success
-            agent_quality[agent.name] = quality
+        Draws (n_simulations x n_agents) matrices of response times,
+        successes and qualities, then applies the tiered soft/hard
+        timeout logic with array masks.
 
-        # Sort by response time
-        sorted_agents = sorted(agent_times.items(), key=lambda x: x[1])
+        Returns:
+            Arrays of length n_simulations: "status" (QueueStatus values),
+            "latency", "num_results", "quality", and per-agent
+            "times" / "success" matrices (columns in self.agents order)
+        """
+        cfg = self.queue_config
+        rng = self._generator()
+        shape = (n_simulations, len(self.agents))
 
-        # Collect successful results
-        successes = [
-            (n, t, agent_quality[n]) for n, t in sorted_agents if agent_success[n]
-        ]
+        def column(attr: str) -> np.ndarray:
+            return np.array([getattr(a, attr) for a in self.agents], dtype=float)
 
-        # Apply tiered timeout logic
-        if len(successes) == 0:
-            return SimulationResult(
-                QueueStatus.FAILED, cfg.hard_timeout, 0, 0.0, agent_times, agent_success
-            )
+        # Generate agent responses
+        times = column("shift") + rng.lognormal(column("mu"), column("sigma"), shape)
+        success = rng.random(shape) < column("reliability")
+        quality = np.where(
+            success,
+            np.clip(
+                rng.normal(column("quality_mean"), column("quality_std"), shape), 0, 10
+            ),
+            0.0,
+        )
 
-        by_soft = [(n, t, q) for n, t, q in successes if t <= cfg.soft_timeout]
-        by_hard = [(n, t, q) for n, t, q in successes if t <= cfg.hard_timeout]
-
-        if len(successes) >= cfg.expected_agents:
-            max_time = max(t for _, t, _ in successes)
-            if max_time <= cfg.hard_timeout:
-                latency = max_time
-                status = QueueStatus.COMPLETE
-                num_results = cfg.expected_agents
-            else:
-                latency = cfg.hard_timeout
-                num_results = len(by_hard)
-                status = (
-                    QueueStatus.SOFT_DEGRADED
-                    if num_results >= cfg.min_for_soft
-                    else QueueStatus.HARD_DEGRADED
-                )
-        elif len(by_soft) >= cfg.min_for_soft:
-            latency = cfg.soft_timeout
-            status = QueueStatus.SOFT_DEGRADED
-            num_results = len(by_soft)
-        elif len(by_hard) >= cfg.min_for_hard:
-            latency = cfg.hard_timeout
-            status = QueueStatus.HARD_DEGRADED
-            num_results = len(by_hard)
-        else:
-            latency = cfg.hard_timeout
-            status = QueueStatus.FAILED
-            num_results = 0
+        # Successful results in by each deadline
+        n_success = success.sum(axis=1)
+        n_soft = (success & (times <= cfg.soft_timeout)).sum(axis=1)
+        n_hard = (success & (times <= cfg.hard_timeout)).sum(axis=1)
+        last_success = np.where(success, times, -np.inf).max(axis=1, initial=-np.inf)
+
+        # Apply tiered timeout logic (first matching tier wins)
+        any_success = n_success > 0
+        all_in = any_success & (n_success >= cfg.expected_agents)
+        complete = all_in & (last_success <= cfg.hard_timeout)
+        all_late = all_in & ~complete
+        soft = any_success & ~all_in & (n_soft >= cfg.min_for_soft)
+        hard = any_success & ~all_in & ~soft & (n_hard >= cfg.min_for_hard)
+
+        status = np.full(n_simulations, 3)  # FAILED
+        status[hard] = 2
+        status[soft] = 1
+        status[all_late] = np.where(n_hard[all_late] >= cfg.min_for_soft, 1, 2)
+        status[complete] = 0
+
+        latency = np.full(n_simulations, float(cfg.hard_timeout))
+        latency[soft] = cfg.soft_timeout
+        latency[complete] = last_success[complete]
+
+        num_results = np.zeros(n_simulations, dtype=int)
+        num_results[all_late | hard] = n_hard[all_late | hard]
+        num_results[soft] = n_soft[soft]
+        num_results[complete] = cfg.expected_agents
+
+        # Best result in by the deadline, penalized per missing result
+        in_time = success & (times <= latency[:, None])
+        best = np.where(in_time, quality, 0.0).max(axis=1, initial=0.0)
+        penalty = np.maximum(0, 1.0 - 0.05 * (cfg.expected_agents - num_results))
 
-        valid_qualities = [q for _, t, q in successes if t <= latency]
-        quality = max(valid_qualities) if valid_qualities else 0.0
-        degradation_penalty = 1.0 - 0.05 * (cfg.expected_agents - num_results)
-        quality *= max(0, degradation_penalty)
+        return {
+            "status": self._STATUSES[status],
+            "latency": latency,
+            "num_results": num_results,
+            "quality": best * penalty,
+            "times": times,
+            "success": success,
+        }
 
+    def simulate_single(self) -> SimulationResult:
+        """Simulate a single queue processing cycle."""
+        batch = self.simulate_batch(1)
+        names = [agent.name for agent in self.agents]
         return SimulationResult(
-            status, latency, num_results, quality, agent_times, agent_success
+            QueueStatus(batch["status"][0]),
+            float(batch["latency"][0]),
+            int(batch["num_results"][0]),
+            float(batch["quality"][0]),
+            dict(zip(names, batch["times"][0].tolist(), strict=True)),
+            dict(zip(names, batch["success"][0].tolist(), strict=True)),
         )
 
     def run_monte_carlo(self, n_simulations: int = 1000) -> pd.DataFrame:
         """Run Monte Carlo simulation."""
-        results = []
-        for _ in range(n_simulations):
-            result = self.simulate_single()
-            results.append(
-                {
-                    "status": result.status.value,
-                    "latency": result.latency,
-                    "num_results": result.num_results,
-                    "quality": result.quality,
-                    **{f"{k}_time": v for k, v in result.agent_times.items()},
-                    **{f"{k}_success": v for k, v in result.agent_success.items()},
-                }
-            )
-        return pd.DataFrame(results)
+        batch = self.simulate_batch(n_simulations)
+        columns: dict[str, Any] = {
+            "status": batch["status"],
+            "latency": batch["latency"],
+            "num_results": batch["num_results"],
+            "quality": batch["quality"],
+        }
+        for i, agent in enumerate(self.agents):
+            columns[f"{agent.name}_time"] = batch["times"][:, i]
+        for i, agent in enumerate(self.agents):
+            columns[f"{agent.name}_success"] = batch["success"][:, i]
+        return pd.DataFrame(columns)
 
 
 class DashboardDataManager:
@@ -289,6 +335,7 @@ class DashboardDataManager:
         self,
         cache_dir: Path | None = None,
         data_source: DataSourceMode | str = DataSourceMode.SIMULATED,
+        seed: int | None = None,
     ):
         self.cache_dir = cache_dir or Path("./data/cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -306,8 +353,18 @@ class DashboardDataManager:
         self._baseline_data: pd.DataFrame | None = None
         self._sensitivity_data: dict[str, pd.DataFrame] = {}
 
+        # Parameter sweeps (memoized per seed); the seed is drawn from the
+        # global np.random state unless given, so it is fixed per manager
+        # and repeated sweeps reuse cells
+        self.seed = seed if seed is not None else int(np.random.randint(0, 2**31 - 1))
+        self._sweep: ParameterSweep | None = None
+
+        # Live tour/point/agent events (fed once attach_tour_store is called)
+        self.events = DashboardEventStore()
+
         # Initialize API client for live/hybrid modes
         self._api_client = None
+        self._tour_store: TourStore | None = None
         if self.data_source in (DataSourceMode.LIVE, DataSourceMode.HYBRID):
             self._init_api_client()
 
@@ -460,97 +517,136 @@ class DashboardDataManager:
 
         return df
 
+    def _get_sweep(self) -> ParameterSweep:
+        """The sweep engine (imported on first use; it imports this module)."""
+        with self._lock:
+            if self._sweep is None:
+                from src.dashboard.sweep import ParameterSweep
+
+                self._sweep = ParameterSweep()
+            return self._sweep
+
+    def close(self) -> None:
+        """Shut down the sweep process pool (it is restarted on demand)."""
+        with self._lock:
+            sweep = self._sweep
+        if sweep is not None:
+            sweep.close()
+
     def run_sensitivity_analysis(
         self,
         param_name: str,
         param_values: list[float],
         n_sims: int = 2000,
         callback: Callable[[float], None] | None = None,
+        seed: int | None = None,
     ) -> pd.DataFrame:
-        """Run sensitivity analysis for a single parameter."""
-        results = []
+        """
+        Run sensitivity analysis for a single parameter.
 
-        for i, value in enumerate(param_values):
+        Values already evaluated (same n_sims and seed) come from the sweep
+        cache. Rows are published to the sensitivity data as each value
+        completes, before `callback` is told the progress, so a polling UI
+        can draw partial results.
+        """
+        configs = []
+        for value in param_values:
             config = QueueConfig()
             setattr(config, param_name, value)
+            configs.append(config)
+
+        rows: dict[int, dict[str, Any]] = {}
+
+        def on_result(index: int, df: pd.DataFrame) -> None:
+            rows[index] = self._summarize(df, param_value=param_values[index])
+            partial = pd.DataFrame([rows[i] for i in sorted(rows)])
+            with self._lock:
+                self._sensitivity_data[param_name] = partial
+
+        self._get_sweep().run(
+            configs,
+            n_sims,
+            self.seed if seed is None else seed,
+            callback=callback,
+            on_result=on_result,
+        )
 
-            sim = SmartQueueSimulator(queue_config=config)
-            df = sim.run_monte_carlo(n_simulations=n_sims)
-
-            complete_rate = (df["status"] == "complete").mean()
-            degraded_rate = df["status"].isin(["soft_degraded", "hard_degraded"]).mean()
-            failed_rate = (df["status"] == "failed").mean()
-
-            results.append(
-                {
-                    "param_value": value,
-                    "latency_mean": df["latency"].mean(),
-                    "latency_std": df["latency"].std(),
-                    "latency_p50": df["latency"].quantile(0.5),
-                    "latency_p95": df["latency"].quantile(0.95),
-                    "latency_p99": df["latency"].quantile(0.99),
-                    "quality_mean": df["quality"].mean(),
-                    "quality_std": df["quality"].std(),
-                    "complete_rate": complete_rate,
-                    "degraded_rate": degraded_rate,
-                    "failed_rate": failed_rate,
-                    "success_rate": 1 - failed_rate,
-                }
-            )
-
-            if callback:
-                callback((i + 1) / len(param_values))
-
-        result_df = pd.DataFrame(results)
-        self._sensitivity_data[param_name] = result_df
+        result_df = pd.DataFrame([rows[i] for i in sorted(rows)])
+        with self._lock:
+            self._sensitivity_data[param_name] = result_df
         return result_df
 
+    @staticmethod
+    def _summarize(df: pd.DataFrame, **fields: Any) -> dict[str, Any]:
+        """Latency, quality and status-rate summary of one Monte Carlo run."""
+        complete_rate = (df["status"] == "complete").mean()
+        degraded_rate = df["status"].isin(["soft_degraded", "hard_degraded"]).mean()
+        failed_rate = (df["status"] == "failed").mean()
+        return {
+            **fields,
+            "latency_mean": df["latency"].mean(),
+            "latency_std": df["latency"].std(),
+            "latency_p50": df["latency"].quantile(0.5),
+            "latency_p95": df["latency"].quantile(0.95),
+            "latency_p99": df["latency"].quantile(0.99),
+            "quality_mean": df["quality"].mean(),
+            "quality_std": df["quality"].std(),
+            "complete_rate": complete_rate,
+            "degraded_rate": degraded_rate,
+            "failed_rate": failed_rate,
+            "success_rate": 1 - failed_rate,
+        }
+
     def run_pareto_analysis(
         self,
         soft_timeout_range: tuple[float, float] = (5, 30),
         hard_timeout_range: tuple[float, float] = (10, 60),
         n_points: int = 50,
         n_sims: int = 1000,
+        callback: Callable[[float], None] | None = None,
+        seed: int | None = None,
     ) -> pd.DataFrame:
-        """Generate Pareto frontier data."""
-        results = []
-
+        """Generate Pareto frontier data (grid cells are memoized)."""
         soft_values = np.linspace(*soft_timeout_range, int(np.sqrt(n_points)))
         hard_values = np.linspace(*hard_timeout_range, int(np.sqrt(n_points)))
 
-        for soft in soft_values:
-            for hard in hard_values:
-                if hard <= soft:
-                    continue
-
-                config = QueueConfig(soft_timeout=soft, hard_timeout=hard)
-                sim = SmartQueueSimulator(queue_config=config)
-                df = sim.run_monte_carlo(n_simulations=n_sims)
-
-                results.append(
-                    {
-                        "soft_timeout": soft,
-                        "hard_timeout": hard,
-                        "latency_mean": df["latency"].mean(),
-                        "quality_mean": df["quality"].mean(),
-                        "success_rate": (df["status"] != "failed").mean(),
-                        "complete_rate": (df["status"] == "complete").mean(),
-                    }
-                )
+        configs = [
+            QueueConfig(soft_timeout=float(soft), hard_timeout=float(hard))
+            for soft in soft_values
+            for hard in hard_values
+            if hard > soft
+        ]
+        frames = self._get_sweep().run(
+            configs, n_sims, self.seed if seed is None else seed, callback=callback
+        )
 
-        return pd.DataFrame(results)
+        return pd.DataFrame(
+            [
+                {
+                    "soft_timeout": config.soft_timeout,
+                    "hard_timeout": config.hard_timeout,
+                    "latency_mean": df["latency"].mean(),
+                    "quality_mean": df["quality"].mean(),
+                    "success_rate": (df["status"] != "failed").mean(),
+                    "complete_rate": (df["status"] == "complete").mean(),
+                }
+                for config, df in zip(configs, frames, strict=True)
+            ]
+        )
 
     def compare_configurations(
-        self, config_a: QueueConfig, config_b: QueueConfig, n_sims: int = 5000
+        self,
+        config_a: QueueConfig,
+        config_b: QueueConfig,
+        n_sims: int = 5000,
+        seed: int | None = None,
     ) -> dict:
         """Compare two configurations statistically."""
         from scipy import stats
 
-        sim_a = SmartQueueSimulator(queue_config=config_a)
-        sim_b = SmartQueueSimulator(queue_config=config_b)
-
-        df_a = sim_a.run_monte_carlo(n_simulations=n_sims)
-        df_b = sim_b.run_monte_carlo(n_simulations=n_sims)
+        df_a, df_b = self._get_sweep().run(
+            [config_a, config_b], n_sims, self.seed if seed is None else seed
+        )
 
         lat_a, lat_b = df_a["latency"].values, df_b["latency"].values
         qual_a, qual_b = df_a["quality"].values, df_b["quality"].values
@@ -592,8 +688,23 @@ class DashboardDataManager:
             "status_b": df_b["status"].value_counts(normalize=True).to_dict(),
         }
 
+    def attach_tour_store(self, store: TourStore | None = None) -> None:
+        """Feed the live event store from TourStore updates (default: global)."""
+        from src.services.tour_service import get_tour_store
+
+        self._tour_store = store or get_tour_store()
+        self.events.attach(self._tour_store)
+
     def get_real_time_metrics(self) -> dict:
-        """Generate simulated real-time metrics for monitoring."""
+        """
+        Real-time metrics for monitoring.
+
+        Read from the live event store's running aggregates once it has
+        recorded points; simulated until then.
+        """
+        if len(self.events):
+            return self._live_metrics()
+
         # Simulate current system state
         return {
             "timestamp": datetime.now().isoformat(),
@@ -624,6 +735,42 @@ class DashboardDataManager:
             "error_rate": np.random.uniform(0, 0.05),
         }
 
+    def _live_metrics(self) -> dict:
+        """Metrics from the event store and TourStore counters (no scans)."""
+        by_status = self._tour_store.count_by_status() if self._tour_store else {}
+        finished = self.events.tour_status_counts()
+        n_finished = sum(finished.values())
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "source": "live",
+            "active_tours": by_status.get("processing", 0),
+            # Tours not yet processing points
+            "queue_depth": sum(
+                by_status.get(s, 0) for s in ("pending", "fetching_route", "scheduling")
+            ),
+            "agents": {
+                agent: {
+                    "status": "healthy" if stats["success_rate"] >= 0.9 else "degraded",
+                    "avg_response_time": stats["avg_response_time"],
+                    "success_rate": stats["success_rate"],
+                }
+                for agent, stats in self.events.agent_stats().items()
+            },
+            "throughput": self.events.throughput(),
+            "error_rate": finished["failed"] / n_finished if n_finished else 0.0,
+            "point_latency_ms": self.events.summary("points", "total_ms"),
+        }
+
+    def get_throughput_history(self, buckets: int = 60) -> list[dict] | None:
+        """Points per second over the last `buckets` seconds (None without live data)."""
+        if not len(self.events):
+            return None
+        history = self.events.throughput_history(buckets)
+        return [
+            {"timestamp": i, "throughput": float(value)}
+            for i, value in enumerate(history)
+        ]
+
     def export_results(self, output_path: Path) -> None:
         """Export all cached results to JSON."""
         export_data = {
@@ -0,0 +1,311 @@
+"""
+Dashboard Event Store
+=====================
+
+Append-only columnar store of tour, point and agent timing events for the
+dashboard's live views.
+
+Events arrive through a TourStore subscription: each tour update is
+diffed against what was already recorded, so a completed point is
+appended once (with one row per agent) and a finished tour once.
+
+Each table is a fixed-capacity NumPy ring buffer per column. Rows are
+written twice (at i and i + capacity), so the newest rows always form
+one contiguous slice and column reads are zero-copy views. Aggregates
+(count, mean, min/max and DDSketch quantiles) are updated on append, so
+dashboard callbacks read them in O(1) instead of rebuilding DataFrames
+from lists of dicts and recomputing on every refresh.
+
+Tables:
+    tours   timestamp, duration_s, points, status (TOUR_STATUSES code)
+    points  timestamp, total_ms, agents_ms, queue_wait_ms, judge_ms,
+            judge_llm_ms, store_update_ms
+    agents  timestamp, agent (AGENT_TYPES code), total_ms, llm_ms,
+            search_ms, success
+
+Example:
+    events = DashboardEventStore()
+    events.attach(get_tour_store())
+
+    events.summary("points", "total_ms")       # {"count", "mean", "p95", ...}
+    events.throughput(window_seconds=60)       # points per second
+    events.points.column("total_ms", last=100)  # read-only view
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from src.core.observability.sketch import DDSketch
+
+if TYPE_CHECKING:
+    from src.services.tour_service import PointResult, TourState, TourStore
+
+# Codes stored in the "status" and "agent" columns
+TOUR_STATUSES = ("completed", "failed", "cancelled")
+AGENT_TYPES = ("video", "music", "text", "other")
+
+TOUR_COLUMNS = {
+    "timestamp": np.float64,
+    "duration_s": np.float64,
+    "points": np.int32,
+    "status": np.uint8,
+}
+POINT_COLUMNS = {
+    "timestamp": np.float64,
+    "total_ms": np.float64,
+    "agents_ms": np.float64,
+    "queue_wait_ms": np.float64,
+    "judge_ms": np.float64,
+    "judge_llm_ms": np.float64,
+    "store_update_ms": np.float64,
+}
+AGENT_COLUMNS = {
+    "timestamp": np.float64,
+    "agent": np.uint8,
+    "total_ms": np.float64,
+    "llm_ms": np.float64,
+    "search_ms": np.float64,
+    "success": np.bool_,
+}
+
+# Columns with running aggregates, per table
+_AGGREGATED = {
+    "tours": ("duration_s", "points"),
+    "points": (
+        "total_ms",
+        "agents_ms",
+        "queue_wait_ms",
+        "judge_ms",
+        "judge_llm_ms",
+        "store_update_ms",
+    ),
+    "agents": ("total_ms", "llm_ms", "search_ms"),
+}
+
+
+class RingBuffer:
+    """
+    Fixed-capacity columnar ring buffer.
+
+    Not thread-safe on its own; DashboardEventStore serializes access.
+    Views returned by column() share memory with the buffer and are
+    overwritten as newer rows wrap around, so copy them to keep them.
+    """
+
+    def __init__(self, columns: dict[str, Any], capacity: int = 4096):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = {
+            name: np.zeros(2 * capacity, dtype=dtype) for name, dtype in columns.items()
+        }
+        # Rows appended since creation (including those overwritten)
+        self.total = 0
+
+    def append(self, **values: Any) -> None:
+        """Append one row; columns not given are zero."""
+        i = self.total % self.capacity
+        for name, column in self._data.items():
+            value = values.get(name, 0)
+            column[i] = value
+            column[i + self.capacity] = value
+        self.total += 1
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def column(self, name: str, last: int | None = None) -> np.ndarray:
+        """Read-only view of a column's newest rows, oldest first."""
+        n = len(self) if last is None else min(last, len(self))
+        end = self.total % self.capacity + self.capacity
+        view = self._data[name][end - n : end]
+        view.flags.writeable = False
+        return view
+
+    def to_frame(self, last: int | None = None) -> pd.DataFrame:
+        """The newest rows as a DataFrame (pandas may copy the columns)."""
+        return pd.DataFrame({name: self.column(name, last) for name in self._data})
+
+
+class DashboardEventStore:
+    """
+    Tour, point and agent events with incremental aggregates.
+
+    Parameters:
+        capacity: Rows kept per table (older rows remain in the aggregates)
+        max_tracked_tours: In-progress tours whose recorded points are
+            remembered for diffing updates
+    """
+
+    def __init__(self, capacity: int = 4096, max_tracked_tours: int = 1024):
+        self.tours = RingBuffer(TOUR_COLUMNS, capacity)
+        self.points = RingBuffer(POINT_COLUMNS, capacity)
+        self.agents = RingBuffer(AGENT_COLUMNS, capacity)
+        self.max_tracked_tours = max_tracked_tours
+
+        self._lock = threading.Lock()
+        self._sketches: dict[tuple[str, str, str | None], DDSketch] = {}
+        self._tour_status_counts = [0] * len(TOUR_STATUSES)
+        self._agent_counts = [0] * len(AGENT_TYPES)
+        self._agent_successes = [0] * len(AGENT_TYPES)
+
+        # Tour ID -> indexes of points already recorded
+        self._recorded_points: OrderedDict[str, set[int]] = OrderedDict()
+        self._finished: OrderedDict[str, None] = OrderedDict()
+        self._store: TourStore | None = None
+
+    # ==================== Feeding ====================
+
+    def attach(self, store: TourStore) -> None:
+        """Record events from every tour update in the store."""
+        self.detach()
+        self._store = store
+        store.subscribe(None, self.ingest)
+
+    def detach(self) -> None:
+        if self._store is not None:
+            self._store.unsubscribe(None, self.ingest)
+            self._store = None
+
+    def ingest(self, tour: TourState) -> None:
+        """Record what is new in a tour update (TourStore subscriber)."""
+        with self._lock:
+            if tour.tour_id in self._finished:
+                return
+            recorded = self._recorded_points.setdefault(tour.tour_id, set())
+            self._recorded_points.move_to_end(tour.tour_id)
+            for index, point in enumerate(tour.points):
+                if index not in recorded and point.timing is not None:
+                    recorded.add(index)
+                    self._record_point(point)
+
+            status = getattr(tour.status, "value", tour.status)
+            if status in TOUR_STATUSES:
+                self._record_tour(tour, status)
+                del self._recorded_points[tour.tour_id]
+                self._finished[tour.tour_id] = None
+                if len(self._finished) > self.max_tracked_tours:
+                    self._finished.popitem(last=False)
+            elif len(self._recorded_points) > self.max_tracked_tours:
+                self._recorded_points.popitem(last=False)
+
+    def _record_point(self, point: PointResult) -> None:
+        now = time.time()
+        timing = point.timing
+        values = {
+            name: getattr(timing, name) for name in POINT_COLUMNS if name != "timestamp"
+        }
+        self.points.append(timestamp=now, **values)
+        self._aggregate("points", values)
+
+        for result in point.agent_results:
+            agent_type = result.agent_type.lower()
+            code = AGENT_TYPES.index(
+                agent_type if agent_type in AGENT_TYPES else "other"
+            )
+            agent_timing = result.timing
+            values = {
+                "total_ms": agent_timing.total_ms
+                if agent_timing
+                else result.duration_seconds * 1000,
+                "llm_ms": agent_timing.llm_ms if agent_timing else 0.0,
+                "search_ms": agent_timing.search_ms if agent_timing else 0.0,
+            }
+            self.agents.append(
+                timestamp=now, agent=code, success=result.success, **values
+            )
+            self._aggregate("agents", values, AGENT_TYPES[code])
+            self._agent_counts[code] += 1
+            self._agent_successes[code] += bool(result.success)
+
+    def _record_tour(self, tour: TourState, status: str) -> None:
+        duration = 0.0
+        if tour.started_at and tour.completed_at:
+            duration = (tour.completed_at - tour.started_at).total_seconds()
+        code = TOUR_STATUSES.index(status)
+        values = {"duration_s": duration, "points": tour.completed_points}
+        self.tours.append(timestamp=time.time(), status=code, **values)
+        self._aggregate("tours", values)
+        self._tour_status_counts[code] += 1
+
+    def _aggregate(
+        self, table: str, values: dict[str, float], agent: str | None = None
+    ) -> None:
+        """Add values to the table's sketches (and the agent's, if given)."""
+        for column in _AGGREGATED[table]:
+            for key in ((table, column, None), (table, column, agent)):
+                sketch = self._sketches.get(key)
+                if sketch is None:
+                    sketch = self._sketches[key] = DDSketch()
+                sketch.add(values[column])
+                if agent is None:
+                    break
+
+    # ==================== Reading ====================
+
+    def summary(
+        self, table: str, column: str, agent: str | None = None
+    ) -> dict[str, float]:
+        """Count, mean, min/max and p50/p95/p99 of every value ever recorded."""
+        with self._lock:
+            sketch = self._sketches.get((table, column, agent))
+            if sketch is None or sketch.count == 0:
+                return {"count": 0}
+            return {
+                "count": sketch.count,
+                "mean": sketch.avg,
+                "min": sketch.min,
+                "max": sketch.max,
+                "p50": sketch.quantile(0.50),
+                "p95": sketch.quantile(0.95),
+                "p99": sketch.quantile(0.99),
+            }
+
+    def agent_stats(self) -> dict[str, dict[str, float]]:
+        """Calls, success rate and mean latency (seconds) per observed agent."""
+        stats = {}
+        for code, agent in enumerate(AGENT_TYPES):
+            with self._lock:
+                calls = self._agent_counts[code]
+                successes = self._agent_successes[code]
+            if calls:
+                latency = self.summary("agents", "total_ms", agent)
+                stats[agent] = {
+                    "calls": calls,
+                    "success_rate": successes / calls,
+                    "avg_response_time": latency["mean"] / 1000,
+                }
+        return stats
+
+    def tour_status_counts(self) -> dict[str, int]:
+        with self._lock:
+            return dict(zip(TOUR_STATUSES, self._tour_status_counts, strict=True))
+
+    def throughput(self, window_seconds: float = 60.0) -> float:
+        """Points completed per second over the last window."""
+        now = time.time()
+        with self._lock:
+            timestamps = self.points.column("timestamp")
+            recent = len(timestamps) - np.searchsorted(timestamps, now - window_seconds)
+        return recent / window_seconds
+
+    def throughput_history(
+        self, buckets: int = 60, bucket_seconds: float = 1.0
+    ) -> np.ndarray:
+        """Points completed per second in each of the last `buckets` intervals."""
+        now = time.time()
+        edges = now - bucket_seconds * np.arange(buckets, -1, -1)
+        with self._lock:
+            counts, _ = np.histogram(self.points.column("timestamp"), bins=edges)
+        return counts / bucket_seconds
+
+    def __len__(self) -> int:
+        """Points recorded (the dashboard's signal that live data exists)."""
+        return self.points.total
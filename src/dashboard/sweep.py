@@ -0,0 +1,236 @@
+"""
+Parameter Sweep Engine
+======================
+
+Evaluates many SmartQueue configurations for the dashboard analyses
+(sensitivity, Pareto, A/B comparison).
+
+Each cell - one (config, n_sims, seed) - gets its own RNG stream, derived
+from the sweep seed and the config values rather than from the cell's
+position in the grid. A cell therefore gives the same result however the
+grid around it changes, which is what makes memoization sound: results
+are kept in a bounded LRU cache, and adding grid points or moving a
+slider back only simulates the cells not seen before.
+
+Large sweeps are spread across a process pool; small ones run inline,
+since with the vectorized simulator a 1000-simulation cell takes a few
+milliseconds and process start-up would dominate. Cells are reported as
+they finish, through `on_result` (partial results) and `callback`
+(progress fraction), in completion order.
+
+Example:
+    sweep = ParameterSweep()
+    configs = [QueueConfig(soft_timeout=s) for s in (5.0, 10.0, 15.0)]
+    frames = sweep.run(configs, n_sims=2000, seed=42, callback=print)
+    sweep.get_stats()  # hits, misses, cells computed in the pool
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.dashboard.data_manager import AgentConfig, QueueConfig, SmartQueueSimulator
+
+logger = logging.getLogger(__name__)
+
+CellKey = tuple[tuple[Any, ...], int, int]
+
+
+def cell_key(config: QueueConfig, n_sims: int, seed: int) -> CellKey:
+    """Cache key of one sweep cell."""
+    return dataclasses.astuple(config), n_sims, seed
+
+
+def cell_seed(config: QueueConfig, seed: int) -> np.random.SeedSequence:
+    """Independent RNG stream for a config, stable across processes and grids."""
+    digest = hashlib.blake2b(
+        repr(dataclasses.astuple(config)).encode(), digest_size=8
+    ).digest()
+    return np.random.SeedSequence(seed, spawn_key=(int.from_bytes(digest, "little"),))
+
+
+def simulate_cell(
+    config: QueueConfig,
+    agents: list[AgentConfig] | None,
+    n_sims: int,
+    seed: int,
+) -> pd.DataFrame:
+    """Run one cell's Monte Carlo (module-level so process workers can pickle it)."""
+    rng = np.random.default_rng(cell_seed(config, seed))
+    simulator = SmartQueueSimulator(queue_config=config, agents=agents, rng=rng)
+    return simulator.run_monte_carlo(n_simulations=n_sims)
+
+
+class ParameterSweep:
+    """
+    Memoized, optionally parallel evaluation of queue configurations.
+
+    Parameters:
+        agents: Agent models for every cell (None = simulator defaults)
+        cache_size: Cells kept in the LRU cache
+        max_workers: Process pool size (1 = always inline)
+        parallel_threshold: Simulations (cells x n_sims) still to run
+            before a sweep is sent to the process pool
+    """
+
+    def __init__(
+        self,
+        agents: list[AgentConfig] | None = None,
+        cache_size: int = 128,
+        max_workers: int | None = None,
+        parallel_threshold: int = 500_000,
+    ):
+        self.agents = agents
+        self.cache_size = cache_size
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.parallel_threshold = parallel_threshold
+
+        self._cache: OrderedDict[CellKey, pd.DataFrame] = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Executor | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.pool_cells = 0
+
+    def run(
+        self,
+        configs: Sequence[QueueConfig],
+        n_sims: int,
+        seed: int,
+        callback: Callable[[float], None] | None = None,
+        on_result: Callable[[int, pd.DataFrame], None] | None = None,
+    ) -> list[pd.DataFrame]:
+        """
+        Evaluate every config, reusing cached cells.
+
+        Args:
+            configs: Configurations to evaluate
+            n_sims: Simulations per configuration
+            seed: Sweep seed (with the config, determines each cell's stream)
+            callback: Called with the completed fraction after each cell
+            on_result: Called with (index in configs, results) after each cell
+
+        Returns:
+            One Monte Carlo DataFrame per config, in configs order (shared
+            with the cache, so treat them as read-only)
+        """
+        results: list[pd.DataFrame | None] = [None] * len(configs)
+        done = 0
+
+        def report(index: int, df: pd.DataFrame) -> None:
+            nonlocal done
+            results[index] = df
+            done += 1
+            if on_result:
+                on_result(index, df)
+            if callback:
+                callback(done / len(configs))
+
+        # Cached cells first, so partial results appear immediately
+        missing: dict[CellKey, list[int]] = {}
+        for i, config in enumerate(configs):
+            key = cell_key(config, n_sims, seed)
+            cached = self._get(key)
+            if cached is not None:
+                report(i, cached)
+            else:
+                missing.setdefault(key, []).append(i)
+
+        for key, df in self._compute(configs, missing, n_sims, seed):
+            self._put(key, df)
+            for i in missing[key]:
+                report(i, df)
+
+        return results  # type: ignore[return-value]
+
+    def _compute(
+        self,
+        configs: Sequence[QueueConfig],
+        missing: dict[CellKey, list[int]],
+        n_sims: int,
+        seed: int,
+    ):
+        """Yield (key, results) for each missing cell as it completes."""
+        if not missing:
+            return
+        with self._lock:
+            self.misses += len(missing)
+
+        parallel = (
+            self.max_workers > 1
+            and len(missing) > 1
+            and len(missing) * n_sims >= self.parallel_threshold
+        )
+        if not parallel:
+            for key, indexes in missing.items():
+                yield key, simulate_cell(configs[indexes[0]], self.agents, n_sims, seed)
+            return
+
+        executor = self._get_executor()
+        futures = {
+            executor.submit(
+                simulate_cell, configs[indexes[0]], self.agents, n_sims, seed
+            ): key
+            for key, indexes in missing.items()
+        }
+        with self._lock:
+            self.pool_cells += len(futures)
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    def _get(self, key: CellKey) -> pd.DataFrame | None:
+        with self._lock:
+            df = self._cache.get(key)
+            if df is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            return df
+
+    def _put(self, key: CellKey, df: pd.DataFrame) -> None:
+        with self._lock:
+            self._cache[key] = df
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                logger.info(f"Starting sweep process pool ({self.max_workers} workers)")
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def clear(self) -> None:
+        """Drop every cached cell."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Shut down the process pool (it is restarted on demand)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "cached_cells": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "pool_cells": self.pool_cells,
+            }
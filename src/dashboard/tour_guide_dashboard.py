@@ -642,6 +642,23 @@ class ContentPreference(str, Enum):
     RELAXING = "relaxing"
 
 
+def format_point_timing(timing: dict | None) -> str | None:
+    """One-line latency breakdown of a point from the results API."""
+    if not timing:
+        return None
+    agents = timing.get("agents", {})
+    slowest = max(agents.items(), key=lambda a: a[1]["total_ms"], default=None)
+    parts = [f"agents {timing['agents_ms'] / 1000:.1f}s"]
+    if slowest:
+        name, agent = slowest
+        parts.append(
+            f"slowest {name} (LLM {agent['llm_ms'] / 1000:.1f}s, "
+            f"search {agent['search_ms'] / 1000:.1f}s)"
+        )
+    parts.append(f"judge {timing['judge_ms'] / 1000:.1f}s")
+    return f"{timing['total_ms'] / 1000:.1f}s: " + " · ".join(parts)
+
+
 # ============================================================================
 # Dashboard Layout Components
 # ============================================================================
@@ -2634,6 +2651,9 @@ def create_tour_guide_app() -> Dash:
                                         "duration": f"{random.randint(2, 8)} min",
                                         "url": decision.get("url"),
                                         "is_real": True,
+                                        "latency": format_point_timing(
+                                            item.get("timing")
+                                        ),
                                     }
                                 )
                             tour_store["recommendations"] = recommendations
@@ -2772,7 +2792,20 @@ def create_tour_guide_app() -> Dash:
                                                 "marginLeft": "15px",
                                             },
                                         ),
-                                    ],
+                                    ]
+                                    + (
+                                        [
+                                            html.Span(
+                                                f" • ⚙️ {rec['latency']}",
+                                                style={
+                                                    "color": THEME["text_muted"],
+                                                    "marginLeft": "15px",
+                                                },
+                                            )
+                                        ]
+                                        if rec.get("latency")
+                                        else []
+                                    ),
                                     style={"marginTop": "8px", "fontSize": "0.85rem"},
                                 ),
                             ],
@@ -2,23 +2,59 @@
 Data models for the Multi-Agent Tour Guide system.
 """
 
-from src.models.content import AgentStatus, ContentResult, ContentType
-from src.models.decision import AgentTask, JudgeDecision
-from src.models.metrics import QueueMetrics, QueueStatus
-from src.models.output import SystemState, TourGuideOutput
-from src.models.route import Route, RoutePoint
-from src.models.user_profile import (
-    AgeGroup,
-    ContentPreference,
-    Gender,
-    TravelMode,
-    TripPurpose,
-    UserProfile,
-    get_driver_profile,
-    get_family_profile,
-    get_kid_profile,
-    get_senior_profile,
-    get_teenager_profile,
+from typing import TYPE_CHECKING
+
+from src._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.models.content import AgentStatus, ContentResult, ContentType
+    from src.models.decision import AgentTask, JudgeDecision
+    from src.models.metrics import QueueMetrics, QueueStatus
+    from src.models.output import SystemState, TourGuideOutput
+    from src.models.route import Route, RoutePoint
+    from src.models.user_profile import (
+        AgeGroup,
+        ContentPreference,
+        Gender,
+        ProfilePlan,
+        TravelMode,
+        TripPurpose,
+        UserProfile,
+        get_driver_profile,
+        get_family_profile,
+        get_kid_profile,
+        get_senior_profile,
+        get_teenager_profile,
+    )
+
+# Exports are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AgentStatus": "src.models.content",
+        "ContentResult": "src.models.content",
+        "ContentType": "src.models.content",
+        "AgentTask": "src.models.decision",
+        "JudgeDecision": "src.models.decision",
+        "QueueMetrics": "src.models.metrics",
+        "QueueStatus": "src.models.metrics",
+        "SystemState": "src.models.output",
+        "TourGuideOutput": "src.models.output",
+        "Route": "src.models.route",
+        "RoutePoint": "src.models.route",
+        "AgeGroup": "src.models.user_profile",
+        "ContentPreference": "src.models.user_profile",
+        "Gender": "src.models.user_profile",
+        "ProfilePlan": "src.models.user_profile",
+        "TravelMode": "src.models.user_profile",
+        "TripPurpose": "src.models.user_profile",
+        "UserProfile": "src.models.user_profile",
+        "get_driver_profile": "src.models.user_profile",
+        "get_family_profile": "src.models.user_profile",
+        "get_kid_profile": "src.models.user_profile",
+        "get_senior_profile": "src.models.user_profile",
+        "get_teenager_profile": "src.models.user_profile",
+    },
 )
 
 __all__ = [
@@ -34,6 +70,7 @@ __all__ = [
     "AgentTask",
     # User Profile
     "UserProfile",
+    "ProfilePlan",
     "AgeGroup",
     "Gender",
     "TravelMode",
@@ -16,11 +16,18 @@ Profile Categories:
 5. ACCESSIBILITY: visual, hearing, mobility needs
 6. EXPERIENCE: familiarity with area, travel experience
 7. MOOD & ENERGY: current state, attention span
+
+Agents and the judge read a profile's prompt fragments and type weights
+for every point. UserProfile.compile() builds them once into a frozen
+ProfilePlan, which is reused until a field of the profile changes.
 """
 
+import hashlib
+from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 # =============================================================================
 # ENUMS - All profile options
@@ -192,6 +199,31 @@ class TimeOfDay(str, Enum):
     NIGHT = "night"  # Mysterious, nightlife
 
 
+# Order of ProfilePlan.preference_vector
+CONTENT_TYPES = ("video", "music", "text")
+
+
+@dataclass(frozen=True)
+class ProfilePlan:
+    """
+    Precompiled, immutable view of a UserProfile.
+
+    fingerprint identifies the profile's content (not the object), so it
+    can key caches of profile-dependent results across equal profiles.
+    """
+
+    fingerprint: str
+    agent_context: str
+    judge_criteria: str
+    music_search_context: str
+    preference_vector: tuple[float, ...]
+
+    @property
+    def preferences(self) -> dict[str, float]:
+        """Content type -> weight, as returned by get_content_type_preferences."""
+        return dict(zip(CONTENT_TYPES, self.preference_vector, strict=True))
+
+
 class UserProfile(BaseModel):
     """
     Comprehensive user profile for personalizing the tour guide.
@@ -398,11 +430,81 @@ class UserProfile(BaseModel):
         default_factory=list, description="IDs of content user disliked"
     )
 
+    # Compiled plan and the field values it was built from
+    _plan: ProfilePlan | None = PrivateAttr(default=None)
+    _plan_state: dict[str, Any] | None = PrivateAttr(default=None)
+
+    # =========================================================================
+    # COMPILED PLAN
+    # =========================================================================
+    def compile(self) -> ProfilePlan:
+        """
+        Get the precompiled plan for the current field values.
+
+        The plan is rebuilt when any field changed since the last call,
+        whether by assignment, model_copy(update=...) or in-place list edits.
+        """
+        # Read private attributes directly: BaseModel.__getattr__ is slow
+        private = self.__pydantic_private__ or {}
+        plan = private.get("_plan")
+        # One C-level dict comparison; lists in the snapshot are copies
+        if plan is None or private.get("_plan_state") != self.__dict__:
+            weights = self._build_content_type_preferences()
+            plan = ProfilePlan(
+                fingerprint=hashlib.sha256(
+                    self.model_dump_json().encode("utf-8")
+                ).hexdigest()[:16],
+                agent_context=self._build_agent_context(),
+                judge_criteria=self._build_judge_criteria(),
+                music_search_context=self._build_music_search_context(),
+                preference_vector=tuple(weights[key] for key in CONTENT_TYPES),
+            )
+            self._plan = plan
+            self._plan_state = {
+                key: list(value) if isinstance(value, list) else value
+                for key, value in self.__dict__.items()
+            }
+        return plan
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable content hash of the profile, for cache keys."""
+        return self.compile().fingerprint
+
     def to_agent_context(self) -> str:
         """
         Convert profile to context string for agents.
         This is injected into agent prompts.
         """
+        return self.compile().agent_context
+
+    def to_judge_criteria(self) -> str:
+        """
+        Convert profile to criteria for the judge agent.
+        Returns prioritized list of criteria for content selection.
+        """
+        return self.compile().judge_criteria
+
+    def get_content_type_preferences(self) -> dict[str, float]:
+        """
+        Get content type preference weights based on user profile.
+        Returns multipliers for VIDEO, MUSIC, TEXT scoring.
+
+        Higher = more preferred (1.0 = neutral, >1.0 = boost, <1.0 = penalty)
+        0.0 = strictly prohibited (e.g., video for drivers)
+        """
+        return self.compile().preferences
+
+    def get_music_search_context(self) -> str:
+        """Get context string for music agent searches."""
+        return self.compile().music_search_context
+
+    # =========================================================================
+    # PLAN BUILDERS
+    # =========================================================================
+
+    def _build_agent_context(self) -> str:
+        """Build the context string injected into agent prompts."""
         parts = []
 
         # ─────────────────────────────────────────────────────────────────
@@ -585,11 +687,8 @@ class UserProfile(BaseModel):
 
         return " ".join(parts) if parts else "No specific preferences."
 
-    def to_judge_criteria(self) -> str:
-        """
-        Convert profile to criteria for the judge agent.
-        Returns prioritized list of criteria for content selection.
-        """
+    def _build_judge_criteria(self) -> str:
+        """Build the prioritized criteria list for the judge agent."""
         criteria = []
 
         # ─────────────────────────────────────────────────────────────────
@@ -725,14 +824,8 @@ class UserProfile(BaseModel):
             else "- No specific criteria"
         )
 
-    def get_content_type_preferences(self) -> dict[str, float]:
-        """
-        Get content type preference weights based on user profile.
-        Returns multipliers for VIDEO, MUSIC, TEXT scoring.
-
-        Higher = more preferred (1.0 = neutral, >1.0 = boost, <1.0 = penalty)
-        0.0 = strictly prohibited (e.g., video for drivers)
-        """
+    def _build_content_type_preferences(self) -> dict[str, float]:
+        """Build the VIDEO/MUSIC/TEXT weights (0.0 = prohibited)."""
         weights = {"video": 1.0, "music": 1.0, "text": 1.0}
 
         # ─────────────────────────────────────────────────────────────────
@@ -816,8 +909,8 @@ class UserProfile(BaseModel):
 
         return weights
 
-    def get_music_search_context(self) -> str:
-        """Get context string for music agent searches."""
+    def _build_music_search_context(self) -> str:
+        """Build the context string for music agent searches."""
         parts = []
 
         if self.music_genres and MusicGenre.NO_PREFERENCE not in self.music_genres:
@@ -41,185 +41,300 @@ Academic References:
     - Sutton & Barto (2018). Reinforcement Learning: An Introduction.
 """
 
-# === MIT-LEVEL INNOVATIONS ===
-from .adaptive_learning import (
-    UCB,
-    AdaptiveAgentSelector,
-    # Data structures
-    AgentType,
-    BanditExperiment,
-    BanditStatistics,
-    Context,
-    ContextualThompsonSampling,
-    Reward,
-    # Multi-Armed Bandits
-    ThompsonSampling,
-)
-from .agent_negotiation import (
-    # Auction Components
-    AgentBid,
-    AuctionResult,
-    # Consensus
-    ConsensusProtocol,
-    # Cooperative Game Theory
-    CooperativeContentGame,
-    # Main Interface
-    MultiAgentNegotiationSystem,
-    # Nash Equilibrium
-    NashEquilibriumAnalyzer,
-    # Strategic Agents
-    StrategicAgent,
-    # VCG Mechanism
-    VCGAuction,
-)
-from .bayesian_optimization import (
-    # Optimization
-    BayesianOptimizer,
-    # Configuration Space
-    ConfigurationSpace,
-    # Acquisition Functions
-    ExpectedImprovement,
-    # Gaussian Process
-    GaussianProcess,
-    MaternKernel,
-    MultiObjectiveBO,
-    OptimizationHistory,
-    OptimizationResult,
-    Parameter,
-    ParameterType,
-    ProbabilityOfImprovement,
-    SquaredExponentialKernel,
-    ThompsonSamplingAcquisition,
-    UCBAcquisition,
-)
-from .causal_inference import (
-    # Analysis
-    AgentPerformanceAnalyzer,
-    CausalDiscovery,
-    CausalEdge,
-    # Estimators
-    CausalEffectEstimator,
-    CausalObservation,
-    CausalVariable,
-    # Structural Causal Models
-    StructuralCausalModel,
-    StructuralEquation,
-)
-from .experimental_framework import (
-    ExperimentConfig,
-    ExperimentResult,
-    ExperimentRunner,
-    ReproducibleExperiment,
-)
-from .explainability import (
-    # Counterfactuals
-    CounterfactualExplainer,
-    CounterfactualExplanation,
-    Decision,
-    # Integrated Engine
-    ExplainabilityEngine,
-    ExplanationType,
-    # Data structures
-    Feature,
-    FeatureValue,
-    # LIME
-    LIMEExplainer,
-    # Natural Language
-    NaturalLanguageExplainer,
-    # SHAP
-    SHAPExplainer,
-)
-from .graph_neural_content import (
-    GraphAttentionLayer,
-    # GNN Layers
-    GraphConvLayer,
-    # Graph Components
-    LocationNode,
-    LocationType,
-    # Positional Encoding
-    PositionalEncoding,
-    # Main Interface
-    RouteAwareContentSelector,
-    RouteEdge,
-    # GNN Model
-    RouteGNN,
-    RouteGraph,
-)
-from .information_theory import (
-    # Channel Theory
-    AgentUserChannel,
-    # Diversity
-    DiversityMetrics,
-    # Entropy
-    EntropyCalculator,
-    InformationTheoreticAnalysis,
-    # Complete Analysis
-    InformationTheoreticAnalyzer,
-    # Regret Bounds
-    InformationTheoreticRegretBounds,
-    KLDivergence,
-    MutualInformationCalculator,
-    # Rate-Distortion
-    RateDistortionAnalyzer,
-    RegretBoundResult,
-)
-from .meta_learning import (
-    # Meta-Learning Algorithms
-    MAML,
-    # Main Interface
-    ColdStartHandler,
-    # Preference Model
-    PreferenceModel,
-    # Prototypical Networks
-    PrototypicalNetworks,
-    Reptile,
-    Task,
-    # Data Structures
-    UserInteraction,
-    # Task Generator
-    create_synthetic_task_generator,
-)
+from typing import TYPE_CHECKING
 
-# === NEW GROUNDBREAKING INNOVATIONS ===
-from .sequential_optimization import (
-    DiversityConstrainedOptimizer,
-    # Reward Shaping
-    EmotionalArcReward,
-    EmotionalState,
-    # Main Interface
-    SequentialContentOptimizer,
-    # Policy
-    SoftmaxPolicy,
-    TourAction,
-    # MDP Components
-    TourState,
-)
-from .statistical_analysis import (
-    BootstrapAnalysis,
-    EffectSizeAnalysis,
-    HypothesisTest,
-    StatisticalComparison,
-)
-from .uncertainty_quantification import (
-    AdaptiveConformalPredictor,
-    AdaptiveProbabilityScore,
-    CalibrationResult,
-    # Conformal Predictors
-    ConformalPredictor,
-    # Conformity Scores
-    ConformityScore,
-    # Prediction Set
-    PredictionSet,
-    RAPSScore,
-    # Selective Prediction
-    SelectivePredictor,
-    SimpleProbabilityScore,
-    # Main Interface
-    UncertaintyAwareContentSelector,
-)
-from .visualization import (
-    ResearchVisualizer,
-    create_publication_figure,
+from src._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # === MIT-LEVEL INNOVATIONS ===
+    from .adaptive_learning import (
+        UCB,
+        AdaptiveAgentSelector,
+        # Data structures
+        AgentType,
+        BanditExperiment,
+        BanditStatistics,
+        Context,
+        ContextualThompsonSampling,
+        Reward,
+        # Multi-Armed Bandits
+        ThompsonSampling,
+    )
+    from .agent_negotiation import (
+        # Auction Components
+        AgentBid,
+        AuctionResult,
+        # Consensus
+        ConsensusProtocol,
+        # Cooperative Game Theory
+        CooperativeContentGame,
+        # Main Interface
+        MultiAgentNegotiationSystem,
+        # Nash Equilibrium
+        NashEquilibriumAnalyzer,
+        # Strategic Agents
+        StrategicAgent,
+        # VCG Mechanism
+        VCGAuction,
+    )
+    from .bayesian_optimization import (
+        # Optimization
+        BayesianOptimizer,
+        # Configuration Space
+        ConfigurationSpace,
+        # Acquisition Functions
+        ExpectedImprovement,
+        # Gaussian Process
+        GaussianProcess,
+        MaternKernel,
+        MultiObjectiveBO,
+        OptimizationHistory,
+        OptimizationResult,
+        Parameter,
+        ParameterType,
+        ProbabilityOfImprovement,
+        SquaredExponentialKernel,
+        ThompsonSamplingAcquisition,
+        UCBAcquisition,
+    )
+    from .causal_inference import (
+        # Analysis
+        AgentPerformanceAnalyzer,
+        CausalDiscovery,
+        CausalEdge,
+        # Estimators
+        CausalEffectEstimator,
+        CausalObservation,
+        CausalVariable,
+        # Structural Causal Models
+        StructuralCausalModel,
+        StructuralEquation,
+    )
+    from .experimental_framework import (
+        ExperimentConfig,
+        ExperimentResult,
+        ExperimentRunner,
+        ReproducibleExperiment,
+    )
+    from .explainability import (
+        # Counterfactuals
+        CounterfactualExplainer,
+        CounterfactualExplanation,
+        Decision,
+        # Integrated Engine
+        ExplainabilityEngine,
+        ExplanationType,
+        # Data structures
+        Feature,
+        FeatureValue,
+        # LIME
+        LIMEExplainer,
+        # Natural Language
+        NaturalLanguageExplainer,
+        # SHAP
+        SHAPExplainer,
+    )
+    from .graph_neural_content import (
+        GraphAttentionLayer,
+        # GNN Layers
+        GraphConvLayer,
+        # Graph Components
+        LocationNode,
+        LocationType,
+        # Positional Encoding
+        PositionalEncoding,
+        # Main Interface
+        RouteAwareContentSelector,
+        RouteEdge,
+        # GNN Model
+        RouteGNN,
+        RouteGraph,
+    )
+    from .information_theory import (
+        # Channel Theory
+        AgentUserChannel,
+        # Diversity
+        DiversityMetrics,
+        # Entropy
+        EntropyCalculator,
+        InformationTheoreticAnalysis,
+        # Complete Analysis
+        InformationTheoreticAnalyzer,
+        # Regret Bounds
+        InformationTheoreticRegretBounds,
+        KLDivergence,
+        MutualInformationCalculator,
+        # Rate-Distortion
+        RateDistortionAnalyzer,
+        RegretBoundResult,
+    )
+    from .meta_learning import (
+        # Meta-Learning Algorithms
+        MAML,
+        # Main Interface
+        ColdStartHandler,
+        # Preference Model
+        PreferenceModel,
+        # Prototypical Networks
+        PrototypicalNetworks,
+        Reptile,
+        Task,
+        # Data Structures
+        UserInteraction,
+        # Task Generator
+        create_synthetic_task_generator,
+    )
+
+    # === NEW GROUNDBREAKING INNOVATIONS ===
+    from .sequential_optimization import (
+        DiversityConstrainedOptimizer,
+        # Reward Shaping
+        EmotionalArcReward,
+        EmotionalState,
+        # Main Interface
+        SequentialContentOptimizer,
+        # Policy
+        SoftmaxPolicy,
+        TourAction,
+        # MDP Components
+        TourState,
+    )
+    from .statistical_analysis import (
+        BootstrapAnalysis,
+        EffectSizeAnalysis,
+        HypothesisTest,
+        StatisticalComparison,
+    )
+    from .uncertainty_quantification import (
+        AdaptiveConformalPredictor,
+        AdaptiveProbabilityScore,
+        CalibrationResult,
+        # Conformal Predictors
+        ConformalPredictor,
+        # Conformity Scores
+        ConformityScore,
+        # Prediction Set
+        PredictionSet,
+        RAPSScore,
+        # Selective Prediction
+        SelectivePredictor,
+        SimpleProbabilityScore,
+        # Main Interface
+        UncertaintyAwareContentSelector,
+    )
+    from .visualization import (
+        ResearchVisualizer,
+        create_publication_figure,
+    )
+
+# Exports are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "UCB": ".adaptive_learning",
+        "AdaptiveAgentSelector": ".adaptive_learning",
+        "AgentType": ".adaptive_learning",
+        "BanditExperiment": ".adaptive_learning",
+        "BanditStatistics": ".adaptive_learning",
+        "Context": ".adaptive_learning",
+        "ContextualThompsonSampling": ".adaptive_learning",
+        "Reward": ".adaptive_learning",
+        "ThompsonSampling": ".adaptive_learning",
+        "AgentBid": ".agent_negotiation",
+        "AuctionResult": ".agent_negotiation",
+        "ConsensusProtocol": ".agent_negotiation",
+        "CooperativeContentGame": ".agent_negotiation",
+        "MultiAgentNegotiationSystem": ".agent_negotiation",
+        "NashEquilibriumAnalyzer": ".agent_negotiation",
+        "StrategicAgent": ".agent_negotiation",
+        "VCGAuction": ".agent_negotiation",
+        "BayesianOptimizer": ".bayesian_optimization",
+        "ConfigurationSpace": ".bayesian_optimization",
+        "ExpectedImprovement": ".bayesian_optimization",
+        "GaussianProcess": ".bayesian_optimization",
+        "MaternKernel": ".bayesian_optimization",
+        "MultiObjectiveBO": ".bayesian_optimization",
+        "OptimizationHistory": ".bayesian_optimization",
+        "OptimizationResult": ".bayesian_optimization",
+        "Parameter": ".bayesian_optimization",
+        "ParameterType": ".bayesian_optimization",
+        "ProbabilityOfImprovement": ".bayesian_optimization",
+        "SquaredExponentialKernel": ".bayesian_optimization",
+        "ThompsonSamplingAcquisition": ".bayesian_optimization",
+        "UCBAcquisition": ".bayesian_optimization",
+        "AgentPerformanceAnalyzer": ".causal_inference",
+        "CausalDiscovery": ".causal_inference",
+        "CausalEdge": ".causal_inference",
+        "CausalEffectEstimator": ".causal_inference",
+        "CausalObservation": ".causal_inference",
+        "CausalVariable": ".causal_inference",
+        "StructuralCausalModel": ".causal_inference",
+        "StructuralEquation": ".causal_inference",
+        "ExperimentConfig": ".experimental_framework",
+        "ExperimentResult": ".experimental_framework",
+        "ExperimentRunner": ".experimental_framework",
+        "ReproducibleExperiment": ".experimental_framework",
+        "CounterfactualExplainer": ".explainability",
+        "CounterfactualExplanation": ".explainability",
+        "Decision": ".explainability",
+        "ExplainabilityEngine": ".explainability",
+        "ExplanationType": ".explainability",
+        "Feature": ".explainability",
+        "FeatureValue": ".explainability",
+        "LIMEExplainer": ".explainability",
+        "NaturalLanguageExplainer": ".explainability",
+        "SHAPExplainer": ".explainability",
+        "GraphAttentionLayer": ".graph_neural_content",
+        "GraphConvLayer": ".graph_neural_content",
+        "LocationNode": ".graph_neural_content",
+        "LocationType": ".graph_neural_content",
+        "PositionalEncoding": ".graph_neural_content",
+        "RouteAwareContentSelector": ".graph_neural_content",
+        "RouteEdge": ".graph_neural_content",
+        "RouteGNN": ".graph_neural_content",
+        "RouteGraph": ".graph_neural_content",
+        "AgentUserChannel": ".information_theory",
+        "DiversityMetrics": ".information_theory",
+        "EntropyCalculator": ".information_theory",
+        "InformationTheoreticAnalysis": ".information_theory",
+        "InformationTheoreticAnalyzer": ".information_theory",
+        "InformationTheoreticRegretBounds": ".information_theory",
+        "KLDivergence": ".information_theory",
+        "MutualInformationCalculator": ".information_theory",
+        "RateDistortionAnalyzer": ".information_theory",
+        "RegretBoundResult": ".information_theory",
+        "MAML": ".meta_learning",
+        "ColdStartHandler": ".meta_learning",
+        "PreferenceModel": ".meta_learning",
+        "PrototypicalNetworks": ".meta_learning",
+        "Reptile": ".meta_learning",
+        "Task": ".meta_learning",
+        "UserInteraction": ".meta_learning",
+        "create_synthetic_task_generator": ".meta_learning",
+        "DiversityConstrainedOptimizer": ".sequential_optimization",
+        "EmotionalArcReward": ".sequential_optimization",
+        "EmotionalState": ".sequential_optimization",
+        "SequentialContentOptimizer": ".sequential_optimization",
+        "SoftmaxPolicy": ".sequential_optimization",
+        "TourAction": ".sequential_optimization",
+        "TourState": ".sequential_optimization",
+        "BootstrapAnalysis": ".statistical_analysis",
+        "EffectSizeAnalysis": ".statistical_analysis",
+        "HypothesisTest": ".statistical_analysis",
+        "StatisticalComparison": ".statistical_analysis",
+        "AdaptiveConformalPredictor": ".uncertainty_quantification",
+        "AdaptiveProbabilityScore": ".uncertainty_quantification",
+        "CalibrationResult": ".uncertainty_quantification",
+        "ConformalPredictor": ".uncertainty_quantification",
+        "ConformityScore": ".uncertainty_quantification",
+        "PredictionSet": ".uncertainty_quantification",
+        "RAPSScore": ".uncertainty_quantification",
+        "SelectivePredictor": ".uncertainty_quantification",
+        "SimpleProbabilityScore": ".uncertainty_quantification",
+        "UncertaintyAwareContentSelector": ".uncertainty_quantification",
+        "ResearchVisualizer": ".visualization",
+        "create_publication_figure": ".visualization",
+    },
 )
 
 __all__ = [
@@ -5,6 +5,8 @@ Fetches directions and extracts waypoints with addresses.
 
 import re
 
+from src.core.observability.tracing import PIPELINE_TRACER, trace
+from src.core.transport import get_transports
 from src.models.route import Route, RoutePoint
 from src.utils.config import settings
 from src.utils.logger import get_logger, set_log_context
@@ -46,10 +48,14 @@ class GoogleMapsClient:
                 "Google Maps API key is required. Set GOOGLE_MAPS_API_KEY in .env"
             )
 
-        self.client = googlemaps.Client(key=self.api_key)
+        self.client = googlemaps.Client(
+            key=self.api_key,
+            requests_session=get_transports().requests_session("google_maps"),
+        )
         set_log_context(agent_type="route")
         logger.info("Google Maps client initialized")
 
+    @trace("maps.get_route", tracer_name=PIPELINE_TRACER)
     def get_route(
         self,
         origin: str,
@@ -185,6 +191,7 @@ class GoogleMapsClient:
             total_duration=total_duration,
         )
 
+    @trace("maps.reverse_geocode", tracer_name=PIPELINE_TRACER)
     def _get_address_from_location(self, lat: float, lng: float) -> str | None:
         """
         Reverse geocode to get address from coordinates.
@@ -270,6 +277,7 @@ class MockGoogleMapsClient:
     def __init__(self, api_key: str | None = None):
         logger.info("Using MOCK Google Maps client (for testing)")
 
+    @trace("maps.get_route", tracer_name=PIPELINE_TRACER)
     def get_route(self, origin: str, destination: str, **kwargs) -> Route:
         """Return a sample route for testing."""
         # Sample route in Israel
@@ -46,9 +46,77 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from src.core.observability.critical_path import analyze_trace, collect_trace
+from src.core.observability.metrics import Counter, Gauge, QuantileSketch
+from src.core.observability.timing import (
+    AgentTiming,
+    PointTiming,
+    StageTimer,
+    bind_timer,
+    summarize_timings,
+)
+from src.core.observability.tracing import (
+    PIPELINE_TRACER,
+    get_tracer,
+    submit_in_context,
+)
+
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Latency Sketches (p50/p95/p99 with ~1% relative error)
+# =============================================================================
+
+agent_latency = QuantileSketch(
+    "tour_agent_latency_seconds",
+    "Per-agent content search latency",
+    labels=["agent_type"],
+)
+
+point_latency = QuantileSketch(
+    "tour_point_latency_seconds",
+    "End-to-end latency of a single route point",
+)
+
+tour_latency = QuantileSketch(
+    "tour_latency_seconds",
+    "End-to-end latency of a complete tour",
+)
+
+
+# =============================================================================
+# Tour Counters (maintained on status transitions, O(1) to export)
+# =============================================================================
+
+tour_requests_total = Counter(
+    "tour_requests_total",
+    "Tours that have entered each status",
+    labels=["status"],
+)
+
+active_tours = Gauge(
+    "active_tours",
+    "Currently processing tours",
+)
+
+tour_service_api_mode = Gauge(
+    "tour_service_api_mode",
+    "Current API mode",
+    labels=["mode"],
+)
+_api_mode_lock = threading.Lock()
+
+
+def _set_api_mode_metric(mode: str) -> None:
+    """Set the current mode's gauge to 1 and every other mode's to 0."""
+    with _api_mode_lock:
+        for sample in tour_service_api_mode.collect():
+            if sample.labels["mode"] != mode and sample.value:
+                tour_service_api_mode.set(0, mode=sample.labels["mode"])
+        tour_service_api_mode.set(1, mode=mode)
+
+
 # =============================================================================
 # Tour State Management
 # =============================================================================
@@ -89,6 +157,7 @@ class AgentResult:
     duration_seconds: float = 0.0
     error: str | None = None
     raw_result: Any = None
+    timing: AgentTiming | None = None
 
 
 @dataclass
@@ -102,6 +171,7 @@ class PointResult:
     winner: AgentResult | None = None
     judge_reasoning: str | None = None
     processing_time_seconds: float = 0.0
+    timing: PointTiming | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
@@ -137,12 +207,23 @@ class TourStore:
 
     In production, this would be backed by Redis or a database.
     For MIT demo, in-memory with proper locking is sufficient.
+
+    Per-status counts are maintained on every status transition, so
+    count_by_status() and the exported tour metrics never scan tours.
+
+    Parameters:
+        export_metrics: Maintain the process-wide tour metrics
+            (active_tours, tour_requests_total). Only the global store
+            does, so extra stores (tests, tools) don't skew them.
     """
 
-    def __init__(self):
+    def __init__(self, export_metrics: bool = False):
+        self.export_metrics = export_metrics
         self._tours: dict[str, TourState] = {}
         self._lock = threading.RLock()
-        self._subscribers: dict[str, list[Callable]] = {}
+        # Keyed by tour ID; None holds subscribers to every tour
+        self._subscribers: dict[str | None, list[Callable]] = {}
+        self._status_counts: dict[str, int] = {}
 
     def create(
         self, tour_id: str, source: str, destination: str, profile: dict
@@ -155,7 +236,9 @@ class TourStore:
                 destination=destination,
                 profile=profile,
             )
+            previous = self._tours.get(tour_id)
             self._tours[tour_id] = tour
+            self._record_transition(previous.status if previous else None, tour.status)
             return tour
 
     def get(self, tour_id: str) -> TourState | None:
@@ -168,9 +251,12 @@ class TourStore:
         with self._lock:
             tour = self._tours.get(tour_id)
             if tour:
+                previous_status = tour.status
                 for key, value in updates.items():
                     if hasattr(tour, key):
                         setattr(tour, key, value)
+                if tour.status != previous_status:
+                    self._record_transition(previous_status, tour.status)
                 self._notify_subscribers(tour_id, tour)
             return tour
 
@@ -182,19 +268,50 @@ class TourStore:
     def delete(self, tour_id: str) -> bool:
         """Delete a tour."""
         with self._lock:
-            if tour_id in self._tours:
-                del self._tours[tour_id]
-                return True
-            return False
+            tour = self._tours.pop(tour_id, None)
+            if tour is None:
+                return False
+            self._record_transition(tour.status, None)
+            return True
 
-    def subscribe(self, tour_id: str, callback: Callable[[TourState], None]):
-        """Subscribe to tour updates."""
+    def count_by_status(self) -> dict[str, int]:
+        """Number of stored tours in each status."""
+        with self._lock:
+            return {
+                status: count for status, count in self._status_counts.items() if count
+            }
+
+    def _record_transition(
+        self, old: TourStatus | str | None, new: TourStatus | str | None
+    ) -> None:
+        """Update status counts and metrics. Caller must hold the lock."""
+        if old is not None:
+            old = getattr(old, "value", old)
+            self._status_counts[old] = self._status_counts.get(old, 0) - 1
+            if self.export_metrics and old == TourStatus.PROCESSING.value:
+                active_tours.dec()
+
+        if new is not None:
+            new = getattr(new, "value", new)
+            self._status_counts[new] = self._status_counts.get(new, 0) + 1
+            if self.export_metrics:
+                tour_requests_total.inc(status=new)
+                if new == TourStatus.PROCESSING.value:
+                    active_tours.inc()
+
+    def subscribe(self, tour_id: str | None, callback: Callable[[TourState], None]):
+        """
+        Subscribe to tour updates (tour_id=None: updates of every tour).
+
+        Callbacks run on the updating thread while the store lock is held,
+        so they must be quick and must not block on other threads.
+        """
         with self._lock:
             if tour_id not in self._subscribers:
                 self._subscribers[tour_id] = []
             self._subscribers[tour_id].append(callback)
 
-    def unsubscribe(self, tour_id: str, callback: Callable):
+    def unsubscribe(self, tour_id: str | None, callback: Callable):
         """Unsubscribe from tour updates."""
         with self._lock:
             if tour_id in self._subscribers:
@@ -204,7 +321,10 @@ class TourStore:
 
     def _notify_subscribers(self, tour_id: str, tour: TourState):
         """Notify all subscribers of a tour update."""
-        subscribers = self._subscribers.get(tour_id, [])
+        subscribers = [
+            *self._subscribers.get(tour_id, []),
+            *self._subscribers.get(None, []),
+        ]
         for callback in subscribers:
             try:
                 callback(tour)
@@ -213,7 +333,7 @@ class TourStore:
 
 
 # Global tour store instance
-_tour_store = TourStore()
+_tour_store = TourStore(export_metrics=True)
 
 
 def get_tour_store() -> TourStore:
@@ -245,6 +365,7 @@ class TourService:
             max_workers=10, thread_name_prefix="TourService"
         )
         self._api_mode = os.environ.get("TOUR_GUIDE_API_MODE", "auto")
+        _set_api_mode_metric(self._api_mode)
         self._agents_available = self._check_agents_available()
         self._api_keys_available = self._check_api_keys()
         self._api_status = self._get_api_status()
@@ -375,11 +496,21 @@ class TourService:
         │ Google Maps │     │ Scheduler   │     │ Orchestrator│     │ Output      │
         │ (Route)     │     │ (Emit Pts)  │     │ (Agents)    │     │ (Playlist)  │
         └─────────────┘     └─────────────┘     └─────────────┘     └─────────────┘
+
+        Each step runs under a span of one trace per tour; the trace ID is
+        kept in tour.metrics["trace_id"] for get_critical_path().
         """
         tour = self.store.get(tour_id)
         if not tour:
             return
 
+        with get_tracer(PIPELINE_TRACER).span("tour") as span:
+            span.set_attribute("tour.id", tour_id)
+            tour.metrics["trace_id"] = span.context.trace_id
+            self._run_tour_pipeline(tour_id, tour)
+
+    def _run_tour_pipeline(self, tour_id: str, tour: TourState):
+        tracer = get_tracer(PIPELINE_TRACER)
         try:
             # ================================================================
             # STEP 1: GOOGLE MAPS API - Fetch Route
@@ -392,7 +523,8 @@ class TourService:
                 tour_id, status=TourStatus.FETCHING_ROUTE, started_at=datetime.now()
             )
 
-            route = self._fetch_route(tour.source, tour.destination)
+            with tracer.span("route.fetch"):
+                route = self._fetch_route(tour.source, tour.destination)
             logger.info(f"   ✅ Route fetched: {len(route['points'])} points")
 
             # ================================================================
@@ -402,22 +534,23 @@ class TourService:
             logger.info("⏰ STEP 2: Scheduler preparing point emission...")
             logger.info("=" * 60)
 
-            self.store.update(
-                tour_id,
-                status=TourStatus.SCHEDULING,
-                total_points=len(route["points"]),
-                route_info=route,
-            )
-
-            # Initialize point results (Scheduler prepares the queue)
-            points = [
-                PointResult(
-                    point_index=i,
-                    point_name=p["name"],
+            with tracer.span("scheduler.prepare"):
+                self.store.update(
+                    tour_id,
+                    status=TourStatus.SCHEDULING,
+                    total_points=len(route["points"]),
+                    route_info=route,
                 )
-                for i, p in enumerate(route["points"])
-            ]
-            self.store.update(tour_id, points=points)
+
+                # Initialize point results (Scheduler prepares the queue)
+                points = [
+                    PointResult(
+                        point_index=i,
+                        point_name=p["name"],
+                    )
+                    for i, p in enumerate(route["points"])
+                ]
+                self.store.update(tour_id, points=points)
             logger.info(f"   ✅ Scheduler ready: {len(points)} points queued")
 
             # ================================================================
@@ -442,11 +575,15 @@ class TourService:
                 )
 
             # Step 3: Complete
-            self.store.update(
+            completed = self.store.update(
                 tour_id,
                 status=TourStatus.COMPLETED,
                 completed_at=datetime.now(),
             )
+            if completed and completed.started_at and completed.completed_at:
+                tour_latency.observe(
+                    (completed.completed_at - completed.started_at).total_seconds()
+                )
 
             logger.info(f"✅ Tour {tour_id} completed successfully")
 
@@ -513,59 +650,102 @@ class TourService:
         self, tour_id: str, point_index: int, point_data: dict, profile: dict
     ):
         """Process a single route point with parallel agents."""
+        with get_tracer(PIPELINE_TRACER).span("point.process") as span:
+            span.set_attribute("point.index", point_index)
+            span.set_attribute("point.name", point_data["name"])
+            self._process_point_stages(tour_id, point_index, point_data, profile)
+
+    def _process_point_stages(
+        self, tour_id: str, point_index: int, point_data: dict, profile: dict
+    ):
+        tracer = get_tracer(PIPELINE_TRACER)
         start_time = time.time()
+        stages = StageTimer()
+
+        def update_point(**changes):
+            with stages.stage("store"):
+                self.store.update(tour_id, **changes)
 
         # Update point status
         tour = self.store.get(tour_id)
         if tour and tour.points and len(tour.points) > point_index:
             tour.points[point_index].status = PointStatus.AGENTS_RUNNING
             tour.points[point_index].started_at = datetime.now()
-            self.store.update(tour_id, points=tour.points)
+            update_point(points=tour.points)
 
-        logger.info(f"📍 Processing point {point_index + 1}: {point_data['name']}")
+        logger.info("📍 Processing point %d: %s", point_index + 1, point_data["name"])
 
         use_real = self._should_use_real_apis()
 
-        if use_real:
-            agent_results = self._run_real_agents(point_data, profile)
-        else:
-            agent_results = self._run_mock_agents(point_data, profile)
+        with tracer.span("agents.run"), stages.stage("agents"):
+            if use_real:
+                agent_results = self._run_real_agents(point_data, profile)
+            else:
+                agent_results = self._run_mock_agents(point_data, profile)
 
         # Update with agent results
         tour = self.store.get(tour_id)
         if tour and tour.points and len(tour.points) > point_index:
             tour.points[point_index].status = PointStatus.QUEUE_WAITING
             tour.points[point_index].agent_results = agent_results
-            self.store.update(tour_id, points=tour.points)
+            update_point(points=tour.points)
 
         # Run judge
         tour = self.store.get(tour_id)
         if tour and tour.points and len(tour.points) > point_index:
             tour.points[point_index].status = PointStatus.JUDGE_EVALUATING
-            self.store.update(tour_id, points=tour.points)
+            update_point(points=tour.points)
 
-        winner, reasoning = self._run_judge(
-            agent_results, point_data, profile, use_real
-        )
+        judge_stages = StageTimer()
+        with tracer.span("judge.run"), stages.stage("judge"), bind_timer(judge_stages):
+            winner, reasoning = self._run_judge(
+                agent_results, point_data, profile, use_real
+            )
 
         # Complete the point
         elapsed = time.time() - start_time
+        point_latency.observe(elapsed)
+        timing = self._point_timing(elapsed, stages, judge_stages, agent_results)
         tour = self.store.get(tour_id)
         if tour and tour.points and len(tour.points) > point_index:
             tour.points[point_index].status = PointStatus.COMPLETED
             tour.points[point_index].winner = winner
             tour.points[point_index].judge_reasoning = reasoning
             tour.points[point_index].processing_time_seconds = elapsed
+            tour.points[point_index].timing = timing
             tour.points[point_index].completed_at = datetime.now()
             tour.completed_points = sum(
                 1 for p in tour.points if p.status == PointStatus.COMPLETED
             )
-            self.store.update(
-                tour_id, points=tour.points, completed_points=tour.completed_points
-            )
+            # Final: subscribers (e.g. the dashboard) record the timing now,
+            # so store_update_ms covers the updates before this one
+            update_point(points=tour.points, completed_points=tour.completed_points)
 
         logger.info(
-            f"   🏆 Winner: {winner.agent_type if winner else 'None'} - {winner.title if winner else 'N/A'}"
+            "   🏆 Winner: %s - %s",
+            winner.agent_type if winner else "None",
+            winner.title if winner else "N/A",
+        )
+
+    @staticmethod
+    def _point_timing(
+        elapsed: float,
+        stages: StageTimer,
+        judge_stages: StageTimer,
+        agent_results: list[AgentResult],
+    ) -> PointTiming:
+        """Build the latency breakdown of a point from its stage timers."""
+        agents = {r.agent_type.lower(): r.timing for r in agent_results if r.timing}
+        agents_seconds = stages.get("agents")
+        slowest = max((a.total_ms for a in agents.values()), default=0.0) / 1000
+        return PointTiming(
+            total_ms=round(elapsed * 1000, 3),
+            agents_ms=round(agents_seconds * 1000, 3),
+            queue_wait_ms=round(max(agents_seconds - slowest, 0.0) * 1000, 3),
+            judge_ms=round(stages.get("judge") * 1000, 3),
+            judge_llm_ms=round(judge_stages.get("llm") * 1000, 3),
+            store_update_ms=round(stages.get("store") * 1000, 3),
+            agents=agents,
         )
 
     def _run_real_agents(self, point_data: dict, profile: dict) -> list[AgentResult]:
@@ -587,11 +767,19 @@ class TourService:
         results_lock = threading.Lock()
 
         def run_agent(agent_class, agent_type: str):
+            with get_tracer(PIPELINE_TRACER).span("agent.run") as span:
+                span.set_attribute("agent.type", agent_type.lower())
+                _run_agent(agent_class, agent_type)
+
+        def _run_agent(agent_class, agent_type: str):
             start = time.time()
+            stages = StageTimer()
             try:
                 agent = agent_class()
-                result = agent.execute(route_point)
+                with bind_timer(stages):
+                    result = agent.execute(route_point)
                 elapsed = time.time() - start
+                timing = AgentTiming.from_timer(agent_type.lower(), stages, elapsed)
 
                 if result:
                     agent_result = AgentResult(
@@ -604,6 +792,7 @@ class TourService:
                         url=result.url,
                         duration_seconds=elapsed,
                         raw_result=result,
+                        timing=timing,
                     )
                 else:
                     agent_result = AgentResult(
@@ -611,17 +800,23 @@ class TourService:
                         success=False,
                         duration_seconds=elapsed,
                         error="No result returned",
+                        timing=timing,
                     )
 
                 with results_lock:
                     results.append(agent_result)
+                agent_latency.observe(elapsed, agent_type=agent_type)
 
                 logger.info(
-                    f"   ✅ {agent_type} Agent: {result.title if result else 'No result'} [{elapsed:.1f}s]"
+                    "   ✅ %s Agent: %s [%.1fs]",
+                    agent_type,
+                    result.title if result else "No result",
+                    elapsed,
                 )
 
             except Exception as e:
                 elapsed = time.time() - start
+                agent_latency.observe(elapsed, agent_type=agent_type)
                 logger.warning(f"   ❌ {agent_type} Agent failed: {e}")
                 with results_lock:
                     results.append(
@@ -630,15 +825,18 @@ class TourService:
                             success=False,
                             duration_seconds=elapsed,
                             error=str(e),
+                            timing=AgentTiming.from_timer(
+                                agent_type.lower(), stages, elapsed
+                            ),
                         )
                     )
 
         # Run agents in parallel
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = [
-                executor.submit(run_agent, VideoAgent, "VIDEO"),
-                executor.submit(run_agent, MusicAgent, "MUSIC"),
-                executor.submit(run_agent, TextAgent, "TEXT"),
+                submit_in_context(executor, run_agent, VideoAgent, "VIDEO"),
+                submit_in_context(executor, run_agent, MusicAgent, "MUSIC"),
+                submit_in_context(executor, run_agent, TextAgent, "TEXT"),
             ]
             for future in as_completed(futures, timeout=30):
                 try:
@@ -685,8 +883,13 @@ class TourService:
         ]
 
         for r in results:
+            # Mock agents do no staged work; their whole time is "other"
+            r.timing = AgentTiming.from_timer(
+                r.agent_type.lower(), StageTimer(), r.duration_seconds
+            )
+            agent_latency.observe(r.duration_seconds, agent_type=r.agent_type)
             logger.info(
-                f"   ✅ {r.agent_type} Agent: {r.title} [{r.duration_seconds:.1f}s]"
+                "   ✅ %s Agent: %s [%.1fs]", r.agent_type, r.title, r.duration_seconds
             )
 
         return results
@@ -781,6 +984,35 @@ class TourService:
 
         return successful[0], f"Default selection for {point_data['name']}"
 
+    def get_latency_percentiles(self) -> dict[str, Any]:
+        """p50/p95/p99 latency for agents, points and tours (seconds)."""
+        return {
+            "agents": {
+                labels["agent_type"]: agent_latency.get_quantiles(**labels)
+                for labels in agent_latency.label_sets()
+            },
+            "point": point_latency.get_quantiles(),
+            "tour": tour_latency.get_quantiles(),
+        }
+
+    def get_critical_path(self, tour_id: str) -> dict | None:
+        """
+        Critical-path report for a finished tour.
+
+        Lists, per point, the stage and agent that set the point's latency.
+        Returns None if the tour is unknown, still running, or its trace has
+        been evicted from the tracer buffer.
+        """
+        tour = self.store.get(tour_id)
+        trace_id = tour.metrics.get("trace_id") if tour else None
+        if not trace_id:
+            return None
+
+        report = analyze_trace(collect_trace(trace_id))
+        if report is None:
+            return None
+        return {"tour_id": tour_id, **report.to_dict()}
+
     def get_tour_summary(self, tour_id: str) -> dict | None:
         """Get a summary of the tour suitable for API response."""
         tour = self.store.get(tour_id)
@@ -838,6 +1070,7 @@ class TourService:
                         },
                         "reasoning": point.judge_reasoning,
                         "processing_time_seconds": point.processing_time_seconds,
+                        "timing": point.timing.to_dict() if point.timing else None,
                         "all_candidates": [
                             {
                                 "agent_type": r.agent_type,
@@ -863,6 +1096,9 @@ class TourService:
                 "completed_points": tour.completed_points,
                 "successful_decisions": len([p for p in tour.points if p.winner]),
                 "content_distribution": content_distribution,
+                "timing": summarize_timings(
+                    [p.timing for p in tour.points if p.timing]
+                ),
             },
             "created_at": tour.created_at.isoformat(),
             "completed_at": tour.completed_at.isoformat()
@@ -5,20 +5,26 @@ Utility modules for the Multi-Agent Tour Guide system.
 from src.utils.config import AGENT_SKILLS, settings
 from src.utils.logger import (
     clear_log_context,
+    configure_logging,
     get_logger,
     log_agent_error,
     log_agent_result,
     log_agent_start,
+    log_context,
     log_judge_decision,
     set_log_context,
+    shutdown_logging,
 )
 
 __all__ = [
     "settings",
     "AGENT_SKILLS",
     "get_logger",
+    "configure_logging",
+    "shutdown_logging",
     "set_log_context",
     "clear_log_context",
+    "log_context",
     "log_agent_start",
     "log_agent_result",
     "log_agent_error",
@@ -39,14 +39,43 @@ class Settings(BaseSettings):
     llm_provider: str = Field(default="anthropic", alias="LLM_PROVIDER")
     llm_model: str = Field(default="claude-sonnet-4-20250514", alias="LLM_MODEL")
     llm_temperature: float = Field(default=0.7, alias="LLM_TEMPERATURE")
+    # Default completion budget; prompts with short answers set their own
+    llm_max_tokens: int = Field(default=1024, alias="LLM_MAX_TOKENS")
+    # Stream responses so callers can act on (or stop at) partial output
+    llm_streaming: bool = Field(default=True, alias="LLM_STREAMING")
+    # Estimated input tokens (system + user prompt) per judge call
+    llm_input_budget_tokens: int = Field(default=800, alias="LLM_INPUT_BUDGET_TOKENS")
+
+    # Judge (rule-score lead that skips the LLM judge; negative = always LLM)
+    judge_fast_margin: float = Field(default=2.0, alias="JUDGE_FAST_MARGIN")
+    judge_shadow_rate: float = Field(default=0.0, alias="JUDGE_SHADOW_RATE")
+    # Batched judging (points per LLM call, wait for a batch to fill, and the
+    # longest a point waits for its verdict: a batch ahead of it, its own
+    # batched call and any per-point fallback)
+    judge_batch_size: int = Field(default=8, alias="JUDGE_BATCH_SIZE")
+    judge_batch_wait_ms: float = Field(default=50.0, alias="JUDGE_BATCH_WAIT_MS")
+    judge_batch_timeout_seconds: float = Field(
+        default=120.0, alias="JUDGE_BATCH_TIMEOUT_SECONDS"
+    )
 
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
     log_file: str = Field(default="tour_guide.log", alias="LOG_FILE")
+    log_format: str = Field(default="console", alias="LOG_FORMAT")
+    log_async: bool = Field(default=False, alias="LOG_ASYNC")
+    log_sample_rates: str = Field(default="", alias="LOG_SAMPLE_RATES")
+
+    # Profiling (opt-in sampling profiler behind /admin/profile)
+    profiling_enabled: bool = Field(default=False, alias="PROFILING_ENABLED")
+    profiling_hz: float = Field(default=100.0, alias="PROFILING_HZ")
 
     # Threading
     max_concurrent_threads: int = Field(default=12, alias="MAX_CONCURRENT_THREADS")
 
+    # Shared HTTP transports (HTTP/2 also needs the optional h2 package)
+    http2_enabled: bool = Field(default=True, alias="HTTP2_ENABLED")
+    http_keepalive_seconds: float = Field(default=30.0, alias="HTTP_KEEPALIVE_SECONDS")
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
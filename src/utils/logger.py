@@ -1,14 +1,53 @@
 """
-Logging setup with colored console output.
+Logging setup with colored console or JSON-lines output.
 Provides thread-safe logging for the multi-agent system.
+
+All loggers returned by get_logger share one handler chain, configured
+once by configure_logging (or lazily from settings):
+
+    console: RichHandler (or stdout) rendering "[point][agent] message"
+    json:    one JSON object per line, with point/agent context and extras
+
+With use_queue=True records are only put on a queue by the calling
+thread; a QueueListener thread does the rendering and I/O, so slow
+console output never blocks agents.
+
+Point/agent context lives in contextvars, so it follows asyncio tasks and
+executor work submitted with a copied context instead of leaking between
+threads. Per-module sampling thins high-volume INFO/DEBUG logs; warnings
+and errors are always kept.
+
+Example:
+    configure_logging(
+        format="json",
+        use_queue=True,
+        sample_rates={"src.core.smart_queue": 0.1},
+    )
+
+    with log_context(point_id="p1", agent_type="video"):
+        logger.info("Found %d candidates", len(results))
 """
 
+import atexit
+import contextvars
+import json
 import logging
+import logging.handlers
+import queue
 import sys
 import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import IO, Any
 
-# Thread-local storage for context
-_thread_local = threading.local()
+# Context for the current thread / asyncio task
+_point_id: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "log_point_id", default="-"
+)
+_agent_type: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "log_agent_type", default="-"
+)
 
 # Try to import rich for colored output
 try:
@@ -19,71 +58,329 @@ try:
 except ImportError:
     HAS_RICH = False
 
+LOG_FORMATS = ("console", "json")
+
 
 def set_log_context(point_id: str | None = None, agent_type: str | None = None):
-    """Set logging context for the current thread."""
+    """Set logging context for the current thread or task."""
     if point_id is not None:
-        _thread_local.point_id = point_id
+        _point_id.set(point_id)
     if agent_type is not None:
-        _thread_local.agent_type = agent_type
+        _agent_type.set(agent_type)
 
 
 def clear_log_context():
-    """Clear logging context for the current thread."""
-    _thread_local.point_id = "-"
-    _thread_local.agent_type = "-"
+    """Clear logging context for the current thread or task."""
+    _point_id.set("-")
+    _agent_type.set("-")
+
+
+@contextmanager
+def log_context(
+    point_id: str | None = None, agent_type: str | None = None
+) -> Iterator[None]:
+    """Set logging context for a block and restore the previous one after."""
+    tokens = []
+    if point_id is not None:
+        tokens.append((_point_id, _point_id.set(point_id)))
+    if agent_type is not None:
+        tokens.append((_agent_type, _agent_type.set(agent_type)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
 
 
 class ContextFilter(logging.Filter):
     """Add context information to log records."""
 
     def filter(self, record):
-        record.thread_name = threading.current_thread().name
-        record.point_id = getattr(_thread_local, "point_id", "-")
-        record.agent_type = getattr(_thread_local, "agent_type", "-")
+        record.thread_name = record.threadName
+        record.point_id = _point_id.get()
+        record.agent_type = _agent_type.get()
         record.context = f"[{record.point_id}][{record.agent_type}]"
         return True
 
 
-def get_logger(name: str = "tour_guide") -> logging.Logger:
+class SamplingFilter(logging.Filter):
     """
-    Get a configured logger.
+    Keep a fixed fraction of INFO-and-below records per module.
 
-    Args:
-        name: Logger name
+    Rates are matched on the longest logger-name prefix. Sampling is
+    deterministic (the first record, then every 1/rate-th), so a rate of
+    0.1 keeps exactly one record in ten.
 
-    Returns:
-        Configured logger instance
+    Parameters:
+        rates: Logger name prefix -> fraction of records to keep (0..1)
     """
-    logger = logging.getLogger(name)
 
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
+    def __init__(self, rates: dict[str, float] | None = None):
+        super().__init__()
+        self.rates = dict(rates or {})
+        self._resolved: dict[str, float] = {}
+        self._credit: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def rate_for(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            best = -1
+            for prefix, value in self.rates.items():
+                matches = name == prefix or name.startswith(prefix + ".")
+                if matches and len(prefix) > best:
+                    rate, best = value, len(prefix)
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record):
+        if record.levelno > logging.INFO:
+            return True
+        rate = self.rate_for(record.name)
+        if rate >= 1.0:
+            return True
 
-    logger.setLevel(logging.DEBUG)
+        with self._lock:
+            # Start with enough credit that the first record is kept
+            credit = self._credit.get(record.name, 1.0 - rate) + rate
+            keep = credit >= 1.0 - 1e-9 and rate > 0
+            self._credit[record.name] = credit - 1.0 if keep else credit
+            if not keep:
+                self.dropped += 1
+        return keep
 
-    # Add context filter
-    context_filter = ContextFilter()
-    logger.addFilter(context_filter)
 
-    # Console handler
+# Attributes every LogRecord has; anything else came from `extra=`
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message",
+    "asctime",
+    "thread_name",
+    "point_id",
+    "agent_type",
+    "context",
+}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Render records as single-line JSON objects."""
+
+    def format(self, record):
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "point_id": getattr(record, "point_id", "-"),
+            "agent_type": getattr(record, "agent_type", "-"),
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+# ============== Configuration ==============
+
+
+class _LoggingState:
+    """Shared handler chain for all loggers returned by get_logger."""
+
+    def __init__(self):
+        # Reentrant: get_logger configures logging while holding it
+        self.lock = threading.RLock()
+        self.handler: logging.Handler | None = None
+        self.listener: logging.handlers.QueueListener | None = None
+        self.level = logging.INFO
+        self.sampling: SamplingFilter | None = None
+        self.loggers: set[str] = set()
+
+
+_state = _LoggingState()
+
+
+def _parse_sample_rates(spec: str) -> dict[str, float]:
+    """Parse "module=rate,module=rate" (as used by LOG_SAMPLE_RATES)."""
+    rates = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, rate = item.split("=", 1)
+            rates[name.strip()] = float(rate)
+    return rates
+
+
+def _build_output_handler(format: str, stream: IO[str] | None) -> logging.Handler:
     handler: logging.Handler
+    if format == "json":
+        handler = logging.StreamHandler(stream or sys.stdout)
+        handler.setFormatter(JsonLinesFormatter())
+        return handler
+
     if HAS_RICH:
-        console = Console()
-        handler = RichHandler(
-            console=console,
-            show_time=True,
-            show_path=False,
+        console = Console(file=stream) if stream is not None else Console()
+        handler = RichHandler(console=console, show_time=True, show_path=False)
+    else:
+        handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter("%(context)s %(message)s"))
+    return handler
+
+
+def configure_logging(
+    level: str | int | None = None,
+    format: str | None = None,
+    use_queue: bool | None = None,
+    sample_rates: dict[str, float] | None = None,
+    stream: IO[str] | None = None,
+) -> None:
+    """
+    (Re)configure the handler chain shared by all project loggers.
+
+    Unset arguments fall back to settings (LOG_LEVEL, LOG_FORMAT,
+    LOG_ASYNC, LOG_SAMPLE_RATES).
+
+    Args:
+        level: Minimum level; lower-level calls return before building a record
+        format: "console" or "json"
+        use_queue: Render and write records on a background listener thread
+        sample_rates: Logger name prefix -> fraction of INFO/DEBUG kept
+        stream: Output stream (defaults to stdout / the rich console)
+    """
+    from src.utils.config import settings
+
+    level = level if level is not None else settings.log_level
+    format = format or settings.log_format
+    use_queue = settings.log_async if use_queue is None else use_queue
+    if sample_rates is None:
+        sample_rates = _parse_sample_rates(settings.log_sample_rates)
+
+    if format not in LOG_FORMATS:
+        raise ValueError(f"Unknown log format '{format}', expected {LOG_FORMATS}")
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.INFO
+
+    output = _build_output_handler(format, stream)
+    sampling = SamplingFilter(sample_rates)
+
+    handler: logging.Handler
+    listener = None
+    if use_queue:
+        # Filters run on the caller's thread so context is captured there
+        handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        listener = logging.handlers.QueueListener(
+            handler.queue, output, respect_handler_level=True
         )
     else:
-        handler = logging.StreamHandler(sys.stdout)
+        handler = output
+    handler.addFilter(sampling)
+    handler.addFilter(ContextFilter())
+
+    with _state.lock:
+        old_handler, old_listener = _state.handler, _state.listener
+        _state.handler = handler
+        _state.listener = listener
+        _state.level = level
+        _state.sampling = sampling
+        if listener is not None:
+            listener.start()
+        for name in _state.loggers:
+            _attach(logging.getLogger(name), old_handler)
+
+    if old_listener is not None:
+        old_listener.stop()
+    if old_handler is not None:
+        old_handler.close()
+
+
+def _attach(logger: logging.Logger, old_handler: logging.Handler | None) -> None:
+    if old_handler is not None:
+        logger.removeHandler(old_handler)
+    logger.addHandler(_state.handler)
+    logger.setLevel(_state.level)
+
+
+class _ForwardingHandler(logging.Handler):
+    """Hands records straight to another handler (replaces a stopped queue)."""
+
+    def __init__(self, target: logging.Handler):
+        super().__init__()
+        self.target = target
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.target.handle(record)
+
+    def flush(self) -> None:
+        self.target.flush()
+
+    def close(self) -> None:
+        self.target.close()
+        super().close()
+
+
+def shutdown_logging() -> None:
+    """
+    Drain the queue listener (if any) and flush output.
+
+    Loggers are switched to writing directly first, so records logged
+    after shutdown (e.g. by later atexit handlers) are still written.
+    """
+    with _state.lock:
+        listener, _state.listener = _state.listener, None
+        if listener is None:
+            return
+        queue_handler = _state.handler
+        direct = _ForwardingHandler(listener.handlers[0])
+        for log_filter in queue_handler.filters if queue_handler else ():
+            direct.addFilter(log_filter)
+        _state.handler = direct
+        for name in _state.loggers:
+            _attach(logging.getLogger(name), queue_handler)
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+    if queue_handler is not None:
+        queue_handler.close()
+
+
+def get_logging_stats() -> dict[str, Any]:
+    """Get logging pipeline statistics."""
+    handler = _state.handler
+    return {
+        "level": logging.getLevelName(_state.level),
+        "queued": isinstance(handler, logging.handlers.QueueHandler),
+        "loggers": len(_state.loggers),
+        "sampled_out": _state.sampling.dropped if _state.sampling else 0,
+    }
+
+
+atexit.register(shutdown_logging)
+
+
+def get_logger(name: str = "tour_guide") -> logging.Logger:
+    """
+    Get a configured logger.
+
+    Args:
+        name: Logger name
+
+    Returns:
+        Configured logger instance
+    """
+    logger = logging.getLogger(name)
 
-    handler.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(context)s %(message)s")
-    handler.setFormatter(formatter)
-    handler.addFilter(context_filter)
-    logger.addHandler(handler)
+    with _state.lock:
+        if _state.handler is None:
+            configure_logging()
+        # Avoid duplicate handlers
+        if name not in _state.loggers:
+            _state.loggers.add(name)
+            _attach(logger, None)
 
     return logger
 
@@ -95,22 +392,22 @@ logger = get_logger()
 def log_agent_start(agent_type: str, point_id: str, location: str):
     """Log when an agent starts working."""
     set_log_context(point_id=point_id, agent_type=agent_type)
-    logger.info(f"🚀 Starting {agent_type} agent for location: {location}")
+    logger.info("🚀 Starting %s agent for location: %s", agent_type, location)
 
 
 def log_agent_result(agent_type: str, point_id: str, result_summary: str):
     """Log agent result."""
     set_log_context(point_id=point_id, agent_type=agent_type)
-    logger.info(f"✅ {agent_type} agent completed: {result_summary}")
+    logger.info("✅ %s agent completed: %s", agent_type, result_summary)
 
 
 def log_agent_error(agent_type: str, point_id: str, error: str):
     """Log agent error."""
     set_log_context(point_id=point_id, agent_type=agent_type)
-    logger.error(f"❌ {agent_type} agent error: {error}")
+    logger.error("❌ %s agent error: %s", agent_type, error)
 
 
 def log_judge_decision(point_id: str, winner: str, reason: str):
     """Log judge's decision."""
     set_log_context(point_id=point_id, agent_type="judge")
-    logger.info(f"⚖️ Judge selected: {winner} - Reason: {reason}")
+    logger.info("⚖️ Judge selected: %s - Reason: %s", winner, reason)
@@ -81,7 +81,7 @@ class TestVideoAgent:
 
         # Mock LLM to fail
         with patch.object(agent, "_call_llm", side_effect=Exception("LLM Error")):
-            queries = agent._generate_search_queries(mock_route_point)
+            queries = list(agent._iter_search_queries(mock_route_point))
 
         assert len(queries) >= 2
         assert any("Ammunition Hill" in q for q in queries)
@@ -563,6 +563,33 @@ REASONING: Text provides comprehensive historical context."""
         assert result["winner_index"] == 0
         assert result["scores"] == {}
 
+    @patch(
+        "src.agents.judge_agent.AGENT_SKILLS",
+        {"judge_agent": {"scoring_criteria": ["relevance", "quality", "engagement"]}},
+    )
+    def test_verdict_ends_streamed_response(
+        self, mock_route_point, mock_video_result, mock_music_result
+    ):
+        """Test the judge stops at the verdict and keeps the reasoning."""
+        from src.agents.judge_agent import JudgeAgent, _verdict_complete
+
+        agent = JudgeAgent()
+        response = "REASONING: Music suits the mood.\nWINNER: 2\nWINNER_SCORE: 8.5\n"
+
+        with patch.object(agent, "_call_llm", return_value=response) as mock_llm:
+            evaluation = agent._evaluate_two_candidates(
+                mock_route_point,
+                [mock_video_result, mock_music_result],
+                agent.user_profile,
+            )
+
+        assert mock_llm.call_args.kwargs["stop_when"] is _verdict_complete
+        assert evaluation["winner_index"] == 1
+        assert evaluation["winner_score"] == 8.5
+        assert evaluation["reasoning"] == "Music suits the mood."
+        assert not _verdict_complete("WINNER: 2\nWINNER_SCORE: 8")
+        assert _verdict_complete(response)
+
     @patch(
         "src.agents.judge_agent.AGENT_SKILLS",
         {"judge_agent": {"scoring_criteria": ["relevance", "quality", "engagement"]}},
@@ -584,3 +611,301 @@ REASONING: Text provides comprehensive historical context."""
         assert "winner_index" in result
         assert "winner_score" in result
         assert "reasoning" in result
+
+
+@patch(
+    "src.agents.judge_agent.AGENT_SKILLS",
+    {"judge_agent": {"scoring_criteria": ["relevance", "quality", "engagement"]}},
+)
+@patch("src.agents.judge_agent.log_judge_decision")
+class TestTieredJudge:
+    """Tests for rule-based decisions with LLM escalation."""
+
+    @staticmethod
+    def _candidates(point, video_score, music_score):
+        return [
+            ContentResult(
+                point_id=point.id,
+                content_type=ContentType.VIDEO,
+                title="Walking Tour",
+                source="YouTube",
+                relevance_score=video_score,
+            ),
+            ContentResult(
+                point_id=point.id,
+                content_type=ContentType.MUSIC,
+                title="Evening Song",
+                source="Spotify",
+                relevance_score=music_score,
+            ),
+        ]
+
+    def test_clear_lead_skips_llm(self, mock_log, mock_route_point):
+        """Test a clear rule-score lead is decided without the LLM."""
+        from src.agents.judge_agent import JudgeAgent, get_judge_stats
+
+        agent = JudgeAgent(fast_margin=2.0, shadow_rate=0.0)
+        before = get_judge_stats()
+
+        with patch.object(agent, "_call_llm") as mock_llm:
+            decision = agent.evaluate(
+                mock_route_point, self._candidates(mock_route_point, 9.0, 5.0)
+            )
+
+        mock_llm.assert_not_called()
+        assert decision.selected_content.content_type == ContentType.VIDEO
+        assert "lead of 4.0" in decision.reasoning
+        assert get_judge_stats()["rule_decisions"] == before["rule_decisions"] + 1
+
+    def test_close_call_escalates(self, mock_log, mock_route_point):
+        """Test a small lead is escalated and agreement recorded."""
+        from src.agents.judge_agent import JudgeAgent, get_judge_stats
+
+        agent = JudgeAgent(fast_margin=2.0)
+        before = get_judge_stats()
+
+        with patch.object(
+            agent, "_call_llm", return_value="WINNER: 2\nREASONING: Music fits"
+        ) as mock_llm:
+            decision = agent.evaluate(
+                mock_route_point, self._candidates(mock_route_point, 8.0, 7.5)
+            )
+
+        mock_llm.assert_called_once()
+        assert decision.selected_content.content_type == ContentType.MUSIC
+        stats = get_judge_stats()
+        assert stats["llm_decisions"] == before["llm_decisions"] + 1
+        assert 0.0 < stats["escalation_rate"] <= 1.0
+        assert stats["agreement_rate"] is not None
+
+    def test_negative_margin_always_escalates(self, mock_log, mock_route_point):
+        """Test a negative fast margin disables the rule tier."""
+        from src.agents.judge_agent import JudgeAgent
+
+        agent = JudgeAgent(fast_margin=-1)
+
+        with patch.object(agent, "_call_llm", return_value="WINNER: 2") as mock_llm:
+            agent.evaluate(
+                mock_route_point, self._candidates(mock_route_point, 9.0, 1.0)
+            )
+
+        mock_llm.assert_called_once()
+
+    def test_shadow_keeps_rule_decision(self, mock_log, mock_route_point):
+        """Test shadow LLM calls measure agreement but do not change the pick."""
+        from src.agents.judge_agent import JudgeAgent, judge_llm_agreement_total
+
+        agent = JudgeAgent(fast_margin=2.0, shadow_rate=1.0)
+        disagreed = judge_llm_agreement_total.get(agreed="false")
+
+        with patch.object(agent, "_call_llm", return_value="WINNER: 2") as mock_llm:
+            decision = agent.evaluate(
+                mock_route_point, self._candidates(mock_route_point, 9.0, 5.0)
+            )
+
+        mock_llm.assert_called_once()
+        assert decision.selected_content.content_type == ContentType.VIDEO
+        assert judge_llm_agreement_total.get(agreed="false") == disagreed + 1
+
+    def test_rule_scores_apply_profile_weights(self, mock_log, mock_route_point):
+        """Test rule scores multiply relevance by the profile type weight."""
+        from src.agents.judge_agent import JudgeAgent
+        from src.models.user_profile import AgeGroup, UserProfile
+
+        profile = UserProfile(age_group=AgeGroup.TEENAGER)
+        weights = profile.get_content_type_preferences()
+        agent = JudgeAgent(user_profile=profile)
+
+        scores = agent.rule_scores(
+            mock_route_point, self._candidates(mock_route_point, 6.0, 6.0)
+        )
+
+        assert scores == pytest.approx([6.0 * weights["video"], 6.0 * weights["music"]])
+
+
+@patch(
+    "src.agents.judge_agent.AGENT_SKILLS",
+    {"judge_agent": {"scoring_criteria": ["relevance", "quality", "engagement"]}},
+)
+@patch("src.agents.judge_agent.log_judge_decision")
+class TestBatchedJudge:
+    """Tests for judging several points in one LLM call."""
+
+    @staticmethod
+    def _items(count, video_score=8.0, music_score=7.5):
+        items = []
+        for i in range(count):
+            point = RoutePoint(
+                id=f"p{i}",
+                index=i,
+                address=f"Stop {i}",
+                latitude=31.7,
+                longitude=35.2,
+            )
+            items.append(
+                (
+                    point,
+                    TestTieredJudge._candidates(point, video_score, music_score),
+                )
+            )
+        return items
+
+    def test_close_calls_share_one_llm_call(self, mock_log):
+        """Test close calls for several points are judged in one call."""
+        from src.agents.judge_agent import JudgeAgent
+
+        agent = JudgeAgent(fast_margin=2.0, batch_size=8)
+        response = (
+            "POINT 1:\nWINNER: 2\nWINNER_SCORE: 8.8\nREASONING: Music fits.\n\n"
+            "**POINT 2:**\nWINNER: 1\nWINNER_SCORE: 7.9\nREASONING: Video fits."
+        )
+
+        with patch.object(agent, "_call_llm", return_value=response) as mock_llm:
+            decisions = agent.evaluate_batch(self._items(2))
+
+        mock_llm.assert_called_once()
+        assert [d.point_id for d in decisions] == ["p0", "p1"]
+        assert decisions[0].selected_content.content_type == ContentType.MUSIC
+        assert decisions[0].selected_content.relevance_score == 8.8
+        assert decisions[0].reasoning == "Music fits."
+        assert decisions[1].selected_content.content_type == ContentType.VIDEO
+
+    def test_missing_verdict_falls_back_per_point(self, mock_log):
+        """Test a point missing from the batched answer is judged alone."""
+        from src.agents.judge_agent import JudgeAgent, get_judge_stats
+
+        agent = JudgeAgent(fast_margin=2.0)
+        fallbacks = get_judge_stats()["batch_fallbacks"]
+        responses = [
+            "POINT 1:\nWINNER: 2\nREASONING: Music fits.\n\nPOINT 2:\nWINNER: 7",
+            "WINNER: 2\nWINNER_SCORE: 8.0\nREASONING: Alone",
+        ]
+
+        with patch.object(agent, "_call_llm", side_effect=responses) as mock_llm:
+            decisions = agent.evaluate_batch(self._items(2))
+
+        assert mock_llm.call_count == 2
+        assert decisions[1].reasoning == "Alone"
+        assert decisions[1].selected_content.content_type == ContentType.MUSIC
+        assert get_judge_stats()["batch_fallbacks"] == fallbacks + 1
+
+    def test_triage_splits_rule_decisions_from_escalations(self, mock_log):
+        """Test triage decides clear leads and escalates close calls."""
+        from src.agents.judge_agent import Escalation, JudgeAgent
+
+        agent = JudgeAgent(fast_margin=2.0)
+        (clear,) = self._items(1, video_score=9.0, music_score=5.0)
+        (close,) = self._items(1)
+
+        with patch.object(agent, "_call_llm", return_value="WINNER: 2") as mock_llm:
+            decided = agent.triage(*clear)
+            escalation = agent.triage(*close)
+            (verdict,) = agent.evaluate_escalated([escalation])
+
+        assert decided.selected_content.content_type == ContentType.VIDEO
+        assert isinstance(escalation, Escalation)
+        assert escalation.rule_winner == 0
+        mock_llm.assert_called_once()
+        assert verdict.selected_content.content_type == ContentType.MUSIC
+
+    def test_clear_leads_and_chunks(self, mock_log):
+        """Test rule decisions skip the LLM and batches respect batch_size."""
+        from src.agents.judge_agent import JudgeAgent
+
+        agent = JudgeAgent(fast_margin=2.0, batch_size=2)
+        items = self._items(1, video_score=9.0, music_score=5.0) + self._items(3)
+        response = "\n\n".join(f"POINT {n}:\nWINNER: 1" for n in (1, 2))
+
+        with patch.object(agent, "_call_llm", return_value=response) as mock_llm:
+            decisions = agent.evaluate_batch(items)
+
+        # 3 close calls in chunks of 2; the last one is judged alone
+        assert mock_llm.call_count == 2
+        assert len(decisions) == 4
+        assert "lead of 4.0" in decisions[0].reasoning
+
+    def test_screening_applies_per_point(self, mock_log):
+        """Test profile screening runs for every point of a batch."""
+        from src.agents.judge_agent import JudgeAgent
+        from src.models.user_profile import get_driver_profile
+
+        agent = JudgeAgent(user_profile=get_driver_profile())
+        items = self._items(2, video_score=9.0, music_score=5.0)
+
+        decisions = agent.evaluate_batch(items)
+
+        # Video is prohibited for drivers: music is the only option
+        for decision in decisions:
+            assert decision.selected_content.content_type == ContentType.MUSIC
+
+    def test_empty_candidates_raise(self, mock_log):
+        """Test a point without candidates is rejected up front."""
+        from src.agents.judge_agent import JudgeAgent
+
+        agent = JudgeAgent()
+        with pytest.raises(ValueError, match="No candidates"):
+            agent.evaluate_batch([(self._items(1)[0][0], [])])
+
+
+@patch("src.agents.judge_agent.log_judge_decision")
+class TestJudgePrompts:
+    """Tests for the judge's budgeted system and user prompts."""
+
+    def test_profile_goes_to_shared_system_prompt(self, mock_log):
+        """Test the profile is sent once as a cached system prompt."""
+        from src.agents.judge_agent import JudgeAgent
+        from src.models.user_profile import get_family_profile
+
+        profile = get_family_profile(min_age=6)
+        items = TestBatchedJudge._items(2)
+        prompts = []
+
+        for point, candidates in items:
+            agent = JudgeAgent(user_profile=profile, fast_margin=-1)
+            with patch.object(agent, "_call_llm", return_value="WINNER: 1") as llm:
+                agent.evaluate(point, candidates)
+            prompts.append((llm.call_args.args[0], llm.call_args.kwargs))
+
+        (first, first_kwargs), (second, second_kwargs) = prompts
+        assert first_kwargs["system_prompt"] is second_kwargs["system_prompt"]
+        assert profile.compile().agent_context in first_kwargs["system_prompt"]
+        assert profile.compile().agent_context not in first
+        assert "1. VIDEO 8.0 | Walking Tour" in first
+        assert "WINNER: [1 or 2]" in second
+
+    def test_small_budget_trims_prompts(self, mock_log):
+        """Test criteria and descriptions are cut to fit the input budget."""
+        from src.agents.judge_agent import JudgeAgent
+        from src.agents.prompt_builder import estimate_tokens
+
+        agent = JudgeAgent(fast_margin=-1, input_budget_tokens=220)
+        point, candidates = TestBatchedJudge._items(1)[0]
+        for candidate in candidates:
+            candidate.description = "Long description. " * 40
+
+        with patch.object(agent, "_call_llm", return_value="WINNER: 1") as llm:
+            agent.evaluate(point, candidates)
+
+        prompt = llm.call_args.args[0]
+        system_prompt = llm.call_args.kwargs["system_prompt"]
+        assert "ALSO CONSIDER" not in system_prompt
+        assert "| Long description" in prompt
+        assert "Long description. " * 3 not in prompt
+        assert estimate_tokens(prompt) + estimate_tokens(system_prompt) <= 220
+
+    def test_batch_usage_billed_per_point(self, mock_log):
+        """Test a batched call is attributed to its points, then reset."""
+        from src.agents.judge_agent import JudgeAgent
+
+        agent = JudgeAgent(fast_margin=-1, batch_size=8)
+        billed = []
+
+        def call_llm(*args, **kwargs):
+            billed.append(agent.usage_point_ids)
+            return "POINT 1:\nWINNER: 1\n\nPOINT 2:\nWINNER: 2"
+
+        with patch.object(agent, "_call_llm", side_effect=call_llm):
+            agent.evaluate_batch(TestBatchedJudge._items(2))
+
+        assert billed == [("p0", "p1")]
+        assert agent.usage_point_ids == ()
@@ -11,6 +11,8 @@ Tests cover:
 MIT Level Testing - 85%+ Coverage Target
 """
 
+from unittest.mock import patch
+
 import pytest
 
 
@@ -131,6 +133,116 @@ class TestAPIEndpoints:
         data = response.json()
         assert data["ready"] is True
 
+    @pytest.fixture
+    def scheduled_health(self):
+        """Health scheduler with a clean registry."""
+        from src.core.observability.health import HealthRegistry, get_health_scheduler
+
+        HealthRegistry.clear()
+        scheduler = get_health_scheduler()
+        yield HealthRegistry, scheduler
+        scheduler.reset()
+        HealthRegistry.clear()
+
+    def test_probes_read_cached_health(self, client, scheduled_health):
+        """Test /health and /ready report the scheduler's snapshot."""
+        registry, scheduler = scheduled_health
+        registry.register("db", lambda: True)
+        scheduler.refresh()
+
+        health = client.get("/health").json()
+        assert health["status"] == "healthy"
+        assert health["checks"]["health"]["checks"]["db"]["status"] == "healthy"
+        assert health["checks"]["health"]["stale"] is False
+
+        ready = client.get("/ready")
+        assert ready.status_code == 200
+        assert ready.json()["ready"] is True
+
+    def test_lifespan_runs_health_scheduler(self, scheduled_health):
+        """Test the app schedules checks while running and cleans up after."""
+        from fastapi.testclient import TestClient
+
+        from src.api.app import app
+
+        _, scheduler = scheduled_health
+        with patch("src.api.app.shutdown_content_caches") as shutdown_caches:
+            with TestClient(app) as client:
+                assert scheduler.is_running
+                ready = client.get("/ready").json()
+                checks = ready["health"]["checks"]
+                assert checks["tour_service"]["status"] == "healthy"
+                shutdown_caches.assert_not_called()
+
+        assert not scheduler.is_running
+        assert scheduler.get_cached() is None
+        shutdown_caches.assert_called_once()
+
+    def test_profile_disabled_by_default(self, client):
+        """Test the profiling endpoint is opt-in."""
+        assert client.get("/admin/profile?seconds=0").status_code == 404
+
+    def test_profile_window(self, client, monkeypatch):
+        """Test a profiling window returns folded stacks or group totals."""
+        from src.core.observability.profiler import get_profiler
+        from src.utils.config import settings
+
+        monkeypatch.setattr(settings, "profiling_enabled", True)
+        try:
+            response = client.get("/admin/profile?seconds=0.1")
+            assert response.status_code == 200
+            assert "text/plain" in response.headers["content-type"]
+
+            data = client.get("/admin/profile?seconds=0&format=json").json()
+            assert data["profiler"]["running"] is True
+            assert data["profiler"]["samples"] > 0
+
+            assert client.get("/admin/profile?format=svg").status_code == 400
+        finally:
+            get_profiler().stop()
+
+    def test_profile_json_group(self, client, monkeypatch):
+        """Test format=json honours the group filter."""
+        import threading
+
+        from src.core.observability.profiler import get_profiler
+        from src.utils.config import settings
+
+        monkeypatch.setattr(settings, "profiling_enabled", True)
+        stop = threading.Event()
+
+        def spin():
+            while not stop.is_set():
+                sum(range(200))
+
+        worker = threading.Thread(target=spin, name="PointProcessor_0")
+        worker.start()
+        try:
+            data = client.get(
+                "/admin/profile?seconds=0.2&format=json&group=PointProcessor"
+            ).json()
+            assert list(data["groups"]) == ["PointProcessor"]
+
+            data = client.get(
+                "/admin/profile?seconds=0&format=json&group=no-such-group"
+            ).json()
+            assert data["groups"] == {}
+        finally:
+            stop.set()
+            worker.join()
+            get_profiler().stop()
+
+    def test_ready_unavailable_on_critical_failure(self, client, scheduled_health):
+        """Test /ready returns 503 while a critical check fails."""
+        registry, scheduler = scheduled_health
+        registry.register("db", lambda: False, critical=True)
+        scheduler.refresh()
+
+        assert client.get("/health").json()["status"] == "unhealthy"
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["ready"] is False
+
     def test_metrics_endpoint(self, client):
         """Test metrics endpoint."""
         response = client.get("/metrics")
@@ -139,6 +251,22 @@ class TestAPIEndpoints:
         # Should return text/plain
         assert "text/plain" in response.headers.get("content-type", "")
 
+    def test_critical_path_unknown_tour(self, client):
+        """Test critical path for unknown tour is 404."""
+        response = client.get("/api/v1/tours/nonexistent/critical-path")
+
+        assert response.status_code == 404
+
+    def test_metrics_endpoint_prometheus_text(self, client):
+        """Test metrics are exposed as raw Prometheus text, not JSON."""
+        response = client.get("/metrics")
+
+        body = response.text
+        assert not body.startswith('"')
+        assert "# TYPE tour_requests_total counter" in body
+        assert "# TYPE active_tours gauge" in body
+        assert "tour_service_api_mode{" in body
+
     def test_create_tour(self, client):
         """Test tour creation endpoint."""
         response = client.post(
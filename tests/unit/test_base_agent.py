@@ -2,9 +2,11 @@
 Unit tests for BaseAgent module.
 
 Tests cover:
-- Agent initialization
+- Agent initialization (including real SDK clients on the shared transport)
 - LLM client initialization
 - LLM calls (mocked)
+- Streaming responses and early stop
+- Token usage reported to the cost tracker
 - Mock response generation
 - System prompt generation
 - Execute method
@@ -43,7 +45,7 @@ class TestBaseAgentInitialization:
             mock_settings.anthropic_api_key = "test-anthropic-key"
             mock_settings.openai_api_key = None
 
-            with patch("src.agents.base_agent.anthropic.Anthropic"):
+            with patch("anthropic.Anthropic"):
                 from src.agents.video_agent import VideoAgent
 
                 agent = VideoAgent()
@@ -56,13 +58,34 @@ class TestBaseAgentInitialization:
             mock_settings.anthropic_api_key = None
             mock_settings.openai_api_key = "test-openai-key"
 
-            with patch("src.agents.base_agent.OpenAI"):
+            with patch("openai.OpenAI"):
                 from src.agents.video_agent import VideoAgent
 
                 agent = VideoAgent()
 
                 assert agent.llm_type == "openai"
 
+    @pytest.mark.parametrize("provider", ["anthropic", "openai"])
+    def test_real_sdk_client_uses_shared_transport(self, provider):
+        """Test the real SDK client accepts the pooled HTTP client."""
+        sdk = pytest.importorskip(provider)
+        from src.core.transport import get_transports
+
+        with patch("src.agents.base_agent.settings") as mock_settings:
+            mock_settings.anthropic_api_key = (
+                "test-key" if provider == "anthropic" else None
+            )
+            mock_settings.openai_api_key = "test-key"
+
+            from src.agents.video_agent import VideoAgent
+
+            agent = VideoAgent()
+
+        shared = get_transports().httpx_client(provider)
+        assert agent.llm_type == provider
+        assert isinstance(shared, sdk.DefaultHttpxClient)
+        assert agent.llm_client._client is shared
+
     def test_init_without_api_keys(self):
         """Test initialization without API keys."""
         with patch("src.agents.base_agent.settings") as mock_settings:
@@ -103,7 +126,7 @@ class TestBaseAgentLLMCalls:
             mock_response = Mock()
             mock_response.content = [Mock(text="Anthropic response")]
 
-            with patch("src.agents.base_agent.anthropic.Anthropic") as mock_anthropic:
+            with patch("anthropic.Anthropic") as mock_anthropic:
                 mock_client = Mock()
                 mock_client.messages.create.return_value = mock_response
                 mock_anthropic.return_value = mock_client
@@ -126,7 +149,7 @@ class TestBaseAgentLLMCalls:
             mock_response = Mock()
             mock_response.choices = [Mock(message=Mock(content="OpenAI response"))]
 
-            with patch("src.agents.base_agent.OpenAI") as mock_openai:
+            with patch("openai.OpenAI") as mock_openai:
                 mock_client = Mock()
                 mock_client.chat.completions.create.return_value = mock_response
                 mock_openai.return_value = mock_client
@@ -138,6 +161,41 @@ class TestBaseAgentLLMCalls:
                 result = agent._call_llm("Test prompt")
                 assert result == "OpenAI response"
 
+    def test_call_llm_records_usage(self):
+        """Test provider calls report estimated tokens per point."""
+        from src.cost_analysis.tracker import CostTracker
+
+        with patch("src.agents.base_agent.settings") as mock_settings:
+            mock_settings.anthropic_api_key = "test-key"
+            mock_settings.openai_api_key = None
+            mock_settings.llm_model = "claude-3-haiku-20240307"
+
+            mock_response = Mock()
+            mock_response.content = [Mock(text="x" * 40)]
+            tracker = CostTracker()
+
+            with (
+                patch("anthropic.Anthropic") as mock_anthropic,
+                patch("src.agents.base_agent.get_cost_tracker", return_value=tracker),
+            ):
+                mock_anthropic.return_value.messages.create.return_value = mock_response
+
+                from src.agents.video_agent import VideoAgent
+
+                agent = VideoAgent()
+                agent.current_point_id = "p1"
+                agent._call_llm("y" * 80, system_prompt="z" * 20)
+
+                agent.usage_point_ids = ("p2", "p3")
+                agent._call_llm("y" * 80, system_prompt="z" * 20)
+
+        assert tracker.get_point_tokens() == {
+            "p1": {"input_tokens": 25, "output_tokens": 10},
+            "p2": {"input_tokens": 12, "output_tokens": 5},
+            "p3": {"input_tokens": 12, "output_tokens": 5},
+        }
+        assert tracker.get_agent_costs()["video"] > 0
+
     def test_call_llm_error_fallback(self):
         """Test _call_llm falls back to mock on error."""
         with patch("src.agents.base_agent.settings") as mock_settings:
@@ -145,7 +203,7 @@ class TestBaseAgentLLMCalls:
             mock_settings.openai_api_key = None
             mock_settings.llm_model = "claude-3-haiku-20240307"
 
-            with patch("src.agents.base_agent.anthropic.Anthropic") as mock_anthropic:
+            with patch("anthropic.Anthropic") as mock_anthropic:
                 mock_client = Mock()
                 mock_client.messages.create.side_effect = Exception("API Error")
                 mock_anthropic.return_value = mock_client
@@ -158,6 +216,178 @@ class TestBaseAgentLLMCalls:
                 assert "Mock response" in result
 
 
+class TestBaseAgentStreaming:
+    """Tests for streamed LLM responses."""
+
+    @staticmethod
+    def _anthropic_agent(chunks, consumed):
+        """VideoAgent whose Anthropic client streams `chunks`."""
+
+        def text_stream():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        stream = Mock()
+        stream.__enter__ = Mock(return_value=Mock(text_stream=text_stream()))
+        stream.__exit__ = Mock(return_value=False)
+
+        with patch("src.agents.base_agent.settings") as mock_settings:
+            mock_settings.anthropic_api_key = "test-key"
+            mock_settings.openai_api_key = None
+            with patch("anthropic.Anthropic") as mock_anthropic:
+                mock_client = Mock()
+                mock_client.messages.stream.return_value = stream
+                mock_anthropic.return_value = mock_client
+
+                from src.agents.video_agent import VideoAgent
+
+                return VideoAgent(), stream
+
+    def test_stop_when_returns_early(self):
+        """Test a satisfied stop_when ends the stream before it finishes."""
+        consumed = []
+        chunks = ["WINNER: 2\n", "WINNER_SCORE: 8", ".5\n", "REASONING: long..."]
+        agent, stream = self._anthropic_agent(chunks, consumed)
+
+        with patch("src.agents.base_agent.settings") as mock_settings:
+            mock_settings.llm_streaming = True
+            mock_settings.llm_model = "claude-3-haiku-20240307"
+            text = agent._call_llm(
+                "Judge", max_tokens=64, stop_when=lambda t: "8.5\n" in t
+            )
+
+        assert text == "WINNER: 2\nWINNER_SCORE: 8.5\n"
+        assert consumed == chunks[:3]
+        stream.__exit__.assert_called_once()
+        assert agent.llm_client.messages.stream.call_args.kwargs["max_tokens"] == 64
+
+    def test_stream_lines_complete_across_chunks(self):
+        """Test lines are yielded only once complete, however chunks split."""
+        consumed = []
+        agent, _ = self._anthropic_agent(
+            ["Jaffa po", "rt\n\nJaffa ", "clock"], consumed
+        )
+
+        with patch("src.agents.base_agent.settings") as mock_settings:
+            mock_settings.llm_streaming = True
+            mock_settings.llm_model = "claude-3-haiku-20240307"
+            lines = agent._stream_llm_lines("Queries")
+            first = next(lines)
+            consumed_at_first = len(consumed)
+            rest = list(lines)
+
+        assert first == "Jaffa port"
+        assert consumed_at_first == 2
+        assert rest == ["Jaffa clock"]
+
+    def test_openai_stream(self):
+        """Test OpenAI deltas are streamed and the response closed."""
+        events = [
+            Mock(choices=[Mock(delta=Mock(content="Hello "))]),
+            Mock(choices=[Mock(delta=Mock(content=None))]),
+            Mock(choices=[Mock(delta=Mock(content="world"))]),
+        ]
+        response = Mock()
+        response.__iter__ = Mock(return_value=iter(events))
+
+        with patch("src.agents.base_agent.settings") as mock_settings:
+            mock_settings.anthropic_api_key = None
+            mock_settings.openai_api_key = "test-key"
+            mock_settings.llm_streaming = True
+            with patch("openai.OpenAI") as mock_openai:
+                mock_client = Mock()
+                mock_client.chat.completions.create.return_value = response
+                mock_openai.return_value = mock_client
+
+                from src.agents.video_agent import VideoAgent
+
+                agent = VideoAgent()
+                chunks = list(agent._stream_llm("Prompt", max_tokens=32))
+
+        assert chunks == ["Hello ", "world"]
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+        response.close.assert_called_once()
+
+    def test_stream_failure_falls_back_to_mock(self):
+        """Test a stream failing before any text yields the mock response."""
+        agent, stream = self._anthropic_agent([], [])
+        stream.__enter__.side_effect = Exception("API Error")
+
+        with patch("src.agents.base_agent.settings") as mock_settings:
+            mock_settings.llm_streaming = True
+            mock_settings.llm_model = "claude-3-haiku-20240307"
+            chunks = list(agent._stream_llm("Prompt"))
+
+        assert len(chunks) == 1
+        assert "Mock response" in chunks[0]
+
+    def test_query_generation_span(self):
+        """Test query generation is traced as its own stage, ended on close."""
+        from src.core.observability.tracing import PIPELINE_TRACER, get_tracer
+
+        agent, _ = self._anthropic_agent(["Jaffa port\n", "Jaffa clock\n"], [])
+        tracer = get_tracer(PIPELINE_TRACER)
+
+        with patch("src.agents.base_agent.settings") as mock_settings:
+            mock_settings.llm_streaming = True
+            mock_settings.llm_model = "claude-3-haiku-20240307"
+            with tracer.span("agent.search_content") as parent:
+                queries = agent._stream_queries("Queries", empty=[], failed=[])
+                assert next(queries) == "Jaffa port"
+                queries.close()
+
+        spans = tracer.get_spans(trace_id=parent.context.trace_id)
+        (span,) = [s for s in spans if s.name == "agent.generate_queries"]
+        assert span.context.parent_span_id == parent.context.span_id
+        assert span.attributes["agent.queries"] == 1
+        assert span.end_time is not None
+
+    def test_mock_mode_yields_call_llm_response(self):
+        """Test without a client the _call_llm response is one chunk."""
+        with patch("src.agents.base_agent.settings") as mock_settings:
+            mock_settings.anthropic_api_key = None
+            mock_settings.openai_api_key = None
+
+            from src.agents.video_agent import VideoAgent
+
+            agent = VideoAgent()
+
+        with patch.object(agent, "_call_llm", return_value="a\nb") as mock_llm:
+            assert list(agent._stream_llm_lines("Prompt", max_tokens=16)) == [
+                "a",
+                "b",
+            ]
+        mock_llm.assert_called_once_with("Prompt", None, 16)
+
+    def test_first_search_starts_before_stream_ends(self, mock_route_point):
+        """Test a query is searched as soon as its line is complete."""
+        from src.agents.video_agent import VideoAgent
+
+        agent = VideoAgent()
+        events = []
+
+        def stream(*args, **kwargs):
+            for chunk in ["Query one\n", "Query two\n", "Query three\n", "extra\n"]:
+                events.append(f"chunk {chunk.strip()}")
+                yield chunk
+
+        def search(query):
+            events.append(f"search {query}")
+            return []
+
+        with (
+            patch.object(agent, "_stream_llm", side_effect=stream),
+            patch.object(agent, "_search_youtube", side_effect=search),
+        ):
+            agent._search_content(mock_route_point)
+
+        assert events[:3] == ["chunk Query one", "search Query one", "chunk Query two"]
+        # At most three queries: the stream is cancelled after the third line
+        assert "chunk extra" not in events
+        assert events[-1] == "search Query three"
+
+
 class TestBaseAgentMockResponse:
     """Tests for mock response generation."""
 
@@ -11,6 +11,7 @@ Tests cover:
 MIT Level Testing - 85%+ Coverage Target
 """
 
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -249,6 +250,38 @@ class TestMainFunction:
         assert result == 0
         mock_demo.assert_called_once()
 
+    @patch("src.cli.main.run_demo_pipeline", side_effect=RuntimeError("boom"))
+    def test_main_releases_shared_pools(self, mock_demo):
+        """Test content caches and transports are released even on failure."""
+        from src.cli.main import main
+
+        with patch("sys.argv", ["main.py", "--demo"]):
+            with patch("src.agents.base_agent_v2.shutdown_content_caches") as caches:
+                with patch("src.cli.main.shutdown_transports") as transports:
+                    main()
+
+        caches.assert_called_once()
+        transports.assert_called_once()
+
+    def test_main_cpu_profile(self, tmp_path, capsys):
+        """Test --cpu-profile writes folded stacks for the run."""
+        from src.cli.main import main
+
+        path = tmp_path / "run.folded"
+
+        def busy(**kwargs):
+            end = time.perf_counter() + 0.1
+            while time.perf_counter() < end:
+                sum(range(100))
+
+        argv = ["main.py", "--demo", "--cpu-profile", str(path)]
+        with patch("sys.argv", argv):
+            with patch("src.cli.main.run_demo_pipeline", side_effect=busy):
+                assert main() == 0
+
+        assert "busy (test_cli.py:" in path.read_text()
+        assert "CPU profile" in capsys.readouterr().out
+
     @patch("src.cli.main.run_demo_pipeline")
     def test_main_demo_mode_with_queue(self, mock_demo):
         """Test main function in demo mode with queue."""
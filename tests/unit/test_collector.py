@@ -8,6 +8,7 @@ Tests cover:
 - Progress monitoring
 - Output generation
 - StreamingCollector functionality
+- JudgeBatcher batching of escalated points and per-point fallback
 
 MIT Level Testing - 85%+ Coverage Target
 """
@@ -449,3 +450,172 @@ class TestEmptyRoute:
 
                 assert output.decisions == []
                 assert output.processing_stats["average_relevance_score"] == 0
+
+
+class TestJudgeBatcher:
+    """Tests for batched judging in front of a collector."""
+
+    @staticmethod
+    def _candidates(point):
+        return [
+            ContentResult(
+                point_id=point.id,
+                content_type=ContentType.TEXT,
+                title=f"About {point.address}",
+                source="Wikipedia",
+            )
+        ]
+
+    @staticmethod
+    def _judge():
+        """A judge that escalates every point to the (batched) LLM."""
+        from src.agents.judge_agent import Escalation
+
+        judge = Mock()
+        judge.triage.side_effect = lambda point, candidates, profile=None: Escalation(
+            point, candidates, rule_winner=0
+        )
+        judge.evaluate_escalated.side_effect = lambda batch, user_profile=None: [
+            JudgeDecision(
+                point_id=e.point.id,
+                selected_content=e.candidates[0],
+                all_candidates=e.candidates,
+                reasoning="batched",
+            )
+            for e in batch
+        ]
+        return judge
+
+    def test_full_batch_delivered_to_collector(self, mock_route):
+        """Test a full batch is judged at once and reaches add_decision."""
+        from src.core.collector import JudgeBatcher, ResultCollector
+
+        collector = ResultCollector(mock_route)
+        judge = self._judge()
+        batcher = JudgeBatcher(
+            judge, collector.add_decision, max_batch=len(mock_route.points)
+        )
+
+        for point in mock_route.points:
+            batcher.submit(point, self._candidates(point))
+
+        judge.evaluate_escalated.assert_called_once()
+        assert collector.is_complete()
+        assert [d.point_id for d in collector.get_ordered_decisions()] == [
+            p.id for p in mock_route.points
+        ]
+        assert batcher.get_stats()["largest_batch"] == len(mock_route.points)
+
+    def test_partial_batch_flushed_after_wait(self, mock_route):
+        """Test a partial batch is judged once max_wait_seconds pass."""
+        from src.core.collector import JudgeBatcher
+
+        delivered = threading.Event()
+        batcher = JudgeBatcher(
+            self._judge(),
+            lambda decision: delivered.set(),
+            max_batch=10,
+            max_wait_seconds=0.01,
+        )
+
+        point = mock_route.points[0]
+        batcher.submit(point, self._candidates(point))
+
+        assert delivered.wait(timeout=2.0)
+        assert batcher.get_stats()["pending"] == 0
+
+    def test_batch_failure_judges_points_alone(self, mock_route):
+        """Test a failing batch falls back to per-point evaluation."""
+        from src.core.collector import JudgeBatcher
+
+        judge = self._judge()
+        judge.evaluate_escalated.side_effect = RuntimeError("boom")
+        judge.evaluate.side_effect = [
+            JudgeDecision(
+                point_id=mock_route.points[0].id,
+                selected_content=None,
+                all_candidates=[],
+                reasoning="alone",
+            ),
+            RuntimeError("judge down"),
+        ]
+        received = []
+        batcher = JudgeBatcher(judge, received.append, max_batch=10)
+
+        for point in mock_route.points[:2]:
+            batcher.submit(point, self._candidates(point))
+        batcher.close()
+
+        assert [d.reasoning for d in received] == [
+            "alone",
+            "Judge failed - using first available content",
+        ]
+        assert batcher.get_stats()["judge_failures"] == 1
+
+    def test_submit_returns_decision_future(self, mock_route):
+        """Test each submitter's future resolves to its own decision."""
+        from src.core.collector import JudgeBatcher
+
+        batcher = JudgeBatcher(self._judge(), max_batch=2)
+        first, second = (
+            batcher.submit(point, self._candidates(point))
+            for point in mock_route.points[:2]
+        )
+
+        assert first.result(timeout=2).point_id == mock_route.points[0].id
+        assert second.result(timeout=2).point_id == mock_route.points[1].id
+
+    def test_rule_decided_points_skip_the_batch(self, mock_route):
+        """Test points settled without the LLM are decided at submit."""
+        from src.core.collector import JudgeBatcher
+
+        judge = self._judge()
+        judge.triage.side_effect = lambda point, candidates, profile=None: (
+            JudgeDecision(
+                point_id=point.id,
+                selected_content=candidates[0],
+                all_candidates=candidates,
+                reasoning="rule",
+            )
+        )
+        received = []
+        batcher = JudgeBatcher(judge, received.append, max_wait_seconds=60)
+
+        point = mock_route.points[0]
+        future = batcher.submit(point, self._candidates(point))
+
+        assert future.done()
+        assert future.result().reasoning == "rule"
+        assert [d.reasoning for d in received] == ["rule"]
+        judge.evaluate_escalated.assert_not_called()
+        stats = batcher.get_stats()
+        assert stats["decided_inline"] == 1
+        assert stats["pending"] == 0
+        assert stats["batches"] == 0
+
+    def test_triage_failure_uses_first_candidate(self, mock_route):
+        """Test a failing screen or rule tier still resolves the point."""
+        from src.core.collector import JudgeBatcher
+
+        judge = self._judge()
+        judge.triage.side_effect = RuntimeError("rules down")
+        batcher = JudgeBatcher(judge, max_wait_seconds=60)
+
+        point = mock_route.points[0]
+        decision = batcher.submit(point, self._candidates(point)).result(timeout=0)
+
+        assert decision.reasoning == "Judge failed - using first available content"
+        assert batcher.get_stats()["judge_failures"] == 1
+
+    def test_closed_batcher_rejects_points(self, mock_route):
+        """Test submit after close raises."""
+        import pytest
+
+        from src.core.collector import JudgeBatcher
+
+        batcher = JudgeBatcher(self._judge(), Mock())
+        batcher.close()
+
+        point = mock_route.points[0]
+        with pytest.raises(RuntimeError, match="closed"):
+            batcher.submit(point, self._candidates(point))
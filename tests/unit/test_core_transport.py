@@ -0,0 +1,162 @@
+"""
+Unit tests for the shared HTTP transports.
+
+Tests cover:
+- One client per upstream, rebuilt after close
+- Keep-alive connection reuse and its metrics (httpx and requests)
+- ClientPool leasing across threads
+- Pool sizing from settings
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.transport import (
+    ClientPool,
+    TransportConfig,
+    TransportRegistry,
+    http_connections,
+    http_requests,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def registry():
+    registry = TransportRegistry(configs={})
+    yield registry
+    registry.close()
+
+
+class TestTransportRegistry:
+    """Tests for shared clients and reuse metrics."""
+
+    def test_one_client_per_upstream(self, registry):
+        """Test clients are shared per upstream and rebuilt after close."""
+        client = registry.httpx_client("test-shared")
+        assert registry.httpx_client("test-shared") is client
+        assert registry.httpx_client("test-other") is not client
+        assert registry.requests_session("test-shared") is (
+            registry.requests_session("test-shared")
+        )
+
+        registry.close()
+
+        assert client.is_closed
+        assert registry.httpx_client("test-shared") is not client
+
+    def test_httpx_reuses_connection(self, registry, server_url):
+        """Test keep-alive serves repeated requests on one connection."""
+        client = registry.httpx_client("test-httpx")
+        for _ in range(5):
+            assert client.get(server_url).text == "ok"
+
+        assert http_requests.get(upstream="test-httpx") == 5
+        assert http_connections.get(upstream="test-httpx") == 1
+        assert registry.get_stats()["test-httpx"]["reuse_rate"] == pytest.approx(0.8)
+
+    def test_requests_reuses_connection(self, registry, server_url):
+        """Test the shared session keeps its pooled connection alive."""
+        session = registry.requests_session("test-requests")
+        for _ in range(4):
+            assert session.get(server_url).text == "ok"
+
+        stats = registry.get_stats()["test-requests"]
+        assert stats["requests"] == 4
+        assert stats["connections_opened"] == 1
+
+    def test_pool_sizes_from_config(self):
+        """Test limits are applied to the httpx pool."""
+        registry = TransportRegistry(
+            configs={"test-sized": TransportConfig(max_connections=3, http2=True)}
+        )
+        client = registry.httpx_client("test-sized")
+        pool = client._transport._pool
+
+        assert pool._max_connections == 3
+        registry.close()
+
+    def test_default_upstreams(self):
+        """Test every upstream has a config sized from the thread count."""
+        configs = TransportRegistry().configs
+        assert {"anthropic", "openai", "youtube", "google_maps"} <= set(configs)
+        assert configs["anthropic"].http2
+        assert not configs["spotify"].http2
+
+
+class TestClientPool:
+    """Tests for leasing non-thread-safe clients."""
+
+    def test_reuses_idle_client(self):
+        """Test a returned client is handed out again."""
+        pool = ClientPool("test-pool", factory=object)
+        with pool.lease() as first:
+            pass
+        with pool.lease() as second:
+            pass
+
+        assert first is second
+        assert pool.get_stats() == {"requests": 2, "connections_opened": 1, "idle": 1}
+
+    def test_concurrent_leases_get_distinct_clients(self):
+        """Test no client is used by two threads at once."""
+        pool = ClientPool("test-threads", factory=object, max_idle=2)
+        barrier = threading.Barrier(4)
+
+        def use(_):
+            with pool.lease() as client:
+                barrier.wait(timeout=2)
+                return client
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            clients = list(executor.map(use, range(4)))
+
+        assert len({id(c) for c in clients}) == 4
+        # Only max_idle clients are kept; the rest were closed
+        assert pool.get_stats()["idle"] == 2
+
+    def test_close_closes_idle_clients(self):
+        """Test close() releases pooled clients."""
+
+        class Client:
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        pool = ClientPool("test-close", factory=Client)
+        with pool.lease() as client:
+            pass
+        pool.close()
+
+        assert client.closed
+        assert pool.get_stats()["idle"] == 0
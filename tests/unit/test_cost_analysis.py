@@ -735,6 +735,23 @@ class TestCostTracker:
         assert "tour_1" in tour_costs
         assert "tour_2" in tour_costs
 
+    def test_tokens_per_point(self, tracker):
+        """Test LLM tokens are aggregated by route point."""
+        tracker.record_llm_usage(400, 100, agent_type="judge", point_id="p1")
+        tracker.record_llm_usage(200, 50, agent_type="video", point_id="p1")
+        tracker.record_llm_usage(300, 0, agent_type="judge", point_id="p2")
+        tracker.record_llm_usage(999, 999)
+
+        assert tracker.get_point_tokens()["p1"] == {
+            "input_tokens": 600,
+            "output_tokens": 150,
+        }
+        assert tracker.get_tokens_per_point() == (750 + 300) / 2
+
+        tracker.reset()
+        assert tracker.get_point_tokens() == {}
+        assert tracker.get_tokens_per_point() == 0.0
+
     def test_get_cost_breakdown(self, tracker):
         """Test getting cost breakdown."""
         tracker.record_llm_usage(1000, 500)
@@ -373,6 +373,70 @@ class TestSmartQueueSimulator:
 
         assert df["latency"].min() >= 0
 
+    def test_generator_seed_reproducible(self):
+        """Test a seed or Generator makes runs reproducible without global state."""
+        df1 = SmartQueueSimulator(rng=7).run_monte_carlo(n_simulations=200)
+        np.random.seed(1)
+        df2 = SmartQueueSimulator(rng=np.random.default_rng(7)).run_monte_carlo(
+            n_simulations=200
+        )
+
+        pd.testing.assert_frame_equal(df1, df2)
+
+    @staticmethod
+    def _fixed_agent(name, seconds, reliability=1.0):
+        """Agent that always answers after exactly `seconds` (zero variance)."""
+        return AgentConfig(
+            name, float(np.log(seconds)), 0.0, 0.0, reliability, 8.0, 0.0
+        )
+
+    @pytest.mark.parametrize(
+        ("times", "config", "status", "latency", "num_results"),
+        [
+            ([1.0, 2.0, 3.0], QueueConfig(), QueueStatus.COMPLETE, 3.0, 3),
+            # Third agent fails: two results by the soft timeout
+            ([1.0, 2.0, None], QueueConfig(), QueueStatus.SOFT_DEGRADED, 15.0, 2),
+            # Third agent fails, second too slow for the soft timeout
+            (
+                [1.0, 20.0, None],
+                QueueConfig(),
+                QueueStatus.HARD_DEGRADED,
+                30.0,
+                2,
+            ),
+            # All succeed, one after the hard timeout: degraded to what arrived
+            ([1.0, 2.0, 40.0], QueueConfig(), QueueStatus.SOFT_DEGRADED, 30.0, 2),
+            ([1.0, 40.0, 50.0], QueueConfig(), QueueStatus.HARD_DEGRADED, 30.0, 1),
+        ],
+    )
+    def test_tiered_timeouts(self, times, config, status, latency, num_results):
+        """Test each tier of the soft/hard timeout logic on fixed times."""
+        # None marks an agent that always fails
+        agents = [
+            self._fixed_agent(f"a{i}", t or 1.0, reliability=float(t is not None))
+            for i, t in enumerate(times)
+        ]
+        sim = SmartQueueSimulator(queue_config=config, agents=agents, rng=0)
+
+        df = sim.run_monte_carlo(n_simulations=20)
+
+        assert set(df["status"]) == {status.value}
+        assert df["latency"].to_numpy() == pytest.approx(latency)
+        assert set(df["num_results"]) == {num_results}
+        # Best quality, less 5% per missing result
+        assert df["quality"].to_numpy() == pytest.approx(
+            8.0 * (1 - 0.05 * (3 - num_results))
+        )
+
+    def test_batch_matches_single(self):
+        """Test simulate_single is one row of the vectorized batch."""
+        batch = SmartQueueSimulator(rng=3).simulate_batch(1)
+        result = SmartQueueSimulator(rng=3).simulate_single()
+
+        assert result.status.value == batch["status"][0]
+        assert result.latency == batch["latency"][0]
+        assert result.agent_times["video"] == batch["times"][0, 0]
+
 
 # ============================================================================
 # DashboardDataManager Tests
@@ -0,0 +1,211 @@
+"""
+Unit tests for the dashboard's columnar event store.
+
+Tests cover:
+- Ring buffer wraparound with contiguous, read-only views
+- Diffing TourStore updates into point, agent and tour events
+- Incremental aggregates and throughput
+- Live real-time metrics in DashboardDataManager
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy", reason="numpy required for dashboard tests")
+pd = pytest.importorskip("pandas", reason="pandas required for dashboard tests")
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src.core.observability.timing import AgentTiming, PointTiming
+from src.dashboard.data_manager import DashboardDataManager
+from src.dashboard.event_store import DashboardEventStore, RingBuffer
+from src.services.tour_service import (
+    AgentResult,
+    PointResult,
+    PointStatus,
+    TourStatus,
+    TourStore,
+)
+
+
+def _complete_point(point, total_ms, video_ok=True):
+    point.status = PointStatus.COMPLETED
+    point.agent_results = [
+        AgentResult(
+            "video",
+            success=video_ok,
+            timing=AgentTiming("video", total_ms=total_ms / 2, llm_ms=10.0),
+        ),
+        AgentResult("Text", success=True, duration_seconds=0.2),
+    ]
+    point.timing = PointTiming(total_ms=total_ms, agents_ms=total_ms / 2)
+
+
+@pytest.fixture
+def store():
+    store = TourStore()
+    store.create("t1", "A", "B", {})
+    store.update(
+        "t1",
+        status=TourStatus.PROCESSING,
+        points=[PointResult(i, f"P{i}") for i in range(3)],
+        started_at=datetime.now() - timedelta(seconds=4),
+    )
+    return store
+
+
+class TestRingBuffer:
+    """Tests for the columnar ring buffer."""
+
+    def test_views_in_order_across_wraparound(self):
+        """Test the newest rows are one contiguous slice, oldest first."""
+        buffer = RingBuffer({"x": np.int64}, capacity=4)
+        for i in range(6):
+            buffer.append(x=i)
+
+        assert len(buffer) == 4
+        assert buffer.total == 6
+        assert buffer.column("x").tolist() == [2, 3, 4, 5]
+        assert buffer.column("x", last=2).tolist() == [4, 5]
+        assert buffer.column("x").base is not None  # a view, not a copy
+
+    def test_views_read_only(self):
+        """Test callers cannot write through a view."""
+        buffer = RingBuffer({"x": np.float64}, capacity=4)
+        buffer.append(x=1.0)
+
+        with pytest.raises(ValueError):
+            buffer.column("x")[0] = 2.0
+
+    def test_to_frame(self):
+        """Test the newest rows convert to a DataFrame."""
+        buffer = RingBuffer({"x": np.int64, "ok": np.bool_}, capacity=8)
+        buffer.append(x=1, ok=True)
+        buffer.append(x=2)
+
+        df = buffer.to_frame()
+        assert df["x"].tolist() == [1, 2]
+        assert df["ok"].tolist() == [True, False]
+
+
+class TestDashboardEventStore:
+    """Tests for recording TourStore updates."""
+
+    def test_points_recorded_once(self, store):
+        """Test repeated updates of a completed point add one event."""
+        events = DashboardEventStore()
+        events.attach(store)
+        tour = store.get("t1")
+
+        _complete_point(tour.points[0], 100.0)
+        store.update("t1", points=tour.points)
+        store.update("t1", points=tour.points)
+        _complete_point(tour.points[1], 300.0, video_ok=False)
+        store.update("t1", points=tour.points)
+
+        assert events.points.column("total_ms").tolist() == [100.0, 300.0]
+        assert len(events.agents) == 4
+        summary = events.summary("points", "total_ms")
+        assert summary["count"] == 2
+        assert summary["mean"] == pytest.approx(200.0)
+        assert events.summary("agents", "llm_ms", "video")["count"] == 2
+
+    def test_agent_stats(self, store):
+        """Test per-agent success rate and latency; unknown types are 'other'."""
+        events = DashboardEventStore()
+        events.attach(store)
+        tour = store.get("t1")
+        _complete_point(tour.points[0], 100.0, video_ok=False)
+        _complete_point(tour.points[1], 300.0)
+        store.update("t1", points=tour.points)
+
+        stats = events.agent_stats()
+        assert stats["video"]["success_rate"] == 0.5
+        assert stats["video"]["avg_response_time"] == pytest.approx(0.1, rel=0.02)
+        assert stats["text"]["calls"] == 2
+        assert stats["text"]["avg_response_time"] == pytest.approx(0.2, rel=0.02)
+
+    def test_finished_tour_recorded_once(self, store):
+        """Test a terminal status adds one tour row, later updates none."""
+        events = DashboardEventStore()
+        events.attach(store)
+
+        store.update(
+            "t1",
+            status=TourStatus.COMPLETED,
+            completed_points=3,
+            completed_at=datetime.now(),
+        )
+        store.update("t1", error="late update")
+
+        assert events.tour_status_counts()["completed"] == 1
+        assert events.tours.column("points").tolist() == [3]
+        assert events.summary("tours", "duration_s")["mean"] == pytest.approx(
+            4.0, rel=0.05
+        )
+
+    def test_throughput(self, store):
+        """Test recent points count towards throughput."""
+        events = DashboardEventStore()
+        events.attach(store)
+        tour = store.get("t1")
+        for point in tour.points:
+            _complete_point(point, 50.0)
+        store.update("t1", points=tour.points)
+
+        assert events.throughput(window_seconds=10) == pytest.approx(0.3)
+        assert events.throughput_history(buckets=5).sum() == 3
+
+    def test_matches_tour_service_timing(self):
+        """Test recorded point timings equal the stored, final ones."""
+        from src.services.tour_service import TourService
+
+        store = TourStore()
+        events = DashboardEventStore()
+        events.attach(store)
+        svc = TourService(store=store)
+        store.create("tour_events", "A", "B", {})
+
+        with patch.object(svc, "_should_use_real_apis", return_value=False):
+            svc._process_tour_async("tour_events")
+        svc._executor.shutdown(wait=False)
+
+        points = store.get("tour_events").points
+        recorded = sorted(events.points.column("store_update_ms").tolist())
+        assert recorded == sorted(p.timing.store_update_ms for p in points)
+        assert events.tour_status_counts()["completed"] == 1
+
+    def test_detach(self, store):
+        """Test a detached store records nothing further."""
+        events = DashboardEventStore()
+        events.attach(store)
+        events.detach()
+        tour = store.get("t1")
+        _complete_point(tour.points[0], 100.0)
+        store.update("t1", points=tour.points)
+
+        assert len(events) == 0
+
+
+class TestLiveMetrics:
+    """Tests for real-time metrics read from the event store."""
+
+    def test_metrics_switch_to_live(self, store, tmp_path):
+        """Test metrics come from recorded events once tours run."""
+        manager = DashboardDataManager(cache_dir=tmp_path)
+        manager.attach_tour_store(store)
+        assert manager.get_throughput_history() is None
+
+        tour = store.get("t1")
+        _complete_point(tour.points[0], 100.0)
+        store.update("t1", points=tour.points)
+        metrics = manager.get_real_time_metrics()
+
+        assert metrics["source"] == "live"
+        assert metrics["active_tours"] == 1
+        assert metrics["agents"]["video"]["success_rate"] == 1.0
+        assert metrics["error_rate"] == 0.0
+        assert len(manager.get_throughput_history(10)) == 10
+        manager.events.detach()
@@ -0,0 +1,197 @@
+"""
+Unit tests for the dashboard parameter sweep engine.
+
+Tests cover:
+- Per-cell RNG streams independent of grid layout
+- Memoization, grid extension and LRU bounds
+- Progress and partial-result streaming
+- Process-pool evaluation matching inline results
+- DashboardDataManager sweeps reusing cells, one engine per manager
+- Shutting down the sweep process pool
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+import threading
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy", reason="numpy required for dashboard tests")
+pd = pytest.importorskip("pandas", reason="pandas required for dashboard tests")
+
+from src.dashboard.data_manager import DashboardDataManager, QueueConfig
+from src.dashboard.sweep import ParameterSweep, simulate_cell
+
+
+def _configs(*soft_timeouts):
+    return [QueueConfig(soft_timeout=s) for s in soft_timeouts]
+
+
+class TestParameterSweep:
+    """Tests for memoized sweeps."""
+
+    def test_cell_independent_of_grid(self):
+        """Test a config's results do not depend on its neighbours."""
+        alone = ParameterSweep().run(_configs(4.0), n_sims=200, seed=1)[0]
+        in_grid = ParameterSweep().run(_configs(2.0, 3.0, 4.0), n_sims=200, seed=1)[2]
+
+        pd.testing.assert_frame_equal(alone, in_grid)
+
+    def test_seed_and_config_select_stream(self):
+        """Test other seeds and configs draw different samples."""
+        base = simulate_cell(QueueConfig(), None, 200, seed=1)
+
+        assert not base["video_time"].equals(
+            simulate_cell(QueueConfig(), None, 200, seed=2)["video_time"]
+        )
+        assert not base["video_time"].equals(
+            simulate_cell(QueueConfig(soft_timeout=14.0), None, 200, 1)["video_time"]
+        )
+
+    def test_extending_grid_reuses_cells(self):
+        """Test only new grid points are simulated."""
+        sweep = ParameterSweep()
+        first = sweep.run(_configs(5.0, 10.0), n_sims=100, seed=3)
+        second = sweep.run(_configs(5.0, 7.5, 10.0), n_sims=100, seed=3)
+
+        assert second[0] is first[0]
+        assert second[2] is first[1]
+        stats = sweep.get_stats()
+        assert stats["misses"] == 3
+        assert stats["hits"] == 2
+
+    def test_n_sims_and_seed_in_key(self):
+        """Test a different n_sims or seed is a different cell."""
+        sweep = ParameterSweep()
+        sweep.run(_configs(5.0), n_sims=100, seed=3)
+        sweep.run(_configs(5.0), n_sims=200, seed=3)
+        sweep.run(_configs(5.0), n_sims=100, seed=4)
+
+        assert sweep.get_stats()["misses"] == 3
+
+    def test_cache_bounded(self):
+        """Test least recently used cells are evicted."""
+        sweep = ParameterSweep(cache_size=2)
+        sweep.run(_configs(1.0, 2.0, 3.0), n_sims=10, seed=0)
+        sweep.run(_configs(1.0), n_sims=10, seed=0)
+
+        stats = sweep.get_stats()
+        assert stats["cached_cells"] == 2
+        assert stats["hits"] == 0
+
+    def test_streams_partial_results(self):
+        """Test cached cells report first, then each computed cell."""
+        sweep = ParameterSweep()
+        sweep.run(_configs(8.0), n_sims=50, seed=0)
+        events = []
+
+        sweep.run(
+            _configs(6.0, 8.0),
+            n_sims=50,
+            seed=0,
+            callback=lambda progress: events.append(progress),
+            on_result=lambda index, df: events.append(index),
+        )
+
+        assert events == [1, 0.5, 0, 1.0]
+
+    def test_process_pool_matches_inline(self):
+        """Test cells computed in worker processes equal inline ones."""
+        configs = _configs(5.0, 10.0, 15.0)
+        inline = ParameterSweep(max_workers=1).run(configs, n_sims=300, seed=9)
+
+        sweep = ParameterSweep(max_workers=2, parallel_threshold=1)
+        try:
+            pooled = sweep.run(configs, n_sims=300, seed=9)
+        finally:
+            sweep.close()
+
+        assert sweep.get_stats()["pool_cells"] == 3
+        for a, b in zip(inline, pooled, strict=True):
+            pd.testing.assert_frame_equal(a, b)
+
+
+class TestDataManagerSweeps:
+    """Tests for the analyses built on the sweep engine."""
+
+    @pytest.fixture
+    def data_manager(self, tmp_path):
+        return DashboardDataManager(cache_dir=tmp_path / "cache", seed=11)
+
+    def test_sensitivity_publishes_partial_rows(self, data_manager):
+        """Test each progress update sees the rows computed so far."""
+        seen = []
+
+        def callback(progress):
+            seen.append(len(data_manager._sensitivity_data["soft_timeout"]))
+
+        data_manager.run_sensitivity_analysis(
+            "soft_timeout", [5.0, 10.0, 15.0], n_sims=50, callback=callback
+        )
+
+        assert seen == [1, 2, 3]
+
+    def test_repeated_sweeps_reuse_cells(self, data_manager):
+        """Test moving a slider back does not re-simulate."""
+        first = data_manager.run_pareto_analysis(
+            (5, 15), (10, 25), n_points=9, n_sims=50
+        )
+        data_manager.run_sensitivity_analysis("hard_timeout", [20.0], n_sims=50)
+        again = data_manager.run_pareto_analysis(
+            (5, 15), (10, 25), n_points=9, n_sims=50
+        )
+
+        pd.testing.assert_frame_equal(first, again)
+        assert data_manager._get_sweep().get_stats()["hits"] == len(again)
+
+    def test_concurrent_callbacks_share_one_sweep(self, data_manager, monkeypatch):
+        """Test racing callbacks build a single sweep engine."""
+
+        class SlowSweep(ParameterSweep):
+            def __init__(self, *args, **kwargs):
+                time.sleep(0.05)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr("src.dashboard.sweep.ParameterSweep", SlowSweep)
+        barrier = threading.Barrier(8)
+        sweeps = []
+
+        def get():
+            barrier.wait()
+            sweeps.append(data_manager._get_sweep())
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(sweep) for sweep in sweeps}) == 1
+
+    def test_close_shuts_down_process_pool(self, data_manager):
+        """Test close() stops the sweep's pool and sweeps still work after."""
+        data_manager.close()  # No sweep yet: nothing to do
+
+        sweep = data_manager._get_sweep()
+        sweep.max_workers, sweep.parallel_threshold = 2, 1
+        data_manager.run_sensitivity_analysis("soft_timeout", [5.0, 10.0], n_sims=50)
+        assert sweep._executor is not None
+
+        data_manager.close()
+        assert sweep._executor is None
+        assert data_manager._get_sweep() is sweep
+
+    def test_seed_makes_comparison_reproducible(self, tmp_path):
+        """Test managers with the same seed compare identically."""
+        config_a = QueueConfig(soft_timeout=10.0)
+        config_b = QueueConfig(soft_timeout=20.0)
+
+        results = [
+            DashboardDataManager(
+                cache_dir=tmp_path / "cache", seed=5
+            ).compare_configurations(config_a, config_b, n_sims=200)
+            for _ in range(2)
+        ]
+
+        assert results[0]["latency"] == results[1]["latency"]
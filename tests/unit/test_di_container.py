@@ -13,7 +13,9 @@ Tests cover:
 MIT Level Testing - 85%+ Coverage Target
 """
 
-from unittest.mock import Mock
+import threading
+import time
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -332,3 +334,142 @@ class TestContainerParentLookup:
 
         child_service = child.resolve(Service)
         assert isinstance(child_service, ChildServiceImpl)
+
+
+class Leaf:
+    pass
+
+
+class Middle:
+    def __init__(self, leaf: Leaf):
+        self.leaf = leaf
+
+
+class Top:
+    def __init__(self, middle: Middle, retries: int = 3):
+        self.middle = middle
+        self.retries = retries
+
+
+class TestConstructionPlans:
+    """Tests for cached constructor plans and lock-free construction."""
+
+    @pytest.fixture
+    def container(self):
+        container = Container()
+        container.register(Leaf, lifetime=Lifetime.SINGLETON)
+        container.register(Middle)
+        container.register(Top)
+        return container
+
+    def test_signature_inspected_once(self, container):
+        """Test repeated resolutions reuse the compiled plan."""
+        import src.core.di.container as module
+
+        with patch.object(
+            module.inspect, "signature", wraps=module.inspect.signature
+        ) as signature:
+            for _ in range(50):
+                top = container.resolve(Top)
+
+        assert signature.call_count == 3  # Once per registration
+        assert top.middle.leaf is container.resolve(Leaf)
+        assert top.retries == 3
+        assert container.get_stats()["compiled_plans"] == 3
+
+    def test_register_invalidates_plans(self, container):
+        """Test a new registration rewires existing constructors."""
+
+        class OtherLeaf(Leaf):
+            pass
+
+        container.resolve(Top)
+        container.register(Leaf, OtherLeaf)
+
+        assert isinstance(container.resolve(Top).middle.leaf, OtherLeaf)
+
+    def test_string_annotations_resolved(self):
+        """Test postponed (string) annotations are wired by type."""
+        container = Container()
+        container.register(Leaf)
+
+        class Service:
+            def __init__(self, leaf: "Leaf"):
+                self.leaf = leaf
+
+        container.register(Service)
+        assert isinstance(container.resolve(Service).leaf, Leaf)
+
+    def test_circular_chain_reported(self):
+        """Test circular dependencies name the full chain."""
+        container = Container()
+
+        class A:
+            def __init__(self, b: "B"):
+                pass
+
+        class B:
+            def __init__(self, a: A):
+                pass
+
+        A.__init__.__annotations__["b"] = B
+        container.register(A)
+        container.register(B)
+
+        with pytest.raises(CircularDependencyError, match="A -> B -> A"):
+            container.resolve(A)
+        # The chain is unwound after the error
+        with pytest.raises(CircularDependencyError, match="B -> A -> B"):
+            container.resolve(B)
+
+    def test_singleton_built_once_under_contention(self):
+        """Test concurrent first resolutions share one singleton."""
+        built = []
+
+        class Slow:
+            def __init__(self):
+                time.sleep(0.01)
+                built.append(self)
+
+        container = Container()
+        container.register(Slow, lifetime=Lifetime.SINGLETON)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(container.resolve(Slow)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+        assert all(result is built[0] for result in results)
+
+    def test_transient_construction_not_serialized(self):
+        """Test slow transient constructors run concurrently."""
+        inside = threading.Barrier(2, timeout=2)
+
+        class Slow:
+            def __init__(self):
+                inside.wait()  # Deadlocks if construction holds a lock
+
+        container = Container()
+        container.register(Slow)
+
+        errors = []
+
+        def resolve():
+            try:
+                container.resolve(Slow)
+            except threading.BrokenBarrierError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=resolve) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
@@ -11,7 +11,7 @@ MIT Level Testing - 85%+ Coverage Target
 """
 
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -99,7 +99,7 @@ class TestGoogleMapsClient:
         client = GoogleMapsClient(api_key="test_api_key")
 
         assert client.api_key == "test_api_key"
-        mock_client.assert_called_once_with(key="test_api_key")
+        mock_client.assert_called_once_with(key="test_api_key", requests_session=ANY)
 
     def test_initialization_without_api_key_raises(self):
         """Test initialization without API key raises ValueError."""
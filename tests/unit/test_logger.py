@@ -4,15 +4,32 @@ Unit tests for logger module.
 Tests cover:
 - Context setting and clearing
 - Log helper functions
+- Context isolation across threads and asyncio tasks
+- Per-module sampling
+- JSON-lines and queued output
 """
 
+import asyncio
+import io
+import json
+import logging
+import threading
+
+import pytest
+
 from src.utils.logger import (
+    SamplingFilter,
     clear_log_context,
+    configure_logging,
+    get_logger,
+    get_logging_stats,
     log_agent_error,
     log_agent_result,
     log_agent_start,
+    log_context,
     log_judge_decision,
     set_log_context,
+    shutdown_logging,
 )
 
 
@@ -49,3 +66,174 @@ class TestLogHelpers:
     def test_log_judge_decision(self):
         """Test logging judge decision."""
         log_judge_decision("p1", "video", "Best quality content")
+
+
+@pytest.fixture
+def json_stream():
+    """Route project loggers to an in-memory JSON-lines stream."""
+    stream = io.StringIO()
+    configure_logging(level="INFO", format="json", use_queue=False, stream=stream)
+    yield stream
+    configure_logging()
+
+
+def read_lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def make_record(name, level=logging.INFO):
+    return logging.LogRecord(name, level, "", 0, "msg", None, None)
+
+
+class TestContextIsolation:
+    """Tests for contextvars-based log context."""
+
+    def test_log_context_restores(self, json_stream):
+        """Test the previous context is restored after the block."""
+        log = get_logger("test.logger.ctx")
+        set_log_context(point_id="outer", agent_type="-")
+        with log_context(point_id="inner", agent_type="video"):
+            log.info("inside")
+        log.info("after")
+        clear_log_context()
+
+        inside, after = read_lines(json_stream)
+        assert (inside["point_id"], inside["agent_type"]) == ("inner", "video")
+        assert (after["point_id"], after["agent_type"]) == ("outer", "-")
+
+    def test_threads_do_not_share_context(self, json_stream):
+        """Test context set in one thread is invisible in another."""
+        log = get_logger("test.logger.threads")
+        set_log_context(point_id="main")
+
+        thread = threading.Thread(target=lambda: log.info("worker"))
+        thread.start()
+        thread.join()
+        clear_log_context()
+
+        assert read_lines(json_stream)[0]["point_id"] == "-"
+
+    def test_asyncio_tasks_isolated(self, json_stream):
+        """Test concurrent tasks keep their own point context."""
+        log = get_logger("test.logger.tasks")
+
+        async def point(point_id):
+            with log_context(point_id=point_id):
+                await asyncio.sleep(0)
+                log.info("step")
+
+        async def main():
+            await asyncio.gather(point("p1"), point("p2"))
+
+        asyncio.run(main())
+        assert sorted(e["point_id"] for e in read_lines(json_stream)) == ["p1", "p2"]
+
+
+class TestSampling:
+    """Tests for per-module sampling."""
+
+    def test_keeps_exact_fraction(self):
+        """Test a rate of 0.25 keeps one record in four."""
+        sampler = SamplingFilter({"src.core": 0.25})
+        kept = sum(
+            sampler.filter(make_record("src.core.smart_queue")) for _ in range(100)
+        )
+        assert kept == 25
+        assert sampler.dropped == 75
+
+    def test_longest_prefix_and_levels(self):
+        """Test prefix matching and that warnings are never sampled."""
+        sampler = SamplingFilter({"src": 0.0, "src.agents": 1.0})
+
+        assert sampler.filter(make_record("src.agents.video_agent"))
+        assert not sampler.filter(make_record("src.core.orchestrator"))
+        assert sampler.filter(make_record("srcx"))
+        assert sampler.filter(make_record("src.core.orchestrator", logging.WARNING))
+
+    def test_sampling_applied_to_loggers(self):
+        """Test configured rates thin a module's INFO output."""
+        stream = io.StringIO()
+        configure_logging(
+            format="json",
+            use_queue=False,
+            stream=stream,
+            sample_rates={"test.logger.sampled": 0.1},
+        )
+        try:
+            log = get_logger("test.logger.sampled")
+            for i in range(50):
+                log.info("tick %d", i)
+            log.error("boom")
+            assert len(read_lines(stream)) == 6
+            assert get_logging_stats()["sampled_out"] == 45
+        finally:
+            configure_logging()
+
+
+class TestOutput:
+    """Tests for JSON-lines and queued output."""
+
+    def test_json_fields_and_extras(self, json_stream):
+        """Test JSON lines carry level, logger, message and extras."""
+        log = get_logger("test.logger.json")
+        log.warning("found %d", 3, extra={"score": 0.9})
+
+        entry = read_lines(json_stream)[0]
+        assert entry["level"] == "WARNING"
+        assert entry["logger"] == "test.logger.json"
+        assert entry["message"] == "found 3"
+        assert entry["score"] == 0.9
+
+    def test_suppressed_levels_not_formatted(self, json_stream):
+        """Test debug arguments are never rendered at INFO level."""
+        rendered = []
+
+        class Expensive:
+            def __str__(self):
+                rendered.append(True)
+                return "x"
+
+        get_logger("test.logger.lazy").debug("value %s", Expensive())
+        assert rendered == []
+        assert json_stream.getvalue() == ""
+
+    def test_queue_mode_captures_caller_context(self):
+        """Test queued records keep the producing thread's context."""
+        stream = io.StringIO()
+        configure_logging(format="json", use_queue=True, stream=stream)
+        try:
+            log = get_logger("test.logger.queue")
+            with log_context(point_id="p9", agent_type="music"):
+                log.info("queued")
+            assert get_logging_stats()["queued"] is True
+            shutdown_logging()
+
+            entry = read_lines(stream)[0]
+            assert entry["message"] == "queued"
+            assert entry["point_id"] == "p9"
+            assert entry["thread"] == threading.current_thread().name
+        finally:
+            configure_logging()
+
+    def test_records_after_shutdown_written(self):
+        """Test logging after the queue is shut down writes directly."""
+        stream = io.StringIO()
+        configure_logging(format="json", use_queue=True, stream=stream)
+        try:
+            log = get_logger("test.logger.after_shutdown")
+            log.info("before")
+            shutdown_logging()
+            with log_context(point_id="p3"):
+                log.info("after")
+
+            entries = read_lines(stream)
+            assert [e["message"] for e in entries] == ["before", "after"]
+            assert entries[1]["point_id"] == "p3"
+            assert get_logging_stats()["queued"] is False
+        finally:
+            configure_logging()
+
+    def test_unknown_format_rejected(self):
+        """Test an unknown format raises."""
+        with pytest.raises(ValueError):
+            configure_logging(format="xml")
@@ -0,0 +1,127 @@
+"""
+Unit tests for critical-path analysis.
+
+Tests cover:
+- Critical path through sequential and parallel children
+- Self time and bottleneck selection
+- Critical agent attribution
+- Tour-level report and text formatting
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+from datetime import datetime, timedelta
+
+from src.core.observability.critical_path import (
+    analyze_trace,
+    collect_trace,
+    critical_path,
+)
+from src.core.observability.tracing import Span, SpanContext, Tracer
+
+T0 = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def make_span(name, start_ms, end_ms, parent=None, **attributes):
+    """Build a finished span at fixed offsets from T0."""
+    context = SpanContext.create(parent.context if parent else None)
+    if parent is None:
+        context.trace_id = "trace-1"
+    return Span(
+        name=name,
+        context=context,
+        start_time=T0 + timedelta(milliseconds=start_ms),
+        end_time=T0 + timedelta(milliseconds=end_ms),
+        attributes=attributes,
+    )
+
+
+def build_tour():
+    """Tour with a route fetch and one point fanning out to three agents."""
+    tour = make_span("tour", 0, 1000)
+    route = make_span("route.fetch", 0, 100, tour)
+    point = make_span("point.process", 100, 1000, tour, **{"point.index": 0})
+    agents = make_span("agents.run", 110, 800, point)
+    video = make_span("agent.run", 110, 790, agents, **{"agent.type": "video"})
+    search = make_span("agent.search", 120, 700, video)
+    music = make_span("agent.run", 110, 400, agents, **{"agent.type": "music"})
+    judge = make_span("judge.run", 800, 990, point)
+    return [tour, route, point, agents, video, search, music, judge]
+
+
+class TestCriticalPath:
+    """Tests for the critical_path walk."""
+
+    def test_slowest_parallel_child_on_path(self):
+        """Test only the child that finished last is on the path."""
+        spans = build_tour()
+        point = spans[2]
+
+        names = [s.name for s in critical_path(point, spans)]
+        assert names == [
+            "point.process",
+            "agents.run",
+            "agent.run",
+            "agent.search",
+            "judge.run",
+        ]
+
+    def test_self_time_excludes_critical_children(self):
+        """Test self time subtracts the time covered by path children."""
+        spans = build_tour()
+        segments = {s.name: s for s in critical_path(spans[2], spans)}
+
+        assert segments["point.process"].self_ms == 900 - 690 - 190
+        assert segments["agent.run"].self_ms == 680 - 580
+        assert segments["agent.search"].self_ms == 580
+
+    def test_stop_at_does_not_descend(self):
+        """Test stop_at keeps the subtree collapsed."""
+        spans = build_tour()
+        names = [
+            s.name for s in critical_path(spans[0], spans, stop_at="point.process")
+        ]
+        assert names == ["tour", "route.fetch", "point.process"]
+
+
+class TestAnalyzeTrace:
+    """Tests for the tour-level report."""
+
+    def test_point_bottleneck_and_agent(self):
+        """Test the report names the dominant stage and agent."""
+        report = analyze_trace(build_tour())
+
+        assert report.duration_ms == 1000
+        assert [s.name for s in report.stages] == ["route.fetch", "point.process"]
+
+        point = report.points[0]
+        assert point.index == 0
+        assert point.bottleneck.name == "agent.search"
+        assert point.critical_agent == "video"
+
+        data = report.to_dict()
+        assert data["points"][0]["bottleneck_stage"] == "agent.search"
+        assert data["points"][0]["critical_agent"] == "video"
+
+    def test_unfinished_root_returns_none(self):
+        """Test a trace without a finished root has no report."""
+        spans = build_tour()[1:]
+        for span in spans:
+            span.context.parent_span_id = span.context.parent_span_id or "x"
+        assert analyze_trace(spans) is None
+
+    def test_format_text(self):
+        """Test the CLI rendering mentions each point."""
+        text = analyze_trace(build_tour()).format_text()
+        assert "route.fetch" in text
+        assert "critical agent video" in text
+
+    def test_collect_trace_across_tracers(self):
+        """Test spans of one trace are gathered from every tracer."""
+        first = Tracer("test-cp-a")
+        second = Tracer("test-cp-b")
+        with first.span("root") as root:
+            second.span("child").end()
+
+        spans = collect_trace(root.context.trace_id)
+        assert {s.name for s in spans} == {"root", "child"}
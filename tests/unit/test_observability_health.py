@@ -8,10 +8,13 @@ Tests cover:
 - HealthRegistry for managing checks
 - health_check decorator
 - AggregateHealth
+- Timeouts, concurrent execution and the background scheduler
 
 MIT Level Testing - 85%+ Coverage Target
 """
 
+import threading
+import time
 from datetime import datetime
 from unittest.mock import Mock
 
@@ -20,6 +23,7 @@ from src.core.observability.health import (
     HealthCheck,
     HealthCheckResult,
     HealthRegistry,
+    HealthScheduler,
     HealthStatus,
     create_liveness_probe,
     create_readiness_probe,
@@ -314,6 +318,10 @@ class TestProbes:
         """Clear registry before each test."""
         HealthRegistry.clear()
 
+    def teardown_method(self):
+        """Do not leave failing checks registered."""
+        HealthRegistry.clear()
+
     def test_liveness_probe(self):
         """Test liveness probe returns True."""
         probe = create_liveness_probe()
@@ -344,3 +352,125 @@ class TestGetHealthStatus:
         HealthRegistry.register("check1", Mock(return_value=True))
         status = get_health_status()
         assert isinstance(status, AggregateHealth)
+
+
+class TestTimeoutsAndConcurrency:
+    """Tests for enforced timeouts and concurrent checks."""
+
+    def setup_method(self):
+        HealthRegistry.clear()
+        self.release = threading.Event()
+
+    def teardown_method(self):
+        self.release.set()
+        HealthRegistry.clear()
+
+    def test_hung_check_times_out(self):
+        """Test a hung check is reported unhealthy after its timeout."""
+        check_fn = Mock(side_effect=lambda: self.release.wait(5))
+        HealthRegistry.register("hung", check_fn, timeout=0.1)
+
+        start = time.perf_counter()
+        result = HealthRegistry.run_check("hung")
+
+        assert time.perf_counter() - start < 1.0
+        assert result.status == HealthStatus.UNHEALTHY
+        assert result.details["timed_out"] is True
+
+    def test_hung_check_not_restarted(self):
+        """Test a check still in flight is joined, not started again."""
+        check_fn = Mock(side_effect=lambda: self.release.wait(5))
+        HealthRegistry.register("hung", check_fn, timeout=0.05)
+
+        HealthRegistry.run_check("hung", force=True)
+        HealthRegistry.run_check("hung", force=True)
+        assert check_fn.call_count == 1
+
+        self.release.set()
+        time.sleep(0.05)
+        assert HealthRegistry.run_check("hung", force=True).status == (
+            HealthStatus.HEALTHY
+        )
+        assert check_fn.call_count == 2
+
+    def test_checks_run_concurrently(self):
+        """Test run_all_checks takes as long as the slowest check."""
+        for i in range(4):
+            HealthRegistry.register(f"slow{i}", lambda: time.sleep(0.2) or True)
+
+        start = time.perf_counter()
+        results = HealthRegistry.run_all_checks()
+
+        assert time.perf_counter() - start < 0.6
+        assert list(results) == ["slow0", "slow1", "slow2", "slow3"]
+        assert AggregateHealth.from_results(results).is_healthy
+
+
+class TestHealthScheduler:
+    """Tests for background scheduling and the cached aggregate."""
+
+    def setup_method(self):
+        HealthRegistry.clear()
+
+    def teardown_method(self):
+        HealthRegistry.clear()
+
+    def test_start_publishes_snapshot(self):
+        """Test the cache is populated before start returns."""
+        HealthRegistry.register("ok", Mock(return_value=True))
+        scheduler = HealthScheduler(tick=60)
+        assert scheduler.get_cached() is None
+
+        scheduler.start()
+        try:
+            cached = scheduler.get_cached()
+            assert cached.status == HealthStatus.HEALTHY
+            data = cached.to_dict()
+            assert data["checks"]["ok"]["status"] == "healthy"
+            assert data["stale"] is False
+            assert data["age_seconds"] >= 0
+        finally:
+            scheduler.stop()
+
+    def test_runs_checks_at_interval(self):
+        """Test due checks are re-run in the background, others are not."""
+        fast = Mock(return_value=True)
+        slow = Mock(return_value=True)
+        HealthRegistry.register("fast", fast, interval=0.02)
+        HealthRegistry.register("slow", slow, interval=60)
+
+        scheduler = HealthScheduler(tick=0.02)
+        scheduler.start()
+        time.sleep(0.2)
+        scheduler.stop()
+
+        assert fast.call_count >= 3
+        assert slow.call_count == 1
+        assert scheduler.refreshes >= 3
+
+    def test_reads_do_not_run_checks(self):
+        """Test reading the cache never runs a check."""
+        check_fn = Mock(return_value=False)
+        HealthRegistry.register("db", check_fn, critical=True)
+        scheduler = HealthScheduler(tick=60)
+        scheduler.refresh()
+
+        for _ in range(100):
+            assert scheduler.get_cached().status == HealthStatus.UNHEALTHY
+        assert check_fn.call_count == 1
+
+    def test_staleness(self):
+        """Test snapshots older than max_age are reported stale."""
+        HealthRegistry.register("ok", Mock(return_value=True))
+        scheduler = HealthScheduler(max_age=0.01)
+        cached = scheduler.refresh()
+
+        time.sleep(0.03)
+        assert cached.is_stale
+        assert cached.to_dict()["stale"] is True
+
+    def test_default_max_age(self):
+        """Test the default max age covers the longest interval."""
+        HealthRegistry.register("a", Mock(return_value=True), interval=30, timeout=5)
+        scheduler = HealthScheduler(tick=1.0)
+        assert scheduler.refresh().max_age == 36.0
@@ -0,0 +1,292 @@
+"""
+Unit tests for observability metrics.
+
+Tests cover:
+- Histogram bucket placement and percentiles
+- DDSketch relative-error guarantees, merging and serialization
+- QuantileSketch per-label sketches and cross-worker merge
+- Prometheus text exposition and render caching
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from src.core.observability.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    QuantileSketch,
+)
+from src.core.observability.sketch import DDSketch
+
+
+def exact_quantile(values, q):
+    """Lower quantile matching DDSketch's rank definition."""
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestHistogram:
+    """Tests for Histogram bucket accounting."""
+
+    def test_observation_lands_in_one_bucket(self):
+        """Test counts are stored per bucket and cumulated on read."""
+        hist = Histogram("test_hist_single", buckets=(1, 5, 10))
+        hist.observe(3)
+        hist.observe(7)
+        hist.observe(50)
+
+        data = hist.collect()
+        assert data["buckets"][()] == {1: 0, 5: 1, 10: 2}
+        assert data["count"][()] == 3
+
+    def test_percentile_uses_correct_bucket(self):
+        """Test percentiles are not double-accumulated."""
+        hist = Histogram("test_hist_pct", buckets=(0.1, 1, 10))
+        for _ in range(90):
+            hist.observe(0.05)
+        for _ in range(10):
+            hist.observe(5)
+
+        assert hist.get_percentile(0.5) == 0.1
+        assert hist.get_percentile(0.9) == 0.1
+        assert hist.get_percentile(0.95) == 10
+
+    def test_percentile_empty(self):
+        """Test empty histogram returns None."""
+        hist = Histogram("test_hist_empty")
+        assert hist.get_percentile(0.5) is None
+
+    def test_unsorted_buckets_sorted(self):
+        """Test custom buckets are sorted."""
+        hist = Histogram("test_hist_sorted", buckets=(10, 1, 5))
+        assert hist.buckets == (1, 5, 10)
+
+    def test_cumulative_buckets_include_inf(self):
+        """Test cumulative view ends with +Inf holding the total."""
+        hist = Histogram("test_hist_inf", buckets=(1,))
+        hist.observe(0.5)
+        hist.observe(2)
+        assert hist.cumulative_buckets(())[-1] == (float("inf"), 2)
+
+
+class TestDDSketch:
+    """Tests for the DDSketch data structure."""
+
+    @pytest.mark.parametrize("q", [0.5, 0.9, 0.95, 0.99])
+    def test_relative_error_bound(self, q):
+        """Test quantiles are within relative accuracy."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(0, 1.5) for _ in range(20000)]
+        sketch = DDSketch(relative_accuracy=0.01)
+        for v in values:
+            sketch.add(v)
+
+        expected = exact_quantile(values, q)
+        assert abs(sketch.quantile(q) - expected) <= 0.01 * expected + 1e-12
+
+    def test_empty_and_bounds(self):
+        """Test empty sketch and min/max clamping."""
+        sketch = DDSketch()
+        assert sketch.quantile(0.5) is None
+
+        sketch.add(2.0)
+        assert sketch.quantile(0.0) == 2.0
+        assert sketch.quantile(1.0) == 2.0
+        with pytest.raises(ValueError):
+            sketch.quantile(1.5)
+
+    def test_zero_and_negative_values(self):
+        """Test non-positive values are ordered correctly."""
+        sketch = DDSketch()
+        for v in (-10, -1, 0, 1, 10):
+            sketch.add(v)
+        assert sketch.quantile(0.0) == -10
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == 10
+
+    def test_merge_equals_single_sketch(self):
+        """Test merging worker sketches matches one combined sketch."""
+        rng = random.Random(7)
+        values = [rng.expovariate(1.0) for _ in range(5000)]
+
+        combined = DDSketch()
+        worker_a, worker_b = DDSketch(), DDSketch()
+        for i, v in enumerate(values):
+            combined.add(v)
+            (worker_a if i % 2 else worker_b).add(v)
+
+        worker_a.merge(worker_b)
+        assert worker_a.count == combined.count
+        for q in (0.5, 0.95, 0.99):
+            assert worker_a.quantile(q) == combined.quantile(q)
+
+    def test_merge_mismatched_accuracy(self):
+        """Test merging different accuracies is rejected."""
+        with pytest.raises(ValueError):
+            DDSketch(0.01).merge(DDSketch(0.05))
+
+    def test_serialization_round_trip(self):
+        """Test to_dict/from_dict preserves quantiles."""
+        sketch = DDSketch()
+        for v in range(1, 1001):
+            sketch.add(v / 100)
+
+        clone = DDSketch.from_dict(sketch.to_dict())
+        assert clone.count == sketch.count
+        assert clone.quantile(0.99) == sketch.quantile(0.99)
+
+    def test_bins_bounded(self):
+        """Test collapsing keeps bins under max_bins."""
+        sketch = DDSketch(relative_accuracy=0.01, max_bins=50)
+        for exponent in range(-6, 7):
+            for mantissa in range(1, 10):
+                sketch.add(mantissa * 10.0**exponent)
+        assert sketch.num_bins <= 50
+        assert sketch.quantile(1.0) == sketch.max
+
+    def test_invalid_accuracy(self):
+        """Test accuracy must be in (0, 1)."""
+        with pytest.raises(ValueError):
+            DDSketch(relative_accuracy=0)
+
+
+class TestQuantileSketch:
+    """Tests for the labeled QuantileSketch metric."""
+
+    def test_per_label_quantiles(self):
+        """Test each label set has its own sketch."""
+        metric = QuantileSketch("test_qs_labels", labels=["agent_type"])
+        for i in range(100):
+            metric.observe(1.0 + i / 100, agent_type="video")
+            metric.observe(0.1, agent_type="text")
+
+        video = metric.get_quantiles(agent_type="video")
+        assert set(video) == {"p50", "p95", "p99"}
+        assert video["p50"] == pytest.approx(1.49, rel=0.02)
+        assert metric.get_percentile(0.99, agent_type="text") == pytest.approx(0.1)
+        assert metric.get_count(agent_type="video") == 100
+        assert {"agent_type": "text"} in metric.label_sets()
+
+    def test_empty_labels(self):
+        """Test unknown labels return None quantiles."""
+        metric = QuantileSketch("test_qs_empty", labels=["agent_type"])
+        assert metric.get_percentile(0.5, agent_type="music") is None
+        assert metric.get_quantiles(agent_type="music")["p99"] is None
+
+    def test_merge_from_payload(self):
+        """Test merging a serialized worker payload."""
+        primary = QuantileSketch("test_qs_primary", labels=["stage"])
+        worker = QuantileSketch("test_qs_worker", labels=["stage"])
+        primary.observe(1.0, stage="judge")
+        worker.observe(3.0, stage="judge")
+        worker.observe(2.0, stage="search")
+
+        primary.merge(worker.to_dict())
+        assert primary.get_count(stage="judge") == 2
+        assert primary.get_count(stage="search") == 1
+
+    def test_merge_from_metric(self):
+        """Test merging another QuantileSketch directly."""
+        a = QuantileSketch("test_qs_a")
+        b = QuantileSketch("test_qs_b")
+        b.observe(5.0)
+        a.merge(b)
+        assert a.get_count() == 1
+
+    def test_collect_quantile_labels(self):
+        """Test collect emits one value per quantile."""
+        metric = QuantileSketch("test_qs_collect", quantiles=(0.5, 0.99))
+        metric.observe(1.0)
+        values = metric.collect()
+        assert [v.labels["quantile"] for v in values] == ["0.5", "0.99"]
+
+
+class TestPrometheusExport:
+    """Tests for MetricsRegistry Prometheus text exposition."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_registry(self):
+        """Export only metrics created in the test."""
+        saved = dict(MetricsRegistry._metrics)
+        MetricsRegistry.clear()
+        yield
+        MetricsRegistry.clear()
+        MetricsRegistry._metrics.update(saved)
+
+    def test_counter_and_gauge(self):
+        """Test HELP/TYPE lines and labeled samples."""
+        counter = Counter("prom_requests_total", "Requests", ["method"])
+        gauge = Gauge("prom_queue_depth", "Queue depth")
+        counter.inc(method="GET")
+        counter.inc(2, method="GET")
+        gauge.set(1.5)
+
+        text = MetricsRegistry.to_prometheus()
+        assert "# HELP prom_requests_total Requests\n" in text
+        assert "# TYPE prom_requests_total counter\n" in text
+        assert 'prom_requests_total{method="GET"} 3\n' in text
+        assert "# TYPE prom_queue_depth gauge\n" in text
+        assert "prom_queue_depth 1.5\n" in text
+
+    def test_histogram_series(self):
+        """Test histograms export _bucket/_sum/_count with +Inf."""
+        hist = Histogram("prom_latency", "Latency", ["agent"], buckets=(0.5, 1))
+        hist.observe(0.2, agent="video")
+        hist.observe(3, agent="video")
+
+        text = MetricsRegistry.to_prometheus()
+        assert "# TYPE prom_latency histogram\n" in text
+        assert 'prom_latency_bucket{agent="video",le="0.5"} 1\n' in text
+        assert 'prom_latency_bucket{agent="video",le="1"} 1\n' in text
+        assert 'prom_latency_bucket{agent="video",le="+Inf"} 2\n' in text
+        assert 'prom_latency_sum{agent="video"} 3.2\n' in text
+        assert 'prom_latency_count{agent="video"} 2\n' in text
+
+    def test_quantile_sketch_is_summary(self):
+        """Test sketches export as summaries."""
+        sketch = QuantileSketch("prom_point_seconds", "Point", quantiles=(0.5,))
+        sketch.observe(2.0)
+
+        text = MetricsRegistry.to_prometheus()
+        assert "# TYPE prom_point_seconds summary\n" in text
+        assert 'prom_point_seconds{quantile="0.5"} 2' in text
+        assert "prom_point_seconds_count 1\n" in text
+
+    def test_label_values_escaped(self):
+        """Test quotes, backslashes and newlines are escaped."""
+        counter = Counter("prom_escape_total", "Escape", ["path"])
+        counter.inc(path='a"b\\c\nd')
+
+        text = MetricsRegistry.to_prometheus()
+        assert 'prom_escape_total{path="a\\"b\\\\c\\nd"} 1\n' in text
+
+    def test_rendering_cached_until_mutation(self):
+        """Test unchanged metrics reuse their rendered text."""
+        counter = Counter("prom_cached_total", "Cached")
+        counter.inc()
+        MetricsRegistry.to_prometheus()
+
+        with patch.object(
+            Counter, "prometheus_samples", side_effect=AssertionError
+        ) as render:
+            MetricsRegistry.to_prometheus()
+            render.assert_not_called()
+
+        counter.inc()
+        assert "prom_cached_total 2\n" in MetricsRegistry.to_prometheus()
+
+    def test_reregistered_metric_not_served_from_cache(self):
+        """Test replacing a metric under the same name re-renders."""
+        Counter("prom_replaced_total", "Old").inc(5)
+        MetricsRegistry.to_prometheus()
+
+        Counter("prom_replaced_total", "New")
+        text = MetricsRegistry.to_prometheus()
+        assert "# HELP prom_replaced_total New\n" in text
+        assert "prom_replaced_total 5" not in text
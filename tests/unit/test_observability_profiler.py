@@ -0,0 +1,133 @@
+"""
+Unit tests for the sampling profiler.
+
+Tests cover:
+- Thread grouping by name prefix
+- Folded-stack output and windows
+- Idle-thread filtering
+- Overhead accounting
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.core.observability.profiler import SamplingProfiler
+
+
+def busy_leaf(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(200))
+
+
+def busy_worker(stop: threading.Event) -> None:
+    busy_leaf(stop)
+
+
+@pytest.fixture
+def busy_threads():
+    """Two CPU-bound threads in a named pool and an idle one."""
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=busy_worker, args=(stop,), name=f"PointProcessor_{i}")
+        for i in range(2)
+    ]
+    threads.append(threading.Thread(target=stop.wait, name="Idle-1"))
+    for thread in threads:
+        thread.start()
+    yield
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+
+class TestGrouping:
+    """Tests for thread-name grouping."""
+
+    def test_prefix_groups(self):
+        """Test configured prefixes win, pool indexes are stripped otherwise."""
+        profiler = SamplingProfiler()
+        assert profiler.group_name("PointProcessor_3") == "PointProcessor"
+        assert profiler.group_name("Agent-P4_1") == "Agent-P"
+        assert profiler.group_name("EventBus_0") == "EventBus"
+        assert profiler.group_name("ThreadPoolExecutor-2_0") == "ThreadPoolExecutor"
+        assert profiler.group_name("health-db") == "health-db"
+
+    def test_invalid_rate(self):
+        """Test hz must be positive."""
+        with pytest.raises(ValueError):
+            SamplingProfiler(hz=0)
+
+
+class TestSampling:
+    """Tests for stack sampling and export."""
+
+    def test_folded_stacks(self, busy_threads):
+        """Test busy threads show up with their full stack."""
+        profiler = SamplingProfiler()
+        for _ in range(20):
+            profiler.sample()
+
+        folded = profiler.folded(group="PointProcessor")
+        assert sum(folded.values()) == 40
+        stack = max(folded, key=folded.get)
+        assert stack.startswith("PointProcessor;")
+        assert "busy_worker (test_observability_profiler.py:" in stack
+        assert stack.index("busy_worker") < stack.index("busy_leaf")
+
+        line = profiler.format_folded(group="PointProcessor").splitlines()[0]
+        assert line.rsplit(" ", 1)[1].isdigit()
+
+    def test_idle_threads_skipped(self, busy_threads):
+        """Test parked threads are only counted with include_idle."""
+        profiler = SamplingProfiler()
+        profiler.sample()
+        assert "Idle" not in profiler.group_totals()
+
+        profiler = SamplingProfiler(include_idle=True)
+        profiler.sample()
+        assert "Idle" in profiler.group_totals()
+
+    def test_window_from_snapshots(self, busy_threads):
+        """Test subtracting snapshots gives only the window's samples."""
+        profiler = SamplingProfiler()
+        for _ in range(5):
+            profiler.sample()
+        before = profiler.snapshot()
+        for _ in range(3):
+            profiler.sample()
+
+        window = profiler.snapshot() - before
+        assert profiler.group_totals(window)["PointProcessor"] == 6
+        assert list(profiler.group_totals(window, group="PointProcessor")) == [
+            "PointProcessor"
+        ]
+
+    def test_restart_rereads_thread_names(self):
+        """Test a restart forgets thread names cached before the stop."""
+        profiler = SamplingProfiler()
+        profiler._group_by_ident = {threading.get_ident(): "Stale"}
+        profiler.start()
+        profiler.stop()
+        assert "Stale" not in profiler._group_by_ident.values()
+
+    def test_background_sampling(self, busy_threads):
+        """Test the sampler thread runs at roughly the configured rate."""
+        with SamplingProfiler(hz=200) as profiler:
+            time.sleep(0.25)
+
+        stats = profiler.get_stats()
+        assert not stats["running"]
+        assert 10 <= stats["samples"] <= 60
+        assert stats["overhead_percent"] < 50
+        assert "SamplingProfiler" not in profiler.group_totals()
+
+    def test_reset(self, busy_threads):
+        """Test reset drops recorded stacks."""
+        profiler = SamplingProfiler()
+        profiler.sample()
+        profiler.reset()
+        assert profiler.folded() == {}
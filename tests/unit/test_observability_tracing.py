@@ -0,0 +1,337 @@
+"""
+Unit tests for distributed tracing.
+
+Tests cover:
+- Span nesting and parent restoration
+- Cross-thread context propagation
+- Ring-buffer span retention
+- Head and tail sampling
+- Batched OTLP JSON-lines export
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+import contextvars
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.observability.exporters import (
+    BatchSpanProcessor,
+    OTLPJsonLinesExporter,
+    span_to_otlp,
+)
+from src.core.observability.tracing import (
+    SamplingPolicy,
+    SpanContext,
+    SpanKind,
+    SpanStatus,
+    Tracer,
+    get_current_span,
+    submit_in_context,
+)
+
+
+class RecordingExporter:
+    """Exporter that keeps batches in memory."""
+
+    def __init__(self):
+        self.batches = []
+        self.shut_down = False
+
+    def export(self, spans):
+        self.batches.append(list(spans))
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+class TestSpanContext:
+    """Tests for span context IDs."""
+
+    def test_id_formats(self):
+        """Test trace IDs are 128-bit and span IDs 64-bit hex."""
+        context = SpanContext.create()
+        assert len(context.trace_id) == 32
+        assert len(context.span_id) == 16
+        int(context.trace_id, 16)
+        int(context.span_id, 16)
+
+    def test_child_inherits_trace_and_sampling(self):
+        """Test children keep trace ID and sampling decision."""
+        root = SpanContext.create(sampled=False)
+        child = SpanContext.create(root)
+
+        assert child.trace_id == root.trace_id
+        assert child.parent_span_id == root.span_id
+        assert child.is_sampled is False
+
+    def test_ids_unique(self):
+        """Test generated IDs do not collide."""
+        ids = {SpanContext.create().span_id for _ in range(10000)}
+        assert len(ids) == 10000
+
+
+class TestTracer:
+    """Tests for span nesting and storage."""
+
+    @pytest.fixture
+    def tracer(self):
+        return Tracer("test-tracer")
+
+    def test_nested_spans_restore_parent(self, tracer):
+        """Test ending a child makes the parent current again."""
+        with tracer.span("root") as root:
+            with tracer.span("child") as child:
+                assert get_current_span() is child
+                assert child.context.parent_span_id == root.context.span_id
+            assert get_current_span() is root
+        assert get_current_span() is None
+
+    def test_span_ended_in_other_thread(self, tracer):
+        """Test ending a span outside its context does not corrupt it."""
+        with tracer.span("root") as root:
+            child = tracer.span("child")
+            thread = threading.Thread(target=child.end)
+            thread.start()
+            thread.join()
+            assert child.end_time is not None
+        assert root.end_time is not None
+        assert get_current_span() is None
+
+    def test_context_propagates_to_thread_pool(self, tracer):
+        """Test copied contexts parent spans created in worker threads."""
+        with tracer.span("root") as root:
+            context = contextvars.copy_context()
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                child = pool.submit(context.run, lambda: tracer.span("w")).result()
+            child.end()
+        assert child.context.parent_span_id == root.context.span_id
+
+    def test_submit_in_context(self, tracer):
+        """Test submit_in_context parents worker spans under the caller."""
+        with tracer.span("root") as root:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                child = submit_in_context(pool, tracer.span, "w").result()
+            child.end()
+        assert child.context.parent_span_id == root.context.span_id
+
+    def test_ring_buffer_keeps_newest(self):
+        """Test storage is bounded and evicts the oldest spans."""
+        tracer = Tracer("test-ring", max_spans=5)
+        for i in range(12):
+            tracer.span(f"s{i}").end()
+
+        names = [s.name for s in tracer.get_spans()]
+        assert names == ["s7", "s8", "s9", "s10", "s11"]
+
+    def test_get_spans_by_trace(self, tracer):
+        """Test filtering spans by trace ID."""
+        with tracer.span("a") as a:
+            tracer.span("a.child").end()
+        tracer.span("b").end()
+
+        spans = tracer.get_spans(trace_id=a.context.trace_id)
+        assert {s.name for s in spans} == {"a", "a.child"}
+
+    def test_inactive_span_does_not_parent(self, tracer):
+        """Test activate=False keeps the caller's span current."""
+        with tracer.span("root") as root:
+            stream = tracer.span("stream", activate=False)
+            with tracer.span("sibling") as sibling:
+                assert sibling.context.parent_span_id == root.context.span_id
+            stream.end()
+            assert get_current_span() is root
+        assert stream.context.parent_span_id == root.context.span_id
+
+    def test_exception_recorded(self, tracer):
+        """Test exceptions mark the span as failed."""
+        with pytest.raises(RuntimeError):
+            with tracer.span("boom"):
+                raise RuntimeError("fail")
+        assert tracer.get_spans()[-1].status == SpanStatus.ERROR
+
+
+class TestSampling:
+    """Tests for head and tail sampling."""
+
+    def test_head_sampling_drops_whole_trace(self):
+        """Test unsampled traces are not recorded."""
+        tracer = Tracer(
+            "test-head", sampling=SamplingPolicy(rate=0.0, keep_errors=False)
+        )
+        with tracer.span("root"):
+            tracer.span("child").end()
+
+        assert tracer.get_spans() == []
+        assert tracer.get_stats()["spans_dropped"] == 2
+
+    def test_tail_keeps_failed_trace(self):
+        """Test a head-dropped trace with an error is kept."""
+        tracer = Tracer("test-tail-error", sampling=SamplingPolicy(rate=0.0))
+        with tracer.span("root"):
+            with pytest.raises(ValueError):
+                with tracer.span("child"):
+                    raise ValueError("bad")
+
+        spans = tracer.get_spans()
+        assert [s.name for s in spans] == ["child", "root"]
+        assert all(s.context.is_sampled for s in spans)
+        assert tracer.get_stats()["traces_kept_by_tail"] == 1
+
+    def test_tail_keeps_slow_trace(self):
+        """Test slow traces pass the latency threshold."""
+        tracer = Tracer(
+            "test-tail-slow",
+            sampling=SamplingPolicy(rate=0.0, latency_threshold_ms=5),
+        )
+        with tracer.span("fast"):
+            pass
+        with tracer.span("slow"):
+            time.sleep(0.01)
+
+        assert [s.name for s in tracer.get_spans()] == ["slow"]
+
+    def test_pending_traces_bounded(self):
+        """Test buffered traces whose root never ends are evicted."""
+        tracer = Tracer(
+            "test-tail-bound",
+            sampling=SamplingPolicy(rate=0.0, max_pending_traces=3),
+        )
+
+        def abandoned_trace():
+            tracer.span("root")
+            tracer.span("child").end()
+
+        for _ in range(10):
+            contextvars.copy_context().run(abandoned_trace)
+
+        assert tracer.get_stats()["pending_traces"] == 3
+
+
+class TestExport:
+    """Tests for OTLP encoding and batch export."""
+
+    def test_span_to_otlp(self):
+        """Test OTLP/JSON field names and encodings."""
+        tracer = Tracer("test-otlp")
+        with tracer.span("root", kind=SpanKind.SERVER) as root:
+            with tracer.span("child", attributes={"n": 3, "ok": True}) as child:
+                child.add_event("hit", {"score": 0.5})
+
+        encoded = span_to_otlp(child)
+        assert encoded["traceId"] == root.context.trace_id
+        assert encoded["parentSpanId"] == root.context.span_id
+        assert encoded["kind"] == 1
+        assert {"key": "n", "value": {"intValue": "3"}} in encoded["attributes"]
+        assert {"key": "ok", "value": {"boolValue": True}} in encoded["attributes"]
+        assert int(encoded["endTimeUnixNano"]) >= int(encoded["startTimeUnixNano"])
+        assert encoded["events"][0]["name"] == "hit"
+        assert span_to_otlp(root)["kind"] == 2
+        assert "parentSpanId" not in span_to_otlp(root)
+
+    def test_batch_processor_flushes(self):
+        """Test spans are exported in batches off-thread."""
+        exporter = RecordingExporter()
+        processor = BatchSpanProcessor(exporter, max_batch_size=4)
+        tracer = Tracer("test-batch")
+        tracer.add_span_processor(processor)
+
+        for i in range(10):
+            tracer.span(f"s{i}").end()
+
+        assert processor.force_flush(timeout=2.0)
+        assert sum(len(b) for b in exporter.batches) == 10
+        assert max(len(b) for b in exporter.batches) <= 4
+
+        tracer.shutdown()
+        assert exporter.shut_down
+
+    def test_trickle_exported_within_delay(self):
+        """Test a steady trickle of spans is exported every schedule delay."""
+        exporter = RecordingExporter()
+        processor = BatchSpanProcessor(exporter, schedule_delay_seconds=0.2)
+        tracer = Tracer("test-trickle")
+        tracer.add_span_processor(processor)
+
+        start = time.monotonic()
+        first_export = None
+        while time.monotonic() - start < 1.0:
+            tracer.span("tick").end()
+            if first_export is None and exporter.batches:
+                first_export = time.monotonic() - start
+            time.sleep(0.05)
+
+        # Spans arrive faster than the delay, so only the deadline exports them
+        assert first_export is not None and first_export < 0.6
+        assert len(exporter.batches) >= 3
+        tracer.shutdown()
+
+    def test_full_queue_drops(self):
+        """Test a full queue drops spans instead of blocking."""
+        exporter = RecordingExporter()
+        processor = BatchSpanProcessor(
+            exporter, max_queue_size=1, schedule_delay_seconds=60
+        )
+        tracer = Tracer("test-drop")
+        tracer.add_span_processor(processor)
+
+        gate = threading.Event()
+        exporter.export = lambda spans: gate.wait(2)
+        for i in range(50):
+            tracer.span(f"s{i}").end()
+        gate.set()
+
+        assert processor.get_stats()["spans_dropped"] > 0
+        processor.shutdown()
+
+    def test_jsonl_file_exporter(self, tmp_path):
+        """Test each batch becomes one OTLP/JSON line."""
+        path = tmp_path / "traces.jsonl"
+        processor = BatchSpanProcessor(OTLPJsonLinesExporter(path=path))
+        tracer = Tracer("test-file")
+        tracer.add_span_processor(processor)
+
+        with tracer.span("root"):
+            tracer.span("child").end()
+        tracer.shutdown()
+
+        lines = path.read_text().splitlines()
+        payload = json.loads(lines[0])
+        resource = payload["resourceSpans"][0]
+        spans = resource["scopeSpans"][0]["spans"]
+        assert {s["name"] for s in spans} == {"root", "child"}
+        assert resource["resource"]["attributes"][0]["key"] == "service.name"
+
+    def test_socket_exporter(self):
+        """Test batches are written to a TCP listener."""
+        server = socket.create_server(("127.0.0.1", 0))
+        received = []
+
+        def accept():
+            conn, _ = server.accept()
+            with conn:
+                received.append(conn.makefile().readline())
+
+        thread = threading.Thread(target=accept)
+        thread.start()
+
+        exporter = OTLPJsonLinesExporter(address=server.getsockname())
+        tracer = Tracer("test-socket")
+        with tracer.span("root") as root:
+            pass
+        exporter.export([root])
+        thread.join(timeout=2)
+        exporter.shutdown()
+        server.close()
+
+        assert json.loads(received[0])["resourceSpans"]
+
+    def test_exporter_requires_target(self):
+        """Test an exporter needs a file or socket."""
+        with pytest.raises(ValueError):
+            OTLPJsonLinesExporter()
@@ -8,12 +8,15 @@ Tests cover:
 - Result collection and ordering
 - Statistics tracking
 - StreamingOrchestrator functionality
+- Judging through a shared JudgeBatcher
 
 MIT Level Testing - 85%+ Coverage Target
 """
 
 import threading
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+
+import pytest
 
 
 class TestPointProcessor:
@@ -229,6 +232,83 @@ class TestOrchestratorAdditional:
             orchestrator.stop()
 
 
+class TestBatchedJudging:
+    """Tests for judging points through the shared JudgeBatcher."""
+
+    def test_processor_waits_for_batched_decision(self, mock_route_point):
+        """Test a processor takes its decision from the batcher's future."""
+        from concurrent.futures import Future
+
+        from src.core.orchestrator import PointProcessor
+
+        decision = Mock()
+        future = Future()
+        future.set_result(decision)
+        batcher = Mock()
+        batcher.submit.return_value = future
+
+        processor = PointProcessor(mock_route_point, Mock(), judge_batcher=batcher)
+        processor.content_results = [Mock()]
+
+        assert processor._judge() is decision
+        batcher.submit.assert_called_once_with(
+            mock_route_point, processor.content_results
+        )
+
+    def test_points_judged_in_batches(self, mock_route):
+        """Test concurrent points share judge batches and keep their decisions."""
+        from src.core.orchestrator import Orchestrator
+        from src.utils.config import settings
+
+        with (
+            patch("src.agents.base_agent.settings") as mock_settings,
+            patch.object(settings, "judge_batch_size", 3),
+        ):
+            mock_settings.anthropic_api_key = None
+            mock_settings.openai_api_key = None
+
+            orchestrator = Orchestrator(max_concurrent_points=3)
+            orchestrator.start()
+            batcher = orchestrator.judge_batcher
+            decisions = orchestrator.process_points(mock_route.points)
+
+        assert [d.point_id for d in decisions] == [p.id for p in mock_route.points]
+        stats = batcher.get_stats()
+        assert stats["points"] + stats["decided_inline"] == 3
+        assert orchestrator.judge_batcher is None
+
+    def test_batched_wait_uses_its_own_timeout(self, mock_route_point):
+        """Test the wait for a batched verdict is bounded by its own setting."""
+        from concurrent.futures import Future
+        from concurrent.futures import TimeoutError as FutureTimeout
+
+        from src.core.orchestrator import PointProcessor
+        from src.utils.config import settings
+
+        batcher = Mock()
+        batcher.submit.return_value = Future()
+        processor = PointProcessor(mock_route_point, Mock(), judge_batcher=batcher)
+        processor.content_results = [Mock()]
+
+        with (
+            patch.object(settings, "agent_timeout_seconds", 60.0),
+            patch.object(settings, "judge_batch_timeout_seconds", 0.01),
+        ):
+            with pytest.raises(FutureTimeout):
+                processor._judge()
+
+    def test_batching_disabled(self):
+        """Test JUDGE_BATCH_SIZE=1 keeps per-point judging."""
+        from src.core.orchestrator import Orchestrator
+        from src.utils.config import settings
+
+        with patch.object(settings, "judge_batch_size", 1):
+            orchestrator = Orchestrator(max_concurrent_points=3)
+            orchestrator.start()
+        assert orchestrator.judge_batcher is None
+        orchestrator.stop()
+
+
 class TestPointProcessorExecution:
     """Tests for PointProcessor execution flow."""
 
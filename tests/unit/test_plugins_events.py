@@ -0,0 +1,168 @@
+"""
+Unit tests for the event bus.
+
+Tests cover:
+- Priority and class-hierarchy dispatch
+- Dispatch table caching and invalidation
+- Bounded event log
+- Unvalidated event construction
+- Queued, batched delivery
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from src.core.plugins.events import (
+    AgentCompletedEvent,
+    Event,
+    EventBus,
+    EventPriority,
+)
+
+
+class PointEvent(Event):
+    """Test event carrying a point ID."""
+
+    point_id: str
+
+
+class PointDone(PointEvent):
+    """Test event subclass."""
+
+    ok: bool = True
+
+
+@pytest.fixture(autouse=True)
+def clean_bus():
+    EventBus.clear()
+    yield
+    EventBus.flush()
+    EventBus.clear()
+
+
+class TestDispatch:
+    """Tests for synchronous dispatch."""
+
+    def test_priority_and_hierarchy(self):
+        """Test subclass events reach base handlers, in priority order."""
+        calls = []
+        EventBus.add_handler(PointEvent, lambda e: calls.append("base"))
+        EventBus.add_handler(
+            PointDone, lambda e: calls.append("high"), priority=EventPriority.HIGH
+        )
+        EventBus.add_global_handler(lambda e: calls.append("global"))
+
+        EventBus.publish(PointDone(point_id="p1"))
+        assert calls == ["high", "base", "global"]
+
+    def test_dispatch_table_invalidated(self):
+        """Test subscription changes apply to the next publish."""
+        calls = []
+        EventBus.publish(PointDone(point_id="p1"))
+        assert EventBus.get_stats()["dispatch_tables"] == 1
+
+        handler_id = EventBus.add_handler(PointEvent, calls.append)
+        EventBus.publish(PointDone(point_id="p2"))
+        EventBus.remove_handler(handler_id)
+        EventBus.publish(PointDone(point_id="p3"))
+
+        assert [e.point_id for e in calls] == ["p2"]
+
+    def test_once_handler(self):
+        """Test one-time handlers are removed after the first call."""
+        calls = []
+        EventBus.add_handler(PointEvent, calls.append, once=True)
+
+        EventBus.publish(PointEvent(point_id="a"))
+        EventBus.publish(PointEvent(point_id="b"))
+        assert len(calls) == 1
+
+    def test_event_log_bounded(self):
+        """Test the event log keeps only the newest events."""
+        for i in range(EventBus._max_log_size + 50):
+            EventBus.publish(PointEvent.create(point_id=str(i)))
+
+        log = EventBus.get_event_log(limit=EventBus._max_log_size * 2)
+        assert len(log) == EventBus._max_log_size
+        assert log[-1].point_id == str(EventBus._max_log_size + 49)
+
+
+class TestEventCreate:
+    """Tests for unvalidated event construction."""
+
+    def test_create_matches_constructor(self):
+        """Test create fills defaults like the validating constructor."""
+        event = AgentCompletedEvent.create(
+            agent_type="video", point_id="p1", duration_seconds=1.5, success=True
+        )
+
+        assert event.event_type == "AgentCompletedEvent"
+        assert event.content_title is None
+        assert event.metadata == {}
+        assert len(event.event_id) == 32
+        assert AgentCompletedEvent(**event.model_dump()) == event
+
+    def test_create_is_frozen(self):
+        """Test created events are still immutable."""
+        event = PointEvent.create(point_id="p1")
+        with pytest.raises(ValidationError):
+            event.point_id = "p2"
+
+
+class TestQueuedDelivery:
+    """Tests for mailbox delivery."""
+
+    def test_queued_handler_runs_off_thread_in_order(self):
+        """Test queued handlers get every event in publish order."""
+        seen = []
+        threads = set()
+
+        def handler(event):
+            threads.add(threading.current_thread().name)
+            seen.append(event.point_id)
+
+        EventBus.add_handler(PointEvent, handler, queued=True)
+        for i in range(100):
+            EventBus.publish(PointEvent.create(point_id=str(i)))
+
+        assert EventBus.flush(timeout=5)
+        assert seen == [str(i) for i in range(100)]
+        assert threading.current_thread().name not in threads
+
+    def test_batch_handler_receives_lists(self):
+        """Test batch subscribers get lists of at most max_batch_size."""
+        gate = threading.Event()
+        batches = []
+
+        def handler(events):
+            gate.wait(2)
+            batches.append(len(events))
+
+        EventBus.add_handler(
+            PointEvent, handler, queued=True, batch=True, max_batch_size=10
+        )
+        for i in range(25):
+            EventBus.publish(PointEvent.create(point_id=str(i)))
+        gate.set()
+
+        assert EventBus.flush(timeout=5)
+        assert sum(batches) == 25
+        assert max(batches) <= 10
+        assert len(batches) < 25
+
+    def test_full_mailbox_drops(self):
+        """Test a full mailbox drops instead of blocking the publisher."""
+        gate = threading.Event()
+        EventBus.add_handler(
+            PointEvent, lambda e: gate.wait(2), queued=True, max_queue_size=5
+        )
+        for i in range(20):
+            EventBus.publish(PointEvent.create(point_id=str(i)))
+
+        stats = EventBus.get_stats()["queued_subscribers"][0]
+        gate.set()
+        assert stats["dropped"] >= 14
@@ -0,0 +1,168 @@
+"""
+Unit tests for the hook system.
+
+Tests cover:
+- Hook ordering by type and priority
+- Around-hook chaining and result overrides
+- Error and finally hooks
+- Compiled chain caching and invalidation
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+import pytest
+
+from src.core.plugins.hooks import (
+    HookPriority,
+    HookRegistry,
+    HookType,
+    after_hook,
+    around_hook,
+    before_hook,
+    error_hook,
+    finally_hook,
+    hookable,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    HookRegistry.clear()
+    yield
+    HookRegistry.clear()
+
+
+class TestHookable:
+    """Tests for hooked calls."""
+
+    def test_no_hooks_calls_function(self):
+        """Test a hook point without hooks behaves like the function."""
+
+        @hookable("test.plain")
+        def double(x):
+            return x * 2
+
+        assert double(4) == 8
+        assert HookRegistry.compile("test.plain").empty
+
+    def test_execution_order(self):
+        """Test before/around/after run in priority order."""
+        calls = []
+
+        @hookable("test.order")
+        def target(x):
+            calls.append("target")
+            return x
+
+        @before_hook("test.order", priority=HookPriority.LOW)
+        def late(x):
+            calls.append("before-low")
+
+        @before_hook("test.order", priority=HookPriority.HIGH)
+        def early(x):
+            calls.append("before-high")
+
+        @around_hook("test.order")
+        def outer(proceed, x):
+            calls.append("around-1")
+            return proceed()
+
+        @around_hook("test.order")
+        def inner(proceed, x):
+            calls.append("around-2")
+            return proceed()
+
+        @after_hook("test.order")
+        def after(result, x):
+            calls.append("after")
+
+        target(1)
+        assert calls == [
+            "before-high",
+            "before-low",
+            "around-1",
+            "around-2",
+            "target",
+            "after",
+        ]
+
+    def test_after_hook_overrides_result(self):
+        """Test a non-None after-hook return replaces the result."""
+
+        @hookable("test.after")
+        def target():
+            return 1
+
+        after_hook("test.after")(lambda result: result + 10)
+        assert target() == 11
+
+    def test_error_and_finally_hooks(self):
+        """Test error hooks see the exception and finally hooks always run."""
+        seen = {}
+
+        @hookable("test.error")
+        def target():
+            raise ValueError("boom")
+
+        error_hook("test.error")(lambda e: seen.setdefault("error", e))
+        finally_hook("test.error")(
+            lambda result, error: seen.setdefault("finally", error)
+        )
+
+        with pytest.raises(ValueError):
+            target()
+        assert isinstance(seen["error"], ValueError)
+        assert seen["finally"] is seen["error"]
+
+
+class TestCompiledChains:
+    """Tests for chain caching and invalidation."""
+
+    def test_chain_cached_until_change(self):
+        """Test the same chain is reused while the registry is unchanged."""
+        HookRegistry.register("test.cache", HookType.BEFORE, lambda: None)
+        chain = HookRegistry.compile("test.cache")
+        assert HookRegistry.compile("test.cache") is chain
+
+        HookRegistry.register("test.other", HookType.BEFORE, lambda: None)
+        assert HookRegistry.compile("test.cache") is not chain
+
+    def test_disable_and_unregister_take_effect(self):
+        """Test disabling or removing a hook updates hooked calls."""
+        calls = []
+
+        @hookable("test.toggle")
+        def target():
+            return "ok"
+
+        hook_id = HookRegistry.register(
+            "test.toggle", HookType.BEFORE, lambda: calls.append(1)
+        )
+        target()
+        HookRegistry.set_enabled(hook_id, False)
+        target()
+        assert calls == [1]
+        assert HookRegistry.compile("test.toggle").empty
+
+        HookRegistry.set_enabled(hook_id, True)
+        target()
+        HookRegistry.unregister(hook_id)
+        target()
+        assert calls == [1, 1]
+
+    def test_direct_enabled_change_invalidates(self):
+        """Test toggling Hook.enabled directly is picked up."""
+        HookRegistry.register("test.direct", HookType.AFTER, lambda r: None)
+        hook = HookRegistry.get_hooks("test.direct")[0]
+        assert not HookRegistry.compile("test.direct").empty
+
+        hook.enabled = False
+        assert HookRegistry.compile("test.direct").empty
+
+    def test_execute_hooks_counts(self):
+        """Test explicit execution returns results and counts calls."""
+        hook_id = HookRegistry.register("test.exec", HookType.BEFORE, lambda x: x + 1)
+
+        assert HookRegistry.execute_hooks("test.exec", HookType.BEFORE, 1) == [2]
+        assert HookRegistry.execute_hooks("test.exec", HookType.AFTER) == []
+        assert HookRegistry.get_stats()["execution_counts"][hook_id] == 1
@@ -0,0 +1,228 @@
+"""
+Unit tests for plugin startup and discovery.
+
+Tests cover:
+- Parallel start by dependency level
+- Start timeouts (parallel, single-plugin and serial levels)
+- Dependency-failure skips
+- Startup report
+- Manifest-only discovery with deferred import
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from src.core.plugins.base import BasePlugin, PluginMetadata
+from src.core.plugins.manager import PluginManager, PluginManagerConfig
+from src.core.plugins.registry import PluginRegistry
+
+START_LOG: list[tuple[str, float]] = []
+
+
+def make_plugin(name, delay=0.0, fail=False, depends_on=(), enabled=True):
+    """Register a test plugin whose start sleeps for `delay` seconds."""
+
+    class TestPlugin(BasePlugin):
+        metadata = PluginMetadata(
+            name=name,
+            version="1.0.0",
+            depends_on=list(depends_on),
+            enabled=enabled,
+        )
+
+        def _on_start(self):
+            time.sleep(delay)
+            if fail:
+                raise RuntimeError(f"{name} failed")
+            START_LOG.append((name, time.perf_counter()))
+
+        def _on_stop(self):
+            pass
+
+    PluginRegistry.register_plugin(name, TestPlugin)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    PluginRegistry.clear()
+    START_LOG.clear()
+    yield
+    PluginRegistry.clear()
+
+
+@pytest.fixture
+def manager():
+    return PluginManager(
+        PluginManagerConfig(
+            auto_discover=False,
+            health_check_interval=0,
+            graceful_shutdown=False,
+            start_timeout=2.0,
+        )
+    )
+
+
+class TestParallelStart:
+    """Tests for level-parallel start_all."""
+
+    def test_independent_plugins_start_in_parallel(self, manager):
+        """Test one level takes about as long as its slowest plugin."""
+        for i in range(4):
+            make_plugin(f"p{i}", delay=0.2)
+
+        start = time.perf_counter()
+        results = manager.start_all()
+        elapsed = time.perf_counter() - start
+
+        assert all(results.values())
+        assert elapsed < 0.6
+
+    def test_dependencies_start_first(self, manager):
+        """Test dependents start after their dependencies finish."""
+        make_plugin("db", delay=0.1)
+        make_plugin("cache", delay=0.05)
+        make_plugin("api", depends_on=["db", "cache"])
+        make_plugin("disabled", enabled=False)
+        make_plugin("ui", depends_on=["api", "disabled"])
+
+        assert manager.start_all() == {
+            "db": True,
+            "cache": True,
+            "api": True,
+            "ui": True,
+        }
+        order = [name for name, _ in sorted(START_LOG, key=lambda e: e[1])]
+        assert order.index("api") > max(order.index("db"), order.index("cache"))
+        assert order[-1] == "ui"
+
+        levels = {
+            p["name"]: p["level"] for p in manager.get_startup_report()["plugins"]
+        }
+        assert levels == {"db": 0, "cache": 0, "api": 1, "ui": 2}
+
+    def test_failed_dependency_skips_dependents(self, manager):
+        """Test dependents of a failed plugin are not started."""
+        make_plugin("base", fail=True)
+        make_plugin("child", depends_on=["base"])
+        make_plugin("other")
+
+        results = manager.start_all()
+
+        assert results == {"base": False, "other": True, "child": False}
+        report = {p["name"]: p for p in manager.get_startup_report()["plugins"]}
+        assert report["base"]["status"] == "failed"
+        assert report["child"]["status"] == "skipped"
+
+    def test_start_timeout(self, manager):
+        """Test slow plugins are reported as timed out."""
+        manager.config.start_timeout = 0.1
+        make_plugin("slow", delay=0.5)
+        make_plugin("fast")
+
+        start = time.perf_counter()
+        results = manager.start_all()
+
+        assert time.perf_counter() - start < 0.4
+        assert results == {"slow": False, "fast": True}
+        report = {p["name"]: p for p in manager.get_startup_report()["plugins"]}
+        assert report["slow"]["status"] == "timeout"
+
+    def test_single_plugin_level_timeout(self, manager):
+        """Test a level with one plugin is still bounded by start_timeout."""
+        manager.config.start_timeout = 0.1
+        make_plugin("slow", delay=0.5)
+        make_plugin("child", depends_on=["slow"])
+
+        start = time.perf_counter()
+        results = manager.start_all()
+
+        assert time.perf_counter() - start < 0.4
+        assert results == {"slow": False, "child": False}
+        report = {p["name"]: p for p in manager.get_startup_report()["plugins"]}
+        assert report["slow"]["status"] == "timeout"
+        assert report["child"]["status"] == "skipped"
+
+    def test_serial_start_timeout(self, manager):
+        """Test a hung plugin times out with parallel_start off."""
+        manager.config.parallel_start = False
+        manager.config.start_timeout = 0.1
+        make_plugin("hung", delay=0.5)
+        make_plugin("after")
+
+        start = time.perf_counter()
+        results = manager.start_all()
+
+        assert time.perf_counter() - start < 0.4
+        assert results == {"hung": False, "after": True}
+        report = {p["name"]: p for p in manager.get_startup_report()["plugins"]}
+        assert report["hung"]["status"] == "timeout"
+        assert report["after"]["status"] == "started"
+
+    def test_circular_dependency(self, manager):
+        """Test plugins on a cycle fail without blocking others."""
+        make_plugin("a", depends_on=["b"])
+        make_plugin("b", depends_on=["a"])
+        make_plugin("c")
+
+        assert manager.start_all() == {"a": False, "b": False, "c": True}
+
+    def test_concurrent_start_calls_start_once(self, manager):
+        """Test racing start() calls start the plugin only once."""
+        make_plugin("single", delay=0.05)
+        threads = [
+            threading.Thread(target=manager.start, args=("single",)) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [name for name, _ in START_LOG] == ["single"]
+
+
+class TestDeferredDiscovery:
+    """Tests for manifest-only discovery."""
+
+    def write_plugin(self, root, name, enabled=True):
+        plugin_dir = root / name
+        plugin_dir.mkdir()
+        (plugin_dir / "plugin.yaml").write_text(
+            f"name: {name}\nversion: 1.0.0\nenabled: {str(enabled).lower()}\n"
+            "module: plugin\nclass: DeferredPlugin\n"
+        )
+        (plugin_dir / "plugin.py").write_text(
+            "from src.core.plugins.base import BasePlugin\n\n"
+            "class DeferredPlugin(BasePlugin):\n"
+            "    def _on_start(self):\n        pass\n\n"
+            "    def _on_stop(self):\n        pass\n"
+        )
+
+    def test_discover_does_not_import(self, tmp_path):
+        """Test modules are imported on first use only."""
+        self.write_plugin(tmp_path, "lazy_a")
+        self.write_plugin(tmp_path, "lazy_off", enabled=False)
+
+        assert sorted(PluginRegistry.discover(tmp_path)) == ["lazy_a", "lazy_off"]
+        assert "plugins.lazy_a" not in sys.modules
+        assert PluginRegistry.exists("lazy_a")
+        assert PluginRegistry.count() == 2
+        assert PluginRegistry.get_metadata("lazy_a").version == "1.0.0"
+
+        PluginRegistry.get_instance("lazy_a")
+        assert PluginRegistry.is_loaded("lazy_a")
+        assert "plugins.lazy_a" in sys.modules
+
+    def test_start_all_skips_disabled_imports(self, tmp_path, manager):
+        """Test disabled plugins are never imported."""
+        self.write_plugin(tmp_path, "lazy_on")
+        self.write_plugin(tmp_path, "lazy_disabled", enabled=False)
+        PluginRegistry.discover(tmp_path)
+
+        assert manager.start_all() == {"lazy_on": True}
+        assert not PluginRegistry.is_loaded("lazy_disabled")
+        assert "plugins.lazy_disabled" not in sys.modules
@@ -0,0 +1,107 @@
+"""
+Unit tests for token-budgeted prompt construction.
+
+Tests cover:
+- Token estimation and text clipping
+- Compact candidate encoding
+- Fallbacks and dropping of low-priority sections
+- Required sections kept over budget
+
+MIT Level Testing - 85%+ Coverage Target
+"""
+
+from src.agents.prompt_builder import (
+    PromptBuilder,
+    clip,
+    encode_candidates,
+    estimate_tokens,
+)
+from src.models.content import ContentResult, ContentType
+
+
+def _candidate(content_type, description="") -> ContentResult:
+    return ContentResult(
+        content_type=content_type,
+        title=f"{content_type.value} title",
+        description=description,
+        source="Test",
+        relevance_score=7.25,
+    )
+
+
+class TestHelpers:
+    """Tests for estimation, clipping and encoding."""
+
+    def test_estimate_matches_cost_model(self):
+        """Test the estimate is the cost model's ~4 characters per token."""
+        assert estimate_tokens("x" * 400) == 100
+
+    def test_clip_at_word_boundary(self):
+        """Test clipped text ends on a whole word."""
+        assert clip("short", 10) == "short"
+        assert clip("one two three four", 12) == "one two..."
+        assert len(clip("a" * 50, 10)) == 10
+
+    def test_encode_candidates(self):
+        """Test one numbered line per candidate, descriptions optional."""
+        candidates = [
+            _candidate(ContentType.VIDEO, "A  walk\nthrough " + "history " * 20),
+            _candidate(ContentType.MUSIC),
+        ]
+
+        lines = encode_candidates(candidates, description_chars=30).splitlines()
+
+        assert len(lines) == 2
+        assert lines[0].startswith("1. VIDEO 7.2 | video title | A walk")
+        assert lines[0].endswith("...")
+        assert lines[1] == "2. MUSIC 7.2 | music title"
+        assert encode_candidates(candidates, 0).splitlines()[0] == (
+            "1. VIDEO 7.2 | video title"
+        )
+
+
+class TestPromptBuilder:
+    """Tests for fitting sections into a budget."""
+
+    def test_fits_unchanged(self):
+        """Test a prompt within budget keeps every section."""
+        prompt = (
+            PromptBuilder(budget_tokens=100)
+            .add("a", "first")
+            .add("b", "")
+            .add("c", "third")
+            .build()
+        )
+
+        assert prompt.text == "first\n\nthird"
+        assert prompt.trimmed == ()
+        assert not prompt.over_budget
+
+    def test_lowest_priority_shrinks_first(self):
+        """Test fallbacks are used, then optional sections dropped."""
+        builder = (
+            PromptBuilder(budget_tokens=20)
+            .add("task", "t" * 40, priority=2, required=True)
+            .add("profile", "p" * 60, priority=1, fallbacks=["p" * 30])
+            .add("extra", "e" * 60, priority=0)
+        )
+
+        prompt = builder.build()
+
+        assert prompt.text == "t" * 40 + "\n\n" + "p" * 30
+        assert prompt.trimmed == ("extra", "profile")
+        assert prompt.tokens <= 20
+        # Building again starts from the original sections
+        assert builder.build() == prompt
+
+    def test_required_sections_kept(self):
+        """Test required sections survive even when over budget."""
+        prompt = (
+            PromptBuilder(budget_tokens=5)
+            .add("task", "t" * 80, required=True, fallbacks=["t" * 40])
+            .add("note", "n" * 10)
+            .build()
+        )
+
+        assert prompt.text == "t" * 40
+        assert prompt.over_budget
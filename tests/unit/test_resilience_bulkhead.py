@@ -9,6 +9,7 @@ Tests cover:
 MIT Level Testing - 85%+ Coverage Target
 """
 
+import asyncio
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -16,9 +17,11 @@ from concurrent.futures import ThreadPoolExecutor
 import pytest
 
 from src.core.resilience.bulkhead import (
+    AsyncBulkhead,
     Bulkhead,
     BulkheadFull,
     BulkheadStats,
+    async_bulkhead,
 )
 
 
@@ -237,3 +240,59 @@ class TestBulkheadThreadSafety:
 
         assert len(results) == 5
         assert sorted(results) == list(range(5))
+
+
+class TestAsyncBulkhead:
+    """Tests for asyncio.Semaphore-backed bulkhead."""
+
+    def test_limits_concurrency(self):
+        """Test at most max_concurrent coroutines run at once."""
+        active = 0
+        peak = 0
+
+        @async_bulkhead(name="async_limit_test", max_concurrent=2, max_queued=10)
+        async def work():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return True
+
+        async def run_test():
+            return await asyncio.gather(*(work() for _ in range(6)))
+
+        assert all(asyncio.run(run_test()))
+        assert peak == 2
+        stats = work.bulkhead.get_stats()
+        assert stats["successful_calls"] == 6
+        assert stats["max_concurrent_reached"] == 2
+        assert stats["current_concurrent"] == 0
+
+    def test_rejects_without_queue(self):
+        """Test BulkheadFull when full and no queue."""
+        bh = AsyncBulkhead(name="async_reject_test", max_concurrent=1)
+
+        async def run_test():
+            async with bh:
+                with pytest.raises(BulkheadFull):
+                    async with bh:
+                        pass
+
+        asyncio.run(run_test())
+        assert bh.stats.rejected_calls == 1
+        assert bh.get_stats()["acceptance_rate"] == 0.5
+
+    def test_queue_timeout_rejects(self):
+        """Test queued request is rejected after timeout."""
+        bh = AsyncBulkhead(
+            name="async_timeout_test", max_concurrent=1, max_queued=1, timeout=0.02
+        )
+
+        async def run_test():
+            async with bh:
+                return await bh.acquire()
+
+        assert asyncio.run(run_test()) is False
+        assert bh.queued_count == 0
+        assert AsyncBulkhead.get("async_timeout_test") is bh
@@ -11,6 +11,7 @@ Test Coverage:
 - Statistics tracking
 """
 
+import asyncio
 import time
 
 import pytest
@@ -20,6 +21,7 @@ from src.core.resilience.circuit_breaker import (
     CircuitBreakerOpen,
     CircuitBreakerStats,
     CircuitState,
+    async_circuit_breaker,
     circuit_breaker,
 )
 
@@ -436,3 +438,78 @@ class TestCircuitBreakerCallback:
         # Should not raise even though callback fails
         breaker.record_failure()
         assert breaker.state == CircuitState.OPEN
+
+
+class TestAsyncCircuitBreaker:
+    """Tests for async usage of CircuitBreaker."""
+
+    def test_async_context_manager_records_outcomes(self):
+        """Test async with records success and failure."""
+        breaker = CircuitBreaker(name="async_ctx_test", failure_threshold=2)
+
+        async def run_test():
+            async with breaker:
+                pass
+            with pytest.raises(ValueError):
+                async with breaker:
+                    raise ValueError("fail")
+
+        asyncio.run(run_test())
+        stats = breaker.get_stats()
+        assert stats["successful_calls"] == 1
+        assert stats["failed_calls"] == 1
+
+    def test_async_decorator_opens_and_rejects(self):
+        """Test async decorator opens the circuit after failures."""
+
+        @async_circuit_breaker(name="async_deco_test", failure_threshold=2)
+        async def failing():
+            raise ConnectionError("down")
+
+        async def run_test():
+            for _ in range(2):
+                with pytest.raises(ConnectionError):
+                    await failing()
+            with pytest.raises(CircuitBreakerOpen):
+                await failing()
+
+        asyncio.run(run_test())
+        assert failing.circuit_breaker.is_open
+        assert failing.circuit_breaker.stats.rejected_calls == 1
+
+    def test_breaker_shared_between_sync_and_async(self):
+        """Test sync and async callers share one breaker by name."""
+        breaker = CircuitBreaker(name="shared_test", failure_threshold=2)
+
+        @async_circuit_breaker(name="shared_test")
+        async def async_call():
+            raise ConnectionError("down")
+
+        with pytest.raises(ValueError):
+            with breaker:
+                raise ValueError("sync failure")
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(async_call())
+
+        assert async_call.circuit_breaker is breaker
+        assert breaker.is_open
+
+    def test_cancellation_not_counted_as_failure(self):
+        """Test cancelled coroutines do not trip the breaker."""
+        breaker = CircuitBreaker(name="cancel_test", failure_threshold=1)
+
+        async def slow():
+            async with breaker:
+                await asyncio.sleep(5)
+
+        async def run_test():
+            task = asyncio.create_task(slow())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run_test())
+        assert breaker.is_closed
+        assert breaker.stats.failed_calls == 0
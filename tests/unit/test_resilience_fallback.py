@@ -10,6 +10,7 @@ Tests cover:
 MIT Level Testing - 85%+ Coverage Target
 """
 
+import asyncio
 from unittest.mock import Mock
 
 import pytest
@@ -17,6 +18,7 @@ import pytest
 from src.core.resilience.fallback import (
     Fallback,
     FallbackStats,
+    async_fallback,
     cache_fallback,
     fallback,
 )
@@ -357,3 +359,53 @@ class TestCacheFallback:
         # Should not raise
         result = my_func(1)
         assert result == "result_1"
+
+
+class TestAsyncFallback:
+    """Tests for async fallback support."""
+
+    def test_primary_success(self):
+        """Test primary result is returned."""
+
+        @async_fallback(default_value="default")
+        async def primary():
+            return "primary"
+
+        assert asyncio.run(primary()) == "primary"
+        assert primary.fallback_handler.stats.primary_successes == 1
+
+    def test_async_fallback_fn(self):
+        """Test async fallback function is awaited."""
+
+        async def backup(x):
+            return f"backup_{x}"
+
+        @async_fallback(fallback_fn=backup)
+        async def primary(x):
+            raise ConnectionError("down")
+
+        assert asyncio.run(primary(1)) == "backup_1"
+        assert primary.fallback_handler.stats.fallback_activations == 1
+
+    def test_sync_chain_then_default(self):
+        """Test sync chain entries and default value."""
+
+        def broken():
+            raise RuntimeError("also down")
+
+        @async_fallback(fallback_chain=[broken], default_value="default")
+        async def primary():
+            raise ConnectionError("down")
+
+        assert asyncio.run(primary()) == "default"
+
+    def test_all_fail_raises(self):
+        """Test RuntimeError when nothing can serve the call."""
+        fb = Fallback()
+
+        async def primary():
+            raise ConnectionError("down")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(fb.async_execute(primary))
+        assert fb.stats.fallback_failures == 1
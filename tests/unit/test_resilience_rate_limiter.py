@@ -10,6 +10,7 @@ Test Coverage:
 - Statistics tracking
 """
 
+import asyncio
 import threading
 import time
 
@@ -21,6 +22,7 @@ from src.core.resilience.rate_limiter import (
     RateLimitExceeded,
     SlidingWindowLimiter,
     TokenBucket,
+    async_rate_limit,
     rate_limit,
 )
 
@@ -385,3 +387,58 @@ class TestRateLimiterEdgeCases:
         except RateLimitExceeded as e:
             assert e.limiter_name == "exception_test"
             assert e.retry_after is not None
+
+
+class TestAsyncRateLimiting:
+    """Tests for awaitable token buckets and async rate limiting."""
+
+    def test_async_wait_and_acquire(self):
+        """Test awaiting refills the bucket."""
+        bucket = TokenBucket(rate=100, capacity=1)
+        bucket.acquire()
+
+        async def run_test():
+            return await bucket.async_wait_and_acquire(timeout=1.0)
+
+        assert asyncio.run(run_test()) is True
+
+    def test_async_wait_and_acquire_timeout(self):
+        """Test timeout returns False."""
+        bucket = TokenBucket(rate=0.1, capacity=1)
+        bucket.acquire()
+
+        async def run_test():
+            return await bucket.async_wait_and_acquire(timeout=0.05)
+
+        assert asyncio.run(run_test()) is False
+
+    def test_async_decorator_non_blocking_rejects(self):
+        """Test non-blocking async limiter raises when exhausted."""
+
+        @async_rate_limit(max_calls=1, period=60, name="async_nb", block=False)
+        async def call():
+            return "ok"
+
+        async def run_test():
+            assert await call() == "ok"
+            with pytest.raises(RateLimitExceeded):
+                await call()
+
+        asyncio.run(run_test())
+        stats = call.rate_limiter.get_stats()
+        assert stats["allowed_requests"] == 1
+        assert stats["rejected_requests"] == 1
+
+    def test_async_sliding_window(self):
+        """Test async acquire with sliding window algorithm."""
+        limiter = RateLimiter(
+            name="async_sw",
+            max_calls=1,
+            period=60,
+            algorithm="sliding_window",
+        )
+
+        async def run_test():
+            return [await limiter.async_acquire(), await limiter.async_acquire()]
+
+        assert asyncio.run(run_test()) == [True, False]
@@ -11,6 +11,8 @@ Test Coverage:
 - Decorator usage
 """
 
+import asyncio
+
 import pytest
 
 from src.core.resilience.retry import (
@@ -19,6 +21,8 @@ from src.core.resilience.retry import (
     NO_RETRY,
     RetryError,
     RetryPolicy,
+    async_retry,
+    async_with_retry,
     retry,
     with_retry,
 )
@@ -379,3 +383,74 @@ class TestRetryEdgeCases:
         # Should succeed despite callback error
         result = with_retry(fails_once, policy)
         assert result == "success"
+
+
+class TestAsyncRetry:
+    """Tests for async retry helpers."""
+
+    def test_async_with_retry_succeeds_after_failures(self):
+        """Test coroutine is retried until it succeeds."""
+        call_count = 0
+
+        async def flaky():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise ConnectionError("fail")
+            return "ok"
+
+        policy = RetryPolicy(max_attempts=3, initial_delay=0.01, jitter=0.5)
+        assert asyncio.run(async_with_retry(flaky, policy)) == "ok"
+        assert call_count == 3
+
+    def test_async_retry_exhausted(self):
+        """Test RetryError after all attempts fail."""
+
+        @async_retry(max_attempts=2, initial_delay=0.01)
+        async def always_fails():
+            raise ValueError("boom")
+
+        with pytest.raises(RetryError) as exc_info:
+            asyncio.run(always_fails())
+        assert exc_info.value.attempts == 2
+        assert isinstance(exc_info.value.last_exception, ValueError)
+        assert always_fails.retry_policy.max_attempts == 2
+
+    def test_async_retry_non_retryable_raises(self):
+        """Test non-retryable exceptions propagate immediately."""
+        call_count = 0
+
+        @async_retry(
+            max_attempts=3,
+            initial_delay=0.01,
+            non_retryable_exceptions={KeyError},
+        )
+        async def bad_key():
+            nonlocal call_count
+            call_count += 1
+            raise KeyError("missing")
+
+        with pytest.raises(KeyError):
+            asyncio.run(bad_key())
+        assert call_count == 1
+
+    def test_async_retry_does_not_block_loop(self):
+        """Test backoff yields to other coroutines."""
+        ticks = []
+
+        @async_retry(max_attempts=2, initial_delay=0.05, jitter=0)
+        async def fails():
+            raise ValueError("fail")
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        async def run_test():
+            results = await asyncio.gather(fails(), ticker(), return_exceptions=True)
+            return results
+
+        results = asyncio.run(run_test())
+        assert isinstance(results[0], RetryError)
+        assert len(ticks) == 3
@@ -0,0 +1,245 @@
+"""
+Unit tests for the process-wide retry budget.
+
+Test Coverage:
+- Token accounting (deposits per success, withdrawals per retry)
+- Time-based minimum refill
+- Integration with RetryPolicy / with_retry
+- Cost tracker budget alert halting retries
+- Global budget accessors (bound to the global cost tracker)
+"""
+
+import pytest
+
+from src.core.resilience.retry import RetryError, RetryPolicy, with_retry
+from src.core.resilience.retry_budget import (
+    RetryBudget,
+    get_retry_budget,
+    reset_retry_budget,
+)
+
+
+class FakeCostTracker:
+    """Minimal stand-in exposing the budget alert flag."""
+
+    def __init__(self):
+        self.budget_alert_active = False
+
+
+class TestRetryBudget:
+    """Tests for RetryBudget token accounting."""
+
+    def test_starts_full(self):
+        """Test bucket starts at capacity."""
+        budget = RetryBudget(max_tokens=5, min_retries_per_second=0)
+        assert budget.available_tokens == 5
+
+    def test_denies_when_exhausted(self):
+        """Test retries are denied once tokens run out."""
+        budget = RetryBudget(max_tokens=2, min_retries_per_second=0)
+        assert budget.try_acquire("maps")
+        assert budget.try_acquire("maps")
+        assert not budget.try_acquire("maps")
+
+        stats = budget.get_stats()
+        assert stats["retries_allowed"] == 2
+        assert stats["retries_denied"] == 1
+        assert stats["denied_by_upstream"] == {"maps": 1}
+
+    def test_successes_deposit_ratio(self):
+        """Test each success deposits ratio tokens."""
+        budget = RetryBudget(ratio=0.5, max_tokens=1, min_retries_per_second=0)
+        budget.try_acquire()
+        assert not budget.try_acquire()
+
+        budget.record_success()
+        budget.record_success()
+        assert budget.try_acquire()
+        assert budget.get_stats()["successes_recorded"] == 2
+
+    def test_capacity_caps_deposits(self):
+        """Test deposits never exceed max_tokens."""
+        budget = RetryBudget(ratio=1.0, max_tokens=3, min_retries_per_second=0)
+        for _ in range(10):
+            budget.record_success()
+        assert budget.available_tokens == 3
+
+    def test_min_refill(self, monkeypatch):
+        """Test time-based refill with no traffic."""
+        clock = [100.0]
+        monkeypatch.setattr(
+            "src.core.resilience.retry_budget.time.monotonic", lambda: clock[0]
+        )
+        budget = RetryBudget(max_tokens=1, min_retries_per_second=2.0)
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+        clock[0] += 0.5
+        assert budget.try_acquire()
+
+    def test_negative_ratio_rejected(self):
+        """Test invalid ratio raises."""
+        with pytest.raises(ValueError):
+            RetryBudget(ratio=-0.1)
+
+    def test_reset(self):
+        """Test reset refills and clears stats."""
+        budget = RetryBudget(max_tokens=1, min_retries_per_second=0)
+        budget.try_acquire()
+        budget.try_acquire()
+        budget.reset()
+        assert budget.available_tokens == 1
+        assert budget.get_stats()["retries_denied"] == 0
+
+
+class TestCostIntegration:
+    """Tests for halting retries on cost budget alerts."""
+
+    def test_alert_halts_retries(self):
+        """Test retries are denied while the alert is active."""
+        tracker = FakeCostTracker()
+        budget = RetryBudget(max_tokens=10)
+        budget.bind_cost_tracker(tracker)
+
+        assert budget.try_acquire()
+        tracker.budget_alert_active = True
+        assert not budget.try_acquire()
+        assert budget.get_stats()["retries_denied_by_cost"] == 1
+        assert budget.get_stats()["halted_by_cost"] is True
+
+        tracker.budget_alert_active = False
+        assert budget.try_acquire()
+
+    def test_real_cost_tracker_alert(self):
+        """Test binding to CostTracker stops retries after the alert fires."""
+        pytest.importorskip("numpy")
+        from src.cost_analysis.tracker import CostTracker
+
+        tracker = CostTracker(budget_limit_usd=1.0, alert_threshold=0.5)
+        budget = RetryBudget(max_tokens=10)
+        budget.bind_cost_tracker(tracker)
+        assert budget.try_acquire()
+
+        tracker.record_retry_overhead(0.6)
+        tracker.record_api_call("google_maps", calls=1)
+        assert tracker.budget_alert_active
+        assert not budget.try_acquire()
+
+        tracker.reset()
+        assert budget.try_acquire()
+
+
+class TestRetryPolicyBudget:
+    """Tests for with_retry drawing from a budget."""
+
+    def test_budget_exhaustion_stops_retrying(self):
+        """Test RetryError is raised early when the budget is spent."""
+        budget = RetryBudget(max_tokens=1, min_retries_per_second=0)
+        policy = RetryPolicy(max_attempts=5, initial_delay=0, retry_budget=budget)
+        calls = 0
+
+        def always_fails():
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("brownout")
+
+        with pytest.raises(RetryError) as exc_info:
+            with_retry(always_fails, policy)
+
+        assert calls == 2
+        assert exc_info.value.attempts == 2
+        assert "budget" in str(exc_info.value)
+        assert budget.get_stats()["denied_by_upstream"] == {"always_fails": 1}
+
+    def test_policy_upstream_label(self):
+        """Test denials are counted under the policy's upstream name."""
+        budget = RetryBudget(max_tokens=0, min_retries_per_second=0)
+        policy = RetryPolicy(
+            max_attempts=2, initial_delay=0, retry_budget=budget, upstream="video"
+        )
+
+        def _inner():
+            raise ConnectionError("down")
+
+        with pytest.raises(RetryError):
+            with_retry(_inner, policy)
+        assert budget.get_stats()["denied_by_upstream"] == {"video": 1}
+
+    def test_agent_policy_labelled_with_agent_name(self):
+        """Test EnhancedBaseAgent retries are accounted to the agent."""
+        from src.agents.base_agent_v2 import AgentMetadata, EnhancedBaseAgent
+        from src.models.content import ContentType
+
+        class BudgetAgent(EnhancedBaseAgent):
+            metadata = AgentMetadata(name="budget_agent", content_type=ContentType.TEXT)
+
+            def _search_content(self, point):
+                return None
+
+            def get_content_type(self):
+                return ContentType.TEXT
+
+        agent = BudgetAgent()
+        assert agent._retry_policy.upstream == "budget_agent"
+
+    def test_success_credits_budget(self):
+        """Test successful calls deposit into the budget."""
+        budget = RetryBudget(ratio=0.25, min_retries_per_second=0)
+        policy = RetryPolicy(retry_budget=budget)
+
+        with_retry(lambda: "ok", policy)
+        assert budget.get_stats()["successes_recorded"] == 1
+
+    def test_shared_across_policies(self):
+        """Test two policies draw from the same budget."""
+        budget = RetryBudget(max_tokens=1, min_retries_per_second=0)
+        video = RetryPolicy(max_attempts=2, initial_delay=0, retry_budget=budget)
+        music = RetryPolicy(max_attempts=2, initial_delay=0, retry_budget=budget)
+
+        def fails():
+            raise ConnectionError("down")
+
+        with pytest.raises(RetryError):
+            with_retry(fails, video)
+        with pytest.raises(RetryError) as exc_info:
+            with_retry(fails, music)
+        assert "budget" in str(exc_info.value)
+
+
+class TestGlobalBudget:
+    """Tests for the process-wide budget accessors."""
+
+    def test_singleton_and_reset(self):
+        """Test get/reset of the global budget."""
+        reset_retry_budget()
+        first = get_retry_budget()
+        assert get_retry_budget() is first
+
+        reset_retry_budget()
+        assert get_retry_budget() is not first
+
+    def test_global_budget_halts_on_global_cost_alert(self):
+        """Test the global budget follows the global cost tracker's alert."""
+        pytest.importorskip("numpy")
+        from src.cost_analysis.tracker import get_cost_tracker, reset_cost_tracker
+
+        reset_retry_budget()
+        reset_cost_tracker()
+        try:
+            budget = get_retry_budget()
+            assert budget.try_acquire("video")
+
+            tracker = get_cost_tracker()
+            tracker.budget_limit_usd = 1.0
+            tracker.alert_threshold = 0.5
+            tracker.record_retry_overhead(0.6)
+            tracker.record_api_call("google_maps", calls=1)
+            assert not budget.try_acquire("video")
+            assert budget.get_stats()["retries_denied_by_cost"] == 1
+
+            # A fresh global tracker (no alert) is picked up without rebinding
+            reset_cost_tracker()
+            assert budget.try_acquire("video")
+        finally:
+            reset_retry_budget()
+            reset_cost_tracker()
@@ -0,0 +1,296 @@
+"""
+Unit tests for the stale-while-revalidate cache.
+
+Test Coverage:
+- Fresh / stale / expired entry handling
+- LRU bounding
+- Background refresh (deduplicated per key)
+- Optional on-disk last-good store
+- EnhancedBaseAgent cached fallback on failure
+- Content caches shared by agents of one type
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.agents.base_agent_v2 import (
+    AgentCapability,
+    AgentConfig,
+    AgentMetadata,
+    EnhancedBaseAgent,
+    shutdown_content_caches,
+)
+from src.core.resilience.stale_cache import (
+    CacheEntry,
+    DiskStore,
+    StaleWhileRevalidateCache,
+)
+from src.models.content import ContentResult, ContentType
+from src.models.route import RoutePoint
+
+
+def wait_for(predicate, timeout=2.0):
+    """Poll until predicate is true or timeout expires."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestStaleWhileRevalidateCache:
+    """Tests for StaleWhileRevalidateCache."""
+
+    def test_miss_loads_and_caches(self):
+        """Test a miss calls the loader and stores the value."""
+        cache = StaleWhileRevalidateCache(name="miss_test")
+        assert cache.get_or_load("k", lambda: "v1") == "v1"
+        assert cache.get_or_load("k", lambda: "v2") == "v1"
+
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_none_not_cached(self):
+        """Test None results are not stored."""
+        cache = StaleWhileRevalidateCache(name="none_test")
+        assert cache.get_or_load("k", lambda: None) is None
+        assert cache.get("k") is None
+
+    def test_stale_served_and_refreshed(self):
+        """Test stale entries are served immediately and refreshed."""
+        cache = StaleWhileRevalidateCache(
+            name="stale_test", stale_after_seconds=0.0, ttl_seconds=60
+        )
+        cache.put("k", "old")
+
+        assert cache.get_or_load("k", lambda: "new") == "old"
+        assert wait_for(lambda: cache.get("k").value == "new")
+        assert cache.get_stats()["stale_hits"] == 1
+        assert wait_for(lambda: cache.get_stats()["refreshes"] == 1)
+        cache.shutdown()
+
+    def test_refresh_deduplicated(self):
+        """Test at most one refresh per key is in flight."""
+        cache = StaleWhileRevalidateCache(name="dedupe_test")
+        release = threading.Event()
+
+        def slow_loader():
+            release.wait(2.0)
+            return "new"
+
+        assert cache.refresh_async("k", slow_loader)
+        assert not cache.refresh_async("k", slow_loader)
+        release.set()
+        cache.shutdown()
+        assert cache.get("k").value == "new"
+
+    def test_refresh_failure_keeps_last_good(self):
+        """Test failed refreshes leave the old value in place."""
+        cache = StaleWhileRevalidateCache(name="fail_test")
+        cache.put("k", "good")
+
+        def broken():
+            raise ConnectionError("down")
+
+        cache.refresh_async("k", broken)
+        cache.shutdown()
+        assert cache.get("k").value == "good"
+        assert cache.get_stats()["refresh_failures"] == 1
+
+    def test_expired_entries_dropped(self):
+        """Test entries older than TTL are not served."""
+        cache = StaleWhileRevalidateCache(
+            name="ttl_test", stale_after_seconds=0.01, ttl_seconds=0.02
+        )
+        cache.put("k", "v")
+        time.sleep(0.03)
+        assert cache.get("k") is None
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted."""
+        cache = StaleWhileRevalidateCache(name="lru_test", max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a").value == 1
+        assert len(cache) == 2
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_shared_executor_not_shut_down(self):
+        """Test a cache refreshes on a shared pool it does not own."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        cache = StaleWhileRevalidateCache(name="shared_pool_test", executor=executor)
+
+        cache.refresh_async("k", lambda: "v")
+        assert wait_for(lambda: cache.get("k") is not None)
+        cache.shutdown()
+
+        assert executor.submit(lambda: 1).result(timeout=2) == 1
+        executor.shutdown()
+
+    def test_invalid_ages_rejected(self):
+        """Test stale_after must not exceed TTL."""
+        with pytest.raises(ValueError):
+            StaleWhileRevalidateCache(stale_after_seconds=10, ttl_seconds=5)
+
+
+class TestDiskStore:
+    """Tests for the persistent last-good store."""
+
+    def test_round_trip(self, tmp_path):
+        """Test values survive a new cache instance."""
+        store = DiskStore(tmp_path, serializer=lambda v: v, deserializer=lambda v: v)
+        StaleWhileRevalidateCache(name="disk_a", disk_store=store).put("k", {"a": 1})
+
+        fresh = StaleWhileRevalidateCache(name="disk_b", disk_store=store)
+        assert fresh.get("k").value == {"a": 1}
+        assert fresh.get_stats()["disk_hits"] == 1
+
+    def test_expired_disk_entry_deleted(self, tmp_path):
+        """Test expired entries on disk are removed."""
+        store = DiskStore(tmp_path, serializer=lambda v: v, deserializer=lambda v: v)
+        store.save("k", CacheEntry(value="old", stored_at=time.time() - 100))
+
+        cache = StaleWhileRevalidateCache(
+            name="disk_ttl", disk_store=store, stale_after_seconds=1, ttl_seconds=10
+        )
+        assert cache.get("k") is None
+        assert store.load("k") is None
+
+    def test_corrupt_file_discarded(self, tmp_path):
+        """Test unreadable files are treated as misses."""
+        store = DiskStore(tmp_path, serializer=lambda v: v, deserializer=lambda v: v)
+        store._path("k").write_text("{not json")
+        assert store.load("k") is None
+
+    def test_concurrent_saves_of_one_key(self, tmp_path):
+        """Test racing writers of a key leave one complete file and no temps."""
+        store = DiskStore(tmp_path, serializer=lambda v: v, deserializer=lambda v: v)
+        values = [{"writer": i, "payload": "x" * 50_000} for i in range(8)]
+        errors = []
+
+        def write(value):
+            try:
+                for _ in range(20):
+                    store.save("k", CacheEntry(value=value, stored_at=time.time()))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(v,)) for v in values]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert store.load("k").value in values
+        assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+
+class FlakyAgent(EnhancedBaseAgent[AgentConfig]):
+    """Agent whose upstream can be switched off."""
+
+    metadata = AgentMetadata(name="flaky_swr_agent", content_type=ContentType.TEXT)
+
+    def __init__(self, config=None):
+        self.fail = False
+        self.calls = 0
+        super().__init__(config)
+
+    def _search_content(self, point):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("upstream down")
+        return ContentResult(
+            point_id=point.id,
+            content_type=ContentType.TEXT,
+            title=f"Article {self.calls}",
+            source="Wikipedia",
+        )
+
+    def get_content_type(self):
+        return ContentType.TEXT
+
+
+class CacheableAgent(FlakyAgent):
+    """Agent that serves cache-first."""
+
+    metadata = AgentMetadata(
+        name="cacheable_swr_agent",
+        content_type=ContentType.TEXT,
+        capabilities=[AgentCapability.CACHEABLE],
+    )
+
+
+def make_point(point_id):
+    return RoutePoint(
+        id=point_id, address="Ammunition Hill", latitude=31.7944, longitude=35.2283
+    )
+
+
+class TestAgentCachedFallback:
+    """Tests for the cache wiring in EnhancedBaseAgent."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_caches(self):
+        shutdown_content_caches()
+        yield
+        shutdown_content_caches()
+
+    def test_failure_serves_last_good(self):
+        """Test a failed execution returns cached content, not None."""
+        agent = FlakyAgent(AgentConfig(max_retries=1))
+        first = agent.execute(make_point("p1"))
+        assert first.title == "Article 1"
+
+        agent.fail = True
+        degraded = agent.execute(make_point("p2"))
+        assert degraded.title == "Article 1"
+        assert degraded.point_id == "p2"
+        assert degraded.metadata["served_from_cache"] is True
+
+    def test_failure_without_cache_returns_none(self):
+        """Test failure with nothing cached still returns None."""
+        agent = FlakyAgent(AgentConfig(max_retries=1))
+        agent.fail = True
+        assert agent.execute(make_point("p1")) is None
+
+    def test_cacheable_agent_serves_cache_first(self):
+        """Test CACHEABLE agents skip the upstream on a fresh hit."""
+        agent = CacheableAgent(AgentConfig(max_retries=1))
+        agent.execute(make_point("p1"))
+        second = agent.execute(make_point("p2"))
+
+        assert agent.calls == 1
+        assert second.point_id == "p2"
+        assert agent.stats["content_cache"]["hits"] == 1
+
+    def test_cache_shared_across_instances(self):
+        """Test a new agent of the same type reuses the warm cache."""
+        first = CacheableAgent(AgentConfig(max_retries=1))
+        first.execute(make_point("p1"))
+
+        second = CacheableAgent(AgentConfig(max_retries=1))
+        result = second.execute(make_point("p2"))
+
+        assert second.calls == 0
+        assert result.title == "Article 1"
+        assert second._content_cache is first._content_cache
+        assert FlakyAgent()._content_cache is not first._content_cache
+
+    def test_caches_share_one_refresh_pool(self):
+        """Test agents of different types share one refresh executor."""
+        flaky = FlakyAgent()._content_cache
+        cacheable = CacheableAgent()._content_cache
+
+        assert flaky._shared_executor is not None
+        assert flaky._shared_executor is cacheable._shared_executor
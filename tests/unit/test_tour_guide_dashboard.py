@@ -69,6 +69,7 @@ from src.dashboard.tour_guide_dashboard import (
     create_tour_guide_app,
     create_tour_planning_panel,
     create_user_profile_panel,
+    format_point_timing,
     run_tour_guide_dashboard,
 )
 
@@ -414,6 +415,29 @@ class TestLayoutComponents:
 # ============================================================================
 
 
+class TestPointTimingFormat:
+    """Tests for the per-point latency line on recommendation cards."""
+
+    def test_format_point_timing(self):
+        """Test the slowest agent and judge time are shown."""
+        timing = {
+            "total_ms": 2500.0,
+            "agents_ms": 1800.0,
+            "judge_ms": 600.0,
+            "agents": {
+                "video": {"total_ms": 1700.0, "llm_ms": 900.0, "search_ms": 700.0},
+                "text": {"total_ms": 400.0, "llm_ms": 300.0, "search_ms": 100.0},
+            },
+        }
+        assert format_point_timing(timing) == (
+            "2.5s: agents 1.8s · slowest video (LLM 0.9s, search 0.7s) · judge 0.6s"
+        )
+
+    def test_missing_timing(self):
+        """Test results without timing produce no line."""
+        assert format_point_timing(None) is None
+
+
 class TestArchitectureDiagram:
     """Tests for architecture diagram creation."""
 
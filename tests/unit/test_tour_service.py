@@ -12,7 +12,7 @@ MIT Level Testing - 85%+ Coverage Target
 """
 
 import os
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -251,6 +251,20 @@ class TestTourStore:
 
         assert TourStatus.PROCESSING in notifications
 
+    def test_subscribe_to_every_tour(self, store):
+        """Test a tour_id=None subscriber is notified of every tour."""
+        from src.services.tour_service import TourStatus
+
+        notified = []
+        store.subscribe(None, lambda tour: notified.append(tour.tour_id))
+
+        store.create(tour_id="all_1", source="A", destination="B", profile={})
+        store.create(tour_id="all_2", source="A", destination="B", profile={})
+        store.update("all_1", status=TourStatus.PROCESSING)
+        store.update("all_2", status=TourStatus.PROCESSING)
+
+        assert notified == ["all_1", "all_2"]
+
     def test_unsubscribe(self, store):
         """Test unsubscription."""
         notifications = []
@@ -270,6 +284,67 @@ class TestTourStore:
         # Should be empty since we unsubscribed
         assert TourStatus.COMPLETED not in notifications
 
+    def test_count_by_status_tracks_transitions(self, store):
+        """Test status counts follow create, update and delete."""
+        from src.services.tour_service import TourStatus
+
+        store.create(tour_id="c1", source="A", destination="B", profile={})
+        store.create(tour_id="c2", source="A", destination="B", profile={})
+        store.update("c1", status=TourStatus.PROCESSING)
+        store.update("c2", status=TourStatus.PROCESSING)
+        store.update("c2", status=TourStatus.COMPLETED)
+
+        assert store.count_by_status() == {"processing": 1, "completed": 1}
+
+        store.delete("c1")
+        assert store.count_by_status() == {"completed": 1}
+
+    def test_transitions_update_exported_metrics(self):
+        """Test tour metrics are maintained without scanning tours."""
+        from src.services.tour_service import (
+            TourStatus,
+            TourStore,
+            active_tours,
+            tour_requests_total,
+        )
+
+        store = TourStore(export_metrics=True)
+        completed = tour_requests_total.get(status="completed")
+        active = active_tours.get()
+
+        store.create(tour_id="m1", source="A", destination="B", profile={})
+        store.update("m1", status=TourStatus.PROCESSING)
+        assert active_tours.get() == active + 1
+
+        store.update("m1", status=TourStatus.COMPLETED)
+        assert active_tours.get() == active
+        assert tour_requests_total.get(status="completed") == completed + 1
+
+    def test_extra_stores_do_not_export_metrics(self, store):
+        """Test only an exporting store moves the process-wide metrics."""
+        from src.services.tour_service import TourStatus, active_tours
+
+        active = active_tours.get()
+        store.create(tour_id="quiet", source="A", destination="B", profile={})
+        store.update("quiet", status=TourStatus.PROCESSING)
+
+        assert active_tours.get() == active
+        assert store.count_by_status() == {"processing": 1}
+
+    def test_api_mode_metric_zeroes_previous_mode(self):
+        """Test switching API mode leaves only the current mode at 1."""
+        from src.services.tour_service import (
+            _set_api_mode_metric,
+            tour_service_api_mode,
+        )
+
+        _set_api_mode_metric("mock")
+        _set_api_mode_metric("real")
+
+        assert tour_service_api_mode.get(mode="mock") == 0
+        assert tour_service_api_mode.get(mode="real") == 1
+        assert sum(s.value for s in tour_service_api_mode.collect()) == 1
+
 
 class TestTourService:
     """Tests for TourService."""
@@ -431,3 +506,125 @@ class TestGetTourService:
         service2 = get_tour_service()
 
         assert service1 is service2
+
+
+class TestLatencyPercentiles:
+    """Tests for sketch-based latency percentiles."""
+
+    def test_mock_point_records_latency(self):
+        """Test processing a point feeds agent and point sketches."""
+        from src.services.tour_service import (
+            PointResult,
+            TourService,
+            TourStore,
+            point_latency,
+        )
+
+        store = TourStore()
+        svc = TourService(store=store)
+        store.create("tour_lat", "A", "B", {})
+        store.update("tour_lat", points=[PointResult(point_index=0, point_name="X")])
+
+        before = point_latency.get_count()
+        with patch.object(svc, "_should_use_real_apis", return_value=False):
+            svc._process_point("tour_lat", 0, {"name": "X"}, {})
+        svc._executor.shutdown(wait=False)
+
+        assert point_latency.get_count() >= before + 1
+        percentiles = svc.get_latency_percentiles()
+        assert set(percentiles) == {"agents", "point", "tour"}
+        assert {"VIDEO", "MUSIC", "TEXT"} <= set(percentiles["agents"])
+        assert percentiles["point"]["p99"] > 0
+
+
+class TestCriticalPath:
+    """Tests for per-tour tracing and critical-path reports."""
+
+    def test_completed_tour_has_critical_path(self):
+        """Test a processed tour can be explained stage by stage."""
+        from src.services.tour_service import TourService, TourStore
+
+        store = TourStore()
+        svc = TourService(store=store)
+        store.create("tour_cp", "A", "B", {})
+
+        with patch.object(svc, "_should_use_real_apis", return_value=False):
+            svc._process_tour_async("tour_cp")
+        svc._executor.shutdown(wait=False)
+
+        report = svc.get_critical_path("tour_cp")
+        assert report["tour_id"] == "tour_cp"
+        assert report["root"] == "tour"
+        assert {s["name"] for s in report["stages"]} >= {"route.fetch"}
+        assert len(report["points"]) == store.get("tour_cp").total_points
+
+        stages = {s["name"] for s in report["points"][0]["path"]}
+        assert {"agents.run", "judge.run"} <= stages
+
+    def test_unknown_tour_has_no_critical_path(self):
+        """Test unknown tours return None."""
+        from src.services.tour_service import TourService, TourStore
+
+        svc = TourService(store=TourStore())
+        svc._executor.shutdown(wait=False)
+        assert svc.get_critical_path("missing") is None
+
+
+class TestPointTiming:
+    """Tests for per-point latency breakdowns."""
+
+    def test_mock_tour_records_timing(self):
+        """Test every point gets a breakdown and the tour a summary."""
+        from src.services.tour_service import TourService, TourStore
+
+        store = TourStore()
+        svc = TourService(store=store)
+        store.create("tour_timing", "A", "B", {})
+
+        with patch.object(svc, "_should_use_real_apis", return_value=False):
+            svc._process_tour_async("tour_timing")
+        svc._executor.shutdown(wait=False)
+
+        point = store.get("tour_timing").points[0]
+        assert set(point.timing.agents) == {"video", "music", "text"}
+        assert point.timing.total_ms >= point.timing.agents_ms > 0
+        assert point.timing.store_update_ms > 0
+
+        results = svc.get_tour_results("tour_timing")
+        assert results["playlist"][0]["timing"]["agents"]["video"]["total_ms"] > 0
+        summary = results["summary"]["timing"]
+        assert summary["points"] == results["summary"]["total_points"]
+        total = summary["stages"]["total_ms"]
+        assert total["p50"] <= total["p95"] <= total["p99"] <= total["max"]
+
+    def test_real_agents_split_llm_and_search(self):
+        """Test agent stages are recorded on the worker threads."""
+        import time as time_module
+
+        from src.core.observability.timing import timed_stage
+        from src.services.tour_service import TourService, TourStore
+
+        class FakeAgent:
+            def execute(self, point):
+                with timed_stage("llm"):
+                    time_module.sleep(0.03)
+                with timed_stage("search"):
+                    time_module.sleep(0.02)
+                return Mock(title="t", content_type=None, url=None)
+
+        svc = TourService(store=TourStore())
+        svc._executor.shutdown(wait=False)
+        with (
+            patch("src.agents.video_agent.VideoAgent", FakeAgent),
+            patch("src.agents.music_agent.MusicAgent", FakeAgent),
+            patch("src.agents.text_agent.TextAgent", FakeAgent),
+        ):
+            results = svc._run_real_agents({"name": "X"}, {})
+
+        assert len(results) == 3
+        for result in results:
+            timing = result.timing
+            assert timing.llm_calls == 1
+            assert timing.llm_ms >= 25
+            assert timing.search_ms >= 15
+            assert timing.other_ms < timing.total_ms
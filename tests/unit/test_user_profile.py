@@ -8,10 +8,13 @@ Tests cover:
 - Accessibility features
 - Context and criteria generation
 - Edge cases
+- Precompiled profile plans and invalidation
 
 MIT Level Testing - 85%+ Coverage Target
 """
 
+import pytest
+
 from src.models.user_profile import (
     AccessibilityNeed,
     AgeGroup,
@@ -872,3 +875,73 @@ class TestTourSetup:
             user_profile=profile,
         )
         assert setup.user_profile.age_group == AgeGroup.ADULT
+
+
+class TestProfilePlan:
+    """Tests for the precompiled profile plan."""
+
+    def test_plan_reused_until_mutation(self):
+        """Test compile returns the same plan for an unchanged profile."""
+        profile = get_family_profile(min_age=5)
+        plan = profile.compile()
+
+        assert profile.compile() is plan
+        assert profile.to_agent_context() == plan.agent_context
+        assert profile.get_content_type_preferences() == plan.preferences
+
+    def test_assignment_invalidates(self):
+        """Test assigning a field rebuilds the plan."""
+        profile = UserProfile()
+        before = profile.compile()
+
+        profile.is_driver = True
+
+        after = profile.compile()
+        assert after is not before
+        assert after.preferences["video"] == 0.0
+        assert after.fingerprint != before.fingerprint
+
+    def test_in_place_list_edit_invalidates(self):
+        """Test appending to a list field rebuilds the plan."""
+        profile = UserProfile()
+        before = profile.to_agent_context()
+
+        profile.accessibility_needs.append(AccessibilityNeed.HEARING_IMPAIRMENT)
+
+        assert profile.get_content_type_preferences()["music"] == 0.0
+        assert profile.to_agent_context() != before
+
+    def test_model_copy_update_invalidates(self):
+        """Test a copied profile doesn't reuse the original's plan."""
+        profile = UserProfile()
+        profile.compile()
+
+        kid = profile.model_copy(update={"age_group": AgeGroup.KID})
+
+        assert "child" in kid.to_agent_context()
+        assert kid.fingerprint != profile.fingerprint
+
+    def test_fingerprint_depends_on_content(self):
+        """Test equal profiles share a fingerprint and plans hash equal."""
+        a = get_kid_profile(age=7)
+        b = get_kid_profile(age=7)
+
+        assert a.fingerprint == b.fingerprint
+        assert len(a.fingerprint) == 16
+        assert hash(a.compile()) == hash(b.compile())
+        assert a.compile() == b.compile()
+
+    def test_plan_is_immutable(self):
+        """Test plan fields can't be reassigned."""
+        from dataclasses import FrozenInstanceError
+
+        plan = UserProfile().compile()
+        with pytest.raises(FrozenInstanceError):
+            plan.agent_context = "changed"  # type: ignore[misc]
+
+    def test_preferences_are_copies(self):
+        """Test callers can't modify the cached weights."""
+        profile = get_driver_profile()
+        profile.get_content_type_preferences()["video"] = 1.0
+
+        assert profile.get_content_type_preferences()["video"] == 0.0